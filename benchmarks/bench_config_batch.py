@@ -0,0 +1,58 @@
+"""
+Benchmark de l'import en masse de stations dans la configuration.
+
+Compare une écriture par station ajoutée (un ajout au journal, synchronisé
+sur disque, et un compactage périodique dans config.json) à un import dans
+un bloc `config.batch()`, qui n'écrit qu'une fois.
+
+Usage :
+    python -m benchmarks.bench_config_batch [nombre de stations]
+"""
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+from weather_app.config.singleton_config import ConfigurationSingleton
+
+
+def _fresh_config(data_dir: str) -> ConfigurationSingleton:
+    """Crée une nouvelle instance du singleton dans un répertoire temporaire."""
+    # pylint: disable=protected-access
+    ConfigurationSingleton._instance = None
+    ConfigurationSingleton._initialized = False
+    with patch('weather_app.config.singleton_config.os.path.dirname', return_value=data_dir):
+        return ConfigurationSingleton()
+
+
+def _import(config: ConfigurationSingleton, stations: int, batched: bool) -> int:
+    """Ajoute les stations et retourne le nombre d'écritures du fichier."""
+    # pylint: disable=protected-access
+    with patch.object(config.backend, '_write_configuration',
+                      wraps=config.backend._write_configuration) as write:
+        with config.batch() if batched else contextlib.nullcontext():
+            config.add_pays("fr", "France")
+            config.add_ville("tls", "Toulouse", "fr")
+            for i in range(stations):
+                config.add_station(f"s{i}", f"Station {i}", "tls", f"https://example.org/{i}")
+        return write.call_count
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    stations = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    print(f"📊 Import de {stations} stations\n")
+    for label, batched in (("sans batch", False), ("batch", True)):
+        with tempfile.TemporaryDirectory() as data_dir, \
+                contextlib.redirect_stdout(io.StringIO()):
+            config = _fresh_config(data_dir)
+            start = time.perf_counter()
+            writes = _import(config, stations, batched)
+            elapsed = time.perf_counter() - start
+        print(f"{label:<11} {elapsed * 1000:10.1f} ms  ({writes} écriture(s))")
+
+
+if __name__ == '__main__':
+    main()
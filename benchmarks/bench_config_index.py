@@ -0,0 +1,69 @@
+"""
+Benchmark des recherches de la configuration (villes d'un pays, stations
+d'une ville).
+
+Reproduit les listes du menu (nombre de villes de chaque pays, nombre de
+stations de chaque ville) avec les index secondaires, puis avec un parcours
+complet du dictionnaire à chaque appel (comportement précédent).
+
+Usage :
+    python -m benchmarks.bench_config_index [nombre de villes] [stations par ville]
+"""
+import sys
+import time
+
+from weather_app.config.json_backend import JsonConfigBackend
+
+
+def _build_config(villes: int, stations_per_ville: int) -> JsonConfigBackend:
+    """Crée une configuration en mémoire, sans fichier."""
+    config = object.__new__(JsonConfigBackend)
+    pays_count = max(1, villes // 50)
+    # pylint: disable=protected-access
+    config._config = {
+        "settings": {},
+        "pays": {f"p{i}": {"nom": f"Pays {i}"} for i in range(pays_count)},
+        "villes": {
+            f"v{i}": {"nom": f"Ville {i}", "pays_id": f"p{i % pays_count}"}
+            for i in range(villes)
+        },
+        "stations": {
+            f"s{i}": {"nom": f"Station {i}", "ville_id": f"v{i % villes}", "api_url": ""}
+            for i in range(villes * stations_per_ville)
+        },
+    }
+    config._rebuild_indexes()
+    return config
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    villes = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    stations_per_ville = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    config = _build_config(villes, stations_per_ville)
+    pays = config.get_pays()
+    all_villes = config.get_villes()
+    all_stations = config.get_stations()
+    print(f"📊 {len(pays)} pays, {len(all_villes)} villes, {len(all_stations)} stations\n")
+
+    start = time.perf_counter()
+    counts = [len(config.get_villes(pays_id)) for pays_id in pays]
+    counts += [len(config.get_stations(ville_id)) for ville_id in all_villes]
+    indexed = time.perf_counter() - start
+    print(f"index       {indexed * 1000:10.1f} ms  ({sum(counts)} éléments comptés)")
+
+    # Parcours complet sur un échantillon de villes, extrapolé (le parcours
+    # de toutes les villes prendrait plusieurs minutes).
+    sample = list(all_villes)[:max(1, min(len(all_villes), 200))]
+    start = time.perf_counter()
+    for pays_id in pays:
+        _ = {k: v for k, v in all_villes.items() if v.get("pays_id") == pays_id}
+    for ville_id in sample:
+        _ = {k: v for k, v in all_stations.items() if v.get("ville_id") == ville_id}
+    elapsed = time.perf_counter() - start
+    scanned = elapsed * len(all_villes) / len(sample)
+    print(f"parcours    {scanned * 1000:10.1f} ms  (extrapolé depuis {len(sample)} villes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark des stockages de la configuration : JSON (config.json et journal)
+et SQLite (config.db), pour un grand inventaire de stations.
+
+Mesure l'ouverture, l'ajout d'une station, la lecture des stations de chaque
+ville et la suppression en cascade d'un pays.
+
+Usage :
+    python -m benchmarks.bench_config_sqlite [nombre de villes] [stations par ville]
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, List, Tuple, Type
+
+from weather_app.config.backend import ConfigBackend
+from weather_app.config.json_backend import JsonConfigBackend
+from weather_app.config.sqlite_backend import SqliteConfigBackend
+
+
+def _fill(backend: ConfigBackend, villes: int, stations_per_ville: int) -> None:
+    """Remplit la configuration en une seule écriture."""
+    pays_count = max(1, villes // 50)
+    with backend.batch():
+        for i in range(pays_count):
+            backend.add_pays(f"p{i}", f"Pays {i}")
+        for i in range(villes):
+            backend.add_ville(f"v{i}", f"Ville {i}", f"p{i % pays_count}")
+        for i in range(villes * stations_per_ville):
+            backend.add_station(f"s{i}", f"Station {i}", f"v{i % villes}", "https://example.org")
+
+
+def _timed(action: Callable[[], object]) -> Tuple[float, object]:
+    """Exécute une action et retourne sa durée en millisecondes et son résultat."""
+    start = time.perf_counter()
+    result = action()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def _measure(backend_class: Type[ConfigBackend], path: str, villes: int) -> List[float]:
+    """Mesure les opérations sur une configuration déjà remplie."""
+    opening, backend = _timed(lambda: backend_class(path))
+    durations = [opening]
+    durations.append(_timed(lambda: backend.add_station("new", "Nouvelle", "v0", "https://a"))[0])
+    durations.append(_timed(lambda: [backend.get_stations(f"v{i}") for i in range(villes)])[0])
+    durations.append(_timed(lambda: backend.remove_pays("p0"))[0])
+    backend.close()
+    return durations
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    villes = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    stations_per_ville = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    print(f"📊 {villes} villes, {villes * stations_per_ville} stations\n")
+    print(f"{'':8} {'ouverture':>10} {'ajout':>10} {'lectures':>10} {'cascade':>10}  (ms)")
+    backends = (
+        ("JSON", "config.json", JsonConfigBackend),
+        ("SQLite", "config.db", SqliteConfigBackend),
+    )
+    for label, filename, backend_class in backends:
+        with tempfile.TemporaryDirectory() as data_dir, \
+                contextlib.redirect_stdout(io.StringIO()):
+            path = os.path.join(data_dir, filename)
+            backend = backend_class(path)
+            _fill(backend, villes, stations_per_ville)
+            backend.close()
+            durations = _measure(backend_class, path, villes)
+        print(f"{label:8} " + " ".join(f"{duration:10.1f}" for duration in durations))
+
+if __name__ == '__main__':
+    main()
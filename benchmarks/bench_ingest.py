@@ -0,0 +1,68 @@
+"""
+Benchmark d'ingestion d'une réponse de l'API.
+
+Compare la conversion ligne par ligne (parse_measurements puis ajout des
+objets Measurement à la série) à la conversion en colonnes (parse_columns
+puis ajout en bloc).
+
+Usage :
+    python -m benchmarks.bench_ingest [nombre de lignes]
+"""
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from weather_app.models.measurement_series import MeasurementSeries
+from weather_app.services.api_service import chronological, parse_measurements
+from weather_app.services.batch_parser import parse_columns
+
+
+def _results(count: int) -> List[Dict]:
+    """Génère `count` enregistrements, du plus récent au plus ancien comme l'API."""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "heure_de_paris": (start + timedelta(minutes=i)).isoformat(),
+            "temperature_en_degre_c": 10 + i % 50 / 10,
+            "humidite": 60 + i % 40,
+            "pression": 101000 + i % 300,
+        }
+        for i in reversed(range(count))
+    ]
+
+
+def ingest_per_row(results: List[Dict]) -> MeasurementSeries:
+    """Ingestion ligne par ligne."""
+    series = MeasurementSeries()
+    series.extend(chronological(parse_measurements({'results': results})))
+    return series
+
+
+def ingest_columns(results: List[Dict]) -> MeasurementSeries:
+    """Ingestion en colonnes."""
+    columns = parse_columns(results).chronological()
+    series = MeasurementSeries()
+    series.append_columns(
+        columns.epochs, columns.temperatures, columns.humidites, columns.pressions,
+        utc_offsets=columns.utc_offsets
+    )
+    return series
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    results = _results(count)
+    print(f"📊 {count} lignes\n")
+
+    timings = {}
+    for label, ingest in (("ligne", ingest_per_row), ("colonnes", ingest_columns)):
+        best = min(timeit.repeat(lambda f=ingest: f(results), number=3, repeat=5)) / 3
+        timings[label] = best
+        print(f"{label:<9} {best * 1000:8.1f} ms  {count / best / 1000:8.0f} k lignes/s")
+    print(f"\n⚡ x{timings['ligne'] / timings['colonnes']:.1f}")
+
+
+if __name__ == '__main__':
+    main()
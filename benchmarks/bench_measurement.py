@@ -0,0 +1,100 @@
+"""
+Benchmark mémoire / débit de Measurement.
+
+Compare la représentation d'origine (attributs dans un __dict__, heure
+réinterprétée à chaque affichage) à la version compacte (__slots__, epoch
+calculé à la construction, libellés mis en cache).
+
+Usage :
+    python -m benchmarks.bench_measurement [nombre de mesures]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+from weather_app.models.measurement import Measurement
+
+
+class LegacyMeasurement:
+    """Mesure telle qu'implémentée avant l'introduction de __slots__."""
+
+    def __init__(self, heure: str, temperature: float, humidite: int, pression: int):
+        self._heure = heure
+        self._temperature = temperature
+        self._humidite = humidite
+        self._pression = pression
+
+    @property
+    def heure(self) -> str:
+        """Retourne l'horodatage de la mesure."""
+        return self._heure
+
+    def format_heure(self) -> str:
+        """Formate l'heure en la réinterprétant à chaque appel."""
+        try:
+            dt = datetime.fromisoformat(self._heure.replace('Z', '+00:00'))
+            return dt.strftime("%d/%m/%Y %H:%M")
+        except (ValueError, AttributeError):
+            return self._heure
+
+
+def _heures(count: int) -> List[str]:
+    """Génère `count` heures ISO 8601 distinctes, à la minute."""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [(start + timedelta(minutes=i)).isoformat() for i in range(count)]
+
+
+def _build(factory: Callable, heures: List[str]) -> list:
+    """
+    Construit une mesure par heure, comme le ferait le parsing de l'API :
+    chaque mesure reçoit sa propre chaîne, son propre float et son propre int.
+    """
+    return [
+        factory((heure + ' ')[:-1], (i % 400) / 10, 70, 100000 + i % 3000)
+        for i, heure in enumerate(heures)
+    ]
+
+
+def _measure(label: str, factory: Callable, heures: List[str], renders: int) -> None:
+    """Mesure la mémoire occupée, la vitesse de construction et celle de l'affichage."""
+    gc.collect()
+    tracemalloc.start()
+    measurements = _build(factory, heures)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del measurements
+    gc.collect()
+
+    start = time.perf_counter()
+    measurements = _build(factory, heures)
+    build_time = time.perf_counter() - start
+
+    render_rates = []
+    for _ in range(renders):
+        start = time.perf_counter()
+        for measurement in measurements:
+            measurement.format_heure()
+        render_rates.append(len(measurements) / (time.perf_counter() - start))
+
+    count = len(measurements)
+    rates = " / ".join(f"{rate / 1000:.0f}" for rate in render_rates)
+    print(f"{label:<6} {memory / count:6.1f} o/mesure  "
+          f"{memory / 1024 / 1024:7.1f} Mo  "
+          f"construction {count / build_time / 1000:5.0f} k/s  "
+          f"affichages successifs {rates} k/s")
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    heures = _heures(count)
+    print(f"📊 {count} mesures\n")
+    _measure("avant", LegacyMeasurement, heures, renders=3)
+    _measure("après", Measurement, heures, renders=3)
+
+
+if __name__ == '__main__':
+    main()
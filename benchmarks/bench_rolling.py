@@ -0,0 +1,47 @@
+"""
+Benchmark des statistiques glissantes.
+
+Compare la mise à jour incrémentale (RollingStats, O(1) amorti par mesure)
+au recalcul des statistiques sur la fenêtre de 24 heures après chaque mesure.
+
+Usage :
+    python -m benchmarks.bench_rolling [nombre de mesures]
+"""
+import statistics
+import sys
+import time
+
+from weather_app.analytics.rolling import RollingStats
+
+BASE_EPOCH = 1_735_689_600
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    epochs = [BASE_EPOCH + 600 * i for i in range(count)]
+    temperatures = [10 + i % 50 / 10 for i in range(count)]
+    print(f"📊 {count} mesures (une toutes les 10 minutes)\n")
+
+    start = time.perf_counter()
+    stats = RollingStats()
+    for index in range(count):
+        stats.add_columns(epochs[index:index + 1], temperatures[index:index + 1],
+                          [60], [101000], utc_offsets=[0])
+        stats.stats('temperature', '24h')
+    incremental = time.perf_counter() - start
+    print(f"incrémental {incremental * 1000:9.1f} ms  "
+          f"{count / incremental / 1000:8.1f} k mesures/s  (3 fenêtres x 3 grandeurs)")
+
+    start = time.perf_counter()
+    for index in range(count):
+        low = max(0, index - 143)
+        window = temperatures[low:index + 1]
+        _ = (min(window), max(window), statistics.fmean(window), statistics.pstdev(window))
+    recompute = time.perf_counter() - start
+    print(f"recalcul    {recompute * 1000:9.1f} ms  "
+          f"{count / recompute / 1000:8.1f} k mesures/s  (fenêtre 24h, température seule)")
+
+
+if __name__ == '__main__':
+    main()
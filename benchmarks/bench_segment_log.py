@@ -0,0 +1,51 @@
+"""
+Benchmark du journal de mesures en segments.
+
+Écrit un historique d'une station, puis compare, pour un intervalle couvrant
+la moitié de l'historique, l'accès aux enregistrements projetés en mémoire
+(sans copie), leur décodage en colonnes (MeasurementSeries) et la création
+d'un objet Measurement par mesure.
+
+Usage :
+    python -m benchmarks.bench_segment_log [nombre de mesures]
+"""
+import sys
+import tempfile
+import time
+
+from weather_app.storage.segment_log import RECORD, SegmentLog
+
+BASE_EPOCH = 1_735_689_600
+
+
+def _timed(label: str, action) -> object:
+    """Exécute `action` et affiche sa durée."""
+    start = time.perf_counter()
+    result = action()
+    print(f"{label:<28} {(time.perf_counter() - start) * 1000:10.1f} ms")
+    return result
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows = [
+        (BASE_EPOCH + 60 * i, 60, 10 + i % 50 / 10, 60 + i % 40, 101000 + i % 300)
+        for i in range(count)
+    ]
+    window = (BASE_EPOCH + 60 * (count // 4), BASE_EPOCH + 60 * (3 * count // 4))
+    print(f"📊 {count} mesures, intervalle de {count // 2} mesures\n")
+
+    with tempfile.TemporaryDirectory() as directory, SegmentLog(directory) as log:
+        _timed("écriture", lambda: log.add_rows("s001", rows))
+        views = _timed("vues mmap (sans copie)", lambda: log.records("s001", *window))
+        print(f"{'':<28} {sum(v.nbytes for v in views) / 1e6:10.1f} Mo projetés "
+              f"({RECORD.size} o/mesure)")
+        for view in views:
+            view.release()
+        _timed("décodage en colonnes", lambda: log.query("s001", *window))
+        _timed("objets Measurement", lambda: log.query("s001", *window).to_list())
+
+
+if __name__ == '__main__':
+    main()
@@ -2,14 +2,72 @@
 Fixtures communes pour les tests.
 Principe DRY: centralisation des fixtures réutilisables.
 """
+import hashlib
+import json
 import os
 import shutil
 import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock
+from urllib.parse import parse_qsl, urlparse
 
 import pytest
 
 
+class FakeApiHandler(BaseHTTPRequestHandler):
+    """
+    Handler HTTP qui sert les réponses JSON préparées par les tests.
+
+    Les routes sont lues dans `server.routes` : chemin -> (statut, données, délai).
+    Les données peuvent être une fonction recevant les paramètres de la requête.
+    Chaque réponse porte un ETag (et un Last-Modified si `server.last_modified`
+    est défini) ; les requêtes conditionnelles correspondantes reçoivent un 304.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Répond à une requête GET."""
+        self.server.request_paths.append(self.path)
+        self.server.request_headers.append(dict(self.headers))
+        parsed = urlparse(self.path)
+        status, payload, delay = self.server.routes.get(
+            parsed.path, (404, {"error": "not found"}, 0)
+        )
+        if delay:
+            time.sleep(delay)
+        if callable(payload):
+            payload = payload(dict(parse_qsl(parsed.query)))
+
+        body = json.dumps(payload).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        last_modified = self.server.last_modified
+
+        not_modified = status == 200 and (
+            self.headers.get("If-None-Match") == etag
+            or (last_modified and self.headers.get("If-Modified-Since") == last_modified)
+        )
+        if not_modified:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        if last_modified:
+            self.send_header("Last-Modified", last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Désactive les logs du serveur."""
+
+
 @pytest.fixture
 def temp_config_file():
     """
@@ -156,6 +214,54 @@ def sample_api_response():
     }
 
 
+@pytest.fixture
+def fake_api_server():
+    """
+    Fixture qui démarre un serveur HTTP local simulant l'API.
+
+    Yields:
+        ThreadingHTTPServer: Serveur avec `routes`, `request_paths` et `base_url`
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeApiHandler)
+    server.daemon_threads = True
+    server.routes = {}
+    server.request_paths = []
+    server.request_headers = []
+    server.last_modified = None
+    server.base_url = f"http://127.0.0.1:{server.server_port}"
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    # Nettoyage
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def make_stations(fake_api_server):  # pylint: disable=redefined-outer-name
+    """
+    Fixture qui fabrique des stations pointant vers le serveur local.
+
+    Returns:
+        Callable: Fonction count -> liste de Station (/station/0, /station/1, ...)
+    """
+    # pylint: disable=import-outside-toplevel
+    from weather_app.models.location import Pays, Ville, Station
+
+    def factory(count):
+        pays = Pays("fr001", "France")
+        ville = Ville("v001", "Toulouse", pays)
+        return [
+            Station(f"s{i:03d}", f"Station{i}", ville, f"{fake_api_server.base_url}/station/{i}")
+            for i in range(count)
+        ]
+
+    return factory
+
+
 @pytest.fixture
 def mock_api_service():
     """
@@ -2,11 +2,15 @@
 Tests unitaires pour ApiService.
 Test des appels API et gestion d'erreurs réseau.
 """
+import time
 from unittest.mock import Mock, patch
 
+import pytest
 import requests
 
 from weather_app.services.api_service import ApiService
+from weather_app.services.disk_cache import DiskResponseCache
+from weather_app.services.response_cache import ResponseCache
 from weather_app.models.location import Pays, Ville, Station
 from weather_app.models.measurement import Measurement
 
@@ -27,7 +31,7 @@ class TestApiService:
         # Vérifier que le service a été créé sans erreur
         assert service is not None
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_data_success(self, mock_get, sample_api_response):
         """Test le chargement réussi de données."""
         # Préparer le mock
@@ -48,10 +52,10 @@ class TestApiService:
 
         # Vérifications
         assert result is True
-        mock_get.assert_called_once_with("https://api.example.com", timeout=10)
+        mock_get.assert_called_once_with("https://api.example.com", headers={}, timeout=10)
         assert len(station.get_measurements()) == 2
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_data_timeout(self, mock_get):
         """Test le comportement en cas de timeout."""
         mock_get.side_effect = requests.exceptions.Timeout()
@@ -66,7 +70,7 @@ class TestApiService:
 
         assert result is False
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_data_network_error(self, mock_get):
         """Test le comportement en cas d'erreur réseau."""
         mock_get.side_effect = requests.exceptions.RequestException("Network error")
@@ -81,7 +85,7 @@ class TestApiService:
 
         assert result is False
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_data_parsing_error(self, mock_get):
         """Test le comportement en cas d'erreur de parsing."""
         mock_response = Mock()
@@ -101,7 +105,7 @@ class TestApiService:
         assert result is True
         assert len(station.get_measurements()) == 0
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_data_clears_previous_measurements(self, mock_get, sample_api_response):
         """Test que les anciennes mesures sont effacées."""
         mock_response = Mock()
@@ -183,6 +187,27 @@ class TestApiService:
         # Les mesures invalides devraient être ignorées
         assert len(measurements) == 0
 
+    @patch('requests.Session.get')
+    def test_fetch_data_ignores_bad_rows(self, mock_get, sample_api_response):
+        """Test qu'une ligne invalide est écartée et signalée une seule fois."""
+        sample_api_response["results"].append({"heure_de_paris": "invalid"})
+        mock_response = Mock(status_code=200, headers={}, content=b"{}")
+        mock_response.json.return_value = sample_api_response
+        mock_get.return_value = mock_response
+
+        pays = Pays("fr001", "France")
+        ville = Ville("v001", "Toulouse", pays)
+        station = Station("s001", "Montaudran", ville, "https://api.example.com")
+
+        service = ApiService()
+        with patch('builtins.print') as mock_print:
+            result = service.fetch_data_for_station(station)
+
+        assert result is True
+        assert [m.temperature for m in station.get_measurements()] == [14.2, 15.5]
+        mock_print.assert_called_once()
+        assert "1 mesure(s) invalide(s)" in mock_print.call_args[0][0]
+
     def test_parse_measurements_empty_results(self):
         """Test le parsing avec résultats vides."""
         data = {"results": []}
@@ -201,7 +226,7 @@ class TestApiService:
 
         assert len(measurements) == 0
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_api_url_valid(self, mock_get):
         """Test la validation d'une URL valide."""
         mock_response = Mock()
@@ -214,7 +239,7 @@ class TestApiService:
 
         assert result is True
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_api_url_invalid_response(self, mock_get):
         """Test la validation d'une URL avec réponse invalide."""
         mock_response = Mock()
@@ -227,7 +252,7 @@ class TestApiService:
 
         assert result is False
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_api_url_network_error(self, mock_get):
         """Test la validation avec erreur réseau."""
         mock_get.side_effect = requests.exceptions.RequestException()
@@ -237,7 +262,7 @@ class TestApiService:
 
         assert result is False
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_api_url_timeout(self, mock_get):
         """Test la validation avec timeout."""
         mock_get.side_effect = requests.exceptions.Timeout()
@@ -247,7 +272,7 @@ class TestApiService:
 
         assert result is False
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_api_url_invalid_json(self, mock_get):
         """Test la validation avec JSON invalide."""
         mock_response = Mock()
@@ -260,7 +285,7 @@ class TestApiService:
 
         assert result is False
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_multiple_fetches(self, mock_get, sample_api_response):
         """Test plusieurs appels successifs."""
         mock_response = Mock()
@@ -283,3 +308,397 @@ class TestApiService:
         assert result2 is True
         assert len(station1.get_measurements()) == 2
         assert len(station2.get_measurements()) == 2
+
+
+class TestApiServiceFetchAll:
+    """Tests pour le chargement concurrent de plusieurs stations."""
+
+    def test_fetch_all_fills_every_station(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test que chaque station reçoit ses mesures."""
+        stations = make_stations(5)
+        for i in range(5):
+            fake_api_server.routes[f"/station/{i}"] = (200, sample_api_response, 0)
+
+        service = ApiService()
+        with patch('builtins.print'):
+            results = service.fetch_all(stations, max_workers=3)
+
+        assert len(results) == 5
+        assert all(result.success for result in results)
+        assert all(result.count == 2 for result in results)
+        for station in stations:
+            assert len(station.get_measurements()) == 2
+
+    def test_fetch_all_preserves_order(self, fake_api_server, make_stations, sample_api_response):
+        """Test que le rapport suit l'ordre des stations fournies."""
+        stations = make_stations(4)
+        for i in range(4):
+            fake_api_server.routes[f"/station/{i}"] = (200, sample_api_response, 0.05 * (4 - i))
+
+        service = ApiService()
+        with patch('builtins.print'):
+            results = service.fetch_all(stations, max_workers=4)
+
+        assert [result.station for result in results] == stations
+
+    def test_fetch_all_reports_failures(self, fake_api_server, make_stations, sample_api_response):
+        """Test qu'une station en erreur n'empêche pas les autres."""
+        stations = make_stations(3)
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        fake_api_server.routes["/station/1"] = (500, {"error": "boom"}, 0)
+        fake_api_server.routes["/station/2"] = (200, sample_api_response, 0)
+
+        service = ApiService()
+        with patch('builtins.print'):
+            results = service.fetch_all(stations)
+
+        assert [result.success for result in results] == [True, False, True]
+        assert "Erreur réseau" in results[1].message
+        assert len(stations[1].get_measurements()) == 0
+
+    def test_fetch_all_runs_in_parallel(self, fake_api_server, make_stations, sample_api_response):
+        """Test que les requêtes sont exécutées simultanément."""
+        stations = make_stations(6)
+        for i in range(6):
+            fake_api_server.routes[f"/station/{i}"] = (200, sample_api_response, 0.2)
+
+        service = ApiService()
+        start = time.perf_counter()
+        with patch('builtins.print'):
+            service.fetch_all(stations, max_workers=6)
+        elapsed = time.perf_counter() - start
+
+        # En série, il faudrait au moins 1.2s
+        assert elapsed < 0.8
+
+    def test_fetch_all_leaves_request_queue(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test que fetch_all n'utilise pas la file partagée de l'instance."""
+        stations = make_stations(3)
+        for i in range(3):
+            fake_api_server.routes[f"/station/{i}"] = (200, sample_api_response, 0)
+
+        service = ApiService()
+        queue = service._request_queue  # pylint: disable=protected-access
+        with patch.object(queue, 'enqueue') as enqueue, patch('builtins.print'):
+            results = service.fetch_all(stations, max_workers=2)
+
+        enqueue.assert_not_called()
+        assert all(result.success for result in results)
+
+    def test_fetch_all_empty(self):
+        """Test le chargement d'une liste vide."""
+        service = ApiService()
+        with patch('builtins.print'):
+            results = service.fetch_all([])
+
+        assert not results
+
+    def test_fetch_all_invalid_max_workers(self):
+        """Test qu'un nombre de workers invalide est refusé."""
+        service = ApiService()
+
+        with pytest.raises(ValueError):
+            service.fetch_all([], max_workers=0)
+
+
+class TestApiServiceConnectionPool:
+    """Tests pour la réutilisation des connexions HTTP."""
+
+    def test_sequential_fetches_reuse_connection(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test que les requêtes successives réutilisent la même connexion."""
+        stations = make_stations(5)
+        for i in range(5):
+            fake_api_server.routes[f"/station/{i}"] = (200, sample_api_response, 0)
+
+        service = ApiService()
+        with patch('builtins.print'):
+            for station in stations:
+                service.fetch_data_for_station(station)
+
+        stats = service.get_connection_stats()
+        assert stats['requests'] == 5
+        assert stats['connections'] == 1
+        assert stats['reused'] == 4
+        service.close()
+
+    def test_stats_are_split_by_host(self, fake_api_server, sample_api_response):
+        """Test que les statistiques sont détaillées par hôte."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        port = fake_api_server.server_port
+
+        service = ApiService()
+        service.test_api_url(f"http://127.0.0.1:{port}/station/0")
+        service.test_api_url(f"http://localhost:{port}/station/0")
+
+        hosts = service.get_connection_stats()['hosts']
+        assert len(hosts) == 2
+        assert all(stats['requests'] == 1 for stats in hosts.values())
+        service.close()
+
+    def test_concurrent_fetches_bounded_by_pool(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test qu'un fetch_all n'ouvre pas plus de connexions que de workers."""
+        stations = make_stations(12)
+        for i in range(12):
+            fake_api_server.routes[f"/station/{i}"] = (200, sample_api_response, 0.05)
+
+        service = ApiService(pool_maxsize=4)
+        with patch('builtins.print'):
+            service.fetch_all(stations, max_workers=4)
+
+        stats = service.get_connection_stats()
+        assert stats['requests'] == 12
+        assert stats['connections'] <= 4
+        service.close()
+
+    def test_empty_stats(self):
+        """Test les statistiques d'un service sans requête."""
+        service = ApiService()
+
+        stats = service.get_connection_stats()
+
+        assert stats == {'requests': 0, 'connections': 0, 'reused': 0, 'hosts': {}}
+
+
+class TestApiServiceConditionalGet:
+    """Tests pour les requêtes conditionnelles (ETag / Last-Modified)."""
+
+    def test_first_fetch_is_unconditional(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test que le premier chargement n'envoie pas de validateur."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station = make_stations(1)[0]
+
+        service = ApiService()
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+
+        assert "If-None-Match" not in fake_api_server.request_headers[0]
+        service.close()
+
+    def test_not_modified_keeps_measurements(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test qu'un 304 conserve les mesures sans les recharger."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station = make_stations(1)[0]
+
+        service = ApiService()
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+        first = station.get_measurements()
+
+        with patch.object(station, 'clear_measurements') as mock_clear, \
+                patch.object(service, '_parse_measurements') as mock_parse, \
+                patch('builtins.print'):
+            result = service.fetch_data_for_station(station)
+
+        assert result is True
+        mock_clear.assert_not_called()
+        mock_parse.assert_not_called()
+        assert "If-None-Match" in fake_api_server.request_headers[1]
+        assert station.get_measurements() == first
+        service.close()
+
+    def test_changed_payload_is_reloaded(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test qu'une réponse modifiée remplace les mesures."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station = make_stations(1)[0]
+
+        service = ApiService()
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+
+        updated = {"results": sample_api_response["results"][:1]}
+        fake_api_server.routes["/station/0"] = (200, updated, 0)
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+
+        assert len(station.get_measurements()) == 1
+        service.close()
+
+    def test_last_modified_validator(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test l'envoi de If-Modified-Since."""
+        fake_api_server.last_modified = "Tue, 11 Feb 2025 10:00:00 GMT"
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station = make_stations(1)[0]
+
+        service = ApiService()
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+            service.fetch_data_for_station(station)
+
+        headers = fake_api_server.request_headers[1]
+        assert headers["If-Modified-Since"] == "Tue, 11 Feb 2025 10:00:00 GMT"
+        service.close()
+
+    def test_fetch_all_reports_not_modified(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test que le rapport signale les stations inchangées."""
+        stations = make_stations(3)
+        for i in range(3):
+            fake_api_server.routes[f"/station/{i}"] = (200, sample_api_response, 0)
+
+        service = ApiService()
+        with patch('builtins.print'):
+            service.fetch_all(stations)
+            results = service.fetch_all(stations)
+
+        assert all(result.not_modified for result in results)
+        assert all(result.count == 2 for result in results)
+        service.close()
+
+    def test_empty_station_ignores_validators(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test qu'une station vide recharge toujours les données complètes."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        first, = make_stations(1)
+        second, = make_stations(1)
+
+        service = ApiService()
+        with patch('builtins.print'):
+            service.fetch_data_for_station(first)
+            service.fetch_data_for_station(second)
+
+        assert len(second.get_measurements()) == 2
+        assert "If-None-Match" not in fake_api_server.request_headers[1]
+        service.close()
+
+
+class TestApiServiceResponseCache:
+    """Tests pour le cache des réponses devant l'API."""
+
+    def test_second_load_served_from_cache(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test qu'une station déjà chargée est servie sans requête."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        first, = make_stations(1)
+        second, = make_stations(1)
+
+        cache = ResponseCache()
+        service = ApiService(response_cache=cache)
+        with patch('builtins.print'):
+            service.fetch_data_for_station(first)
+            result = service.fetch_data_for_station(second)
+
+        assert result is True
+        assert len(fake_api_server.request_paths) == 1
+        assert len(second.get_measurements()) == 2
+        assert cache.get_stats()['hits'] == 1
+        service.close()
+
+    def test_force_refresh_bypasses_cache(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test qu'un rafraîchissement forcé interroge l'API."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station, = make_stations(1)
+
+        service = ApiService(response_cache=ResponseCache())
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+            service.fetch_data_for_station(station, force_refresh=True)
+
+        assert len(fake_api_server.request_paths) == 2
+        service.close()
+
+    def test_fetch_all_uses_cache(self, fake_api_server, make_stations, sample_api_response):
+        """Test que fetch_all profite du cache."""
+        stations = make_stations(3)
+        for i in range(3):
+            fake_api_server.routes[f"/station/{i}"] = (200, sample_api_response, 0)
+
+        service = ApiService(response_cache=ResponseCache())
+        with patch('builtins.print'):
+            service.fetch_all(stations)
+            results = service.fetch_all(make_stations(3))
+
+        assert all(result.from_cache for result in results)
+        assert len(fake_api_server.request_paths) == 3
+        service.close()
+
+    def test_errors_are_not_cached(self, fake_api_server, make_stations):
+        """Test qu'une réponse en erreur n'est pas mise en cache."""
+        fake_api_server.routes["/station/0"] = (500, {"error": "boom"}, 0)
+        station, = make_stations(1)
+
+        cache = ResponseCache()
+        service = ApiService(response_cache=cache)
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+
+        assert len(cache) == 0
+        service.close()
+
+
+class TestApiServiceDiskCache:
+    """Tests pour le cache disque des réponses."""
+
+    def test_cold_start_served_from_disk(
+            self, fake_api_server, make_stations, sample_api_response, temp_data_dir
+    ):
+        """Test qu'un nouveau service relit les réponses sur disque."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+
+        first_service = ApiService(disk_cache=DiskResponseCache(temp_data_dir))
+        with patch('builtins.print'):
+            first_service.fetch_data_for_station(make_stations(1)[0])
+        first_service.close()
+
+        station, = make_stations(1)
+        service = ApiService(
+            response_cache=ResponseCache(), disk_cache=DiskResponseCache(temp_data_dir)
+        )
+        with patch('builtins.print'):
+            result = service.fetch_data_for_station(station)
+
+        assert result is True
+        assert len(fake_api_server.request_paths) == 1
+        assert len(station.get_measurements()) == 2
+        service.close()
+
+    def test_stale_copy_used_when_api_fails(
+            self, fake_api_server, make_stations, sample_api_response, temp_data_dir
+    ):
+        """Test que les dernières mesures connues sont servies si l'API échoue."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        disk_cache = DiskResponseCache(temp_data_dir)
+        service = ApiService(disk_cache=disk_cache)
+        with patch('builtins.print'):
+            service.fetch_data_for_station(make_stations(1)[0])
+
+        fake_api_server.routes["/station/0"] = (503, {"error": "down"}, 0)
+        station, = make_stations(1)
+        with patch('builtins.print'):
+            result = service.fetch_data_for_station(station, force_refresh=True)
+
+        assert result is True
+        assert len(station.get_measurements()) == 2
+        service.close()
+
+    def test_api_failure_without_copy(self, fake_api_server, make_stations, temp_data_dir):
+        """Test l'échec quand aucune copie n'existe."""
+        fake_api_server.routes["/station/0"] = (503, {"error": "down"}, 0)
+        station, = make_stations(1)
+
+        service = ApiService(disk_cache=DiskResponseCache(temp_data_dir))
+        with patch('builtins.print'):
+            result = service.fetch_data_for_station(station)
+
+        assert result is False
+        service.close()
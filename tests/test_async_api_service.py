@@ -0,0 +1,115 @@
+"""
+Tests unitaires pour AsyncApiService.
+Les requêtes sont servies par un serveur HTTP local.
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from weather_app.services.async_api_service import AsyncApiService
+
+
+async def _fetch_all(stations, max_concurrency=100):
+    """Charge les stations avec un service ouvert puis fermé."""
+    async with AsyncApiService(max_concurrency=max_concurrency) as service:
+        return await service.fetch_all(stations)
+
+
+class TestAsyncApiService:
+    """Tests pour la classe AsyncApiService."""
+
+    def test_invalid_concurrency(self):
+        """Test qu'une concurrence invalide est refusée."""
+        with pytest.raises(ValueError):
+            AsyncApiService(max_concurrency=0)
+
+    def test_fetch_data_success(self, fake_api_server, make_stations, sample_api_response):
+        """Test le chargement réussi d'une station."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station = make_stations(1)[0]
+
+        async def run():
+            async with AsyncApiService() as service:
+                return await service.fetch_data_for_station(station)
+
+        with patch('builtins.print'):
+            result = asyncio.run(run())
+
+        assert result is True
+        assert len(station.get_measurements()) == 2
+        assert station.get_measurements()[-1].temperature == 15.5
+
+    def test_fetch_data_http_error(self, fake_api_server, make_stations):
+        """Test le comportement en cas d'erreur HTTP."""
+        fake_api_server.routes["/station/0"] = (500, {"error": "boom"}, 0)
+        station = make_stations(1)[0]
+
+        async def run():
+            async with AsyncApiService() as service:
+                return await service.fetch_data_for_station(station)
+
+        with patch('builtins.print'):
+            result = asyncio.run(run())
+
+        assert result is False
+        assert len(station.get_measurements()) == 0
+
+    def test_fetch_data_without_context_manager(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test que la session est créée à la demande puis fermée."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station = make_stations(1)[0]
+
+        async def run():
+            service = AsyncApiService()
+            try:
+                return await service.fetch_data_for_station(station)
+            finally:
+                await service.close()
+
+        with patch('builtins.print'):
+            assert asyncio.run(run()) is True
+
+    def test_fetch_all_many_stations(self, fake_api_server, make_stations, sample_api_response):
+        """Test le chargement concurrent de nombreuses stations."""
+        stations = make_stations(200)
+        for i in range(200):
+            fake_api_server.routes[f"/station/{i}"] = (200, sample_api_response, 0)
+
+        with patch('builtins.print'):
+            results = asyncio.run(_fetch_all(stations, max_concurrency=50))
+
+        assert len(results) == 200
+        assert all(result.success for result in results)
+        assert [result.station for result in results] == stations
+        assert all(len(station.get_measurements()) == 2 for station in stations)
+
+    def test_fetch_all_respects_concurrency_limit(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test que le sémaphore limite les requêtes simultanées."""
+        stations = make_stations(6)
+        for i in range(6):
+            fake_api_server.routes[f"/station/{i}"] = (200, sample_api_response, 0.2)
+
+        start = time.perf_counter()
+        with patch('builtins.print'):
+            asyncio.run(_fetch_all(stations, max_concurrency=2))
+        elapsed = time.perf_counter() - start
+
+        # 6 requêtes de 0.2s, 2 à la fois : au moins 3 vagues
+        assert elapsed >= 0.55
+
+    def test_fetch_all_reports_failures(self, fake_api_server, make_stations, sample_api_response):
+        """Test qu'une station en erreur n'empêche pas les autres."""
+        stations = make_stations(3)
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        fake_api_server.routes["/station/2"] = (200, sample_api_response, 0)
+
+        with patch('builtins.print'):
+            results = asyncio.run(_fetch_all(stations))
+
+        assert [result.success for result in results] == [True, False, True]
@@ -0,0 +1,194 @@
+"""
+Tests unitaires pour la récupération paginée de l'historique et la lecture
+en flux des réponses d'ApiService.
+"""
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from weather_app.services.api_service import ApiService, build_page_url
+from weather_app.models.measurement import Measurement
+
+
+def _history(count):
+    """Construit une route paginée servant `count` mesures horaires."""
+    records = [
+        {"heure_de_paris": f"2025-01-{1 + i // 24:02d}T{i % 24:02d}:00:00+00:00",
+         "temperature_en_degre_c": 10.0, "humidite": 70, "pression": 101000}
+        for i in range(count)
+    ]
+
+    def page(params):
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", 100))
+        return {"total_count": count, "results": records[offset:offset + limit]}
+
+    return page
+
+
+class TestBackfill:
+    """Tests pour la récupération paginée de l'historique."""
+
+    def test_build_page_url(self):
+        """Test la réécriture de l'URL avec offset et limit."""
+        url = build_page_url(
+            "https://api.com/records?order_by=heure_de_paris%20DESC&limit=100", 200, 50
+        )
+
+        assert url == "https://api.com/records?order_by=heure_de_paris%20DESC&limit=50&offset=200"
+
+    def test_backfill_streams_all_pages(self, fake_api_server, make_stations):
+        """Test que toutes les pages sont transmises, une à une."""
+        fake_api_server.routes["/station/0"] = (200, _history(250), 0)
+        station, = make_stations(1)
+        pages = []
+
+        service = ApiService()
+        with patch('builtins.print'):
+            written = service.backfill_station(station, pages.append)
+
+        assert written == 250
+        assert [len(page) for page in pages] == [100, 100, 50]
+        assert station.count_measurements() == 0
+        offsets = sorted(int(p.split("offset=")[1].split("&")[0])
+                         for p in fake_api_server.request_paths)
+        assert offsets == [0, 100, 200]
+        service.close()
+
+    def test_backfill_max_records(self, fake_api_server, make_stations):
+        """Test la limite du nombre de mesures récupérées."""
+        fake_api_server.routes["/station/0"] = (200, _history(250), 0)
+        station, = make_stations(1)
+        pages = []
+
+        service = ApiService()
+        with patch('builtins.print'):
+            written = service.backfill_station(station, pages.append, max_records=120)
+
+        assert written == 120
+        assert [len(page) for page in pages] == [100, 20]
+        service.close()
+
+    def test_backfill_pipelines_requests(self, fake_api_server, make_stations):
+        """Test que les pages suivantes sont demandées en parallèle."""
+        fake_api_server.routes["/station/0"] = (200, _history(500), 0.15)
+        station, = make_stations(1)
+
+        service = ApiService()
+        start = time.perf_counter()
+        with patch('builtins.print'):
+            service.backfill_station(station, lambda page: None, prefetch=4)
+        elapsed = time.perf_counter() - start
+
+        # En série : 5 pages x 0.15s = 0.75s
+        assert elapsed < 0.6
+        service.close()
+
+    def test_backfill_interrupted_by_error(self, fake_api_server, make_stations):
+        """Test qu'une erreur réseau arrête l'historique sans perdre les pages reçues."""
+        history = _history(300)
+
+        def failing(params):
+            if int(params.get("offset", 0)) >= 200:
+                raise ConnectionError("boom")
+            return history(params)
+
+        fake_api_server.routes["/station/0"] = (200, failing, 0)
+        station, = make_stations(1)
+        pages = []
+
+        service = ApiService()
+        with patch('builtins.print'):
+            written = service.backfill_station(station, pages.append, prefetch=1)
+
+        assert written == 200
+        service.close()
+
+    def test_backfill_last_page_within_window(self, fake_api_server, make_stations):
+        """Test que la dernière page ne dépasse pas la fenêtre de pagination."""
+        history = _history(120)
+
+        def windowed(params):
+            if int(params.get("offset", 0)) + int(params.get("limit", 100)) > 100:
+                raise ValueError("offset + limit > fenêtre")
+            return history(params)
+
+        fake_api_server.routes["/station/0"] = (200, windowed, 0)
+        station, = make_stations(1)
+        pages = []
+
+        service = ApiService()
+        with patch('weather_app.services.api_service.MAX_OFFSET_WINDOW', 100), \
+                patch('builtins.print'):
+            written = service.backfill_station(station, pages.append, page_size=30)
+
+        assert written == 100
+        assert [len(page) for page in pages] == [30, 30, 30, 10]
+        service.close()
+
+    def test_backfill_invalid_arguments(self, make_stations):
+        """Test que des paramètres invalides sont refusés."""
+        station, = make_stations(1)
+        service = ApiService()
+
+        with pytest.raises(ValueError):
+            service.backfill_station(station, print, page_size=101)
+        with pytest.raises(ValueError):
+            service.backfill_station(station, print, prefetch=0)
+
+
+class TestStreamMeasurements:
+    """Tests pour la lecture en flux des réponses."""
+
+    def test_stream_records(self, fake_api_server):
+        """Test la lecture en flux d'une réponse /records."""
+        fake_api_server.routes["/records"] = (200, _history(250)({"limit": 1000}), 0)
+
+        service = ApiService()
+        measurements = list(service.stream_measurements(
+            f"{fake_api_server.base_url}/records", chunk_size=256
+        ))
+
+        assert len(measurements) == 250
+        assert all(isinstance(m, Measurement) for m in measurements)
+        assert measurements[0].heure == "2025-01-01T00:00:00+00:00"
+        service.close()
+
+    def test_stream_export(self, fake_api_server):
+        """Test la lecture en flux d'un export (liste à la racine)."""
+        records = _history(30)({"limit": 30})["results"]
+        fake_api_server.routes["/exports/json"] = (200, records, 0)
+
+        service = ApiService()
+        measurements = list(service.stream_measurements(
+            f"{fake_api_server.base_url}/exports/json"
+        ))
+
+        assert [m.heure for m in measurements] == [r["heure_de_paris"] for r in records]
+        service.close()
+
+    def test_stream_skips_invalid_records(self, fake_api_server):
+        """Test qu'un enregistrement invalide est ignoré sans interrompre le flux."""
+        fake_api_server.routes["/records"] = (200, {"results": [
+            {"heure_de_paris": "2025-01-01T00:00:00+00:00", "temperature_en_degre_c": "x"},
+            {"heure_de_paris": "2025-01-01T01:00:00+00:00", "temperature_en_degre_c": 4.0},
+        ]}, 0)
+
+        service = ApiService()
+        with patch('builtins.print'):
+            measurements = list(service.stream_measurements(
+                f"{fake_api_server.base_url}/records"
+            ))
+
+        assert [m.temperature for m in measurements] == [4.0]
+        service.close()
+
+    def test_stream_http_error(self, fake_api_server):
+        """Test qu'une erreur HTTP est levée à la lecture."""
+        service = ApiService()
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            list(service.stream_measurements(f"{fake_api_server.base_url}/absent"))
+        service.close()
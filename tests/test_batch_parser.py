@@ -0,0 +1,116 @@
+"""
+Tests unitaires pour le parsing en colonnes des résultats de l'API.
+"""
+from datetime import datetime
+
+from weather_app.services.api_service import iter_measurements
+from weather_app.services.batch_parser import parse_columns
+
+
+def _record(heure, temperature=15.5, humidite=75, pression=101325):
+    """Construit un enregistrement de l'API."""
+    return {
+        "heure_de_paris": heure,
+        "temperature_en_degre_c": temperature,
+        "humidite": humidite,
+        "pression": pression,
+    }
+
+
+class TestParseColumns:
+    """Tests pour la fonction parse_columns."""
+
+    def test_valid_records(self):
+        """Test la conversion de lignes valides."""
+        columns = parse_columns([
+            _record("2025-02-11T10:00:00+00:00"),
+            _record("2025-02-11T11:00:00+01:00", 14, "80", 101300.0),
+        ])
+
+        assert len(columns) == 2
+        assert columns.bad_rows == 0
+        assert columns.epochs.tolist() == [1739268000, 1739268000]
+        assert columns.temperatures.tolist() == [15.5, 14.0]
+        assert columns.humidites.tolist() == [75, 80]
+        assert columns.pressions.tolist() == [101325, 101300]
+        assert columns.utc_offsets.tolist() == [0, 60]
+
+    def test_decimal_values_rounded_like_measurements(self):
+        """Test que les deux lectures de l'API arrondissent humidité et pression."""
+        records = [_record("2025-02-11T10:00:00+00:00", humidite=65.6, pression="101324.7")]
+
+        columns = parse_columns(records)
+        measurement, = iter_measurements(records)
+
+        assert columns.bad_rows == 0
+        assert columns.humidites.tolist() == [measurement.humidite] == [66]
+        assert columns.pressions.tolist() == [measurement.pression] == [101325]
+
+    def test_missing_fields_default_to_zero(self):
+        """Test que les champs absents valent 0."""
+        columns = parse_columns([{"heure_de_paris": "2025-02-11T10:00:00Z"}])
+
+        assert columns.bad_rows == 0
+        assert columns.temperatures.tolist() == [0.0]
+        assert columns.pressions.tolist() == [0]
+
+    def test_invalid_values_masked(self):
+        """Test que les lignes invalides sont marquées sans interrompre le lot."""
+        columns = parse_columns([
+            _record("2025-02-11T10:00:00+00:00"),
+            _record("2025-02-11T11:00:00+00:00", temperature="invalid"),
+            _record("invalid"),
+            _record("2025-02-11T12:00:00+00:00", pression=None),
+            {"temperature_en_degre_c": 12.0},
+            _record("2025-02-11T13:00:00+00:00", humidite=2 ** 40),
+        ])
+
+        assert columns.bad_rows == 5
+        assert columns.bad_indices() == [1, 2, 3, 4, 5]
+        assert list(columns.valid) == [1, 0, 0, 0, 0, 0]
+        assert columns.temperatures[1] == 0.0
+
+    def test_naive_heures_use_local_offset(self):
+        """Test qu'une heure sans fuseau est interprétée en heure locale."""
+        columns = parse_columns([_record("2025-02-11T10:00:00"), _record("2025-02-11T10:00:00Z")])
+        local = datetime(2025, 2, 11, 10).astimezone()
+
+        assert columns.epochs[0] == int(local.timestamp())
+        assert columns.utc_offsets[0] == local.utcoffset().total_seconds() // 60
+        assert columns.utc_offsets[1] == 0
+
+    def test_empty_results(self):
+        """Test une liste vide."""
+        columns = parse_columns([])
+
+        assert len(columns) == 0
+        assert len(columns.chronological()) == 0
+
+
+class TestMeasurementColumnsChronological:
+    """Tests pour le tri chronologique des colonnes."""
+
+    def test_descending_input_reversed(self):
+        """Test l'ordre habituel de l'API (du plus récent au plus ancien)."""
+        columns = parse_columns([
+            _record("2025-02-11T12:00:00+00:00", 12.0),
+            _record("2025-02-11T11:00:00+00:00", 11.0),
+            _record("2025-02-11T10:00:00+00:00", 10.0),
+        ]).chronological()
+
+        assert columns.temperatures.tolist() == [10.0, 11.0, 12.0]
+        assert columns.epochs.tolist() == sorted(columns.epochs.tolist())
+
+    def test_unordered_input_without_bad_rows(self):
+        """Test le tri de lignes dans le désordre, lignes invalides exclues."""
+        original = parse_columns([
+            _record("2025-02-11T11:00:00+00:00", 11.0),
+            _record("invalid", 99.0),
+            _record("2025-02-11T10:00:00+00:00", 10.0),
+            _record("2025-02-11T12:00:00+00:00", 12.0),
+        ])
+        columns = original.chronological()
+
+        assert columns.temperatures.tolist() == [10.0, 11.0, 12.0]
+        assert columns.bad_rows == 0
+        assert len(original) == 4
@@ -2,7 +2,9 @@
 Tests unitaires pour les Builders.
 Test du pattern Builder.
 """
-from weather_app.models.builders import StationBuilder, VilleBuilder
+from unittest.mock import Mock
+
+from weather_app.models.builders import StationBuilder, VilleBuilder, load_stations
 from weather_app.models.location import Pays, Ville, Station
 
 
@@ -211,6 +213,22 @@ class TestStationBuilder:
         assert station.id == "s001"
 
 
+    def test_set_max_measurements(self):
+        """Test la définition d'une limite de mesures conservées."""
+        pays = Pays("fr001", "France")
+        ville = Ville("v001", "Toulouse", pays)
+
+        station = (StationBuilder()
+                   .set_id("s001")
+                   .set_nom("Montaudran")
+                   .set_ville(ville)
+                   .set_api_url("https://api.com")
+                   .set_max_measurements(1440)
+                   .build())
+
+        assert station.max_measurements == 1440
+
+
 class TestVilleBuilder:
     """Tests pour la classe VilleBuilder."""
 
@@ -328,3 +346,40 @@ class TestVilleBuilder:
         assert toulouse.pays == france
         assert madrid.nom == "Madrid"
         assert madrid.pays == espagne
+
+
+class TestLoadStations:
+    """Tests pour la fonction load_stations."""
+
+    @staticmethod
+    def _config():
+        """Crée une configuration simulée (une station orpheline)."""
+        config = Mock()
+        config.get_pays.return_value = {"fr": {"nom": "France"}}
+        config.get_villes.return_value = {
+            "tls": {"nom": "Toulouse", "pays_id": "fr"},
+            "orphan": {"nom": "Nulle part", "pays_id": "xx"},
+        }
+        config.get_stations.return_value = {
+            "s000": {"nom": "Blagnac", "ville_id": "tls", "api_url": "https://a"},
+            "s001": {"nom": "Francazal", "ville_id": "tls", "api_url": "https://b"},
+            "s002": {"nom": "Perdue", "ville_id": "orphan", "api_url": "https://c"},
+        }
+        config.get_max_measurements.side_effect = lambda station_id: (
+            60 if station_id == "s001" else None
+        )
+        return config
+
+    def test_builds_stations_from_config(self):
+        """Test que seules les stations rattachées à une ville connue sont créées."""
+        stations = load_stations(self._config())
+
+        assert [station.id for station in stations] == ["s000", "s001"]
+        assert stations[0].ville is stations[1].ville
+        assert stations[0].ville.pays.nom == "France"
+
+    def test_default_max_measurements(self):
+        """Test que la limite de la configuration est prioritaire sur la limite par défaut."""
+        stations = load_stations(self._config(), default_max_measurements=1000)
+
+        assert [station.max_measurements for station in stations] == [1000, 60]
@@ -0,0 +1,178 @@
+"""
+Tests unitaires pour les commandes non interactives.
+Test des sous-commandes refresh, show et export et de leurs codes de sortie.
+"""
+import json
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from weather_app.__main__ import build_parser, main
+from weather_app.cli import EXIT_FAILURE, EXIT_OK, EXIT_USAGE, run_command
+from weather_app.storage.time_series_store import TimeSeriesStore
+
+
+def _config(data_dir: str, base_url: str) -> Mock:
+    """Crée une configuration simulée : s000 répond, s001 est introuvable."""
+    config = Mock()
+    config.data_dir = data_dir
+    config.get_pays.return_value = {"fr": {"nom": "France"}}
+    config.get_villes.return_value = {"tls": {"nom": "Toulouse", "pays_id": "fr"}}
+    config.get_stations.return_value = {
+        "s000": {"nom": "Blagnac", "ville_id": "tls", "api_url": f"{base_url}/station/0"},
+        "s001": {"nom": "Francazal", "ville_id": "tls", "api_url": f"{base_url}/missing"},
+    }
+    config.get_max_measurements.return_value = None
+    return config
+
+
+def _run(config: Mock, argv):
+    """Exécute une sous-commande avec la configuration simulée."""
+    with patch('weather_app.cli.ConfigurationSingleton', return_value=config):
+        return run_command(build_parser().parse_args(argv))
+
+
+@pytest.fixture(name="cli_config")
+def fixture_cli_config(temp_data_dir, fake_api_server, sample_api_response):
+    """Configuration simulée pointant vers le serveur local."""
+    fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+    return _config(temp_data_dir, fake_api_server.base_url)
+
+
+def _stored(config: Mock, station_id: str) -> int:
+    """Retourne le nombre de mesures enregistrées pour une station."""
+    with TimeSeriesStore(os.path.join(config.data_dir, 'measurements.db')) as store:
+        return store.count(station_id)
+
+
+class TestRefreshCommand:
+    """Tests pour la sous-commande refresh."""
+
+    def test_refresh_station(self, cli_config):
+        """Test le rafraîchissement d'une station et l'enregistrement des mesures."""
+        with patch('builtins.print'):
+            assert _run(cli_config, ["refresh", "s000"]) == EXIT_OK
+
+        assert _stored(cli_config, "s000") == 2
+
+    def test_refresh_all_reports_failures(self, cli_config):
+        """Test qu'une station en erreur donne un code de sortie non nul."""
+        with patch('builtins.print'):
+            assert _run(cli_config, ["refresh", "--all", "--workers", "2"]) == EXIT_FAILURE
+
+        assert _stored(cli_config, "s000") == 2
+
+    def test_refresh_is_incremental(self, cli_config, fake_api_server):
+        """Test qu'un second rafraîchissement ne demande que les nouvelles mesures."""
+        with patch('builtins.print'):
+            _run(cli_config, ["refresh", "s000"])
+            _run(cli_config, ["refresh", "s000"])
+
+        assert "where=" in fake_api_server.request_paths[-1]
+        assert _stored(cli_config, "s000") == 2
+
+    def test_usage_errors(self, cli_config):
+        """Test les erreurs d'utilisation (aucune station, station inconnue)."""
+        with patch('builtins.print'):
+            assert _run(cli_config, ["refresh"]) == EXIT_USAGE
+            assert _run(cli_config, ["refresh", "unknown"]) == EXIT_USAGE
+
+
+class TestShowCommand:
+    """Tests pour la sous-commande show."""
+
+    def test_show_station(self, cli_config, capsys):
+        """Test l'affichage d'une station et de ses dernières mesures."""
+        with patch('builtins.print'):
+            _run(cli_config, ["refresh", "s000"])
+
+        assert _run(cli_config, ["show", "s000", "--limit", "1"]) == EXIT_OK
+
+        out = capsys.readouterr().out
+        assert "Blagnac" in out
+        assert "Temp: 15.5°C" in out
+        assert "Temp: 14.2°C" not in out
+
+    def test_show_with_refresh(self, cli_config, capsys):
+        """Test l'affichage après rafraîchissement."""
+        assert _run(cli_config, ["show", "s000", "--refresh"]) == EXIT_OK
+        assert "Mesures enregistrées: 2" in capsys.readouterr().out
+
+        assert _run(cli_config, ["show", "s001", "--refresh"]) == EXIT_FAILURE
+
+    def test_unknown_station(self, cli_config):
+        """Test qu'une station inconnue est une erreur d'utilisation."""
+        with patch('builtins.print'):
+            assert _run(cli_config, ["show", "unknown"]) == EXIT_USAGE
+
+
+class TestExportCommand:
+    """Tests pour la sous-commande export."""
+
+    def test_export_stdout(self, cli_config, capsys):
+        """Test l'export JSON Lines sur la sortie standard."""
+        with patch('builtins.print'):
+            _run(cli_config, ["refresh", "s000"])
+
+        assert _run(cli_config, ["export", "--format", "jsonl"]) == EXIT_OK
+
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [line["temperature"] for line in lines] == [14.2, 15.5]
+        assert lines[0]["station_id"] == "s000"
+
+    def test_export_file(self, cli_config, temp_data_dir):
+        """Test l'export dans un fichier."""
+        path = os.path.join(temp_data_dir, 'export.jsonl')
+        with patch('builtins.print'):
+            _run(cli_config, ["refresh", "s000"])
+            assert _run(cli_config, ["export", "s000", "--output", path]) == EXIT_OK
+            assert _run(cli_config, ["export", "unknown"]) == EXIT_USAGE
+
+        with open(path, encoding='utf-8') as f:
+            assert len(f.readlines()) == 2
+
+    def test_unsupported_format(self):
+        """Test qu'un format inconnu est refusé par l'analyseur."""
+        with pytest.raises(SystemExit) as excinfo, patch('sys.stderr'):
+            main(["export", "--format", "csv"])
+        assert excinfo.value.code == EXIT_USAGE
+
+
+class TestMigrateConfigCommand:
+    """Tests pour la sous-commande migrate-config."""
+
+    def test_migrate_once(self, temp_data_dir):
+        """Test que la migration crée config.db une seule fois."""
+        with open(os.path.join(temp_data_dir, 'config.json'), 'w', encoding='utf-8') as f:
+            json.dump({"pays": {"fr": {"nom": "France"}}}, f)
+        args = build_parser().parse_args(["migrate-config"])
+
+        with patch('weather_app.cli.default_data_dir', return_value=temp_data_dir), \
+                patch('builtins.print'):
+            assert run_command(args) == EXIT_OK
+            assert run_command(args) == EXIT_FAILURE
+
+        assert os.path.exists(os.path.join(temp_data_dir, 'config.db'))
+
+    def test_missing_config(self, temp_data_dir):
+        """Test qu'une migration sans config.json échoue."""
+        args = build_parser().parse_args(["migrate-config"])
+
+        with patch('weather_app.cli.default_data_dir', return_value=temp_data_dir), \
+                patch('builtins.print'):
+            assert run_command(args) == EXIT_FAILURE
+
+    def test_malformed_journal(self, temp_data_dir):
+        """Test qu'un journal mal formé fait échouer la migration proprement."""
+        with open(os.path.join(temp_data_dir, 'config.json'), 'w', encoding='utf-8') as f:
+            json.dump({"pays": {"fr": {"nom": "France"}}}, f)
+        with open(os.path.join(temp_data_dir, 'config.journal'), 'w', encoding='utf-8') as f:
+            f.write('[{"op":"set","key":"es"}]\n')
+        args = build_parser().parse_args(["migrate-config"])
+
+        with patch('weather_app.cli.default_data_dir', return_value=temp_data_dir), \
+                patch('builtins.print'):
+            assert run_command(args) == EXIT_FAILURE
+
+        assert not os.path.exists(os.path.join(temp_data_dir, 'config.db'))
@@ -4,11 +4,13 @@ Tests unitaires pour le pattern Command.
 
 # pylint: disable=too-few-public-methods
 
+import io
+import json
 from unittest.mock import Mock, patch
 
 from weather_app.patterns.command import (
-    CommandInvoker, SelectStationCommand, RefreshDataCommand,
-    DisplayMeasurementsCommand, AddCountryCommand, RemoveCountryCommand,
+    CommandInvoker, SelectStationCommand, RefreshDataCommand, RefreshStationsCommand,
+    DisplayMeasurementsCommand, ExportMeasurementsCommand, AddCountryCommand, RemoveCountryCommand,
     AddCityCommand, RemoveCityCommand, AddStationCommand,
     RemoveStationCommand, UpdateStationUrlCommand
 )
@@ -126,11 +128,51 @@ class TestRefreshDataCommand:
 
         result = cmd.execute()
 
-        mock_station.clear_measurements.assert_called_once()
-        mock_api.fetch_data_for_station.assert_called_once_with(mock_station)
+        mock_station.clear_measurements.assert_not_called()
+        mock_api.fetch_data_for_station.assert_called_once_with(
+            mock_station, force_refresh=True
+        )
         assert result == ["m1", "m2"]
 
 
+class TestRefreshStationsCommand:
+    """Tests pour RefreshStationsCommand."""
+
+    def test_execute(self):
+        """Test que les stations sont rafraîchies en parallèle par le service."""
+        mock_api = Mock()
+        mock_api.fetch_all.return_value = ["r1", "r2"]
+        stations = [Mock(), Mock()]
+        cmd = RefreshStationsCommand(mock_api, stations, max_workers=4, force_refresh=True)
+
+        result = cmd.execute()
+
+        mock_api.fetch_all.assert_called_once_with(stations, max_workers=4, force_refresh=True)
+        assert result == ["r1", "r2"]
+
+
+class TestExportMeasurementsCommand:
+    """Tests pour ExportMeasurementsCommand."""
+
+    def test_execute(self):
+        """Test l'écriture d'une ligne JSON par mesure."""
+        measurement = Mock(heure="2025-02-11T10:00:00+00:00", temperature=15.5,
+                           humidite=75, pression=101325)
+        mock_store = Mock()
+        mock_store.query.side_effect = lambda station_id: [measurement] * (
+            2 if station_id == "s1" else 1
+        )
+        output = io.StringIO()
+        cmd = ExportMeasurementsCommand(mock_store, ["s1", "s2"], output)
+
+        result = cmd.execute()
+
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert result == 3
+        assert [line["station_id"] for line in lines] == ["s1", "s1", "s2"]
+        assert lines[0]["temperature"] == 15.5
+
+
 class TestDisplayMeasurementsCommand:
     """Tests pour DisplayMeasurementsCommand."""
 
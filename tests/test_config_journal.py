@@ -0,0 +1,153 @@
+"""
+Tests unitaires pour ConfigJournal.
+Test de l'instantané atomique, du journal et de sa reprise après interruption.
+"""
+import json
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from weather_app.config.config_journal import ConfigJournal, apply_changes
+
+
+def _set(section: str, key: str, value) -> dict:
+    """Crée une modification `set`."""
+    return {"op": "set", "section": section, "key": key, "value": value}
+
+
+def _del(section: str, key: str) -> dict:
+    """Crée une modification `del`."""
+    return {"op": "del", "section": section, "key": key}
+
+
+@pytest.fixture(name="journal")
+def fixture_journal(temp_data_dir):
+    """Journal dans un répertoire temporaire."""
+    return ConfigJournal(os.path.join(temp_data_dir, 'config.json'), compact_threshold=10)
+
+
+class TestConfigJournal:
+    """Tests pour la classe ConfigJournal."""
+
+    def test_invalid_threshold(self, temp_data_dir):
+        """Test qu'un seuil de compactage nul est refusé."""
+        with pytest.raises(ValueError):
+            ConfigJournal(os.path.join(temp_data_dir, 'config.json'), compact_threshold=0)
+
+    def test_replay(self, journal):
+        """Test que les modifications journalisées sont rejouées dans l'ordre."""
+        journal.append([_set("pays", "fr", {"nom": "France"}),
+                        _set("pays", "es", {"nom": "Espagne"})])
+        journal.append([_del("pays", "es")])
+
+        config = {"pays": {"be": {"nom": "Belgique"}}}
+        assert ConfigJournal(journal.snapshot_path).replay(config) == 3
+        assert config == {"pays": {"be": {"nom": "Belgique"}, "fr": {"nom": "France"}}}
+
+    def test_incomplete_line_ignored(self, journal):
+        """Test qu'une écriture interrompue est ignorée puis tronquée."""
+        journal.append([_set("pays", "fr", {"nom": "France"})])
+        with open(journal.journal_path, 'ab') as f:
+            f.write(b'[{"op":"set","section":"pays","key":"es"')
+        size = os.path.getsize(journal.journal_path)
+
+        config = {}
+        assert journal.replay(config) == 1
+        assert config == {"pays": {"fr": {"nom": "France"}}}
+        assert os.path.getsize(journal.journal_path) < size
+
+        journal.append([_set("pays", "es", {"nom": "Espagne"})])
+        config = {}
+        assert journal.replay(config) == 2
+        assert set(config["pays"]) == {"fr", "es"}
+
+    def test_replay_without_repair(self, journal):
+        """Test qu'une relecture simple laisse le journal intact."""
+        journal.append([_set("pays", "fr", {"nom": "France"})])
+        with open(journal.journal_path, 'ab') as f:
+            f.write(b'[{"op":"set"')
+        size = os.path.getsize(journal.journal_path)
+
+        config = {}
+        assert journal.replay(config, repair=False) == 1
+        assert config == {"pays": {"fr": {"nom": "France"}}}
+        assert os.path.getsize(journal.journal_path) == size
+
+    def test_failed_append_rolled_back(self, journal):
+        """Test qu'une écriture interrompue ne masque pas les écritures suivantes."""
+        journal.append([_set("villes", "v1", {"nom": "Toulouse"})])
+        real_write = os.write
+
+        def partial_write(fd, data):
+            real_write(fd, data[:10])
+            raise OSError(28, "No space left on device")
+
+        with patch('weather_app.config.config_journal.os.write', side_effect=partial_write):
+            with pytest.raises(OSError):
+                journal.append([_set("villes", "v2", {"nom": "Lyon"})])
+        journal.append([_set("villes", "v2", {"nom": "Lyon"}),
+                        _set("stations", "s1", {"nom": "Bron"})])
+
+        config = {}
+        assert ConfigJournal(journal.snapshot_path).replay(config) == 3
+        assert set(config["villes"]) == {"v1", "v2"}
+        assert set(config["stations"]) == {"s1"}
+
+    def test_snapshot_keeps_file_mode(self, journal):
+        """Test qu'un instantané garde le mode du fichier qu'il remplace."""
+        journal.write_snapshot({})
+        assert stat.S_IMODE(os.stat(journal.snapshot_path).st_mode) == 0o644
+
+        os.chmod(journal.snapshot_path, 0o640)
+        journal.write_snapshot({"pays": {}})
+        assert stat.S_IMODE(os.stat(journal.snapshot_path).st_mode) == 0o640
+
+    def test_snapshot_empties_journal(self, journal):
+        """Test qu'un instantané remplace le fichier et vide le journal."""
+        journal.append([_set("pays", "fr", {"nom": "France"})])
+        journal.write_snapshot({"pays": {"fr": {"nom": "France"}}})
+
+        assert not os.path.exists(journal.journal_path)
+        assert journal.records == 0
+        assert journal.load_snapshot() == {"pays": {"fr": {"nom": "France"}}}
+        assert os.listdir(os.path.dirname(journal.snapshot_path)) == ['config.json']
+
+    def test_failed_snapshot_keeps_previous(self, journal):
+        """Test qu'un instantané interrompu laisse l'ancien fichier intact."""
+        journal.write_snapshot({"pays": {"fr": {"nom": "France"}}})
+
+        with patch('weather_app.config.config_journal.os.fsync', side_effect=OSError("disk")):
+            with pytest.raises(OSError):
+                journal.write_snapshot({"pays": {}})
+
+        assert journal.load_snapshot() == {"pays": {"fr": {"nom": "France"}}}
+        assert os.listdir(os.path.dirname(journal.snapshot_path)) == ['config.json']
+
+    def test_needs_compaction(self, journal):
+        """Test que le compactage attend le seuil puis la taille de la configuration."""
+        journal.append([_set("pays", f"p{i}", {}) for i in range(10)])
+
+        assert journal.needs_compaction(entries=5)
+        assert not journal.needs_compaction(entries=20)
+
+    def test_quarantine(self, journal):
+        """Test qu'un instantané illisible est mis de côté."""
+        with open(journal.snapshot_path, 'w', encoding='utf-8') as f:
+            f.write('{"pays": {')
+
+        with pytest.raises(json.JSONDecodeError):
+            journal.load_snapshot()
+        path = journal.quarantine()
+
+        assert journal.load_snapshot() is None
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == '{"pays": {'
+
+    def test_apply_changes(self):
+        """Test l'application de modifications à une configuration."""
+        config = {"stations": {"s001": {"nom": "A"}}}
+        apply_changes(config, [_set("settings", "max_measurements", 10), _del("stations", "s001")])
+
+        assert config == {"stations": {}, "settings": {"max_measurements": 10}}
@@ -0,0 +1,116 @@
+"""
+Tests unitaires pour le mode démon.
+Test du chargement des stations, des interrogations et de l'arrêt sur signal.
+"""
+import os
+import signal
+import threading
+from unittest.mock import Mock, patch
+
+from weather_app.__main__ import build_parser
+from weather_app.daemon import PollingDaemon
+from weather_app.services.api_service import ApiService
+from weather_app.services.scheduler import PollScheduler
+from weather_app.storage.time_series_store import TimeSeriesStore
+
+
+def _config(base_url: str, poll_interval: int = 600) -> Mock:
+    """Crée une configuration simulée avec deux stations."""
+    config = Mock()
+    config.get_pays.return_value = {"fr": {"nom": "France"}}
+    config.get_villes.return_value = {"tls": {"nom": "Toulouse", "pays_id": "fr"}}
+    config.get_stations.return_value = {
+        "s000": {"nom": "Blagnac", "ville_id": "tls", "api_url": f"{base_url}/station/0"},
+        "s001": {"nom": "Francazal", "ville_id": "tls", "api_url": f"{base_url}/station/1"},
+    }
+    config.get_max_measurements.return_value = None
+    config.get_poll_interval.return_value = poll_interval
+    return config
+
+
+class TestPollingDaemon:
+    """Tests pour la classe PollingDaemon."""
+
+    def test_schedules_each_station(self):
+        """Test que chaque station est programmée à son intervalle."""
+        config = _config("http://localhost", poll_interval=120)
+        scheduler = PollScheduler()
+        daemon = PollingDaemon(config, Mock(), scheduler)
+
+        assert daemon.schedule_stations() == 2
+        assert {key: job.interval for key, job in scheduler.jobs.items()} == {
+            "s000": 120, "s001": 120
+        }
+        scheduler.shutdown()
+
+    def test_poll_writes_to_store(self, fake_api_server, sample_api_response, temp_data_dir):
+        """Test qu'une interrogation enregistre les mesures dans la base."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        fake_api_server.routes["/station/1"] = (200, sample_api_response, 0)
+        store = TimeSeriesStore(os.path.join(temp_data_dir, 'measurements.db'))
+        api_service = ApiService(incremental=True, store=store)
+        stop = threading.Event()
+        scheduler = PollScheduler(jitter=0)
+        daemon = PollingDaemon(_config(fake_api_server.base_url), api_service, scheduler)
+        daemon.schedule_stations(interval=3600)
+
+        with patch('builtins.print'):
+            thread = threading.Thread(target=scheduler.run, args=(stop, 0.01))
+            thread.start()
+            while store.count() < 4 and thread.is_alive():
+                stop.wait(0.01)
+            stop.set()
+            thread.join(timeout=2)
+
+        assert store.count("s000") == 2
+        assert store.count("s001") == 2
+        api_service.close()
+        store.close()
+
+    def test_resumes_from_store(self, fake_api_server, sample_api_response, temp_data_dir):
+        """Test que la première requête part de la dernière mesure enregistrée."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        store = TimeSeriesStore(os.path.join(temp_data_dir, 'measurements.db'))
+        store.add_rows("s000", [(1739268000, 0, 15.5, 75, 101325)])
+        api_service = ApiService(incremental=True, store=store)
+        scheduler = PollScheduler()
+        daemon = PollingDaemon(_config(fake_api_server.base_url), api_service, scheduler,
+                               store=store)
+        daemon.schedule_stations()
+
+        with patch('builtins.print'):
+            scheduler.jobs["s000"].task()
+
+        assert "where=" in fake_api_server.request_paths[-1]
+        scheduler.shutdown()
+        api_service.close()
+        store.close()
+
+    def test_sigterm_stops_daemon(self):
+        """Test que SIGTERM demande l'arrêt du démon."""
+        daemon = PollingDaemon(Mock(), Mock(), Mock())
+        previous = {signum: signal.getsignal(signum) for signum in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            daemon.install_signal_handlers()
+            with patch('builtins.print'):
+                signal.raise_signal(signal.SIGTERM)
+            assert daemon._stop.is_set()  # pylint: disable=protected-access
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+
+class TestCommandLine:
+    """Tests pour les arguments de la ligne de commande."""
+
+    def test_daemon_arguments(self):
+        """Test l'analyse des options du mode démon."""
+        args = build_parser().parse_args(["--daemon", "--interval", "300", "--workers", "2"])
+
+        assert args.daemon
+        assert args.interval == 300
+        assert args.workers == 2
+
+    def test_interactive_by_default(self):
+        """Test que le menu interactif est lancé sans argument."""
+        assert not build_parser().parse_args([]).daemon
@@ -0,0 +1,130 @@
+"""
+Tests unitaires pour DiskResponseCache.
+Test de la persistance, de l'expiration et de la limite de taille.
+"""
+import os
+import threading
+
+import pytest
+
+from weather_app.services.disk_cache import DiskResponseCache
+
+
+class FakeClock:
+    """Horloge manuelle pour contrôler l'expiration."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDiskResponseCache:
+    """Tests pour la classe DiskResponseCache."""
+
+    def test_invalid_limits(self, temp_data_dir):
+        """Test que des limites invalides sont refusées."""
+        with pytest.raises(ValueError):
+            DiskResponseCache(temp_data_dir, ttl=0)
+        with pytest.raises(ValueError):
+            DiskResponseCache(temp_data_dir, max_bytes=0)
+
+    def test_put_and_get(self, temp_data_dir):
+        """Test le stockage puis la lecture d'une réponse."""
+        cache = DiskResponseCache(temp_data_dir)
+        cache.put("https://api.com/a", b'{"results": []}')
+
+        assert cache.get("https://api.com/a") == b'{"results": []}'
+
+    def test_survives_new_instance(self, temp_data_dir):
+        """Test que le cache est relu par une nouvelle instance (redémarrage)."""
+        DiskResponseCache(temp_data_dir).put("https://api.com/a", b"body")
+
+        assert DiskResponseCache(temp_data_dir).get("https://api.com/a") == b"body"
+
+    def test_content_addressed_objects(self, temp_data_dir):
+        """Test que deux URLs au contenu identique partagent un seul corps."""
+        cache = DiskResponseCache(temp_data_dir)
+        cache.put("https://api.com/a", b"same")
+        cache.put("https://api.com/b", b"same")
+
+        stats = cache.get_stats()
+        assert stats['entries'] == 2
+        assert stats['objects'] == 1
+        assert stats['bytes'] == 4
+
+    def test_expiration_and_stale_read(self, temp_data_dir):
+        """Test qu'une entrée expirée reste lisible en mode périmé."""
+        clock = FakeClock()
+        cache = DiskResponseCache(temp_data_dir, ttl=60, clock=clock)
+        cache.put("https://api.com/a", b"body")
+
+        clock.now += 61
+
+        assert cache.get("https://api.com/a") is None
+        assert cache.get("https://api.com/a", allow_stale=True) == b"body"
+
+    def test_size_limit_evicts_least_recently_used(self, temp_data_dir):
+        """Test l'éviction quand la taille totale dépasse la limite."""
+        cache = DiskResponseCache(temp_data_dir, max_bytes=10)
+        cache.put("a", b"11111")
+        os.utime(cache._index_path("a"), (1, 1))  # pylint: disable=protected-access
+        cache.put("b", b"22222")
+        cache.put("c", b"333")
+
+        assert cache.get("a") is None
+        assert cache.get("b") == b"22222"
+        assert cache.get("c") == b"333"
+        assert cache.get_stats()['bytes'] == 8
+
+    def test_corrupted_object_is_a_miss(self, temp_data_dir):
+        """Test qu'un corps altéré n'est pas servi."""
+        cache = DiskResponseCache(temp_data_dir)
+        cache.put("a", b"body")
+        objects_dir = os.path.join(temp_data_dir, 'objects')
+        for name in os.listdir(objects_dir):
+            with open(os.path.join(objects_dir, name), 'wb') as f:
+                f.write(b"tampered")
+
+        assert cache.get("a") is None
+
+    def test_invalidate_and_clear(self, temp_data_dir):
+        """Test la suppression d'entrées et des corps orphelins."""
+        cache = DiskResponseCache(temp_data_dir)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        assert cache.get_stats()['objects'] == 1
+
+        cache.clear()
+        assert cache.get_stats() == {'entries': 0, 'objects': 0, 'bytes': 0}
+
+    def test_concurrent_writers_never_expose_partial_data(self, temp_data_dir):
+        """Test que des écritures concurrentes (deux instances) restent cohérentes."""
+        writers = [DiskResponseCache(temp_data_dir), DiskResponseCache(temp_data_dir)]
+        bodies = [b"A" * 50_000, b"B" * 60_000]
+        seen = []
+
+        def write(cache, body):
+            for _ in range(20):
+                cache.put("https://api.com/shared", body)
+
+        def read():
+            reader = DiskResponseCache(temp_data_dir)
+            for _ in range(50):
+                seen.append(reader.get("https://api.com/shared"))
+
+        threads = [threading.Thread(target=write, args=(c, b)) for c, b in zip(writers, bodies)]
+        threads.append(threading.Thread(target=read))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(body is None or body in bodies for body in seen)
+        assert writers[0].get("https://api.com/shared") in bodies
@@ -0,0 +1,207 @@
+"""
+Tests unitaires pour les résumés des villes et des pays.
+Test de la mise à jour incrémentale à partir des stations suivies.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from weather_app.analytics.hierarchy import RESUM_INTERVAL, LocationSummaries, LocationSummary
+from weather_app.analytics.service import AnalyticsService
+from weather_app.models.location import Pays, Ville, Station
+from weather_app.models.measurement import Measurement
+from weather_app.storage.time_series_store import TimeSeriesStore
+
+BASE_EPOCH = 1_735_689_600  # 2025-01-01T00:00:00+00:00
+
+
+def _row(hour: int, temperature: float, humidite: int = 60):
+    """Crée une ligne de mesure à une heure donnée du 1er janvier 2025."""
+    return (BASE_EPOCH + hour * 3600, 0, temperature, humidite, 101300)
+
+
+def _measurement(hour: int, temperature: float) -> Measurement:
+    """Crée une mesure à une heure donnée du 1er janvier 2025 (UTC)."""
+    return Measurement(f"2025-01-01T{hour:02d}:00:00+00:00", temperature, 60, 101300)
+
+
+class TestLocationSummary:
+    """Tests pour la classe LocationSummary."""
+
+    def test_empty(self):
+        """Test un résumé sans mesure."""
+        summary = LocationSummary("toulouse")
+
+        assert summary.station_count == 0
+        assert summary.current_mean() is None
+        assert summary.latest is None
+
+    def test_current_mean_uses_latest_reading_per_station(self):
+        """Test que la moyenne actuelle ne compte que la dernière mesure de chaque station."""
+        summary = LocationSummary("toulouse")
+        summary.add("s1", _row(0, 10.0))
+        summary.add("s2", _row(0, 20.0))
+        summary.add("s1", _row(1, 14.0, humidite=80))
+
+        assert summary.station_count == 2
+        assert summary.current_mean() == pytest.approx(17.0)
+        assert summary.current_mean('humidite') == pytest.approx(70.0)
+        assert summary.current("s1") == _row(1, 14.0, humidite=80)
+
+    def test_extremes_and_latest(self):
+        """Test les extrêmes depuis le début du suivi et la dernière mesure."""
+        summary = LocationSummary("toulouse")
+        summary.add("s1", _row(0, 10.0))
+        summary.add("s2", _row(2, 20.0))
+        summary.add("s1", _row(1, 4.0))
+
+        assert (summary.temperature.minimum, summary.temperature.maximum) == (4.0, 20.0)
+        assert summary.temperature.count == 3
+        assert summary.latest == ("s2", _row(2, 20.0))
+
+    def test_stale_reading_expires(self):
+        """Test qu'une station muette depuis trop longtemps sort de la moyenne."""
+        summary = LocationSummary("toulouse", max_age=2 * 3600)
+        summary.add("s1", _row(0, 10.0))
+        summary.add("s2", _row(1, 20.0))
+        summary.add("s2", _row(3, 30.0))
+
+        assert summary.station_count == 1
+        assert summary.current("s1") is None
+        assert summary.current_mean() == pytest.approx(30.0)
+        assert summary.temperature.count == 3
+
+        summary.add("s1", _row(4, 12.0))
+        assert summary.current_mean() == pytest.approx(21.0)
+
+    def test_expire_with_explicit_cutoff(self):
+        """Test l'expiration à une date donnée, sans nouvelle mesure."""
+        summary = LocationSummary("toulouse")
+        summary.add("s1", _row(0, 10.0))
+        summary.add("s2", _row(1, 20.0))
+
+        assert summary.expire(_row(1, 0)[0]) == 1
+        assert summary.current_mean() == pytest.approx(20.0)
+        assert summary.expire(_row(2, 0)[0]) == 1
+        assert summary.current_mean() is None
+
+    def test_no_expiry(self):
+        """Test que les mesures actuelles n'expirent pas sans âge maximal."""
+        summary = LocationSummary("toulouse", max_age=None)
+        summary.add("s1", _row(0, 10.0))
+        summary.add("s2", _row(100, 20.0))
+
+        assert summary.current_mean() == pytest.approx(15.0)
+        with pytest.raises(ValueError):
+            LocationSummary("toulouse", max_age=-1)
+
+    def test_sums_recomputed(self):
+        """Test que les sommes ne dérivent pas après de nombreux remplacements."""
+        summary = LocationSummary("toulouse", max_age=None)
+        summary.add("s1", _row(0, 0.3))
+        # 0.3 disparaît de la somme courante à chaque ajout de 1e16
+        for value in range(RESUM_INTERVAL - 2):
+            summary.add("s2", _row(0, 1e16 if value % 2 else 0.1))
+        summary.add("s2", _row(0, 0.1))
+
+        assert summary.current_mean() == pytest.approx(0.2)
+
+    def test_unknown_field(self):
+        """Test qu'une grandeur inconnue est refusée."""
+        with pytest.raises(KeyError):
+            LocationSummary("toulouse").current_mean('vent')
+
+
+class TestLocationSummaries:
+    """Tests pour la classe LocationSummaries."""
+
+    def test_feed_updates_ville_and_pays(self):
+        """Test qu'une station alimente sa ville et son pays."""
+        france = Pays("fr", "France")
+        toulouse = Ville("tls", "Toulouse", france)
+        lyon = Ville("lyn", "Lyon", france)
+        summaries = LocationSummaries()
+
+        feed_tls = summaries.feed(Station("s1", "Blagnac", toulouse, "https://a"))
+        feed_lyn = summaries.feed(Station("s2", "Bron", lyon, "https://b"))
+        feed_tls.add_columns([_row(0, 0)[0]], [12.0], [60], [101300], utc_offsets=[0])
+        feed_lyn.add_columns([_row(0, 0)[0]], [8.0], [70], [101300], utc_offsets=[0])
+
+        assert summaries.summary(toulouse).current_mean() == pytest.approx(12.0)
+        assert summaries.summary(lyon).current_mean() == pytest.approx(8.0)
+        assert summaries.summary(france).current_mean() == pytest.approx(10.0)
+        assert summaries.summary(france).station_count == 2
+
+    def test_unknown_location(self):
+        """Test qu'une localisation sans station suivie n'a pas de résumé."""
+        france = Pays("fr", "France")
+
+        assert LocationSummaries().summary(Ville("tls", "Toulouse", france)) is None
+        assert LocationSummaries().summary(france) is None
+
+
+class TestAnalyticsServiceSummary:
+    """Tests pour les résumés de l'AnalyticsService."""
+
+    def test_summary_follows_ingestion(self):
+        """Test que le résumé suit l'ajout de mesures, sans relecture."""
+        france = Pays("fr", "France")
+        toulouse = Ville("tls", "Toulouse", france)
+        blagnac = Station("s1", "Blagnac", toulouse, "https://a")
+        francazal = Station("s2", "Francazal", toulouse, "https://b")
+        service = AnalyticsService()
+
+        service.track_all([blagnac, francazal])
+        blagnac.add_measurements([_measurement(0, 10.0), _measurement(1, 12.0)])
+        francazal.add_measurements([_measurement(1, 16.0)])
+
+        summary = service.summary(toulouse)
+        assert summary.current_mean() == pytest.approx(14.0)
+        assert summary.temperature.count == 3
+
+        with patch.object(Station, 'get_measurements', side_effect=AssertionError):
+            blagnac.add_measurements([_measurement(2, 18.0)])
+        assert summary.current_mean() == pytest.approx(17.0)
+        assert service.summary(france).latest[0] == "s1"
+
+    def test_reloaded_measurements_counted_once(self):
+        """Test qu'une fenêtre rechargée n'est pas comptée deux fois."""
+        toulouse = Ville("tls", "Toulouse", Pays("fr", "France"))
+        service = AnalyticsService()
+        station = Station("s1", "Blagnac", toulouse, "https://a")
+        service.track(station)
+        station.add_measurements([_measurement(0, 10.0)])
+
+        station = Station("s1", "Blagnac", toulouse, "https://a")
+        service.track(station)
+        station.add_measurements([_measurement(0, 10.0), _measurement(1, 11.0)])
+
+        summary = service.summary(toulouse)
+        assert summary.temperature.count == 2
+        assert summary.station_count == 1
+
+    def test_track_all_reads_only_latest_from_store(self):
+        """Test que la liste des stations ne relit pas leur historique."""
+        toulouse = Ville("tls", "Toulouse", Pays("fr", "France"))
+        blagnac = Station("s1", "Blagnac", toulouse, "https://a")
+        francazal = Station("s2", "Francazal", toulouse, "https://b")
+        with TimeSeriesStore(':memory:') as store:
+            store.add_rows("s1", [_row(hour, 10.0 + hour) for hour in range(3)])
+            store.add_rows("s2", [_row(2, 20.0)])
+            service = AnalyticsService(store=store)
+
+            with patch.object(store, 'query', wraps=store.query) as mock_query:
+                service.track_all([blagnac, francazal])
+                mock_query.assert_not_called()
+                summary = service.summary(toulouse)
+                assert summary.current_mean() == pytest.approx(16.0)
+                assert summary.temperature.count == 2
+
+                rollups = service.track(blagnac).rollups
+                mock_query.assert_called_once_with("s1")
+
+            assert len(rollups.rollup(3600)) == 3
+            assert summary.temperature.count == 2
+            blagnac.add_measurements([_measurement(3, 14.0)])
+            assert summary.current_mean() == pytest.approx(17.0)
+            assert summary.temperature.count == 3
@@ -0,0 +1,155 @@
+"""
+Tests unitaires pour le chargement incrémental d'ApiService.
+Test de la réécriture des URL et de l'ajout des seules nouvelles mesures.
+"""
+from unittest.mock import patch
+
+from weather_app.services.api_service import ApiService, build_incremental_url
+from weather_app.models.measurement import Measurement
+
+
+class TestIncrementalFetch:
+    """Tests pour le chargement incrémental des mesures."""
+
+    STATION_URL = (
+        "https://data.toulouse-metropole.fr/api/explore/v2.1/catalog/datasets/"
+        "12-station-meteo-toulouse-montaudran/records?select=heure_de_paris%2C%20humidite"
+        "&order_by=heure_de_paris%20DESC&limit=100"
+    )
+
+    def test_build_incremental_url(self):
+        """Test la réécriture de l'URL avec une clause where."""
+        url = build_incremental_url(self.STATION_URL, "2025-02-11T10:00:00+00:00")
+
+        assert "where=heure_de_paris%20%3E%20date%272025-02-11T10%3A00%3A00%2B00%3A00%27" in url
+        assert "order_by=heure_de_paris%20ASC" in url
+        assert "select=heure_de_paris%2C%20humidite" in url
+        assert "limit=100" in url
+        assert url.startswith("https://data.toulouse-metropole.fr/api/explore/")
+
+    def test_build_incremental_url_keeps_existing_where(self):
+        """Test qu'une clause where existante est combinée."""
+        url = build_incremental_url(
+            "https://api.com/records?where=temperature_en_degre_c%20%3E%200",
+            "2025-02-11T10:00:00+00:00"
+        )
+
+        assert "where=%28temperature_en_degre_c%20%3E%200%29%20AND%20heure_de_paris" in url
+
+    def test_measurements_kept_in_chronological_order(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test que les mesures (reçues de la plus récente à la plus ancienne) sont triées."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station, = make_stations(1)
+
+        service = ApiService()
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+
+        heures = [m.heure for m in station.get_measurements()]
+        assert heures == ["2025-02-11T09:00:00+00:00", "2025-02-11T10:00:00+00:00"]
+        service.close()
+
+    def test_incremental_appends_newer_records(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test que seules les mesures plus récentes sont demandées et ajoutées."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station, = make_stations(1)
+
+        service = ApiService(incremental=True)
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+
+        newer = {"results": [
+            {"heure_de_paris": "2025-02-11T11:00:00+00:00", "temperature_en_degre_c": 16.0,
+             "humidite": 70, "pression": 101350},
+            # Déjà connue : ignorée même si le serveur la renvoie
+            {"heure_de_paris": "2025-02-11T10:00:00+00:00", "temperature_en_degre_c": 15.5,
+             "humidite": 75, "pression": 101325},
+        ]}
+        fake_api_server.routes["/station/0"] = (200, newer, 0)
+        with patch.object(station, 'clear_measurements') as mock_clear, \
+                patch('builtins.print'):
+            result = service.fetch_data_for_station(station, force_refresh=True)
+
+        assert result is True
+        mock_clear.assert_not_called()
+        assert "where=heure_de_paris" in fake_api_server.request_paths[1]
+        heures = [m.heure for m in station.get_measurements()]
+        assert heures[-1] == "2025-02-11T11:00:00+00:00"
+        assert len(heures) == 3
+        service.close()
+
+    def test_incremental_without_new_records(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test un rafraîchissement incrémental sans nouvelle mesure."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station, = make_stations(1)
+
+        service = ApiService(incremental=True)
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+            fake_api_server.routes["/station/0"] = (200, {"results": []}, 0)
+            results = service.fetch_all([station])
+
+        assert results[0].success
+        assert results[0].not_modified
+        assert station.count_measurements() == 2
+        service.close()
+
+    def test_incremental_requests_keep_no_validators(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test que les validateurs restent limités à l'URL de la station."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station, = make_stations(1)
+
+        service = ApiService(incremental=True)
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+            for hour in range(11, 14):
+                fake_api_server.routes["/station/0"] = (200, {"results": [
+                    {"heure_de_paris": f"2025-02-11T{hour}:00:00+00:00",
+                     "temperature_en_degre_c": 16.0, "humidite": 70, "pression": 101350}
+                ]}, 0)
+                service.fetch_data_for_station(station, force_refresh=True)
+
+        assert list(service._validators) == [station.api_url]  # pylint: disable=protected-access
+        assert all("If-None-Match" not in headers
+                   for headers in fake_api_server.request_headers[1:])
+        assert station.count_measurements() == 5
+        service.close()
+
+    def test_latest_measurement_read_from_epochs(self, make_stations):
+        """Test que la dernière mesure datée est lue sans reconstruire la série."""
+        station, = make_stations(1)
+        station.add_measurements([
+            Measurement("2025-02-11T09:00:00+00:00", 14.0, 80, 101300),
+            Measurement("2025-02-11T10:00:00+00:00", 15.5, 75, 101325),
+            Measurement("inconnue", 16.0, 70, 101350),
+        ])
+
+        with patch.object(station.measurements, 'to_list') as mock_to_list:
+            latest = ApiService._latest_measurement(station)  # pylint: disable=protected-access
+
+        mock_to_list.assert_not_called()
+        assert latest.heure == "2025-02-11T10:00:00+00:00"
+        assert ApiService._latest_measurement(make_stations(1)[0]) is None  # pylint: disable=protected-access
+
+    def test_empty_station_gets_full_load(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test qu'une station vide est chargée complètement."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station, = make_stations(1)
+
+        service = ApiService(incremental=True)
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+
+        assert "where=" not in fake_api_server.request_paths[0]
+        assert station.count_measurements() == 2
+        service.close()
@@ -0,0 +1,112 @@
+"""
+Tests unitaires pour le parsing JSON en flux.
+"""
+import json
+import tracemalloc
+
+import pytest
+
+from weather_app.services.json_stream import iter_json_records
+
+
+def _chunks(data: bytes, size: int):
+    """Découpe des octets en blocs de `size` octets."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+RECORDS = [
+    {"heure_de_paris": "2025-01-01T10:00:00+00:00", "temperature_en_degre_c": 12.5,
+     "humidite": 70, "pression": 101325, "station": "Montréal-Gaillard"},
+    {"heure_de_paris": "2025-01-01T11:00:00+00:00", "temperature_en_degre_c": -3,
+     "humidite": 65, "pression": 101300, "station": None},
+]
+
+
+class TestIterJsonRecords:
+    """Tests pour la fonction iter_json_records."""
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 100000])
+    def test_results_object(self, size):
+        """Test la lecture de la clé results quel que soit le découpage."""
+        body = json.dumps({"total_count": 2, "results": RECORDS}).encode("utf-8")
+
+        assert list(iter_json_records(_chunks(body, size))) == RECORDS
+
+    @pytest.mark.parametrize("size", [1, 5, 100000])
+    def test_root_array(self, size):
+        """Test la lecture d'un export (liste à la racine)."""
+        body = json.dumps(RECORDS, indent=2).encode("utf-8")
+
+        assert list(iter_json_records(_chunks(body, size))) == RECORDS
+
+    def test_skips_other_keys(self):
+        """Test que les autres clés, même imbriquées, sont ignorées."""
+        body = json.dumps({
+            "links": [{"href": "x", "results": [1]}],
+            "meta": {"results": "non"},
+            "results": RECORDS,
+        }).encode("utf-8")
+
+        assert list(iter_json_records(_chunks(body, 3))) == RECORDS
+
+    def test_custom_key(self):
+        """Test la lecture d'une autre clé."""
+        body = json.dumps({"records": RECORDS}).encode("utf-8")
+
+        assert list(iter_json_records([body], key="records")) == RECORDS
+
+    def test_missing_key(self):
+        """Test qu'un document sans la clé ne produit rien."""
+        assert not list(iter_json_records([b'{"total_count": 0}']))
+
+    def test_empty_results(self):
+        """Test une liste vide."""
+        assert not list(iter_json_records([b'{"results": [ ] }']))
+
+    def test_truncated_stream(self):
+        """Test qu'un flux tronqué lève une ValueError."""
+        body = json.dumps({"results": RECORDS}).encode("utf-8")
+
+        with pytest.raises(ValueError):
+            list(iter_json_records(_chunks(body[:-20], 8)))
+
+    def test_invalid_document(self):
+        """Test qu'un document qui n'est ni objet ni liste est refusé."""
+        with pytest.raises(ValueError):
+            list(iter_json_records([b'"texte"']))
+
+    def test_records_available_before_end(self):
+        """Test que les premiers enregistrements sont produits avant la fin du flux."""
+        body = json.dumps({"results": RECORDS * 50}).encode("utf-8")
+        consumed = []
+
+        def source():
+            for chunk in _chunks(body, 64):
+                consumed.append(chunk)
+                yield chunk
+
+        records = iter_json_records(source())
+        assert next(records) == RECORDS[0]
+        assert len(consumed) < len(_chunks(body, 64)) // 10
+
+    def test_flat_memory(self):
+        """Test que la mémoire reste bornée pour un document volumineux."""
+        count = 100000
+        record = json.dumps(RECORDS[0]).encode("utf-8")
+
+        def source():
+            yield b'{"total_count": 100000, "results": ['
+            for i in range(count):
+                yield (b"," if i else b"") + record
+            yield b"]}"
+
+        tracemalloc.start()
+        try:
+            total = sum(1 for _ in iter_json_records(source()))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert total == count
+        # Le document complet dépasse 13 Mo
+        assert peak < 1024 * 1024
@@ -2,6 +2,8 @@
 Tests unitaires pour les classes de localisation.
 Test de l'héritage et des relations entre classes.
 """
+from unittest.mock import Mock
+
 from weather_app.models.location import Location, Pays, Ville, Station
 from weather_app.models.measurement import Measurement
 
@@ -260,6 +262,18 @@ class TestStation:
 
         assert len(station.get_measurements()) == 0
 
+    def test_count_measurements(self):
+        """Test le comptage des mesures."""
+        pays = Pays("fr001", "France")
+        ville = Ville("v001", "Toulouse", pays)
+        station = Station("s001", "Montaudran", ville, "https://api.com")
+
+        assert station.count_measurements() == 0
+
+        station.add_measurement(Measurement("2025-02-11T10:00:00+00:00", 20.0, 70, 101000))
+
+        assert station.count_measurements() == 1
+
     def test_get_info(self):
         """Test la méthode get_info."""
         pays = Pays("fr001", "France")
@@ -290,6 +304,52 @@ class TestStation:
         assert measurements1 == measurements2
         assert measurements1 is not measurements2
 
+    def test_max_measurements(self):
+        """Test qu'une station bornée ne garde que les mesures les plus récentes."""
+        pays = Pays("fr001", "France")
+        ville = Ville("v001", "Toulouse", pays)
+        station = Station("s001", "Montaudran", ville, "https://api.com", max_measurements=2)
+
+        for hour in range(10, 14):
+            station.add_measurement(Measurement(f"2025-02-11T{hour}:00:00+00:00", hour, 70, 1))
+
+        assert station.max_measurements == 2
+        assert station.count_measurements() == 2
+        assert [m.temperature for m in station.get_measurements()] == [12, 13]
+
+    def test_add_measurements_bulk(self):
+        """Test l'ajout de plusieurs mesures et l'accès à la série."""
+        pays = Pays("fr001", "France")
+        ville = Ville("v001", "Toulouse", pays)
+        station = Station("s001", "Montaudran", ville, "https://api.com")
+
+        station.add_measurements([
+            Measurement("2025-02-11T10:00:00+00:00", 20.0, 70, 101000),
+            Measurement("2025-02-11T11:00:00+00:00", 21.0, 68, 101100),
+        ])
+
+        assert station.count_measurements() == 2
+        assert station.measurements.temperatures().tolist() == [20.0, 21.0]
+
+    def test_observers_notified_with_columns(self):
+        """Test que les observateurs reçoivent les nouvelles mesures datées en colonnes."""
+        pays = Pays("fr001", "France")
+        ville = Ville("v001", "Toulouse", pays)
+        station = Station("s001", "Montaudran", ville, "https://api.com")
+        observer = Mock()
+        station.attach(observer)
+
+        station.add_measurements([
+            Measurement("2025-02-11T10:00:00+01:00", 20.0, 70, 101000),
+            Measurement("invalide", 21.0, 68, 101100),
+        ])
+
+        observer.update.assert_called_once_with(
+            station, epochs=[1739264400], temperatures=[20.0], humidites=[70],
+            pressions=[101000], utc_offsets=[60]
+        )
+        assert station.count_measurements() == 2
+
 
 class TestLocationHierarchy:
     """Tests de la hiérarchie complète."""
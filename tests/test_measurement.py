@@ -1,6 +1,9 @@
 """
 Tests unitaires pour la classe Measurement.
 """
+from datetime import datetime
+from unittest.mock import patch
+
 from weather_app.models.measurement import Measurement
 
 
@@ -204,3 +207,81 @@ class TestMeasurement:
 
         assert "11/02/2025 10:00" in m1.format_heure()
         assert "11/02/2025 10:00" in m2.format_heure()
+
+    def test_epoch(self):
+        """Test la conversion de l'heure en timestamp Unix."""
+        m1 = Measurement("2025-02-11T10:00:00+00:00", 20.0, 70, 101000)
+        m2 = Measurement("2025-02-11T11:00:00+01:00", 20.0, 70, 101000)
+        m3 = Measurement("2025-02-11T10:00:00Z", 20.0, 70, 101000)
+
+        assert m1.epoch == 1739268000
+        assert m2.epoch == m1.epoch
+        assert m3.epoch == m1.epoch
+
+    def test_epoch_invalid_heure(self):
+        """Test le timestamp d'une heure invalide."""
+        m = Measurement("invalid", 20.0, 70, 101000)
+
+        assert m.epoch is None
+
+    def test_equality(self):
+        """Test l'égalité et le hash de deux mesures identiques."""
+        m1 = Measurement("2025-02-11T10:00:00+00:00", 20.0, 70, 101000)
+        m2 = Measurement("2025-02-11T10:00:00+00:00", 20.0, 70, 101000)
+        m3 = Measurement("2025-02-11T10:00:00+00:00", 21.0, 70, 101000)
+
+        assert m1 == m2
+        assert hash(m1) == hash(m2)
+        assert m1 != m3
+        assert m1 != "2025-02-11T10:00:00+00:00"
+
+
+class TestMeasurementCompact:
+    """Tests de la représentation compacte de Measurement."""
+
+    def test_slots(self):
+        """Test que la mesure n'a pas de dictionnaire d'attributs."""
+        m = Measurement("2025-02-11T10:00:00+00:00", 20.0, 70, 101000)
+
+        assert not hasattr(m, "__dict__")
+
+    def test_utc_offset(self):
+        """Test le décalage UTC de l'heure d'origine."""
+        assert Measurement("2025-02-11T11:00:00+01:00", 20.0, 70, 101000).utc_offset == 60
+        assert Measurement("2025-02-11T10:00:00Z", 20.0, 70, 101000).utc_offset == 0
+        assert Measurement("2025-02-11T10:00:00", 20.0, 70, 101000).utc_offset is None
+        assert Measurement("invalid", 20.0, 70, 101000).utc_offset is None
+
+    def test_format_date_and_time(self):
+        """Test les libellés de date et d'heure, dans le fuseau d'origine."""
+        m = Measurement("2025-02-11T23:30:00-02:00", 20.0, 70, 101000)
+
+        assert m.format_heure() == "11/02/2025 23:30"
+        assert m.format_date() == "11/02/2025"
+        assert m.format_time() == "23h30"
+
+    def test_format_invalid_heure(self):
+        """Test les libellés d'une heure invalide."""
+        m = Measurement("invalid", 20.0, 70, 101000)
+
+        assert m.format_heure() == "invalid"
+        assert m.format_date() is None
+        assert m.format_time() is None
+
+    def test_timestamp_parsed_once(self):
+        """Test que l'heure n'est interprétée qu'à la construction."""
+        with patch('weather_app.models.measurement.datetime', wraps=datetime) as mock_dt:
+            m = Measurement("2025-02-11T10:00:00+00:00", 20.0, 70, 101000)
+            for _ in range(3):
+                _ = m.epoch
+                m.format_heure()
+                m.format_time()
+
+        assert mock_dt.fromisoformat.call_count == 1
+        assert mock_dt.fromtimestamp.call_count == 1
+
+    def test_heure_rebuilt_from_epoch(self):
+        """Test que l'heure d'origine est restituée à l'identique."""
+        for heure in ("2025-02-11T10:00:00+00:00", "2025-02-11T10:00:00-05:30",
+                      "2025-02-11T10:00:00Z", "2025-02-11T10:00:00.250000+00:00"):
+            assert Measurement(heure, 20.0, 70, 101000).heure == heure
@@ -0,0 +1,250 @@
+"""
+Tests unitaires pour la classe MeasurementSeries.
+"""
+from array import array
+
+import pytest
+
+from weather_app.models.measurement import Measurement
+from weather_app.models.measurement_series import MeasurementSeries
+
+
+def _hourly(count):
+    """Construit `count` mesures horaires à partir du 11/02/2025 10:00 UTC."""
+    return [
+        Measurement(f"2025-02-11T{10 + i:02d}:00:00+00:00", 10.0 + i, 70, 101000 + i)
+        for i in range(count)
+    ]
+
+
+class TestMeasurementSeries:
+    """Tests pour la classe MeasurementSeries."""
+
+    def test_empty_series(self):
+        """Test une série vide."""
+        series = MeasurementSeries()
+
+        assert len(series) == 0
+        assert not series.to_list()
+        assert series.nbytes == 0
+
+    def test_append_and_get(self):
+        """Test que les mesures sont restituées à l'identique."""
+        measurements = _hourly(3)
+        series = MeasurementSeries(measurements)
+
+        assert len(series) == 3
+        assert series.to_list() == measurements
+        assert series[0] == measurements[0]
+        assert series[-1] == measurements[-1]
+        assert list(series) == measurements
+
+    def test_decimal_humidite_and_pression(self):
+        """Test qu'une humidité ou une pression décimale est arrondie, sans erreur."""
+        series = MeasurementSeries([Measurement("2025-02-11T10:00:00+00:00", 15.5, 65.7, 101325.4)])
+        ring = MeasurementSeries(capacity=2)
+        ring.append(Measurement("2025-02-11T10:00:00+00:00", 15.5, 65.2, 101325.6))
+
+        assert (series[0].humidite, series[0].pression) == (66, 101325)
+        assert (ring[0].humidite, ring[0].pression) == (65, 101326)
+
+    def test_index_out_of_range(self):
+        """Test l'accès hors limites."""
+        series = MeasurementSeries(_hourly(1))
+
+        with pytest.raises(IndexError):
+            _ = series[1]
+
+    @pytest.mark.parametrize("heure", [
+        "2025-02-11T10:00:00+00:00",
+        "2025-02-11T11:00:00+01:00",
+        "2025-02-11T10:00:00Z",
+        "2025-02-11T10:00:00",
+        "2025-02-11T10:00:00.500000+00:00",
+        "invalid",
+        "",
+    ])
+    def test_heure_roundtrip(self, heure):
+        """Test que l'heure d'origine est conservée quel que soit son format."""
+        measurement = Measurement(heure, 15.5, 75, 101325)
+        series = MeasurementSeries([measurement])
+
+        assert series[0].heure == heure
+        assert series[0].epoch == measurement.epoch
+
+    def test_clear(self):
+        """Test l'effacement des mesures."""
+        series = MeasurementSeries(_hourly(3) + [Measurement("invalid", 1.0, 1, 1)])
+
+        series.clear()
+        series.append(Measurement("2025-02-11T10:00:00+00:00", 1.0, 1, 1))
+
+        assert len(series) == 1
+        assert series[0].heure == "2025-02-11T10:00:00+00:00"
+
+    def test_append_columns(self):
+        """Test l'ajout en bloc à partir de colonnes."""
+        series = MeasurementSeries()
+
+        series.append_columns(
+            array('q', [1739268000, 1739271600]), [12.5, 13.0], [70, 71], [101000, 101100],
+            utc_offset=60
+        )
+
+        assert len(series) == 2
+        assert series[0] == Measurement("2025-02-11T11:00:00+01:00", 12.5, 70, 101000)
+        assert series[1].epoch == 1739271600
+
+    def test_append_columns_per_row_offsets(self):
+        """Test l'ajout en bloc avec un décalage UTC par mesure."""
+        series = MeasurementSeries()
+
+        series.append_columns(
+            [1739268000, 1739268000], [1.0, 2.0], [70, 70], [101000, 101000],
+            utc_offsets=[0, -300]
+        )
+
+        assert series[0].heure == "2025-02-11T10:00:00+00:00"
+        assert series[1].heure == "2025-02-11T05:00:00-05:00"
+
+    def test_append_columns_length_mismatch(self):
+        """Test que des colonnes de longueurs différentes sont refusées."""
+        series = MeasurementSeries()
+
+        with pytest.raises(ValueError):
+            series.append_columns([1, 2], [1.0], [1, 2], [1, 2])
+        assert len(series) == 0
+
+    def test_column_views(self):
+        """Test que les colonnes sont exposées sans copie."""
+        series = MeasurementSeries(_hourly(5))
+
+        with series.temperatures(1, 3) as view:
+            assert view.tolist() == [11.0, 12.0]
+            assert view.obj is series.temperatures().obj
+        assert series.pressions().tolist() == [101000 + i for i in range(5)]
+        assert series.humidites()[0] == 70
+        assert series.epochs()[-1] - series.epochs()[0] == 4 * 3600
+
+    def test_view_blocks_growth(self):
+        """Test qu'une vue active empêche l'ajout de mesures."""
+        series = MeasurementSeries(_hourly(2))
+        view = series.epochs()
+
+        with pytest.raises(BufferError):
+            series.append(_hourly(1)[0])
+        view.release()
+        series.append(_hourly(1)[0])
+
+        assert len(series) == 3
+
+    def test_index_range(self):
+        """Test la recherche par intervalle de dates."""
+        series = MeasurementSeries(_hourly(10))
+        start_epoch = 1739268000
+
+        assert series.index_range() == (0, 10)
+        assert series.index_range(start_epoch + 3600, start_epoch + 3 * 3600) == (1, 4)
+        assert series.index_range(start_epoch + 1800) == (1, 10)
+        assert series.index_range(end_epoch=start_epoch - 1) == (0, 0)
+
+    def test_compact_storage(self):
+        """Test que la série occupe bien moins qu'une liste d'objets."""
+        series = MeasurementSeries(_hourly(10))
+
+        assert series.nbytes == 10 * 27
+
+
+class TestMeasurementSeriesRingBuffer:
+    """Tests pour le mode tampon circulaire de MeasurementSeries."""
+
+    def test_invalid_capacity(self):
+        """Test qu'une capacité nulle est refusée."""
+        with pytest.raises(ValueError):
+            MeasurementSeries(capacity=0)
+
+    def test_evicts_oldest(self):
+        """Test que les mesures les plus anciennes sont évincées."""
+        measurements = _hourly(7)
+        series = MeasurementSeries(capacity=3)
+
+        series.extend(measurements)
+
+        assert len(series) == 3
+        assert series.capacity == 3
+        assert series.to_list() == measurements[4:]
+        assert series[0] == measurements[4]
+        assert series[-1] == measurements[6]
+
+    def test_memory_is_fixed(self):
+        """Test que la mémoire allouée ne dépend pas du nombre d'ajouts."""
+        series = MeasurementSeries(capacity=4)
+        allocated = series.nbytes
+
+        series.extend(_hourly(10))
+
+        assert series.nbytes == allocated
+
+    def test_views_contiguous_after_wrap(self):
+        """Test que les vues restent contiguës et dans l'ordre après rotation."""
+        series = MeasurementSeries(_hourly(5), capacity=3)
+
+        assert series.temperatures().tolist() == [12.0, 13.0, 14.0]
+        assert series.pressions(1).tolist() == [101003, 101004]
+        assert series.epochs(-1)[0] == 1739268000 + 4 * 3600
+
+    def test_append_allowed_with_active_view(self):
+        """Test qu'une vue active n'empêche pas l'ajout dans le tampon."""
+        series = MeasurementSeries(_hourly(2), capacity=3)
+        view = series.temperatures()
+
+        series.append(_hourly(3)[2])
+
+        assert len(series) == 3
+        view.release()
+
+    def test_append_columns_wraps(self):
+        """Test l'ajout en bloc qui fait le tour du tampon."""
+        series = MeasurementSeries(_hourly(2), capacity=4)
+
+        series.append_columns(
+            [1739275200 + 3600 * i for i in range(3)], [20.0, 21.0, 22.0],
+            [70, 70, 70], [101000, 101000, 101000]
+        )
+
+        assert series.temperatures().tolist() == [11.0, 20.0, 21.0, 22.0]
+        series.append_columns(
+            [1739286000 + 3600 * i for i in range(6)], [float(i) for i in range(6)],
+            [70] * 6, [101000] * 6
+        )
+        assert series.temperatures().tolist() == [2.0, 3.0, 4.0, 5.0]
+        assert series[0].epoch == 1739286000 + 2 * 3600
+
+    def test_raw_heures_evicted(self):
+        """Test que les heures non reconstructibles suivent l'éviction."""
+        series = MeasurementSeries(capacity=2)
+        series.append(Measurement("invalid", 1.0, 1, 1))
+        series.append(Measurement("2025-02-11T10:00:00Z", 2.0, 1, 1))
+        series.append(Measurement("2025-02-11T11:00:00+00:00", 3.0, 1, 1))
+        series.append(Measurement("autre", 4.0, 1, 1))
+
+        assert [m.heure for m in series] == ["2025-02-11T11:00:00+00:00", "autre"]
+
+    def test_index_range_after_wrap(self):
+        """Test la recherche par dates dans un tampon ayant tourné."""
+        series = MeasurementSeries(_hourly(8), capacity=5)
+        start_epoch = 1739268000
+
+        assert series.index_range() == (0, 5)
+        assert series.index_range(start_epoch + 4 * 3600, start_epoch + 5 * 3600) == (1, 3)
+
+    def test_clear_keeps_capacity(self):
+        """Test que l'effacement conserve la capacité."""
+        series = MeasurementSeries(_hourly(4), capacity=3)
+
+        series.clear()
+        series.extend(_hourly(2))
+
+        assert len(series) == 2
+        assert series.capacity == 3
+        assert series.to_list() == _hourly(2)
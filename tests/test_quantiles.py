@@ -0,0 +1,159 @@
+"""
+Tests unitaires pour les sketches de quantiles (KLL).
+Test de la précision, de la mémoire bornée et de la fusion
+(station -> ville -> pays).
+"""
+import random
+
+import pytest
+
+from weather_app.analytics.quantiles import KllSketch, StationSketches
+from weather_app.analytics.service import AnalyticsService
+from weather_app.models.location import Pays, Ville, Station
+from weather_app.models.measurement import Measurement
+
+# Tolérance sur le rang, au-delà de l'erreur documentée (~1,7 % pour k = 200)
+RANK_TOLERANCE = 0.03
+
+
+def _exact_rank(values, value):
+    """Retourne la proportion exacte des valeurs inférieures ou égales."""
+    return sum(1 for item in values if item <= value) / len(values)
+
+
+class TestKllSketch:
+    """Tests pour la classe KllSketch."""
+
+    def test_invalid_k(self):
+        """Test qu'une précision trop faible est refusée."""
+        with pytest.raises(ValueError):
+            KllSketch(k=4)
+
+    def test_empty(self):
+        """Test un sketch vide."""
+        sketch = KllSketch()
+
+        assert sketch.quantile(0.5) is None
+        assert sketch.rank(1.0) == 0.0
+
+    def test_invalid_quantile(self):
+        """Test qu'un quantile hors de [0, 1] est refusé."""
+        with pytest.raises(ValueError):
+            KllSketch().quantile(1.5)
+
+    def test_exact_while_small(self):
+        """Test que les quantiles sont exacts tant qu'aucun compactage n'a eu lieu."""
+        sketch = KllSketch()
+        for value in range(1, 101):
+            sketch.add(float(value))
+
+        assert sketch.quantiles([0.0, 0.5, 0.95, 1.0]) == [1.0, 50.0, 95.0, 100.0]
+
+    def test_rank_error_bound(self):
+        """Test l'erreur de rang des percentiles sur 100 000 valeurs."""
+        generator = random.Random(7)
+        values = [generator.gauss(12.0, 6.0) for _ in range(100_000)]
+        sketch = KllSketch(seed=1)
+        for value in values:
+            sketch.add(value)
+
+        for q, estimate in zip((0.5, 0.95, 0.99), sketch.quantiles((0.5, 0.95, 0.99))):
+            assert abs(_exact_rank(values, estimate) - q) < RANK_TOLERANCE
+
+    def test_memory_bounded(self):
+        """Test que le nombre de valeurs conservées reste de l'ordre de 3k."""
+        sketch = KllSketch(k=100, seed=3)
+        for value in range(200_000):
+            sketch.add(float(value))
+
+        assert sketch.count == 200_000
+        assert sketch.retained < 3 * 100 + 50
+
+    def test_merge(self):
+        """Test que la fusion garde la précision et ne modifie pas l'autre sketch."""
+        generator = random.Random(11)
+        first_values = [generator.uniform(0, 10) for _ in range(30_000)]
+        second_values = [generator.uniform(20, 30) for _ in range(10_000)]
+        first, second = KllSketch(seed=1), KllSketch(seed=2)
+        for value in first_values:
+            first.add(value)
+        for value in second_values:
+            second.add(value)
+        second_count = second.count
+
+        first.merge(second)
+
+        all_values = first_values + second_values
+        assert first.count == 40_000
+        assert second.count == second_count
+        for q in (0.5, 0.8, 0.95):
+            assert abs(_exact_rank(all_values, first.quantile(q)) - q) < RANK_TOLERANCE
+
+    def test_merged_and_copy(self):
+        """Test la fusion de plusieurs sketches dans un nouveau sketch."""
+        sketches = []
+        for offset in range(3):
+            sketch = KllSketch()
+            sketch.add(float(offset))
+            sketches.append(sketch)
+
+        merged = KllSketch.merged(sketches)
+        copy = merged.copy()
+        copy.add(10.0)
+
+        assert merged.count == 3
+        assert merged.quantile(1.0) == 2.0
+        assert copy.count == 4
+
+
+class TestStationSketches:
+    """Tests pour la classe StationSketches."""
+
+    def test_unknown_field(self):
+        """Test qu'une grandeur inconnue est refusée."""
+        with pytest.raises(ValueError):
+            StationSketches(fields=('vent',))
+
+    def test_fields_updated(self):
+        """Test l'alimentation des sketches de température et d'humidité."""
+        sketches = StationSketches()
+        sketches.add_columns([1, 2, 3], [10.0, 20.0, 30.0], [40, 50, 60], [0, 0, 0],
+                             utc_offsets=[0, 0, 0])
+
+        assert sketches.sketch('temperature').quantile(0.5) == 20.0
+        assert sketches.sketch('humidite').quantile(1.0) == 60
+        with pytest.raises(KeyError):
+            sketches.sketch('pression')
+
+
+class TestLocationQuantiles:
+    """Tests pour les percentiles par station, ville et pays."""
+
+    def test_city_and_country_percentiles(self):
+        """Test les percentiles fusionnés depuis les sketches des stations."""
+        pays = Pays("fr001", "France")
+        toulouse = Ville("v001", "Toulouse", pays)
+        lyon = Ville("v002", "Lyon", pays)
+        pays.add_ville(toulouse)
+        pays.add_ville(lyon)
+        service = AnalyticsService()
+        for index, (ville, temperature) in enumerate(((toulouse, 10.0), (toulouse, 20.0),
+                                                      (lyon, 30.0))):
+            station = Station(f"s{index:03d}", f"Station{index}", ville, "https://api.com")
+            service.track(station)
+            station.add_measurements([
+                Measurement(f"2025-01-01T{hour:02d}:00:00+00:00", temperature, 50, 101000)
+                for hour in range(10)
+            ])
+
+        assert service.quantiles(toulouse.get_stations()[0], qs=(0.5,)) == [10.0]
+        assert service.quantiles(toulouse, qs=(0.25, 0.75)) == [10.0, 20.0]
+        assert service.quantiles(pays, qs=(0.5, 0.99)) == [20.0, 30.0]
+        assert service.sketch(lyon, 'humidite').count == 10
+
+    def test_untracked_station(self):
+        """Test une ville dont aucune station n'est suivie."""
+        ville = Ville("v001", "Toulouse", Pays("fr001", "France"))
+        Station("s001", "Montaudran", ville, "https://api.com")
+
+        assert AnalyticsService().quantiles(ville) == [None, None, None]
@@ -0,0 +1,125 @@
+"""
+Tests unitaires pour ResponseCache.
+Test de l'expiration, de l'éviction LRU et des compteurs.
+"""
+import pytest
+
+from weather_app.services.response_cache import ResponseCache
+
+
+class FakeClock:
+    """Horloge manuelle pour contrôler l'expiration."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache:
+    """Tests pour la classe ResponseCache."""
+
+    def test_invalid_limits(self):
+        """Test que des limites invalides sont refusées."""
+        with pytest.raises(ValueError):
+            ResponseCache(ttl=0)
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+        with pytest.raises(ValueError):
+            ResponseCache(max_bytes=0)
+
+    def test_put_and_get(self):
+        """Test le stockage puis la lecture d'une réponse."""
+        cache = ResponseCache()
+        cache.put("https://api.com/a", b"body")
+
+        assert cache.get("https://api.com/a") == b"body"
+        assert len(cache) == 1
+
+    def test_miss(self):
+        """Test la lecture d'une URL absente."""
+        cache = ResponseCache()
+
+        assert cache.get("https://api.com/a") is None
+        assert cache.get_stats()['misses'] == 1
+
+    def test_entry_expires(self):
+        """Test l'expiration d'une entrée après le TTL."""
+        clock = FakeClock()
+        cache = ResponseCache(ttl=60, clock=clock)
+        cache.put("https://api.com/a", b"body")
+
+        clock.now += 59
+        assert cache.get("https://api.com/a") == b"body"
+
+        clock.now += 1
+        assert cache.get("https://api.com/a") is None
+        assert cache.get_stats()['expirations'] == 1
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_entries(self):
+        """Test l'éviction de l'entrée la moins récemment utilisée."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")
+        cache.put("c", b"3")
+
+        assert cache.get("a") == b"1"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"3"
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_eviction_by_bytes(self):
+        """Test l'éviction quand la taille totale dépasse la limite."""
+        cache = ResponseCache(max_bytes=10)
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")
+        cache.put("c", b"123")
+
+        stats = cache.get_stats()
+        assert cache.get("a") is None
+        assert stats['bytes'] == 8
+        assert stats['entries'] == 2
+
+    def test_oversized_body_not_cached(self):
+        """Test qu'un corps trop gros n'est pas mis en cache."""
+        cache = ResponseCache(max_bytes=4)
+        cache.put("a", b"12345")
+
+        assert cache.get("a") is None
+        assert cache.get_stats()['bytes'] == 0
+
+    def test_put_replaces_entry(self):
+        """Test qu'un nouveau stockage remplace l'ancien."""
+        cache = ResponseCache()
+        cache.put("a", b"old")
+        cache.put("a", b"new!")
+
+        assert cache.get("a") == b"new!"
+        assert cache.get_stats()['bytes'] == 4
+
+    def test_invalidate_and_clear(self):
+        """Test la suppression d'entrées."""
+        cache = ResponseCache()
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+
+        cache.invalidate("a")
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get_stats()['bytes'] == 0
+
+    def test_hit_counter(self):
+        """Test le compteur de hits."""
+        cache = ResponseCache()
+        cache.put("a", b"1")
+        cache.get("a")
+        cache.get("a")
+
+        assert cache.get_stats()['hits'] == 2
@@ -0,0 +1,143 @@
+"""
+Tests unitaires pour les statistiques glissantes.
+Test des fenêtres, de l'expiration et de la mise à jour à l'ingestion.
+"""
+import random
+import statistics
+
+import pytest
+
+from weather_app.analytics.rolling import RollingStats, RollingWindow
+from weather_app.analytics.service import AnalyticsService
+from weather_app.models.location import Pays, Ville, Station
+from weather_app.models.measurement import Measurement
+
+BASE_EPOCH = 1_735_689_600  # 2025-01-01T00:00:00+00:00
+
+
+class TestRollingWindow:
+    """Tests pour la classe RollingWindow."""
+
+    def test_invalid_duration(self):
+        """Test qu'une durée invalide est refusée."""
+        with pytest.raises(ValueError):
+            RollingWindow(0)
+
+    def test_empty(self):
+        """Test une fenêtre vide."""
+        window = RollingWindow(3600)
+
+        assert window.count == 0
+        assert window.mean is None
+        assert window.minimum is None
+        assert window.stddev is None
+        assert window.rate is None
+
+    def test_statistics(self):
+        """Test moyenne, extrêmes, écart type et tendance."""
+        window = RollingWindow(3600)
+        for minute, value in ((0, 10.0), (20, 14.0), (40, 12.0)):
+            window.add(BASE_EPOCH + minute * 60, value)
+
+        assert window.mean == pytest.approx(12.0)
+        assert (window.minimum, window.maximum) == (10.0, 14.0)
+        assert window.stddev == pytest.approx(statistics.pstdev([10.0, 14.0, 12.0]))
+        assert window.rate == pytest.approx(3.0)  # +2 °C en 40 minutes
+
+    def test_old_values_expire(self):
+        """Test que les valeurs sorties de la fenêtre ne comptent plus."""
+        window = RollingWindow(3600)
+        window.add(BASE_EPOCH, 30.0)
+        window.add(BASE_EPOCH + 1800, 10.0)
+        window.add(BASE_EPOCH + 3600, 12.0)
+
+        assert window.count == 2
+        assert window.maximum == 12.0
+        assert window.mean == pytest.approx(11.0)
+
+    def test_expire_to_now(self):
+        """Test l'avancement de la fenêtre sans nouvelle valeur."""
+        window = RollingWindow(3600)
+        window.add(BASE_EPOCH, 5.0)
+
+        window.expire(BASE_EPOCH + 7200)
+
+        assert window.count == 0
+        assert window.maximum is None
+
+    def test_matches_full_recomputation(self):
+        """Test la cohérence avec un recalcul complet sur une longue série."""
+        generator = random.Random(42)
+        window = RollingWindow(3 * 3600)
+        history = []
+        for step in range(2000):
+            epoch = BASE_EPOCH + step * 600
+            value = 101000 + generator.uniform(-500, 500)
+            window.add(epoch, value)
+            history.append((epoch, value))
+
+        recent = [value for epoch, value in history if epoch > history[-1][0] - 3 * 3600]
+        assert window.count == len(recent)
+        assert window.mean == pytest.approx(statistics.fmean(recent))
+        assert window.minimum == min(recent)
+        assert window.maximum == max(recent)
+        assert window.stddev == pytest.approx(statistics.pstdev(recent), rel=1e-6)
+
+
+class TestRollingStats:
+    """Tests pour la classe RollingStats."""
+
+    def test_default_windows(self):
+        """Test les fenêtres par défaut."""
+        assert RollingStats().window_names == ('1h', '24h', '7d')
+
+    def test_windows_per_field(self):
+        """Test les statistiques de chaque grandeur sur chaque fenêtre."""
+        stats = RollingStats()
+        epochs = [BASE_EPOCH + hour * 3600 for hour in range(48)]
+        stats.add_columns(epochs, [float(h) for h in range(48)], [50] * 48,
+                          [101000 + h for h in range(48)], utc_offsets=[0] * 48)
+
+        assert stats.stats('temperature', '1h').count == 1
+        assert stats.stats('temperature', '24h').minimum == 24.0
+        assert stats.stats('pression', '7d').count == 48
+        assert stats.stats('humidite', '24h').stddev == 0.0
+
+    def test_duplicates_ignored(self):
+        """Test qu'une mesure déjà reçue n'est pas comptée deux fois."""
+        stats = RollingStats()
+        for _ in range(2):
+            stats.add_columns([BASE_EPOCH], [1.0], [50], [101000], utc_offsets=[0])
+
+        assert stats.stats(window='7d').count == 1
+
+    def test_unknown_window(self):
+        """Test une fenêtre inconnue."""
+        with pytest.raises(KeyError):
+            RollingStats().stats(window='1an')
+
+    def test_snapshot_with_now(self):
+        """Test l'instantané de toutes les grandeurs à une date donnée."""
+        stats = RollingStats({'1h': 3600})
+        stats.add_columns([BASE_EPOCH], [1.0], [50], [101000], utc_offsets=[0])
+
+        snapshot = stats.snapshot('1h', now=BASE_EPOCH + 7200)
+
+        assert set(snapshot) == {'temperature', 'humidite', 'pression'}
+        assert snapshot['temperature'].count == 0
+
+    def test_service_snapshot(self):
+        """Test l'instantané de toutes les stations suivies."""
+        pays = Pays("fr001", "France")
+        ville = Ville("v001", "Toulouse", pays)
+        service = AnalyticsService()
+        for index in range(3):
+            station = Station(f"s{index:03d}", f"Station{index}", ville, "https://api.com")
+            service.track(station)
+            station.add_measurement(
+                Measurement("2025-01-01T10:00:00+00:00", float(index), 80, 101000)
+            )
+
+        snapshot = service.snapshot('1h')
+
+        assert [snapshot[f"s{i:03d}"]['temperature'].mean for i in range(3)] == [0.0, 1.0, 2.0]
@@ -0,0 +1,257 @@
+"""
+Tests unitaires pour les agrégats précalculés.
+Test des agrégats, des résolutions, de la mise à jour à l'ingestion
+et du service d'analyse.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from weather_app.analytics.rollups import Aggregate, Rollup, StationRollups
+from weather_app.analytics.service import AnalyticsService
+from weather_app.models.location import Pays, Ville, Station
+from weather_app.models.measurement import Measurement
+from weather_app.storage.time_series_store import TimeSeriesStore
+
+BASE_EPOCH = 1_735_689_600  # 2025-01-01T00:00:00+00:00
+
+
+def _columns(count, step=600, start=0):
+    """Colonnes de `count` mesures espacées de `step` secondes."""
+    epochs = [BASE_EPOCH + start + step * i for i in range(count)]
+    return {
+        'epochs': epochs,
+        'temperatures': [float(i % 10) for i in range(count)],
+        'humidites': [50 + i % 5 for i in range(count)],
+        'pressions': [101000 + i for i in range(count)],
+        'utc_offsets': [0] * count,
+    }
+
+
+def _add(rollups, columns):
+    """Agrège des colonnes produites par _columns."""
+    return rollups.add_columns(
+        columns['epochs'], columns['temperatures'], columns['humidites'],
+        columns['pressions'], utc_offsets=columns['utc_offsets']
+    )
+
+
+def _station():
+    """Crée une station de test."""
+    ville = Ville("v001", "Toulouse", Pays("fr001", "France"))
+    return Station("s001", "Montaudran", ville, "https://api.com")
+
+
+class TestAggregate:
+    """Tests pour la classe Aggregate."""
+
+    def test_empty(self):
+        """Test un agrégat vide."""
+        assert Aggregate().count == 0
+        assert Aggregate().mean is None
+
+    def test_add(self):
+        """Test le minimum, le maximum et la moyenne."""
+        aggregate = Aggregate()
+        for value in (3.0, -1.0, 7.0):
+            aggregate.add(value)
+
+        assert (aggregate.minimum, aggregate.maximum, aggregate.mean) == (-1.0, 7.0, 3.0)
+
+    def test_merge(self):
+        """Test la fusion de deux agrégats."""
+        first, second = Aggregate(), Aggregate()
+        first.add(1.0)
+        second.add(5.0)
+        second.add(6.0)
+
+        first.merge(second)
+
+        assert first.count == 3
+        assert first.mean == 4.0
+        assert first.maximum == 6.0
+
+
+class TestRollup:
+    """Tests pour la classe Rollup."""
+
+    def test_invalid_resolution(self):
+        """Test qu'une résolution invalide est refusée."""
+        with pytest.raises(ValueError):
+            Rollup(0)
+
+    def test_buckets_aligned(self):
+        """Test le regroupement des mesures par heure."""
+        rollup = Rollup(3600)
+        for minute in (0, 20, 59, 60, 130):
+            rollup.add((BASE_EPOCH + minute * 60, 0, 10.0, 50, 101000))
+
+        assert [b.count for b in rollup.buckets()] == [3, 1, 1]
+        assert rollup.buckets()[1].start == BASE_EPOCH + 3600
+
+    def test_daily_buckets_follow_local_time(self):
+        """Test qu'un agrégat journalier couvre une journée locale."""
+        rollup = Rollup(86400)
+        # 23h30 UTC le 31/12 = 00h30 le 01/01 à Paris (+01:00)
+        rollup.add((BASE_EPOCH - 1800, 60, 1.0, 50, 101000))
+        rollup.add((BASE_EPOCH + 3600, 60, 3.0, 50, 101000))
+
+        bucket, = rollup.buckets()
+
+        assert bucket.start == BASE_EPOCH - 3600
+        assert bucket.temperature.mean == 2.0
+
+    def test_out_of_order(self):
+        """Test qu'une mesure plus ancienne est rangée dans le bon intervalle."""
+        rollup = Rollup(600)
+        rollup.add((BASE_EPOCH + 1200, 0, 1.0, 50, 101000))
+        rollup.add((BASE_EPOCH, 0, 2.0, 50, 101000))
+
+        assert [b.start for b in rollup.buckets()] == [BASE_EPOCH, BASE_EPOCH + 1200]
+
+    def test_buckets_time_window(self):
+        """Test la sélection des intervalles qui recoupent une période."""
+        rollup = Rollup(3600)
+        for hour in range(6):
+            rollup.add((BASE_EPOCH + hour * 3600, 0, float(hour), 50, 101000))
+
+        buckets = rollup.buckets(BASE_EPOCH + 3600 + 1800, BASE_EPOCH + 3 * 3600)
+
+        assert [b.temperature.mean for b in buckets] == [1.0, 2.0, 3.0]
+
+    def test_first_start(self):
+        """Test le début du plus ancien intervalle, même ajouté en retard."""
+        rollup = Rollup(3600)
+        assert rollup.first_start is None
+
+        rollup.add((BASE_EPOCH + 7200, 0, 1.0, 50, 101000))
+        rollup.add((BASE_EPOCH + 60, 0, 2.0, 50, 101000))
+
+        assert rollup.first_start == BASE_EPOCH
+
+
+class TestStationRollups:
+    """Tests pour la classe StationRollups."""
+
+    def test_all_resolutions_updated(self):
+        """Test que chaque mesure alimente toutes les résolutions."""
+        rollups = StationRollups()
+        _add(rollups, _columns(144, step=600))
+
+        assert len(rollups.rollup(600)) == 144
+        assert len(rollups.rollup(3600)) == 24
+        assert len(rollups.rollup(86400)) == 1
+        assert rollups.rollup(86400).buckets()[0].count == 144
+
+    def test_duplicates_ignored(self):
+        """Test qu'une fenêtre déjà agrégée n'est pas comptée deux fois."""
+        rollups = StationRollups()
+        assert _add(rollups, _columns(10)) == 10
+
+        assert _add(rollups, _columns(15)) == 5
+        assert sum(b.count for b in rollups.rollup(86400).buckets()) == 15
+
+    def test_invalid_epoch_ignored(self):
+        """Test que les mesures sans heure valide ne sont pas agrégées."""
+        rollups = StationRollups()
+        rollups.add_columns([-(2 ** 63), BASE_EPOCH], [1.0, 2.0], [50, 50], [1, 1],
+                            utc_offsets=[0, 0])
+
+        assert rollups.rollup(600).buckets()[0].temperature.mean == 2.0
+
+    def test_resolution_for(self):
+        """Test le choix de la résolution la plus large adaptée à la période."""
+        rollups = StationRollups()
+
+        assert rollups.resolution_for(0, 30 * 86400) == 86400
+        assert rollups.resolution_for(0, 2 * 86400) == 3600
+        assert rollups.resolution_for(0, 3 * 3600) == 600
+
+    def test_query_picks_coarsest(self):
+        """Test qu'une longue période est lue en agrégats journaliers."""
+        rollups = StationRollups()
+        _add(rollups, _columns(40 * 24, step=3600))
+
+        resolution, buckets = rollups.query()
+
+        assert resolution == 86400
+        assert len(buckets) == 40
+
+    def test_query_reads_only_chosen_resolution(self):
+        """Test que seuls les intervalles de la résolution choisie sont lus."""
+        rollups = StationRollups()
+        _add(rollups, _columns(40 * 24, step=3600))
+
+        with patch.object(Rollup, 'buckets', autospec=True, return_value=[]) as mock_buckets:
+            resolution, _ = rollups.query()
+
+        assert resolution == 86400
+        mock_buckets.assert_called_once_with(rollups.rollup(86400), None, None)
+
+    def test_query_empty(self):
+        """Test une requête sans mesure."""
+        assert StationRollups().query() == (600, [])
+
+    def test_observes_station(self):
+        """Test la mise à jour à chaque ajout de mesures sur la station."""
+        station = _station()
+        rollups = StationRollups()
+        station.attach(rollups)
+
+        station.add_measurement(Measurement("2025-01-01T10:00:00+00:00", 5.0, 80, 101000))
+        columns = _columns(3, start=12 * 3600)
+        station.append_columns(
+            columns['epochs'], columns['temperatures'], columns['humidites'],
+            columns['pressions'], utc_offsets=columns['utc_offsets']
+        )
+
+        assert rollups.rollup(86400).buckets()[0].count == 4
+        assert rollups.latest_epoch == columns['epochs'][-1]
+
+
+class TestAnalyticsService:
+    """Tests pour la classe AnalyticsService."""
+
+    def test_track_aggregates_current_measurements(self):
+        """Test que les mesures déjà présentes sont agrégées au suivi."""
+        station = _station()
+        station.add_measurement(Measurement("2025-01-01T10:00:00+00:00", 5.0, 80, 101000))
+        service = AnalyticsService()
+
+        rollups = service.track(station).rollups
+        station.add_measurement(Measurement("2025-01-01T11:00:00+00:00", 7.0, 80, 101000))
+
+        assert rollups.rollup(86400).buckets()[0].temperature.mean == 6.0
+        assert service.rollups("s001") is rollups
+        assert service.rolling("s001").stats(window="24h").count == 2
+
+    def test_rollups_survive_new_station_instance(self):
+        """Test que les agrégats sont rattachés à une nouvelle instance de la station."""
+        service = AnalyticsService()
+        first = _station()
+        first.add_measurement(Measurement("2025-01-01T10:00:00+00:00", 5.0, 80, 101000))
+        service.track(first)
+
+        second = _station()
+        second.add_measurements([
+            Measurement("2025-01-01T10:00:00+00:00", 5.0, 80, 101000),
+            Measurement("2025-01-01T12:00:00+00:00", 9.0, 80, 101000),
+        ])
+        rollups = service.track(second).rollups
+
+        assert rollups.rollup(86400).buckets()[0].count == 2
+
+    def test_track_seeds_from_store(self):
+        """Test l'initialisation depuis la base historique."""
+        with TimeSeriesStore(':memory:') as store:
+            store.add_rows("s001", [(BASE_EPOCH + 86400 * day, 0, 1.0, 50, 101000)
+                                    for day in range(3)])
+            service = AnalyticsService(store=store)
+
+            rollups = service.track(_station()).rollups
+
+            assert len(rollups.rollup(86400)) == 3
+
+    def test_unknown_station(self):
+        """Test une station non suivie."""
+        assert AnalyticsService().rollups("inconnue") is None
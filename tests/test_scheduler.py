@@ -0,0 +1,213 @@
+"""
+Tests unitaires pour l'ordonnanceur de tâches périodiques.
+Test des échéances, du jitter, du non-chevauchement et de l'arrêt.
+"""
+import logging
+import random
+import threading
+import time
+
+import pytest
+
+from weather_app.services.scheduler import PollScheduler
+
+
+class FakeClock:
+    """Horloge contrôlée par le test."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self):
+        """Démarre l'horloge à zéro."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Retourne l'instant courant."""
+        return self.now
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    """Attend qu'une condition soit vraie."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition non remplie à temps"
+        time.sleep(0.005)
+
+
+class TestPollScheduler:
+    """Tests pour la classe PollScheduler."""
+
+    def test_invalid_arguments(self):
+        """Test que les paramètres invalides sont refusés."""
+        with pytest.raises(ValueError):
+            PollScheduler(max_workers=0)
+        with pytest.raises(ValueError):
+            PollScheduler(jitter=1.5)
+
+        scheduler = PollScheduler()
+        with pytest.raises(ValueError):
+            scheduler.schedule("s1", 0, lambda: None)
+        scheduler.schedule("s1", 60, lambda: None)
+        with pytest.raises(ValueError):
+            scheduler.schedule("s1", 60, lambda: None)
+        scheduler.shutdown()
+
+    def test_runs_when_due(self):
+        """Test qu'une tâche ne part qu'à son échéance, puis à chaque intervalle."""
+        clock = FakeClock()
+        calls = []
+        scheduler = PollScheduler(jitter=0, clock=clock)
+        job = scheduler.schedule("s1", 60, lambda: calls.append(clock.now), delay=10)
+
+        assert scheduler.run_pending() == 0
+        clock.now = 10
+        assert scheduler.run_pending() == 1
+        _wait_for(lambda: job.runs == 1)
+        assert scheduler.next_due() == 70
+
+        clock.now = 69
+        assert scheduler.run_pending() == 0
+        clock.now = 70
+        assert scheduler.run_pending() == 1
+        _wait_for(lambda: job.runs == 2)
+        scheduler.shutdown()
+        assert calls == [10, 70]
+
+    def test_per_job_intervals(self):
+        """Test que chaque tâche garde son propre intervalle."""
+        clock = FakeClock()
+        scheduler = PollScheduler(jitter=0, clock=clock)
+        fast = scheduler.schedule("fast", 10, lambda: None, delay=0)
+        slow = scheduler.schedule("slow", 30, lambda: None, delay=0)
+
+        for now in range(0, 31, 10):
+            clock.now = now
+            scheduler.run_pending()
+            _wait_for(lambda: not scheduler._running)  # pylint: disable=protected-access
+        scheduler.shutdown()
+
+        assert (fast.runs, slow.runs) == (4, 2)
+
+    def test_jitter_spreads_due_times(self):
+        """Test que le jitter étale les échéances dans les bornes prévues."""
+        clock = FakeClock()
+        scheduler = PollScheduler(jitter=0.2, clock=clock, rng=random.Random(1))
+        for i in range(50):
+            scheduler.schedule(f"s{i}", 100, lambda: None)
+
+        # pylint: disable=protected-access
+        first = sorted(due for due, _, _ in scheduler._due)
+        assert 0 <= first[0] and first[-1] <= 20
+        assert len(set(first)) == 50
+
+        clock.now = 20
+        scheduler.run_pending()
+        following = [due for due, _, _ in scheduler._due]
+        scheduler.shutdown()
+        assert all(80 <= due <= 140 for due in following)
+        assert len(set(following)) == 50
+
+    def test_no_overlap(self):
+        """Test qu'une tâche encore en cours n'est pas relancée."""
+        clock = FakeClock()
+        release = threading.Event()
+        scheduler = PollScheduler(jitter=0, clock=clock)
+        job = scheduler.schedule("s1", 10, release.wait, delay=0)
+
+        assert scheduler.run_pending() == 1
+        clock.now = 10
+        assert scheduler.run_pending() == 0
+        assert job.skipped == 1
+
+        release.set()
+        _wait_for(lambda: job.runs == 1)
+        clock.now = 20
+        assert scheduler.run_pending() == 1
+        scheduler.shutdown()
+
+    def test_missed_deadlines_not_replayed(self):
+        """Test qu'un retard ne provoque pas une rafale d'exécutions."""
+        clock = FakeClock()
+        scheduler = PollScheduler(jitter=0, clock=clock)
+        scheduler.schedule("s1", 10, lambda: None, delay=0)
+
+        clock.now = 1000
+        assert scheduler.run_pending() == 1
+        assert scheduler.next_due() == 1010
+        scheduler.shutdown()
+
+    def test_failures_counted(self):
+        """Test qu'une tâche en erreur reste programmée."""
+        clock = FakeClock()
+        scheduler = PollScheduler(jitter=0, clock=clock)
+
+        def fail():
+            raise RuntimeError("boom")
+
+        job = scheduler.schedule("s1", 10, fail, delay=0)
+        scheduler.run_pending()
+        _wait_for(lambda: job.runs == 1)
+        scheduler.shutdown()
+
+        assert job.failures == 1
+        assert scheduler.next_due() == 10
+
+    def test_failures_logged(self, caplog):
+        """Test que l'erreur d'une tâche est journalisée avec sa trace."""
+        clock = FakeClock()
+        scheduler = PollScheduler(jitter=0, clock=clock)
+
+        def fail():
+            raise RuntimeError("boom")
+
+        job = scheduler.schedule("s1", 10, fail, delay=0)
+        with caplog.at_level(logging.ERROR, logger="weather_app.services.scheduler"):
+            scheduler.run_pending()
+            _wait_for(lambda: job.runs == 1)
+            scheduler.shutdown()
+
+        record, = caplog.records
+        assert "s1" in record.getMessage()
+        assert record.exc_info[1].args == ("boom",)
+
+    def test_run_until_stopped(self):
+        """Test que run s'arrête sur l'événement et attend les tâches en cours."""
+        finished = []
+        stop = threading.Event()
+        scheduler = PollScheduler(jitter=0)
+
+        def task():
+            stop.set()
+            time.sleep(0.05)
+            finished.append(True)
+
+        scheduler.schedule("s1", 3600, task, delay=0)
+        thread = threading.Thread(target=scheduler.run, args=(stop, 0.01))
+        thread.start()
+        thread.join(timeout=2)
+
+        assert not thread.is_alive()
+        assert finished == [True]
+
+    def test_shutdown_cancels_queued_jobs(self):
+        """Test que l'arrêt n'attend que les exécutions déjà commencées."""
+        clock = FakeClock()
+        started = threading.Event()
+        release = threading.Event()
+        scheduler = PollScheduler(max_workers=1, jitter=0, clock=clock)
+
+        def blocking():
+            started.set()
+            release.wait()
+
+        first = scheduler.schedule("s0", 60, blocking, delay=0)
+        queued = [scheduler.schedule(f"s{i}", 60, lambda: None, delay=0) for i in range(1, 5)]
+        assert scheduler.run_pending() == 5
+        started.wait(timeout=2)
+
+        threading.Timer(0.05, release.set).start()
+        scheduler.shutdown()
+
+        assert first.runs == 1
+        assert all(job.runs == 0 for job in queued)
+        assert not scheduler._running  # pylint: disable=protected-access
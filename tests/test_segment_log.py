@@ -0,0 +1,250 @@
+"""
+Tests unitaires pour SegmentLog.
+Test de l'ajout, des lectures par projection mémoire, du changement de
+segment et du compactage.
+"""
+import os
+
+import pytest
+
+from weather_app.models.measurement import Measurement
+from weather_app.storage.segment_log import RECORD, SegmentLog
+
+BASE_EPOCH = 1_735_689_600  # 2025-01-01T00:00:00+00:00
+
+
+def _rows(count, start=0):
+    """Lignes horaires (epoch, décalage, température, humidité, pression)."""
+    return [
+        (BASE_EPOCH + 3600 * i, 60, 10.0 + i / 10, 50 + i % 50, 101000 + i)
+        for i in range(start, start + count)
+    ]
+
+
+class TestSegmentLog:
+    """Tests pour la classe SegmentLog."""
+
+    def test_invalid_segment_size(self, temp_data_dir):
+        """Test qu'une taille de segment invalide est refusée."""
+        with pytest.raises(ValueError):
+            SegmentLog(temp_data_dir, segment_records=0)
+
+    def test_add_rows_and_query(self, temp_data_dir):
+        """Test l'ajout puis la relecture des mesures d'une station."""
+        with SegmentLog(temp_data_dir) as log:
+            assert log.add_rows("s001", _rows(5)) == 5
+
+            series = log.query("s001")
+
+            assert len(series) == 5
+            assert list(series.epochs()) == [row[0] for row in _rows(5)]
+            assert series[0].heure == "2025-01-01T01:00:00+01:00"
+            assert [m.temperature for m in series] == [10.0, 10.1, 10.2, 10.3, 10.4]
+            assert series[4].pression == 101004
+
+    def test_fixed_width_records(self, temp_data_dir):
+        """Test la taille des fichiers segments (19 octets par mesure)."""
+        with SegmentLog(temp_data_dir) as log:
+            log.add_rows("s001", _rows(10))
+
+            assert RECORD.size == 19
+            assert sum(view.nbytes for view in log.records("s001")) == 10 * 19
+
+    def test_older_rows_ignored(self, temp_data_dir):
+        """Test que les mesures déjà enregistrées ne sont pas ajoutées une seconde fois."""
+        with SegmentLog(temp_data_dir) as log:
+            log.add_rows("s001", _rows(3))
+
+            assert log.add_rows("s001", _rows(5)) == 2
+            assert log.count("s001") == 5
+
+    def test_unsorted_rows(self, temp_data_dir):
+        """Test que les lignes reçues dans le désordre sont triées."""
+        with SegmentLog(temp_data_dir) as log:
+            log.add_rows("s001", reversed(_rows(4)))
+
+            epochs = [row[0] for row in log.iter_rows("s001")]
+
+            assert epochs == sorted(epochs)
+
+    def test_value_out_of_range(self, temp_data_dir):
+        """Test qu'une valeur hors du champ binaire est refusée sans rien écrire."""
+        with SegmentLog(temp_data_dir) as log:
+            with pytest.raises(ValueError):
+                log.add_rows("s001", [(BASE_EPOCH, 0, 10.0, 300, 101000)])
+            assert log.count("s001") == 0
+
+    def test_records_time_window(self, temp_data_dir):
+        """Test la recherche par intervalle, bornes incluses, sur plusieurs segments."""
+        with SegmentLog(temp_data_dir, segment_records=4) as log:
+            log.add_rows("s001", _rows(10))
+
+            rows = list(log.iter_rows(
+                "s001", start_epoch=BASE_EPOCH + 3600 * 3, end_epoch=BASE_EPOCH + 3600 * 6
+            ))
+
+            assert [row[4] for row in rows] == [101003, 101004, 101005, 101006]
+
+    def test_records_are_zero_copy_views(self, temp_data_dir):
+        """Test que les enregistrements sont exposés en memoryview sur le fichier projeté."""
+        with SegmentLog(temp_data_dir) as log:
+            log.add_rows("s001", _rows(3))
+
+            view = log.records("s001")[0]
+
+            assert isinstance(view, memoryview)
+            assert view.readonly
+            assert RECORD.unpack_from(view, RECORD.size)[0] == BASE_EPOCH + 3600
+            view.release()
+
+    def test_empty_window(self, temp_data_dir):
+        """Test un intervalle sans mesure et une station inconnue."""
+        with SegmentLog(temp_data_dir) as log:
+            log.add_rows("s001", _rows(3))
+
+            assert not log.records("s001", start_epoch=BASE_EPOCH + 3600 * 10)
+            assert len(log.query("inconnue")) == 0
+            assert log.latest_epoch("inconnue") is None
+
+    def test_segment_rollover(self, temp_data_dir):
+        """Test l'ouverture d'un nouveau segment quand le précédent est plein."""
+        with SegmentLog(temp_data_dir, segment_records=4) as log:
+            log.add_rows("s001", _rows(3))
+            log.add_rows("s001", _rows(7, start=3))
+
+            assert log.segment_count("s001") == 3
+            assert log.count("s001") == 10
+            assert log.latest_epoch("s001") == BASE_EPOCH + 3600 * 9
+
+    def test_reads_see_appended_rows(self, temp_data_dir):
+        """Test qu'une lecture après un ajout voit les nouvelles mesures du segment actif."""
+        with SegmentLog(temp_data_dir) as log:
+            log.add_rows("s001", _rows(2))
+            assert len(log.query("s001")) == 2
+
+            log.add_rows("s001", _rows(2, start=2))
+
+            assert len(log.query("s001")) == 4
+
+    def test_persists_across_instances(self, temp_data_dir):
+        """Test que le journal est relu après réouverture."""
+        with SegmentLog(temp_data_dir, segment_records=4) as log:
+            log.add_rows("s001", _rows(6))
+            log.add_rows("station/2", _rows(1))
+
+        with SegmentLog(temp_data_dir, segment_records=4) as log:
+            assert log.count() == 7
+            assert log.station_ids() == ["s001", "station/2"]
+            assert log.add_rows("s001", _rows(7)) == 1
+
+    def test_truncated_record_dropped(self, temp_data_dir):
+        """Test qu'un enregistrement incomplet (écriture interrompue) est ignoré."""
+        with SegmentLog(temp_data_dir) as log:
+            log.add_rows("s001", _rows(3))
+            path = os.path.join(temp_data_dir, "s001", "gen-000001", "000000.seg")
+        with open(path, 'ab') as f:
+            f.write(b'\x01\x02\x03')
+
+        with SegmentLog(temp_data_dir) as log:
+            assert log.count("s001") == 3
+            assert log.add_rows("s001", _rows(1, start=3)) == 1
+            assert log.latest_epoch("s001") == BASE_EPOCH + 3600 * 3
+
+    def test_add_measurements(self, temp_data_dir):
+        """Test l'enregistrement d'objets Measurement, sans les heures invalides."""
+        measurements = [
+            Measurement("2025-01-01T10:00:00+01:00", 5.5, 80, 101000),
+            Measurement("pas une date", 6.0, 81, 101001),
+        ]
+        with SegmentLog(temp_data_dir) as log:
+            assert log.add_measurements("s001", measurements) == 1
+
+            measurement, = log.query("s001")
+
+            assert measurement == measurements[0]
+
+    def test_sink(self, temp_data_dir):
+        """Test le sink utilisable pour l'historique paginé."""
+        with SegmentLog(temp_data_dir) as log:
+            log.sink("s001")([Measurement("2025-01-01T10:00:00+00:00", 5.0, 80, 101000)])
+
+            assert log.count("s001") == 1
+
+
+class TestSegmentLogCompaction:
+    """Tests pour le compactage du journal."""
+
+    def test_compact_merges_segments(self, temp_data_dir):
+        """Test que des segments partiels sont regroupés en segments pleins."""
+        with SegmentLog(temp_data_dir, segment_records=4) as log:
+            log.add_rows("s001", _rows(10))
+            before = list(log.iter_rows("s001"))
+
+            assert log.compact("s001") == 0
+            assert log.segment_count("s001") == 3
+            assert list(log.iter_rows("s001")) == before
+
+    def test_compact_drops_old_rows(self, temp_data_dir):
+        """Test la suppression des mesures antérieures à une date."""
+        with SegmentLog(temp_data_dir, segment_records=4) as log:
+            log.add_rows("s001", _rows(10))
+
+            removed = log.compact("s001", before_epoch=BASE_EPOCH + 3600 * 6)
+
+            assert removed == 6
+            assert log.segment_count("s001") == 1
+            assert [row[4] for row in log.iter_rows("s001")] == [
+                101006, 101007, 101008, 101009
+            ]
+
+    def test_compact_switches_generation(self, temp_data_dir):
+        """Test que l'ancienne génération est supprimée et la nouvelle relue."""
+        with SegmentLog(temp_data_dir, segment_records=4) as log:
+            log.add_rows("s001", _rows(10))
+            log.compact("s001", before_epoch=BASE_EPOCH + 3600 * 2)
+            log.add_rows("s001", _rows(1, start=10))
+
+        assert sorted(os.listdir(os.path.join(temp_data_dir, "s001"))) == [
+            "CURRENT", "gen-000002"
+        ]
+        with SegmentLog(temp_data_dir, segment_records=4) as log:
+            assert log.count("s001") == 9
+
+    def test_interrupted_compaction_ignored(self, temp_data_dir):
+        """Test qu'une génération non activée (compactage interrompu) est supprimée."""
+        with SegmentLog(temp_data_dir) as log:
+            log.add_rows("s001", _rows(3))
+        orphan = os.path.join(temp_data_dir, "s001", "gen-000002")
+        os.makedirs(orphan)
+        with open(os.path.join(orphan, "000000.seg"), 'wb') as f:
+            f.write(b'\x00' * RECORD.size)
+
+        with SegmentLog(temp_data_dir) as log:
+            assert log.count("s001") == 3
+        assert not os.path.exists(orphan)
+
+    def test_compact_everything(self, temp_data_dir):
+        """Test un compactage qui supprime toutes les mesures."""
+        with SegmentLog(temp_data_dir) as log:
+            log.add_rows("s001", _rows(3))
+
+            assert log.compact("s001", before_epoch=BASE_EPOCH + 3600 * 100) == 3
+            assert log.count("s001") == 0
+            assert log.add_rows("s001", _rows(1)) == 1
+
+    def test_compact_with_open_view(self, temp_data_dir):
+        """Test qu'une vue encore ouverte reste lisible pendant le compactage."""
+        with SegmentLog(temp_data_dir) as log:
+            log.add_rows("s001", _rows(3))
+            view = log.records("s001")[0]
+
+            log.compact("s001", before_epoch=BASE_EPOCH + 3600)
+
+            assert RECORD.unpack_from(view)[0] == BASE_EPOCH
+            assert log.count("s001") == 2
+            view.release()
+
+    def test_compact_unknown_station(self, temp_data_dir):
+        """Test le compactage d'une station sans journal."""
+        with SegmentLog(temp_data_dir) as log:
+            assert log.compact("inconnue") == 0
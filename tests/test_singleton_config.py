@@ -2,10 +2,15 @@
 Tests unitaires pour le Singleton Configuration.
 Test du pattern Singleton et de la persistance.
 """
+import json
 import os
 from unittest.mock import patch
 
-from weather_app.config.singleton_config import ConfigurationSingleton
+import pytest
+
+from weather_app.config.json_backend import JsonConfigBackend
+from weather_app.config.singleton_config import DEFAULT_POLL_INTERVAL, ConfigurationSingleton
+from weather_app.config.sqlite_backend import SqliteConfigBackend, migrate_json_config
 
 
 class TestConfigurationSingleton:
@@ -411,3 +416,381 @@ class TestConfigurationSingleton:
             pays = config2.get_pays()
             assert "fr001" in pays
             assert pays["fr001"]["nom"] == "France"
+
+
+class TestConfigurationDataDir:
+    """Tests pour l'accès au répertoire de données."""
+
+    # pylint: disable=too-few-public-methods
+
+    def test_data_dir_property(self, temp_data_dir):
+        """Test l'exposition du répertoire de données."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+
+            # pylint: disable=protected-access
+            ConfigurationSingleton._instance = None
+            ConfigurationSingleton._initialized = False
+            # pylint: enable=protected-access
+
+            config = ConfigurationSingleton()
+
+            assert config.data_dir == os.path.join(temp_data_dir, 'data')
+
+
+def _fresh_config():
+    """Crée une nouvelle instance du singleton."""
+    # pylint: disable=protected-access
+    ConfigurationSingleton._instance = None
+    ConfigurationSingleton._initialized = False
+    # pylint: enable=protected-access
+    return ConfigurationSingleton()
+
+
+class TestConfigurationMaxMeasurements:
+    """Tests pour la limite de mesures conservées par station."""
+
+    def test_unlimited_by_default(self, temp_data_dir):
+        """Test qu'aucune limite n'est définie par défaut."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+
+            assert config.get_max_measurements() is None
+            assert config.get_max_measurements("s001") is None
+
+    def test_global_and_station_limits(self, temp_data_dir):
+        """Test que la limite d'une station est prioritaire sur la limite globale."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            config.add_station("s001", "Montaudran", "v001", "https://api.com")
+            config.add_station("s002", "Compans", "v001", "https://api.com")
+
+            config.set_max_measurements(1440)
+            assert config.set_max_measurements(60, "s001") is True
+
+            assert config.get_max_measurements("s001") == 60
+            assert config.get_max_measurements("s002") == 1440
+            assert config.set_max_measurements(10, "unknown") is False
+
+            config.set_max_measurements(None, "s001")
+            assert config.get_max_measurements("s001") == 1440
+
+    def test_limits_persisted(self, temp_data_dir):
+        """Test la persistance des limites."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            config.add_station("s001", "Montaudran", "v001", "https://api.com")
+            config.set_max_measurements(500)
+            config.set_max_measurements(50, "s001")
+
+            config = _fresh_config()
+
+            assert config.get_max_measurements() == 500
+            assert config.get_max_measurements("s001") == 50
+
+    def test_invalid_limit(self, temp_data_dir):
+        """Test qu'une limite nulle est refusée."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+
+            with pytest.raises(ValueError):
+                config.set_max_measurements(0)
+
+
+class TestConfigurationPollInterval:
+    """Tests pour l'intervalle d'interrogation du mode démon."""
+
+    def test_default_interval(self, temp_data_dir):
+        """Test l'intervalle par défaut."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+
+            assert config.get_poll_interval() == DEFAULT_POLL_INTERVAL
+            assert config.get_poll_interval("s001") == DEFAULT_POLL_INTERVAL
+
+    def test_global_and_station_intervals(self, temp_data_dir):
+        """Test que l'intervalle d'une station est prioritaire sur l'intervalle global."""
+        os.makedirs(os.path.join(temp_data_dir, 'data'))
+        with open(os.path.join(temp_data_dir, 'data', 'config.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                "settings": {"poll_interval": 300},
+                "stations": {
+                    "s001": {"nom": "Montaudran", "ville_id": "v001",
+                             "api_url": "https://api.com", "poll_interval": 60},
+                    "s002": {"nom": "Compans", "ville_id": "v001", "api_url": "https://api.com"},
+                },
+            }, f)
+
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            with patch('builtins.print'):
+                config = _fresh_config()
+
+            assert config.get_poll_interval("s001") == 60
+            assert config.get_poll_interval("s002") == 300
+            assert config.get_poll_interval() == 300
+
+
+class TestConfigurationIndexes:
+    """Tests pour les index secondaires (pays -> villes, ville -> stations)."""
+
+    def test_lookups_follow_add_and_remove(self, temp_data_dir):
+        """Test que les recherches suivent les ajouts et suppressions."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            with patch('builtins.print'):
+                config.add_pays("fr", "France")
+                config.add_ville("tls", "Toulouse", "fr")
+                config.add_ville("lyn", "Lyon", "fr")
+                config.add_station("s001", "Montaudran", "tls", "https://a")
+                config.add_station("s002", "Compans", "tls", "https://b")
+                config.add_station("s003", "Bron", "lyn", "https://c")
+
+                assert list(config.get_villes("fr")) == ["tls", "lyn"]
+                assert list(config.get_stations("tls")) == ["s001", "s002"]
+
+                config.remove_station("s001")
+                assert list(config.get_stations("tls")) == ["s002"]
+
+                config.remove_ville("lyn")
+                assert list(config.get_villes("fr")) == ["tls"]
+                assert config.get_stations("lyn") == {}
+                assert config.get_station_by_id("s003") is None
+
+    def test_moved_entries_reindexed(self, temp_data_dir):
+        """Test qu'une ville ou une station ré-ajoutée ailleurs change d'index."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            with patch('builtins.print'):
+                config.add_ville("tls", "Toulouse", "fr")
+                config.add_station("s001", "Montaudran", "tls", "https://a")
+                config.add_ville("tls", "Toulouse", "es")
+                config.add_station("s001", "Montaudran", "bcn", "https://a")
+
+            assert config.get_villes("fr") == {}
+            assert list(config.get_villes("es")) == ["tls"]
+            assert config.get_stations("tls") == {}
+            assert config.get_stations("bcn")["s001"]["nom"] == "Montaudran"
+
+    def test_remove_pays_cascades(self, temp_data_dir):
+        """Test que la suppression d'un pays retire ses villes et stations des index."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            with patch('builtins.print'):
+                config.add_pays("fr", "France")
+                config.add_ville("tls", "Toulouse", "fr")
+                config.add_station("s001", "Montaudran", "tls", "https://a")
+
+                assert config.remove_pays("fr") is True
+
+            assert config.get_villes() == {}
+            assert config.get_villes("fr") == {}
+            assert config.get_stations() == {}
+
+    def test_indexes_rebuilt_on_load(self, temp_data_dir):
+        """Test que les index sont reconstruits au chargement du fichier."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            with patch('builtins.print'):
+                config.add_ville("tls", "Toulouse", "fr")
+                config.add_station("s001", "Montaudran", "tls", "https://a")
+
+                config = _fresh_config()
+
+            assert list(config.get_villes("fr")) == ["tls"]
+            assert list(config.get_stations("tls")) == ["s001"]
+
+
+class TestConfigurationBatchWrites:
+    """Tests pour le regroupement et le report des écritures du fichier."""
+
+    # pylint: disable=protected-access
+
+    def test_batch_writes_once(self, temp_data_dir):
+        """Test qu'un bloc batch produit une seule écriture, à sa sortie."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            with patch('builtins.print'), \
+                    patch.object(config.backend, '_write_configuration',
+                                 wraps=config.backend._write_configuration) as write:
+                with config.batch():
+                    config.add_pays("fr", "France")
+                    with config.batch():
+                        config.add_ville("tls", "Toulouse", "fr")
+                    for i in range(100):
+                        config.add_station(f"s{i}", f"Station {i}", "tls", "https://a")
+                    assert write.call_count == 0
+                assert write.call_count == 1
+
+                assert len(_fresh_config().get_stations("tls")) == 100
+
+    def test_batch_writes_on_error(self, temp_data_dir):
+        """Test que les modifications d'un bloc interrompu sont écrites."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            with patch('builtins.print'):
+                with pytest.raises(RuntimeError), config.batch():
+                    config.add_pays("fr", "France")
+                    raise RuntimeError("boom")
+
+                assert "fr" in _fresh_config().get_pays()
+
+    def test_cascade_writes_once(self, temp_data_dir):
+        """Test que la suppression en cascade d'un pays produit une seule écriture."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            with patch('builtins.print'):
+                with config.batch():
+                    config.add_pays("fr", "France")
+                    config.add_ville("tls", "Toulouse", "fr")
+                    config.add_ville("lyn", "Lyon", "fr")
+                    config.add_station("s001", "Montaudran", "tls", "https://a")
+                    config.add_station("s002", "Bron", "lyn", "https://b")
+
+                with patch.object(config.backend, '_write_configuration',
+                                  wraps=config.backend._write_configuration) as write:
+                    assert config.remove_pays("fr") is True
+                assert write.call_count == 1
+
+    def test_save_delay_coalesces_writes(self, temp_data_dir):
+        """Test que le délai d'écriture regroupe les modifications."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            with pytest.raises(ValueError):
+                config.set_save_delay(-1)
+            config.set_save_delay(60)
+            with patch('builtins.print'), \
+                    patch.object(config.backend, '_write_configuration',
+                                 wraps=config.backend._write_configuration) as write:
+                config.add_pays("fr", "France")
+                config.add_pays("es", "Espagne")
+                assert write.call_count == 0
+
+                config.flush()
+                config.flush()
+                assert write.call_count == 1
+                assert set(_fresh_config().get_pays()) == {"fr", "es"}
+
+    def test_save_timer_writes(self, temp_data_dir):
+        """Test que le minuteur écrit les modifications à l'échéance."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            config.set_save_delay(0.2)
+            with patch('builtins.print'):
+                config.add_pays("fr", "France")
+                timer = config.backend._save_timer
+                assert not _fresh_config().get_pays()
+                timer.join(timeout=2)
+
+                assert "fr" in _fresh_config().get_pays()
+
+
+class TestConfigurationJournal:
+    """Tests pour la persistance de la configuration par journal."""
+
+    def test_changes_appended_to_journal(self, temp_data_dir):
+        """Test que les modifications sont journalisées puis relues."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            with patch('builtins.print'):
+                config.add_pays("fr", "France")
+                config.add_ville("tls", "Toulouse", "fr")
+                config.set_max_measurements(100)
+                config.remove_pays("fr")
+                config.add_pays("es", "Espagne")
+
+                journal_path = os.path.join(temp_data_dir, 'data', 'config.journal')
+                with open(journal_path, encoding='utf-8') as f:
+                    assert len(f.readlines()) == 4
+                with open(os.path.join(temp_data_dir, 'data', 'config.json'),
+                          encoding='utf-8') as f:
+                    assert json.load(f)["pays"] == {"fr": {"nom": "France"}}
+
+                config = _fresh_config()
+
+            assert config.get_pays() == {"es": {"nom": "Espagne"}}
+            assert config.get_villes() == {}
+            assert config.get_max_measurements() == 100
+
+    def test_journal_compacted(self, temp_data_dir):
+        """Test que le journal est compacté dans config.json une fois assez long."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            config = _fresh_config()
+            with patch('builtins.print'):
+                # Le premier ajout crée config.json, les 1000 suivants sont journalisés
+                for i in range(1001):
+                    config.add_pays("fr", f"France {i}")
+
+            data_dir = os.path.join(temp_data_dir, 'data')
+            assert not os.path.exists(os.path.join(data_dir, 'config.journal'))
+            with open(os.path.join(data_dir, 'config.json'), encoding='utf-8') as f:
+                assert json.load(f)["pays"]["fr"]["nom"] == "France 1000"
+
+    def test_corrupt_file_kept(self, temp_data_dir):
+        """Test qu'un config.json illisible est conservé au lieu d'être écrasé."""
+        data_dir = os.path.join(temp_data_dir, 'data')
+        os.makedirs(data_dir)
+        with open(os.path.join(data_dir, 'config.json'), 'w', encoding='utf-8') as f:
+            f.write('{"pays": {"fr"')
+
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            with patch('builtins.print'):
+                config = _fresh_config()
+                config.add_pays("es", "Espagne")
+
+        with open(os.path.join(data_dir, 'config.json.corrupt'), encoding='utf-8') as f:
+            assert f.read() == '{"pays": {"fr"'
+        assert config.get_pays() == {"es": {"nom": "Espagne"}}
+
+
+class TestConfigurationBackends:
+    """Tests pour le choix du stockage de la configuration."""
+
+    def test_json_by_default(self, temp_data_dir):
+        """Test que config.json est utilisé en l'absence de config.db."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            with patch('builtins.print'):
+                config = _fresh_config()
+
+        assert isinstance(config.backend, JsonConfigBackend)
+
+    def test_sqlite_after_migration(self, temp_data_dir):
+        """Test que config.db remplace config.json une fois migré."""
+        with patch('weather_app.config.singleton_config.os.path.dirname') as mock_dirname:
+            mock_dirname.return_value = temp_data_dir
+            with patch('builtins.print'):
+                config = _fresh_config()
+                config.add_pays("fr", "France")
+                config.add_ville("tls", "Toulouse", "fr")
+                config.add_station("s001", "Montaudran", "tls", "https://a")
+                data_dir = config.data_dir
+                migrate_json_config(os.path.join(data_dir, 'config.json'),
+                                    os.path.join(data_dir, 'config.db'))
+
+                config = _fresh_config()
+                with config.batch():
+                    config.add_station("s002", "Compans", "tls", "https://b")
+
+            assert isinstance(config.backend, SqliteConfigBackend)
+            assert list(config.get_stations("tls")) == ["s001", "s002"]
+            assert config.remove_pays("fr") is True
+            assert config.get_all_stations_list() == []
+            config.backend.close()
@@ -0,0 +1,198 @@
+"""
+Tests unitaires pour le stockage SQLite de la configuration.
+Test des requêtes, des suppressions en cascade et de la migration depuis JSON.
+"""
+import json
+import os
+import sqlite3
+
+import pytest
+
+from weather_app.config.backend import DEFAULT_POLL_INTERVAL
+from weather_app.config.config_journal import ConfigJournal
+from weather_app.config.sqlite_backend import SqliteConfigBackend, migrate_json_config
+
+
+@pytest.fixture(name="backend")
+def fixture_backend(temp_data_dir):
+    """Stockage SQLite contenant un pays, deux villes et trois stations."""
+    backend = SqliteConfigBackend(os.path.join(temp_data_dir, 'config.db'))
+    backend.add_pays("fr", "France")
+    backend.add_ville("tls", "Toulouse", "fr")
+    backend.add_ville("lyn", "Lyon", "fr")
+    backend.add_station("s001", "Montaudran", "tls", "https://a")
+    backend.add_station("s002", "Compans", "tls", "https://b")
+    backend.add_station("s003", "Bron", "lyn", "https://c")
+    yield backend
+    backend.close()
+
+
+class TestSqliteConfigBackend:
+    """Tests pour la classe SqliteConfigBackend."""
+
+    def test_lookups(self, backend):
+        """Test que les lectures retournent les structures du stockage JSON."""
+        assert backend.get_pays() == {"fr": {"nom": "France"}}
+        assert list(backend.get_villes("fr")) == ["tls", "lyn"]
+        assert backend.get_villes()["lyn"] == {"nom": "Lyon", "pays_id": "fr"}
+        assert list(backend.get_stations("tls")) == ["s001", "s002"]
+        assert backend.get_station_by_id("s003") == {
+            "nom": "Bron", "ville_id": "lyn", "api_url": "https://c"
+        }
+        assert backend.get_station_by_id("unknown") is None
+        assert backend.get_all_stations_list()[0] == ("s001", "Montaudran", "https://a")
+
+    def test_lookups_use_indexes(self, backend):
+        """Test que les recherches par parent utilisent les index."""
+        # pylint: disable=protected-access
+        plans = [
+            backend._query(f"EXPLAIN QUERY PLAN SELECT id FROM {table} WHERE {column} = ?",
+                           ("x",))
+            for table, column in (("villes", "pays_id"), ("stations", "ville_id"))
+        ]
+        assert "villes_pays_id" in str(plans[0])
+        assert "stations_ville_id" in str(plans[1])
+
+    def test_remove_pays_cascades(self, backend):
+        """Test que la suppression d'un pays retire ses villes et stations."""
+        assert backend.remove_pays("fr") is True
+        assert backend.remove_pays("fr") is False
+
+        assert backend.get_villes() == {}
+        assert backend.get_stations() == {}
+
+    def test_remove_ville_cascades(self, backend):
+        """Test que la suppression d'une ville retire ses stations."""
+        assert backend.remove_ville("tls") is True
+
+        assert list(backend.get_stations()) == ["s003"]
+        assert backend.remove_station("s003") is True
+        assert backend.remove_station("s003") is False
+
+    def test_foreign_keys(self, backend):
+        """Test qu'une ville ou une station sans parent est refusée."""
+        with pytest.raises(ValueError):
+            backend.add_ville("bcn", "Barcelone", "es")
+        with pytest.raises(ValueError):
+            backend.add_station("s004", "Sants", "bcn", "https://d")
+
+    def test_readd_keeps_children(self, backend):
+        """Test qu'une ville ré-ajoutée garde sa place et ses stations."""
+        backend.add_ville("tls", "Toulouse Métropole", "fr")
+
+        assert list(backend.get_villes()) == ["tls", "lyn"]
+        assert backend.get_villes()["tls"]["nom"] == "Toulouse Métropole"
+        assert list(backend.get_stations("tls")) == ["s001", "s002"]
+
+    def test_updates(self, backend):
+        """Test la modification d'URL et des limites de mesures."""
+        assert backend.update_station_url("s001", "https://z") is True
+        assert backend.update_station_url("unknown", "https://z") is False
+        assert backend.get_station_by_id("s001")["api_url"] == "https://z"
+
+        assert backend.set_max_measurements(100) is True
+        assert backend.set_max_measurements(10, "s001") is True
+        assert backend.set_max_measurements(10, "unknown") is False
+        assert backend.get_max_measurements("s001") == 10
+        assert backend.get_max_measurements("s002") == 100
+        backend.set_max_measurements(None)
+        assert backend.get_max_measurements("s002") is None
+        with pytest.raises(ValueError):
+            backend.set_max_measurements(0)
+
+        assert backend.get_poll_interval("s001") == DEFAULT_POLL_INTERVAL
+
+    def test_batch_is_one_transaction(self, backend, temp_data_dir):
+        """Test que les modifications d'un bloc ne sont visibles qu'à sa sortie."""
+        reader = sqlite3.connect(os.path.join(temp_data_dir, 'config.db'))
+        try:
+            with backend.batch():
+                backend.add_pays("es", "Espagne")
+                with backend.batch():
+                    backend.add_ville("bcn", "Barcelone", "es")
+                assert reader.execute("SELECT COUNT(*) FROM pays").fetchone() == (1,)
+
+            assert reader.execute("SELECT COUNT(*) FROM villes").fetchone() == (3,)
+        finally:
+            reader.close()
+
+    def test_batch_after_automatic_rollback(self, backend):
+        """Test qu'une transaction déjà annulée par SQLite ne masque pas l'erreur."""
+        with pytest.raises(RuntimeError):
+            with backend.batch():
+                backend.add_pays("es", "Espagne")
+                # Ce que fait SQLite de lui-même sur un disque plein
+                backend._connection.execute("ROLLBACK")  # pylint: disable=protected-access
+                raise RuntimeError("disque plein")
+
+        assert "es" not in backend.get_pays()
+        backend.add_pays("it", "Italie")
+        assert "it" in backend.get_pays()
+
+    def test_persistence(self, backend):
+        """Test que la configuration est relue à la réouverture."""
+        backend.set_max_measurements(100)
+        backend.close()
+
+        reopened = SqliteConfigBackend(backend.path)
+        assert list(reopened.get_stations()) == ["s001", "s002", "s003"]
+        assert reopened.get_max_measurements() == 100
+        reopened.close()
+
+
+class TestMigrateJsonConfig:
+    """Tests pour la migration de config.json vers SQLite."""
+
+    def test_migration(self, temp_data_dir):
+        """Test la migration du fichier, de son journal et des champs optionnels."""
+        json_path = os.path.join(temp_data_dir, 'config.json')
+        db_path = os.path.join(temp_data_dir, 'config.db')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "settings": {"poll_interval": 300},
+                "pays": {"fr": {"nom": "France"}},
+                "villes": {"tls": {"nom": "Toulouse", "pays_id": "fr"},
+                           "bcn": {"nom": "Barcelone", "pays_id": "es"}},
+                "stations": {"s001": {"nom": "Montaudran", "ville_id": "tls",
+                                      "api_url": "https://a", "max_measurements": 50}},
+            }, f)
+        ConfigJournal(json_path).append([{
+            "op": "set", "section": "stations", "key": "s002",
+            "value": {"nom": "Compans", "ville_id": "tls", "api_url": "https://b"}
+        }])
+
+        counts = migrate_json_config(json_path, db_path)
+
+        assert counts == {"pays": 1, "villes": 1, "stations": 2, "ignorées": 1}
+        backend = SqliteConfigBackend(db_path)
+        assert list(backend.get_stations("tls")) == ["s001", "s002"]
+        assert backend.get_max_measurements("s001") == 50
+        assert backend.get_poll_interval() == 300
+        backend.close()
+        assert sorted(os.listdir(temp_data_dir)) == ['config.db', 'config.journal', 'config.json']
+
+        with pytest.raises(FileExistsError):
+            migrate_json_config(json_path, db_path)
+
+    def test_journal_left_intact(self, temp_data_dir):
+        """Test que la migration ne tronque pas une écriture incomplète du journal."""
+        json_path = os.path.join(temp_data_dir, 'config.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({"pays": {"fr": {"nom": "France"}}}, f)
+        journal = ConfigJournal(json_path)
+        journal.append([{"op": "set", "section": "pays", "key": "es", "value": {"nom": "Espagne"}}])
+        with open(journal.journal_path, 'ab') as f:
+            f.write(b'[{"op":"set"')
+        size = os.path.getsize(journal.journal_path)
+
+        counts = migrate_json_config(json_path, os.path.join(temp_data_dir, 'config.db'))
+
+        assert counts["pays"] == 2
+        assert os.path.getsize(journal.journal_path) == size
+
+    def test_missing_file(self, temp_data_dir):
+        """Test qu'une migration sans config.json échoue sans créer de base."""
+        db_path = os.path.join(temp_data_dir, 'config.db')
+        with pytest.raises(FileNotFoundError):
+            migrate_json_config(os.path.join(temp_data_dir, 'config.json'), db_path)
+        assert not os.path.exists(db_path)
@@ -0,0 +1,253 @@
+"""
+Tests unitaires pour TimeSeriesStore.
+Test de l'insertion en bloc, de la déduplication, des requêtes par intervalle
+et de l'enregistrement des mesures reçues par ApiService.
+"""
+import os
+import threading
+from unittest.mock import patch
+
+from weather_app.models.measurement import Measurement
+from weather_app.services.api_service import ApiService
+from weather_app.storage.time_series_store import TimeSeriesStore
+
+BASE_EPOCH = 1_735_689_600  # 2025-01-01T00:00:00+00:00
+
+
+def _rows(count, start=0):
+    """Lignes horaires (epoch, décalage, température, humidité, pression)."""
+    return [
+        (BASE_EPOCH + 3600 * i, 60, 10.0 + i, 50 + i, 101000 + i)
+        for i in range(start, start + count)
+    ]
+
+
+class TestTimeSeriesStore:
+    """Tests pour la classe TimeSeriesStore."""
+
+    def test_add_rows_and_query(self):
+        """Test l'insertion en bloc puis la lecture d'une station."""
+        with TimeSeriesStore(':memory:') as store:
+            assert store.add_rows("s001", _rows(5)) == 5
+
+            series = store.query("s001")
+
+            assert len(series) == 5
+            assert list(series.epochs()) == [row[0] for row in _rows(5)]
+            assert series[0].heure == "2025-01-01T01:00:00+01:00"
+            assert series[4].temperature == 14.0
+
+    def test_query_sorted_by_epoch(self):
+        """Test que les mesures sont relues dans l'ordre chronologique."""
+        with TimeSeriesStore(':memory:') as store:
+            store.add_rows("s001", reversed(_rows(4)))
+
+            epochs = list(store.query("s001").epochs())
+
+            assert epochs == sorted(epochs)
+
+    def test_duplicates_ignored(self):
+        """Test qu'une mesure déjà connue (station, heure) n'est pas réinsérée."""
+        with TimeSeriesStore(':memory:') as store:
+            store.add_rows("s001", _rows(3))
+
+            assert store.add_rows("s001", _rows(5)) == 2
+            assert store.count("s001") == 5
+
+    def test_same_epoch_on_other_station(self):
+        """Test que la déduplication est propre à chaque station."""
+        with TimeSeriesStore(':memory:') as store:
+            store.add_rows("s001", _rows(3))
+            store.add_rows("s002", _rows(3))
+
+            assert store.count() == 6
+            assert store.station_ids() == ["s001", "s002"]
+
+    def test_query_time_window(self):
+        """Test une requête bornée par un intervalle de temps (bornes incluses)."""
+        with TimeSeriesStore(':memory:') as store:
+            store.add_rows("s001", _rows(10))
+
+            series = store.query(
+                "s001", start_epoch=BASE_EPOCH + 3600 * 2, end_epoch=BASE_EPOCH + 3600 * 5
+            )
+
+            assert [m.temperature for m in series] == [12.0, 13.0, 14.0, 15.0]
+
+    def test_query_limit(self):
+        """Test la limite du nombre de mesures lues."""
+        with TimeSeriesStore(':memory:') as store:
+            store.add_rows("s001", _rows(10))
+
+            assert len(store.query("s001", limit=3)) == 3
+
+    def test_query_unknown_station(self):
+        """Test la lecture d'une station sans mesure."""
+        with TimeSeriesStore(':memory:') as store:
+            assert len(store.query("inconnue")) == 0
+            assert store.latest_epoch("inconnue") is None
+
+    def test_add_measurements(self):
+        """Test l'enregistrement d'objets Measurement, sans les heures invalides."""
+        measurements = [
+            Measurement("2025-01-01T10:00:00+01:00", 5.0, 80, 101000),
+            Measurement("pas une date", 6.0, 81, 101001),
+            Measurement("2025-01-01T08:00:00Z", 4.0, 79, 100999),
+        ]
+        with TimeSeriesStore(':memory:') as store:
+            assert store.add_measurements("s001", measurements) == 2
+
+            series = store.query("s001")
+
+            assert [m.temperature for m in series] == [4.0, 5.0]
+            assert series[1].heure == "2025-01-01T10:00:00+01:00"
+
+    def test_latest_epoch(self):
+        """Test la date de la mesure la plus récente."""
+        with TimeSeriesStore(':memory:') as store:
+            store.add_rows("s001", _rows(4))
+
+            assert store.latest_epoch("s001") == BASE_EPOCH + 3600 * 3
+
+    def test_latest(self):
+        """Test la lecture des dernières mesures, dans l'ordre chronologique."""
+        with TimeSeriesStore(':memory:') as store:
+            store.add_rows("s001", _rows(5))
+
+            assert list(store.latest("s001", 2).epochs()) == [row[0] for row in _rows(5)[3:]]
+            assert store.latest("s001")[0].temperature == 14.0
+            assert len(store.latest("unknown")) == 0
+
+    def test_delete_station(self):
+        """Test la suppression des mesures d'une station."""
+        with TimeSeriesStore(':memory:') as store:
+            store.add_rows("s001", _rows(4))
+            store.add_rows("s002", _rows(2))
+
+            assert store.delete_station("s001") == 4
+            assert store.count() == 2
+
+    def test_sink(self):
+        """Test le sink utilisable pour l'historique paginé."""
+        with TimeSeriesStore(':memory:') as store:
+            sink = store.sink("s001")
+            sink([Measurement("2025-01-01T10:00:00+00:00", 5.0, 80, 101000)])
+
+            assert store.count("s001") == 1
+
+    def test_persists_across_instances(self, temp_data_dir):
+        """Test que les mesures sont relues après réouverture du fichier."""
+        path = os.path.join(temp_data_dir, 'measurements.db')
+        with TimeSeriesStore(path) as store:
+            store.add_rows("s001", _rows(3))
+
+        with TimeSeriesStore(path) as store:
+            assert store.count("s001") == 3
+
+    def test_concurrent_writes(self, temp_data_dir):
+        """Test des écritures simultanées depuis plusieurs threads."""
+        store = TimeSeriesStore(os.path.join(temp_data_dir, 'measurements.db'))
+
+        threads = [
+            threading.Thread(target=store.add_rows, args=(f"s{i:03d}", _rows(50)))
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert store.count() == 400
+        store.close()
+
+class TestApiServiceStore:
+    """Tests pour l'enregistrement des mesures dans la base historique."""
+
+    def test_fetch_writes_to_store(self, fake_api_server, make_stations, sample_api_response):
+        """Test que les mesures reçues de l'API sont enregistrées."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station, = make_stations(1)
+        store = TimeSeriesStore(':memory:')
+
+        service = ApiService(store=store)
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+
+        assert [m.heure for m in store.query("s000")] == [
+            "2025-02-11T09:00:00+00:00", "2025-02-11T10:00:00+00:00"
+        ]
+        service.close()
+        store.close()
+
+    def test_refetch_does_not_duplicate(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test qu'un rafraîchissement complet n'enregistre pas deux fois les mesures."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station, = make_stations(1)
+        store = TimeSeriesStore(':memory:')
+
+        service = ApiService(store=store)
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+            service.fetch_data_for_station(station, force_refresh=True)
+
+        assert store.count("s000") == 2
+        service.close()
+        store.close()
+
+    def test_invalid_rows_not_stored(self, fake_api_server, make_stations):
+        """Test que les lignes invalides ne sont pas enregistrées."""
+        fake_api_server.routes["/station/0"] = (200, {"results": [
+            {"heure_de_paris": "invalide", "temperature_en_degre_c": 1.0},
+            {"heure_de_paris": "2025-01-01T00:00:00+00:00", "temperature_en_degre_c": 2.0},
+        ]}, 0)
+        station, = make_stations(1)
+        store = TimeSeriesStore(':memory:')
+
+        service = ApiService(store=store)
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+
+        assert [m.temperature for m in store.query("s000")] == [2.0]
+        service.close()
+        store.close()
+
+    def test_incremental_fetch_writes_new_rows(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test que les nouvelles mesures d'un chargement incrémental sont enregistrées."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station, = make_stations(1)
+        store = TimeSeriesStore(':memory:')
+
+        service = ApiService(incremental=True, store=store)
+        with patch('builtins.print'):
+            service.fetch_data_for_station(station)
+            fake_api_server.routes["/station/0"] = (200, {"results": [
+                {"heure_de_paris": "2025-02-11T11:00:00+00:00", "temperature_en_degre_c": 16.0,
+                 "humidite": 70, "pression": 101350},
+            ]}, 0)
+            service.fetch_data_for_station(station, force_refresh=True)
+
+        assert store.count("s000") == 3
+        service.close()
+        store.close()
+
+    def test_store_error_does_not_fail_fetch(
+            self, fake_api_server, make_stations, sample_api_response
+    ):
+        """Test qu'une erreur d'écriture est signalée sans faire échouer le chargement."""
+        fake_api_server.routes["/station/0"] = (200, sample_api_response, 0)
+        station, = make_stations(1)
+        store = TimeSeriesStore(':memory:')
+        store.close()
+
+        service = ApiService(store=store)
+        with patch('builtins.print') as mock_print:
+            result = service.fetch_data_for_station(station)
+
+        assert result is True
+        assert station.count_measurements() == 2
+        assert any("Impossible d'enregistrer" in str(call) for call in mock_print.call_args_list)
+        service.close()
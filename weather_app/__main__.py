@@ -1,14 +1,85 @@
 """
 Point d'entrée de l'application météo.
+
+Sans argument, lance le menu interactif. `--daemon` interroge les stations
+en continu, sans terminal (voir weather_app.daemon). Les sous-commandes
+`refresh`, `show`, `export` et `migrate-config` s'exécutent une fois et
+retournent un code de sortie (voir weather_app.cli).
 """
-from weather_app.ui.menu import MainMenu
+import argparse
+import sys
+from typing import List, Optional
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Construit l'analyseur des arguments de la ligne de commande."""
+    parser = argparse.ArgumentParser(prog='weather_app', description="Application météo")
+    parser.add_argument('--daemon', action='store_true',
+                        help="interroge les stations en continu, sans interface")
+    parser.add_argument('--interval', type=float, default=None,
+                        help="intervalle entre deux interrogations d'une station, en "
+                             "secondes (mode démon, configuration par défaut)")
+    parser.add_argument('--jitter', type=float, default=0.1,
+                        help="décalage aléatoire maximal, en fraction de l'intervalle")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="nombre maximal d'interrogations simultanées")
+
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMANDE')
+    refresh = subparsers.add_parser('refresh', help="rafraîchit des stations et enregistre "
+                                                    "leurs mesures")
+    refresh.add_argument('station_ids', nargs='*', metavar='STATION_ID')
+    refresh.add_argument('--all', action='store_true', help="toutes les stations configurées")
+    refresh.add_argument('--workers', type=int, default=8,
+                         help="nombre maximal de requêtes simultanées")
+    refresh.add_argument('--force', action='store_true', help="ignore le cache des réponses")
+
+    show = subparsers.add_parser('show', help="affiche une station et ses dernières mesures")
+    show.add_argument('station_id', metavar='STATION_ID')
+    show.add_argument('--limit', type=int, default=10, help="nombre de mesures affichées")
+    show.add_argument('--refresh', action='store_true', help="rafraîchit la station avant")
+
+    export = subparsers.add_parser('export', help="exporte les mesures enregistrées")
+    export.add_argument('station_ids', nargs='*', metavar='STATION_ID')
+    export.add_argument('--format', choices=['jsonl'], default='jsonl',
+                        help="format de sortie (une ligne JSON par mesure)")
+    export.add_argument('--output', default='-',
+                        help="fichier de sortie (sortie standard par défaut)")
+
+    subparsers.add_parser('migrate-config',
+                          help="copie config.json dans une base SQLite (config.db), "
+                               "utilisée ensuite à la place du fichier JSON")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Lance l'application météo.
+
+    Args:
+        argv: Les arguments de la ligne de commande (sys.argv si absent)
 
+    Returns:
+        Le code de sortie du processus
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers doit être supérieur ou égal à 1")
+    if args.command:
+        # pylint: disable=import-outside-toplevel
+        from weather_app.cli import run_command
+        return run_command(args)
+    if args.daemon:
+        # pylint: disable=import-outside-toplevel
+        from weather_app.daemon import run_daemon
+        return run_daemon(args.interval, args.jitter, args.workers)
 
-def main():
-    """Lance l'application météo."""
+    # pylint: disable=import-outside-toplevel
+    from weather_app.ui.menu import MainMenu
     menu = MainMenu()
     menu.run()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,16 @@
+"""
+Module d'analyse des mesures (statistiques tenues à jour à l'ingestion).
+"""
+from .hierarchy import LocationSummaries, LocationSummary, StationFeed
+from .quantiles import KllSketch, StationSketches
+from .rolling import RollingStats, RollingWindow, WindowStats
+from .rollups import Aggregate, Rollup, RollupBucket, StationRollups
+from .service import AnalyticsService, StationAnalytics
+
+__all__ = [
+    'Aggregate', 'Rollup', 'RollupBucket', 'StationRollups',
+    'RollingStats', 'RollingWindow', 'WindowStats',
+    'KllSketch', 'StationSketches',
+    'LocationSummaries', 'LocationSummary', 'StationFeed',
+    'AnalyticsService', 'StationAnalytics'
+]
@@ -0,0 +1,83 @@
+"""
+Base des observateurs de Station qui tiennent des statistiques à jour.
+"""
+from abc import abstractmethod
+from typing import Any, Optional, Sequence, Tuple
+
+from weather_app.models.measurement_series import NO_EPOCH
+from weather_app.patterns.observer import Observer
+
+# (epoch, décalage UTC en minutes, température, humidité, pression)
+Row = Tuple[int, int, float, int, int]
+
+
+class MeasurementObserver(Observer):
+    """
+    Observateur de Station qui traite chaque nouvelle mesure une seule fois.
+
+    Seules les mesures plus récentes que la dernière mesure traitée sont
+    prises en compte : recharger une fenêtre déjà reçue ne compte pas deux
+    fois les mêmes mesures. Les mesures sans heure valide (NO_EPOCH) sont
+    ignorées.
+    """
+
+    def __init__(self):
+        """Initialise l'observateur sans mesure traitée."""
+        self._latest: Optional[int] = None
+
+    @property
+    def latest_epoch(self) -> Optional[int]:
+        """Retourne l'horodatage de la dernière mesure traitée."""
+        return self._latest
+
+    # pylint: disable=too-many-arguments
+    def add_columns(self,
+                    epochs: Sequence[int],
+                    temperatures: Sequence[float],
+                    humidites: Sequence[int],
+                    pressions: Sequence[int],
+                    *,
+                    utc_offsets: Sequence[int]) -> int:
+        """
+        Traite des mesures fournies en colonnes, dans l'ordre chronologique.
+
+        Args:
+            epochs: Horodatages en secondes depuis l'epoch Unix
+            temperatures: Températures en °C
+            humidites: Humidités en %
+            pressions: Pressions en Pa
+            utc_offsets: Décalage UTC de chaque mesure, en minutes
+
+        Returns:
+            Le nombre de mesures traitées
+        """
+        added = 0
+        for row in zip(epochs, utc_offsets, temperatures, humidites, pressions):
+            if row[0] == NO_EPOCH or (self._latest is not None and row[0] <= self._latest):
+                continue
+            self._add_row(row)
+            self._latest = row[0]
+            added += 1
+        return added
+
+    def update(self, subject: Any, *args, **kwargs) -> None:
+        """
+        Traite les mesures ajoutées à la station observée.
+
+        Args:
+            subject: La station (non utilisée)
+            *args: Arguments positionnels (non utilisés)
+            **kwargs: Les colonnes des nouvelles mesures
+        """
+        self.add_columns(
+            kwargs['epochs'], kwargs['temperatures'], kwargs['humidites'],
+            kwargs['pressions'], utc_offsets=kwargs['utc_offsets']
+        )
+
+    @abstractmethod
+    def _add_row(self, row: Row) -> None:
+        """
+        Args:
+            row: Une nouvelle mesure (epoch, décalage UTC, température,
+                humidité, pression)
+        """
@@ -0,0 +1,233 @@
+"""
+Résumés en direct des villes et des pays (Pays → Ville → Station).
+
+Chaque station suivie alimente le résumé de sa ville et celui de son pays à
+chaque nouvelle mesure : dernière mesure reçue, moyenne des mesures
+actuelles des stations et extrêmes depuis le début du suivi. La mise à jour
+est en O(1) amorti par mesure ; aucun résumé ne relit les mesures des stations.
+"""
+import heapq
+import math
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from weather_app.analytics.base import MeasurementObserver, Row
+from weather_app.analytics.rollups import Aggregate
+from weather_app.models.location import Pays, Station, Ville
+
+# Grandeurs résumées, dans l'ordre des lignes (à partir de l'indice 2)
+FIELDS = ('temperature', 'humidite', 'pression')
+_POSITIONS = {field: position for position, field in enumerate(FIELDS)}
+
+# Âge maximal (secondes) d'une mesure actuelle, par rapport à la plus récente
+# du résumé : une station muette au-delà ne compte plus dans la moyenne
+MAX_CURRENT_AGE = 3 * 3600
+
+# Nombre minimal de mises à jour entre deux recalculs exacts des sommes
+RESUM_INTERVAL = 1024
+
+
+class LocationSummary:
+    """
+    Résumé d'une ville ou d'un pays, tenu à jour par ses stations.
+
+    La moyenne actuelle porte sur la dernière mesure de chaque station : les
+    sommes sont corrigées quand une station remplace sa mesure actuelle, et
+    recalculées exactement de temps en temps pour ne pas accumuler les
+    erreurs d'arrondi. Une mesure actuelle plus ancienne que `max_age` par
+    rapport à la plus récente du résumé expire.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, location_id: str, max_age: Optional[int] = MAX_CURRENT_AGE):
+        """
+        Args:
+            location_id: L'identifiant de la ville ou du pays
+            max_age: Âge maximal d'une mesure actuelle, en secondes
+                (None : les mesures actuelles n'expirent pas)
+
+        Raises:
+            ValueError: Si l'âge maximal est négatif
+        """
+        if max_age is not None and max_age < 0:
+            raise ValueError("L'âge maximal ne peut pas être négatif")
+        self.location_id = location_id
+        self._max_age = max_age
+        # Identifiant de station -> dernière mesure de la station
+        self._current: Dict[str, Row] = {}
+        # Tas (epoch, station) des mesures actuelles ; les entrées remplacées
+        # depuis sont ignorées à l'expiration
+        self._expiry: List[Tuple[int, str]] = []
+        self._sums = [0.0, 0.0, 0.0]
+        self._updates = 0
+        self.temperature = Aggregate()
+        self.humidite = Aggregate()
+        self.pression = Aggregate()
+        self.latest: Optional[Tuple[str, Row]] = None
+
+    @property
+    def station_count(self) -> int:
+        """Retourne le nombre de stations dont la mesure actuelle n'a pas expiré."""
+        return len(self._current)
+
+    def add(self, station_id: str, row: Row) -> None:
+        """
+        Prend en compte une nouvelle mesure d'une station.
+
+        Args:
+            station_id: L'identifiant de la station
+            row: La mesure (epoch, décalage UTC, température, humidité, pression)
+        """
+        previous = self._current.get(station_id)
+        sums = self._sums
+        for position in range(len(FIELDS)):
+            if previous is not None:
+                sums[position] -= previous[position + 2]
+            sums[position] += row[position + 2]
+        self._current[station_id] = row
+        self._updates += 1
+        if self._updates >= max(RESUM_INTERVAL, len(self._current)):
+            self._resum()
+
+        _, _, temperature, humidite, pression = row
+        self.temperature.add(temperature)
+        self.humidite.add(humidite)
+        self.pression.add(pression)
+        if self.latest is None or row[0] >= self.latest[1][0]:
+            self.latest = (station_id, row)
+        if self._max_age is not None:
+            heapq.heappush(self._expiry, (row[0], station_id))
+            self.expire(self.latest[1][0] - self._max_age)
+
+    def expire(self, cutoff: int) -> int:
+        """
+        Retire les mesures actuelles antérieures à une date : leurs stations
+        ne comptent plus dans la moyenne jusqu'à leur prochaine mesure
+        (fait à chaque mesure reçue, avec l'âge maximal du résumé).
+
+        Args:
+            cutoff: La date limite, en secondes depuis l'epoch Unix
+
+        Returns:
+            Le nombre de mesures actuelles retirées
+        """
+        expired = 0
+        expiry = self._expiry
+        while expiry and expiry[0][0] < cutoff:
+            epoch, station_id = heapq.heappop(expiry)
+            row = self._current.get(station_id)
+            if row is None or row[0] != epoch:
+                continue
+            del self._current[station_id]
+            for position in range(len(FIELDS)):
+                self._sums[position] -= row[position + 2]
+            expired += 1
+        if expired and not self._current:
+            self._sums = [0.0, 0.0, 0.0]
+        return expired
+
+    def _resum(self) -> None:
+        """Recalcule exactement les sommes des mesures actuelles."""
+        rows = self._current.values()
+        self._sums = [math.fsum(row[position + 2] for row in rows)
+                      for position in range(len(FIELDS))]
+        self._updates = 0
+
+    def current(self, station_id: str) -> Optional[Row]:
+        """
+        Args:
+            station_id: L'identifiant de la station
+
+        Returns:
+            La dernière mesure de la station, ou None si elle n'en a reçu aucune
+        """
+        return self._current.get(station_id)
+
+    def current_mean(self, field: str = 'temperature') -> Optional[float]:
+        """
+        Args:
+            field: La grandeur ('temperature', 'humidite' ou 'pression')
+
+        Returns:
+            La moyenne des dernières mesures des stations, ou None si aucune mesure
+
+        Raises:
+            KeyError: Si la grandeur est inconnue
+        """
+        position = _POSITIONS[field]
+        if not self._current:
+            return None
+        return self._sums[position] / len(self._current)
+
+
+class StationFeed(MeasurementObserver):
+    """
+    Observateur d'une station qui transmet chacune de ses nouvelles mesures
+    aux résumés de sa ville et de son pays.
+    """
+
+    def __init__(self, station_id: str, summaries: Sequence[LocationSummary]):
+        """
+        Args:
+            station_id: L'identifiant de la station
+            summaries: Les résumés à alimenter
+        """
+        super().__init__()
+        self._station_id = station_id
+        self._summaries = tuple(summaries)
+
+    def _add_row(self, row: Row) -> None:
+        """Transmet une mesure aux résumés."""
+        for summary in self._summaries:
+            summary.add(self._station_id, row)
+
+
+class LocationSummaries:
+    """Résumés des villes et des pays, indexés par identifiant."""
+
+    def __init__(self, max_age: Optional[int] = MAX_CURRENT_AGE):
+        """
+        Args:
+            max_age: Âge maximal d'une mesure actuelle (voir LocationSummary)
+        """
+        self._max_age = max_age
+        self._villes: Dict[str, LocationSummary] = {}
+        self._pays: Dict[str, LocationSummary] = {}
+
+    def feed(self, station: Station) -> StationFeed:
+        """
+        Crée l'observateur qui alimente les résumés de la ville et du pays
+        d'une station (créés au besoin).
+
+        Args:
+            station: La station
+
+        Returns:
+            L'observateur à alimenter avec les mesures de la station
+        """
+        summaries = []
+        ville = station.ville
+        if ville is not None:
+            summaries.append(self._summary(self._villes, ville.id))
+            if ville.pays is not None:
+                summaries.append(self._summary(self._pays, ville.pays.id))
+        return StationFeed(station.id, summaries)
+
+    def summary(self, location: Union[Ville, Pays]) -> Optional[LocationSummary]:
+        """
+        Args:
+            location: Une ville ou un pays
+
+        Returns:
+            Le résumé de la localisation, ou None si aucune de ses stations
+            n'est suivie
+        """
+        summaries = self._villes if isinstance(location, Ville) else self._pays
+        return summaries.get(location.id)
+
+    def _summary(self, summaries: Dict[str, LocationSummary], location_id: str) -> LocationSummary:
+        """Retourne le résumé d'une localisation, créé au besoin."""
+        summary = summaries.get(location_id)
+        if summary is None:
+            summary = summaries[location_id] = LocationSummary(location_id, self._max_age)
+        return summary
@@ -0,0 +1,259 @@
+"""
+Percentiles approchés en mémoire bornée (sketch KLL).
+
+Un sketch KLL (Karnin, Lang, Liberty, 2016) range les valeurs dans une
+pile de « compacteurs ». Quand un compacteur est plein, il est trié et une
+valeur sur deux (choisie au hasard entre les paires) monte au niveau
+supérieur, où elle pèse deux fois plus. Les capacités décroissent
+géométriquement (facteur 2/3) vers les niveaux bas : la mémoire reste de
+l'ordre de 3k valeurs, quel que soit le nombre de valeurs ajoutées.
+
+Borne d'erreur : pour k = 200, le rang d'un percentile estimé s'écarte du
+rang exact de moins de 1,7 % environ du nombre de valeurs (ex. le p95
+retourné est entre les vrais p93,3 et p96,7) avec une probabilité
+supérieure à 99 %. L'erreur décroît en 1/k. Deux sketches fusionnés
+gardent la même garantie, ce qui permet de calculer les percentiles d'une
+ville ou d'un pays à partir de ceux de ses stations.
+"""
+import math
+import random
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from weather_app.analytics.base import MeasurementObserver, Row
+
+# Grandeurs suivies par défaut
+SKETCH_FIELDS = ('temperature', 'humidite')
+_ROW_INDEX = {'temperature': 2, 'humidite': 3, 'pression': 4}
+
+
+class KllSketch:
+    """Sketch KLL de quantiles, fusionnable."""
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        """
+        Args:
+            k: Précision (capacité du compacteur de plus haut niveau)
+            seed: Graine du tirage aléatoire des compactages (optionnel)
+
+        Raises:
+            ValueError: Si k est inférieur à 8
+        """
+        if k < 8:
+            raise ValueError("k doit être supérieur ou égal à 8")
+        self._k = k
+        self._random = random.Random(seed)
+        self._compactors: List[List[float]] = [[]]
+        self._size = 0
+        self._max_size = 0
+        self._count = 0
+        self._update_max_size()
+
+    @property
+    def k(self) -> int:
+        """Retourne le paramètre de précision."""
+        return self._k
+
+    @property
+    def count(self) -> int:
+        """Retourne le nombre de valeurs ajoutées."""
+        return self._count
+
+    @property
+    def retained(self) -> int:
+        """Retourne le nombre de valeurs conservées en mémoire."""
+        return self._size
+
+    def add(self, value: float) -> None:
+        """
+        Args:
+            value: La valeur à ajouter
+        """
+        self._compactors[0].append(value)
+        self._size += 1
+        self._count += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def merge(self, other: 'KllSketch') -> None:
+        """
+        Ajoute les valeurs d'un autre sketch à celui-ci (l'autre est inchangé).
+
+        Args:
+            other: Le sketch à fusionner
+        """
+        # pylint: disable=protected-access
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for level, items in enumerate(other._compactors):
+            self._compactors[level].extend(items)
+        self._count += other._count
+        self._size = sum(len(items) for items in self._compactors)
+        while self._size >= self._max_size:
+            self._compress()
+
+    def rank(self, value: float) -> float:
+        """
+        Args:
+            value: La valeur
+
+        Returns:
+            La proportion estimée des valeurs inférieures ou égales (0 à 1)
+        """
+        if not self._count:
+            return 0.0
+        below = sum(
+            (1 << level) * sum(1 for item in items if item <= value)
+            for level, items in enumerate(self._compactors)
+        )
+        return below / self._weight()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Args:
+            q: Le quantile demandé, entre 0 et 1 (ex. 0.95 pour le p95)
+
+        Returns:
+            La valeur estimée, ou None si le sketch est vide
+
+        Raises:
+            ValueError: Si q n'est pas entre 0 et 1
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Sequence[float]) -> List[Optional[float]]:
+        """
+        Estime plusieurs quantiles en un seul tri des valeurs conservées.
+
+        Args:
+            qs: Les quantiles demandés, entre 0 et 1
+
+        Returns:
+            Les valeurs estimées (None si le sketch est vide)
+
+        Raises:
+            ValueError: Si un quantile n'est pas entre 0 et 1
+        """
+        if any(not 0 <= q <= 1 for q in qs):
+            raise ValueError("Les quantiles doivent être compris entre 0 et 1")
+        if not self._count:
+            return [None] * len(qs)
+
+        weighted = sorted(
+            (item, 1 << level)
+            for level, items in enumerate(self._compactors) for item in items
+        )
+        total = self._weight()
+        results = []
+        for q in qs:
+            target = q * total
+            cumulative = 0
+            value = weighted[-1][0]
+            for item, weight in weighted:
+                cumulative += weight
+                if cumulative >= target:
+                    value = item
+                    break
+            results.append(value)
+        return results
+
+    def copy(self) -> 'KllSketch':
+        """Retourne une copie indépendante du sketch."""
+        clone = KllSketch(self._k)
+        clone.merge(self)
+        return clone
+
+    @classmethod
+    def merged(cls, sketches: Iterable['KllSketch'], k: int = 200) -> 'KllSketch':
+        """
+        Args:
+            sketches: Les sketches à fusionner (inchangés)
+            k: Précision du sketch résultant
+
+        Returns:
+            Un nouveau sketch contenant les valeurs de tous les sketches
+        """
+        result = cls(k)
+        for sketch in sketches:
+            result.merge(sketch)
+        return result
+
+    def _weight(self) -> int:
+        """Retourne le poids total des valeurs conservées."""
+        return sum((1 << level) * len(items) for level, items in enumerate(self._compactors))
+
+    def _capacity(self, level: int) -> int:
+        """Retourne la capacité du compacteur d'un niveau."""
+        depth = len(self._compactors) - level - 1
+        return int(math.ceil(self._k * (2 / 3) ** depth)) + 1
+
+    def _update_max_size(self) -> None:
+        """Recalcule le nombre de valeurs conservées déclenchant un compactage."""
+        self._max_size = sum(self._capacity(level) for level in range(len(self._compactors)))
+
+    def _grow(self) -> None:
+        """Ajoute un niveau de compacteur."""
+        self._compactors.append([])
+        self._update_max_size()
+
+    def _compress(self) -> None:
+        """Compacte les niveaux pleins, du plus bas au plus haut."""
+        for level, items in enumerate(self._compactors):
+            if len(items) < self._capacity(level):
+                continue
+            if level + 1 == len(self._compactors):
+                self._grow()
+
+            items.sort()
+            # Une valeur impaire reste au même niveau
+            leftover = len(items) % 2
+            offset = leftover + self._random.randrange(2)
+            self._compactors[level + 1].extend(items[offset::2])
+            del items[leftover:]
+
+            self._size = sum(len(level_items) for level_items in self._compactors)
+            if self._size < self._max_size:
+                break
+
+
+class StationSketches(MeasurementObserver):
+    """
+    Sketches de quantiles d'une station (température et humidité par
+    défaut), tenus à jour à chaque ajout de mesures (observateur de Station).
+    """
+
+    def __init__(self, k: int = 200, fields: Sequence[str] = SKETCH_FIELDS):
+        """
+        Args:
+            k: Précision des sketches
+            fields: Les grandeurs suivies ('temperature', 'humidite', 'pression')
+
+        Raises:
+            ValueError: Si une grandeur est inconnue
+        """
+        super().__init__()
+        unknown = set(fields) - set(_ROW_INDEX)
+        if unknown:
+            raise ValueError(f"Grandeur(s) inconnue(s): {', '.join(sorted(unknown))}")
+        self._sketches: Dict[str, KllSketch] = {field: KllSketch(k) for field in fields}
+        # Position de chaque grandeur dans une ligne (epoch, décalage, temp., hum., pres.)
+        self._targets = [
+            (sketch, _ROW_INDEX[field]) for field, sketch in self._sketches.items()
+        ]
+
+    def _add_row(self, row: Row) -> None:
+        """Ajoute une mesure aux sketches."""
+        for sketch, index in self._targets:
+            sketch.add(row[index])
+
+    def sketch(self, field: str = 'temperature') -> KllSketch:
+        """
+        Args:
+            field: La grandeur
+
+        Returns:
+            Le sketch de la grandeur
+
+        Raises:
+            KeyError: Si la grandeur n'est pas suivie
+        """
+        return self._sketches[field]
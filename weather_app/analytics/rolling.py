@@ -0,0 +1,230 @@
+"""
+Statistiques sur fenêtres glissantes (dernière heure, 24 heures, 7 jours).
+
+Chaque fenêtre est tenue à jour en O(1) amorti par mesure : des sommes
+courantes donnent la moyenne et l'écart type, deux files monotones donnent
+le minimum et le maximum, et la tendance se lit aux deux extrémités de la
+fenêtre. Rien n'est recalculé à partir de la liste des mesures.
+"""
+import math
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from weather_app.analytics.base import MeasurementObserver, Row
+
+# Fenêtres tenues à jour par défaut, en secondes
+WINDOWS = {'1h': 3600, '24h': 86400, '7d': 7 * 86400}
+FIELDS = ('temperature', 'humidite', 'pression')
+
+
+class WindowStats:
+    """
+    Statistiques d'une grandeur sur une fenêtre.
+
+    Cette classe est une simple structure de données sans méthodes.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, window: 'RollingWindow'):
+        """
+        Args:
+            window: La fenêtre dont copier les statistiques
+        """
+        self.count = window.count
+        self.mean = window.mean
+        self.minimum = window.minimum
+        self.maximum = window.maximum
+        self.stddev = window.stddev
+        self.rate = window.rate
+
+
+class RollingWindow:
+    """
+    Fenêtre glissante sur une grandeur, alimentée dans l'ordre chronologique.
+
+    Les sommes portent sur les écarts à une valeur de référence (la première
+    valeur de la fenêtre), ce qui évite la perte de précision de la formule
+    E[x²] - E[x]² sur des valeurs élevées comme la pression.
+    """
+
+    __slots__ = ('_duration', '_values', '_minima', '_maxima',
+                 '_reference', '_sum', '_sum_squares')
+
+    def __init__(self, duration: int):
+        """
+        Args:
+            duration: Durée de la fenêtre, en secondes
+
+        Raises:
+            ValueError: Si la durée n'est pas strictement positive
+        """
+        if duration < 1:
+            raise ValueError("La durée de la fenêtre doit être supérieure ou égale à 1 seconde")
+        self._duration = duration
+        self._values: Deque[Tuple[int, float]] = deque()
+        # Candidats au minimum (valeurs croissantes) et au maximum (décroissantes)
+        self._minima: Deque[Tuple[int, float]] = deque()
+        self._maxima: Deque[Tuple[int, float]] = deque()
+        self._reference = 0.0
+        self._sum = 0.0
+        self._sum_squares = 0.0
+
+    def add(self, epoch: int, value: float) -> None:
+        """
+        Ajoute une valeur, puis retire celles sorties de la fenêtre.
+
+        Args:
+            epoch: Horodatage de la valeur (croissant d'un appel à l'autre)
+            value: La valeur
+        """
+        if not self._values:
+            self._reference = value
+        self._values.append((epoch, value))
+        delta = value - self._reference
+        self._sum += delta
+        self._sum_squares += delta * delta
+
+        while self._minima and self._minima[-1][1] >= value:
+            self._minima.pop()
+        self._minima.append((epoch, value))
+        while self._maxima and self._maxima[-1][1] <= value:
+            self._maxima.pop()
+        self._maxima.append((epoch, value))
+
+        self.expire(epoch)
+
+    def expire(self, now: int) -> None:
+        """
+        Retire les valeurs antérieures à la fenêtre (now - durée, now].
+
+        Args:
+            now: Fin de la fenêtre
+        """
+        cutoff = now - self._duration
+        values = self._values
+        while values and values[0][0] <= cutoff:
+            _, value = values.popleft()
+            delta = value - self._reference
+            self._sum -= delta
+            self._sum_squares -= delta * delta
+        while self._minima and self._minima[0][0] <= cutoff:
+            self._minima.popleft()
+        while self._maxima and self._maxima[0][0] <= cutoff:
+            self._maxima.popleft()
+        if not values:
+            # Fenêtre vide : repart de sommes exactes
+            self._sum = self._sum_squares = 0.0
+
+    @property
+    def count(self) -> int:
+        """Retourne le nombre de valeurs dans la fenêtre."""
+        return len(self._values)
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Retourne la moyenne, ou None si la fenêtre est vide."""
+        if not self._values:
+            return None
+        return self._reference + self._sum / len(self._values)
+
+    @property
+    def minimum(self) -> Optional[float]:
+        """Retourne le minimum, ou None si la fenêtre est vide."""
+        return self._minima[0][1] if self._minima else None
+
+    @property
+    def maximum(self) -> Optional[float]:
+        """Retourne le maximum, ou None si la fenêtre est vide."""
+        return self._maxima[0][1] if self._maxima else None
+
+    @property
+    def stddev(self) -> Optional[float]:
+        """Retourne l'écart type (population), ou None si la fenêtre est vide."""
+        count = len(self._values)
+        if not count:
+            return None
+        variance = (self._sum_squares - self._sum * self._sum / count) / count
+        return math.sqrt(max(0.0, variance))
+
+    @property
+    def rate(self) -> Optional[float]:
+        """
+        Retourne la variation par heure entre la première et la dernière
+        valeur de la fenêtre, ou None s'il y a moins de deux instants.
+        """
+        if len(self._values) < 2:
+            return None
+        (first_epoch, first), (last_epoch, last) = self._values[0], self._values[-1]
+        if last_epoch == first_epoch:
+            return None
+        return (last - first) * 3600 / (last_epoch - first_epoch)
+
+
+class RollingStats(MeasurementObserver):
+    """
+    Statistiques glissantes d'une station (température, humidité, pression),
+    tenues à jour à chaque ajout de mesures (observateur de Station).
+
+    Les fenêtres se terminent à la dernière mesure reçue ; `stats(now=...)`
+    les fait avancer jusqu'à l'instant demandé.
+    """
+
+    def __init__(self, windows: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            windows: Nom -> durée en secondes des fenêtres (WINDOWS par défaut)
+        """
+        super().__init__()
+        self._windows = {
+            name: {field: RollingWindow(duration) for field in FIELDS}
+            for name, duration in (windows or WINDOWS).items()
+        }
+
+    @property
+    def window_names(self) -> Tuple[str, ...]:
+        """Retourne les noms des fenêtres tenues à jour."""
+        return tuple(self._windows)
+
+    def _add_row(self, row: Row) -> None:
+        """Ajoute une mesure à chaque fenêtre."""
+        epoch, _, temperature, humidite, pression = row
+        for fields in self._windows.values():
+            fields['temperature'].add(epoch, temperature)
+            fields['humidite'].add(epoch, humidite)
+            fields['pression'].add(epoch, pression)
+
+    def stats(self,
+              field: str = 'temperature',
+              window: str = '1h',
+              now: Optional[int] = None) -> WindowStats:
+        """
+        Args:
+            field: La grandeur ('temperature', 'humidite' ou 'pression')
+            window: Le nom de la fenêtre (ex. '24h')
+            now: Fin de la fenêtre (dernière mesure reçue si absent)
+
+        Returns:
+            Les statistiques de la grandeur sur la fenêtre
+
+        Raises:
+            KeyError: Si la grandeur ou la fenêtre est inconnue
+        """
+        rolling = self._windows[window][field]
+        if now is not None:
+            rolling.expire(now)
+        return WindowStats(rolling)
+
+    def snapshot(self, window: str = '1h', now: Optional[int] = None) -> Dict[str, WindowStats]:
+        """
+        Args:
+            window: Le nom de la fenêtre
+            now: Fin de la fenêtre (dernière mesure reçue si absent)
+
+        Returns:
+            Les statistiques de chaque grandeur sur la fenêtre
+
+        Raises:
+            KeyError: Si la fenêtre est inconnue
+        """
+        return {field: self.stats(field, window, now) for field in FIELDS}
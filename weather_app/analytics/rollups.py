@@ -0,0 +1,247 @@
+"""
+Agrégats précalculés des mesures (min, max, moyenne, nombre) par intervalle.
+
+Les agrégats sont tenus à jour à chaque mesure reçue, à plusieurs
+résolutions (10 minutes, heure, jour). Une requête sur une longue période
+lit quelques agrégats journaliers au lieu de regrouper les mesures brutes.
+"""
+import math
+from bisect import bisect_right, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from weather_app.analytics.base import MeasurementObserver, Row
+
+# Résolutions tenues à jour, en secondes (10 minutes, heure, jour)
+RESOLUTIONS = (600, 3600, 86400)
+
+
+class Aggregate:
+    """Nombre, minimum, maximum et somme d'une grandeur ; fusionnable."""
+
+    __slots__ = ('count', 'minimum', 'maximum', 'total')
+
+    def __init__(self):
+        """Initialise un agrégat vide."""
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.total = 0.0
+
+    def add(self, value: float) -> None:
+        """
+        Args:
+            value: La valeur à ajouter
+        """
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: 'Aggregate') -> None:
+        """
+        Args:
+            other: L'agrégat à ajouter à celui-ci
+        """
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Retourne la moyenne, ou None si l'agrégat est vide."""
+        return self.total / self.count if self.count else None
+
+
+class RollupBucket:
+    """Agrégats de température, humidité et pression d'un intervalle."""
+
+    __slots__ = ('start', 'utc_offset', 'temperature', 'humidite', 'pression')
+
+    def __init__(self, start: int, utc_offset: int):
+        """
+        Args:
+            start: Début de l'intervalle, en secondes depuis l'epoch Unix
+            utc_offset: Décalage UTC (minutes) utilisé pour l'alignement
+        """
+        self.start = start
+        self.utc_offset = utc_offset
+        self.temperature = Aggregate()
+        self.humidite = Aggregate()
+        self.pression = Aggregate()
+
+    @property
+    def count(self) -> int:
+        """Retourne le nombre de mesures de l'intervalle."""
+        return self.temperature.count
+
+    def add(self, temperature: float, humidite: int, pression: int) -> None:
+        """Ajoute une mesure à l'intervalle."""
+        self.temperature.add(temperature)
+        self.humidite.add(humidite)
+        self.pression.add(pression)
+
+    def merge(self, other: 'RollupBucket') -> None:
+        """Ajoute les agrégats d'un autre intervalle à celui-ci."""
+        self.temperature.merge(other.temperature)
+        self.humidite.merge(other.humidite)
+        self.pression.merge(other.pression)
+
+
+class Rollup:
+    """
+    Intervalles d'une résolution donnée, triés par date de début.
+
+    Les intervalles sont alignés sur l'heure locale de la mesure (décalage
+    UTC) : un agrégat journalier couvre une journée locale, comme
+    l'affichage des mesures.
+    """
+
+    def __init__(self, resolution: int):
+        """
+        Args:
+            resolution: Durée d'un intervalle, en secondes
+
+        Raises:
+            ValueError: Si la résolution n'est pas strictement positive
+        """
+        if resolution < 1:
+            raise ValueError("La résolution doit être supérieure ou égale à 1 seconde")
+        self._resolution = resolution
+        self._starts: List[int] = []
+        self._buckets: Dict[int, RollupBucket] = {}
+
+    @property
+    def resolution(self) -> int:
+        """Retourne la durée d'un intervalle, en secondes."""
+        return self._resolution
+
+    @property
+    def first_start(self) -> Optional[int]:
+        """Retourne le début du plus ancien intervalle, ou None s'il n'y en a aucun."""
+        return self._starts[0] if self._starts else None
+
+    def add(self, row: Row) -> None:
+        """
+        Ajoute une mesure à l'intervalle qui la contient.
+
+        Args:
+            row: La mesure (epoch, décalage UTC en minutes, température,
+                humidité, pression)
+        """
+        epoch, utc_offset, temperature, humidite, pression = row
+        start = epoch - (epoch + utc_offset * 60) % self._resolution
+        bucket = self._buckets.get(start)
+        if bucket is None:
+            bucket = self._buckets[start] = RollupBucket(start, utc_offset)
+            if not self._starts or start > self._starts[-1]:
+                self._starts.append(start)
+            else:
+                insort(self._starts, start)
+        bucket.add(temperature, humidite, pression)
+
+    def buckets(self,
+                start_epoch: Optional[int] = None,
+                end_epoch: Optional[int] = None) -> List[RollupBucket]:
+        """
+        Args:
+            start_epoch: Début de la période (optionnel)
+            end_epoch: Fin de la période, incluse (optionnel)
+
+        Returns:
+            Les intervalles qui recoupent la période, du plus ancien au plus récent
+        """
+        low = 0 if start_epoch is None else bisect_right(
+            self._starts, start_epoch - self._resolution
+        )
+        high = len(self._starts) if end_epoch is None else bisect_right(self._starts, end_epoch)
+        return [self._buckets[start] for start in self._starts[low:high]]
+
+    def __len__(self) -> int:
+        """Retourne le nombre d'intervalles."""
+        return len(self._starts)
+
+
+class StationRollups(MeasurementObserver):
+    """
+    Agrégats d'une station à toutes les résolutions, tenus à jour à chaque
+    ajout de mesures (observateur de Station).
+    """
+
+    def __init__(self, resolutions: Iterable[int] = RESOLUTIONS):
+        """
+        Args:
+            resolutions: Les résolutions à tenir à jour, en secondes
+        """
+        super().__init__()
+        self._rollups = {resolution: Rollup(resolution) for resolution in sorted(resolutions)}
+
+    @property
+    def resolutions(self) -> Tuple[int, ...]:
+        """Retourne les résolutions tenues à jour, de la plus fine à la plus large."""
+        return tuple(self._rollups)
+
+    def _add_row(self, row: Row) -> None:
+        """Ajoute une mesure à chaque résolution."""
+        for rollup in self._rollups.values():
+            rollup.add(row)
+
+    def rollup(self, resolution: int) -> Rollup:
+        """
+        Args:
+            resolution: La résolution, en secondes
+
+        Returns:
+            Les agrégats à cette résolution
+
+        Raises:
+            KeyError: Si la résolution n'est pas tenue à jour
+        """
+        return self._rollups[resolution]
+
+    def resolution_for(self, start_epoch: int, end_epoch: int, min_buckets: int = 24) -> int:
+        """
+        Choisit la résolution la plus large qui découpe encore la période en
+        au moins `min_buckets` intervalles (la plus fine sinon).
+
+        Args:
+            start_epoch: Début de la période
+            end_epoch: Fin de la période
+
+        Returns:
+            La résolution, en secondes
+        """
+        span = max(0, end_epoch - start_epoch)
+        chosen = self.resolutions[0]
+        for resolution in self.resolutions:
+            if span // resolution >= min_buckets:
+                chosen = resolution
+        return chosen
+
+    def query(self,
+              start_epoch: Optional[int] = None,
+              end_epoch: Optional[int] = None,
+              min_buckets: int = 24) -> Tuple[int, List[RollupBucket]]:
+        """
+        Retourne les agrégats d'une période, à la résolution la plus large
+        qui la découpe en au moins `min_buckets` intervalles.
+
+        Args:
+            start_epoch: Début de la période (première mesure agrégée si absent)
+            end_epoch: Fin de la période, incluse (dernière mesure si absent)
+            min_buckets: Nombre minimal d'intervalles souhaité
+
+        Returns:
+            La résolution choisie et les intervalles de la période
+        """
+        oldest = self._rollups[self.resolutions[0]].first_start
+        if oldest is None:
+            return self.resolutions[0], []
+        first = oldest if start_epoch is None else start_epoch
+        last = self._latest if end_epoch is None else end_epoch
+        resolution = self.resolution_for(first, last, min_buckets)
+        return resolution, self._rollups[resolution].buckets(start_epoch, end_epoch)
+
+    def __len__(self) -> int:
+        """Retourne le nombre d'intervalles à la résolution la plus fine."""
+        return len(self._rollups[self.resolutions[0]])
@@ -0,0 +1,243 @@
+"""
+Service qui tient à jour les statistiques des stations suivies.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from weather_app.analytics.base import MeasurementObserver
+from weather_app.analytics.hierarchy import LocationSummaries, LocationSummary, StationFeed
+from weather_app.analytics.quantiles import KllSketch, StationSketches
+from weather_app.analytics.rolling import RollingStats, WindowStats
+from weather_app.analytics.rollups import StationRollups
+from weather_app.models.location import Pays, Station, Ville
+from weather_app.models.measurement_series import MeasurementSeries
+from weather_app.patterns.observer import Observer
+from weather_app.storage.time_series_store import TimeSeriesStore
+
+
+class StationAnalytics(Observer):
+    """
+    Statistiques d'une station : agrégats par intervalle, fenêtres
+    glissantes et sketches de quantiles, alimentés ensemble à chaque ajout
+    de mesures (ainsi que les résumés de sa ville et de son pays).
+    """
+
+    def __init__(self, feed: Optional[MeasurementObserver] = None):
+        """
+        Args:
+            feed: Observateur supplémentaire à alimenter, comme celui des
+                résumés de la ville et du pays (optionnel)
+        """
+        self.rollups = StationRollups()
+        self.rolling = RollingStats()
+        self.sketches = StationSketches()
+        self.feed = feed
+
+    def _components(self):
+        """Retourne les statistiques alimentées par les mesures."""
+        components = (self.rollups, self.rolling, self.sketches)
+        return components if self.feed is None else components + (self.feed,)
+
+    def add_series(self, series: MeasurementSeries) -> None:
+        """
+        Ajoute les mesures d'une série, en relâchant les vues utilisées.
+
+        Args:
+            series: Les mesures, dans l'ordre chronologique
+        """
+        _add_series(self._components(), series)
+
+    def update(self, subject: Any, *args, **kwargs) -> None:
+        """
+        Transmet les mesures ajoutées à la station à chaque statistique.
+
+        Args:
+            subject: La station observée
+            *args: Arguments positionnels
+            **kwargs: Les colonnes des nouvelles mesures
+        """
+        for component in self._components():
+            component.update(subject, *args, **kwargs)
+
+
+class AnalyticsService:
+    """
+    Statistiques des stations, indexées par identifiant de station.
+
+    Les statistiques survivent aux objets Station : l'interface recrée les
+    stations à chaque affichage, et `track` rattache les statistiques
+    existantes à la nouvelle instance.
+    """
+
+    def __init__(self, store: Optional[TimeSeriesStore] = None):
+        """
+        Args:
+            store: Base historique utilisée pour initialiser les statistiques
+                d'une station lors de son premier suivi (optionnel)
+        """
+        self._store = store
+        self._stations: Dict[str, StationAnalytics] = {}
+        self._summaries = LocationSummaries()
+        # Identifiant de station -> observateur qui alimente sa ville et son pays
+        self._feeds: Dict[str, StationFeed] = {}
+
+    def track(self, station: Station) -> StationAnalytics:
+        """
+        Suit une station : ses mesures actuelles (et son historique, au premier
+        suivi) sont prises en compte, puis chaque ajout de mesures met à jour
+        les statistiques.
+
+        Args:
+            station: La station à suivre
+
+        Returns:
+            Les statistiques de la station
+        """
+        analytics = self._stations.get(station.id)
+        if analytics is None:
+            analytics = self._stations[station.id] = StationAnalytics(
+                feed=self._feed(station)
+            )
+            if self._store is not None:
+                analytics.add_series(self._store.query(station.id))
+        analytics.add_series(station.measurements)
+        # Les statistiques alimentent aussi les résumés (voir track_all)
+        station.detach(analytics.feed)
+        station.attach(analytics)
+        return analytics
+
+    def track_all(self, stations: Iterable[Station]) -> None:
+        """
+        Fait alimenter par plusieurs stations les résumés de leur ville et de
+        leur pays. Seule la dernière mesure de la base historique est lue :
+        l'historique complet d'une station n'est lu qu'à son suivi par `track`.
+
+        Args:
+            stations: Les stations à suivre
+        """
+        for station in stations:
+            if station.id in self._stations:
+                self.track(station)
+                continue
+            feed = self._feed(station)
+            _add_series((feed,), station.measurements)
+            station.attach(feed)
+
+    def _feed(self, station: Station) -> StationFeed:
+        """Retourne l'observateur des résumés d'une station, créé au besoin."""
+        feed = self._feeds.get(station.id)
+        if feed is None:
+            feed = self._feeds[station.id] = self._summaries.feed(station)
+            if self._store is not None:
+                _add_series((feed,), self._store.latest(station.id))
+        return feed
+
+    def summary(self, location: Union[Ville, Pays]) -> Optional[LocationSummary]:
+        """
+        Résumé en direct d'une ville ou d'un pays, tenu à jour par les
+        stations suivies sans relire leurs mesures.
+
+        Args:
+            location: Une ville ou un pays
+
+        Returns:
+            Le résumé, ou None si aucune station de la localisation n'est suivie
+        """
+        return self._summaries.summary(location)
+
+    def rollups(self, station_id: str) -> Optional[StationRollups]:
+        """
+        Args:
+            station_id: L'identifiant de la station
+
+        Returns:
+            Les agrégats de la station, ou None si elle n'est pas suivie
+        """
+        analytics = self._stations.get(station_id)
+        return None if analytics is None else analytics.rollups
+
+    def rolling(self, station_id: str) -> Optional[RollingStats]:
+        """
+        Args:
+            station_id: L'identifiant de la station
+
+        Returns:
+            Les statistiques glissantes de la station, ou None si elle n'est pas suivie
+        """
+        analytics = self._stations.get(station_id)
+        return None if analytics is None else analytics.rolling
+
+    def snapshot(self,
+                 window: str = '1h',
+                 now: Optional[int] = None) -> Dict[str, Dict[str, WindowStats]]:
+        """
+        Statistiques glissantes de toutes les stations suivies, sans relire
+        aucune mesure (adapté à un tableau de bord interrogé fréquemment).
+
+        Args:
+            window: Le nom de la fenêtre (ex. '24h')
+            now: Fin des fenêtres (dernière mesure de chaque station si absent)
+
+        Returns:
+            Identifiant de station -> statistiques de chaque grandeur
+        """
+        return {
+            station_id: analytics.rolling.snapshot(window, now)
+            for station_id, analytics in self._stations.items()
+        }
+
+    def sketch(self,
+               location: Union[Station, Ville, Pays],
+               field: str = 'temperature') -> KllSketch:
+        """
+        Fusionne les sketches des stations suivies d'une localisation.
+
+        Args:
+            location: Une station, une ville ou un pays
+            field: La grandeur ('temperature' ou 'humidite')
+
+        Returns:
+            Un nouveau sketch couvrant toutes les stations suivies de la localisation
+        """
+        return KllSketch.merged(
+            self._stations[station.id].sketches.sketch(field)
+            for station in _stations_of(location) if station.id in self._stations
+        )
+
+    def quantiles(self,
+                  location: Union[Station, Ville, Pays],
+                  field: str = 'temperature',
+                  qs: Sequence[float] = (0.5, 0.95, 0.99)) -> List[Optional[float]]:
+        """
+        Percentiles approchés d'une station, d'une ville ou d'un pays
+        (erreur de rang d'environ 1,7 %, voir analytics.quantiles).
+
+        Args:
+            location: Une station, une ville ou un pays
+            field: La grandeur ('temperature' ou 'humidite')
+            qs: Les quantiles demandés (p50, p95, p99 par défaut)
+
+        Returns:
+            Les valeurs estimées (None si aucune mesure)
+        """
+        return self.sketch(location, field).quantiles(qs)
+
+
+def _add_series(observers: Iterable[MeasurementObserver], series: MeasurementSeries) -> None:
+    """Transmet les mesures d'une série à des observateurs, en relâchant les vues utilisées."""
+    views = [series.epochs(), series.temperatures(), series.humidites(),
+             series.pressions(), series.utc_offsets()]
+    try:
+        for observer in observers:
+            observer.add_columns(*views[:4], utc_offsets=views[4])
+    finally:
+        for view in views:
+            view.release()
+
+
+def _stations_of(location: Union[Station, Ville, Pays]) -> List[Station]:
+    """Retourne les stations d'une localisation."""
+    if isinstance(location, Station):
+        return [location]
+    if isinstance(location, Ville):
+        return location.get_stations()
+    return [station for ville in location.get_villes() for station in ville.get_stations()]
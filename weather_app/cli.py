@@ -0,0 +1,187 @@
+"""
+Commandes non interactives : rafraîchissement, affichage et export des
+mesures, migration de la configuration vers SQLite.
+
+Chaque commande retourne un code de sortie (EXIT_OK, EXIT_FAILURE ou
+EXIT_USAGE) ; aucune ne lit l'entrée standard. Les messages de chargement
+de la configuration sont envoyés sur la sortie d'erreur pour ne pas se
+mêler à un export écrit sur la sortie standard.
+"""
+import argparse
+import os
+import sys
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List
+
+from weather_app.config.singleton_config import (
+    CONFIG_DB, ConfigurationSingleton, default_data_dir
+)
+from weather_app.config.sqlite_backend import migrate_json_config
+from weather_app.models.builders import load_stations
+from weather_app.models.location import Station
+from weather_app.patterns.command import (
+    CommandInvoker, DisplayMeasurementsCommand, ExportMeasurementsCommand,
+    RefreshStationsCommand
+)
+from weather_app.services.api_service import ApiService
+from weather_app.storage.time_series_store import TimeSeriesStore
+
+# Codes de sortie
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_USAGE = 2
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """
+    Exécute une sous-commande de la ligne de commande.
+
+    Args:
+        args: Les arguments analysés (attribut `command` : 'refresh', 'show',
+            'export' ou 'migrate-config')
+
+    Returns:
+        Le code de sortie du processus
+    """
+    if args.command == 'migrate-config':
+        return _migrate_config()
+    with redirect_stdout(sys.stderr):
+        config = ConfigurationSingleton()
+    handlers: Dict[str, Callable[..., int]] = {
+        'refresh': _refresh, 'show': _show, 'export': _export
+    }
+    with TimeSeriesStore(os.path.join(config.data_dir, 'measurements.db')) as store:
+        return handlers[args.command](args, config, store)
+
+
+def _select_stations(config: ConfigurationSingleton, station_ids: List[str]) -> List[Station]:
+    """
+    Args:
+        config: La configuration
+        station_ids: Les stations demandées (toutes si vide)
+
+    Returns:
+        Les stations demandées, dans l'ordre de la configuration
+
+    Raises:
+        KeyError: Si une station demandée n'est pas configurée
+    """
+    stations = load_stations(config)
+    if not station_ids:
+        return stations
+    unknown = set(station_ids) - {station.id for station in stations}
+    if unknown:
+        raise KeyError(', '.join(sorted(unknown)))
+    return [station for station in stations if station.id in station_ids]
+
+
+def _refresh(args: argparse.Namespace,
+             config: ConfigurationSingleton,
+             store: TimeSeriesStore) -> int:
+    """Rafraîchit les stations demandées en parallèle et enregistre leurs mesures."""
+    if not args.all and not args.station_ids:
+        print("❌ Indiquez des identifiants de station ou --all.", file=sys.stderr)
+        return EXIT_USAGE
+    try:
+        stations = _select_stations(config, [] if args.all else args.station_ids)
+    except KeyError as e:
+        print(f"❌ Station(s) inconnue(s): {e.args[0]}", file=sys.stderr)
+        return EXIT_USAGE
+    if not stations:
+        print("⚠️  Aucune station configurée.", file=sys.stderr)
+        return EXIT_FAILURE
+
+    # La dernière mesure enregistrée sert de point de départ aux requêtes
+    # incrémentales : seules les nouvelles mesures sont demandées.
+    for station in stations:
+        station.add_measurements(store.latest(station.id))
+    api_service = ApiService(pool_maxsize=args.workers, incremental=True, store=store)
+    try:
+        results = CommandInvoker().execute_command(RefreshStationsCommand(
+            api_service, stations, max_workers=args.workers, force_refresh=args.force
+        ))
+    finally:
+        api_service.close()
+    return EXIT_OK if all(result.success for result in results) else EXIT_FAILURE
+
+
+def _show(args: argparse.Namespace,
+          config: ConfigurationSingleton,
+          store: TimeSeriesStore) -> int:
+    """Affiche une station et ses dernières mesures enregistrées."""
+    try:
+        station = _select_stations(config, [args.station_id])[0]
+    except KeyError as e:
+        print(f"❌ Station inconnue: {e.args[0]}", file=sys.stderr)
+        return EXIT_USAGE
+
+    status = EXIT_OK
+    invoker = CommandInvoker()
+    if args.refresh:
+        station.add_measurements(store.latest(station.id))
+        api_service = ApiService(incremental=True, store=store)
+        try:
+            results = invoker.execute_command(RefreshStationsCommand(api_service, [station]))
+        finally:
+            api_service.close()
+        status = EXIT_OK if results[0].success else EXIT_FAILURE
+
+    station.clear_measurements()
+    station.add_measurements(store.latest(station.id, args.limit))
+    print(station.get_info())
+    print(f"📊 Mesures enregistrées: {store.count(station.id)}")
+    for measurement in invoker.execute_command(DisplayMeasurementsCommand(station)):
+        print(f"   {measurement}")
+    return status
+
+
+def _export(args: argparse.Namespace,
+            config: ConfigurationSingleton,
+            store: TimeSeriesStore) -> int:
+    """Exporte les mesures enregistrées (JSON Lines) dans un fichier ou sur la sortie standard."""
+    if args.station_ids:
+        try:
+            station_ids = [station.id for station in _select_stations(config, args.station_ids)]
+        except KeyError as e:
+            print(f"❌ Station(s) inconnue(s): {e.args[0]}", file=sys.stderr)
+            return EXIT_USAGE
+    else:
+        station_ids = store.station_ids()
+
+    invoker = CommandInvoker()
+    if args.output == '-':
+        count = invoker.execute_command(
+            ExportMeasurementsCommand(store, station_ids, sys.stdout)
+        )
+    else:
+        try:
+            with open(args.output, 'w', encoding='utf-8') as output:
+                count = invoker.execute_command(
+                    ExportMeasurementsCommand(store, station_ids, output)
+                )
+        except OSError as e:
+            print(f"❌ Export impossible: {e}", file=sys.stderr)
+            return EXIT_FAILURE
+    print(f"✅ {count} mesure(s) exportée(s)", file=sys.stderr)
+    return EXIT_OK
+
+
+def _migrate_config() -> int:
+    """Copie config.json (et son journal) dans une base SQLite, une seule fois."""
+    data_dir = default_data_dir()
+    db_path = os.path.join(data_dir, CONFIG_DB)
+    try:
+        counts = migrate_json_config(os.path.join(data_dir, 'config.json'), db_path)
+    except FileExistsError:
+        print(f"❌ La configuration est déjà migrée : {db_path}", file=sys.stderr)
+        return EXIT_FAILURE
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"❌ Migration impossible: {e}", file=sys.stderr)
+        return EXIT_FAILURE
+
+    print(f"✅ {counts['pays']} pays, {counts['villes']} ville(s) et "
+          f"{counts['stations']} station(s) migrés dans {db_path}")
+    if counts["ignorées"]:
+        print(f"⚠️  {counts['ignorées']} ville(s) ou station(s) sans parent ignorée(s)")
+    print("config.json n'est plus utilisé ; supprimez config.db pour y revenir.")
+    return EXIT_OK
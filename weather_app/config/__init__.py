@@ -1,6 +1,13 @@
 """
 Module de configuration avec Singleton.
 """
+from .backend import ConfigBackend
+from .config_journal import ConfigJournal
+from .json_backend import JsonConfigBackend
 from .singleton_config import ConfigurationSingleton
+from .sqlite_backend import SqliteConfigBackend, migrate_json_config
 
-__all__ = ['ConfigurationSingleton']
+__all__ = [
+    'ConfigBackend', 'ConfigJournal', 'ConfigurationSingleton', 'JsonConfigBackend',
+    'SqliteConfigBackend', 'migrate_json_config'
+]
@@ -0,0 +1,186 @@
+"""
+Interface des stockages de la configuration (pays, villes, stations, réglages).
+
+ConfigurationSingleton délègue à l'une des implémentations :
+- JsonConfigBackend : tout en mémoire, persisté dans config.json et son journal ;
+- SqliteConfigBackend : base SQLite (config.db), pour les grands inventaires.
+
+Les méthodes retournent les mêmes structures quel que soit le stockage :
+des dictionnaires {identifiant: {"nom": ..., ...}} dans l'ordre d'ajout.
+"""
+from abc import ABC, abstractmethod
+from typing import ContextManager, Dict, List, Optional
+
+# Intervalle par défaut entre deux interrogations d'une station (mode démon)
+DEFAULT_POLL_INTERVAL = 600
+
+
+class ConfigBackend(ABC):
+    """
+    Stockage de la configuration.
+    Principe SOLID : Open/Closed - un nouveau stockage n'impose aucune
+    modification de ConfigurationSingleton ni de ses utilisateurs.
+    """
+
+    # pylint: disable=too-many-public-methods
+
+    @abstractmethod
+    def get_pays(self) -> Dict:
+        """Retourne tous les pays."""
+
+    @abstractmethod
+    def get_villes(self, pays_id: Optional[str] = None) -> Dict:
+        """Retourne toutes les villes ou celles d'un pays spécifique."""
+
+    @abstractmethod
+    def get_stations(self, ville_id: Optional[str] = None) -> Dict:
+        """Retourne toutes les stations ou celles d'une ville spécifique."""
+
+    @abstractmethod
+    def get_station_by_id(self, station_id: str) -> Optional[Dict]:
+        """Récupère une station par son ID."""
+
+    @abstractmethod
+    def get_setting(self, key: str, default=None):
+        """
+        Args:
+            key: Le nom du réglage global (section "settings")
+            default: La valeur retournée si le réglage n'est pas défini
+
+        Returns:
+            La valeur du réglage
+        """
+
+    @abstractmethod
+    def set_max_measurements(self,
+                             max_measurements: Optional[int],
+                             station_id: Optional[str] = None) -> bool:
+        """
+        Définit le nombre maximal de mesures conservées, pour une station ou
+        globalement. None retire la limite.
+
+        Args:
+            max_measurements: Le nombre maximal de mesures, ou None
+            station_id: La station concernée (globalement si absent)
+
+        Returns:
+            False si la station n'existe pas
+
+        Raises:
+            ValueError: Si la limite n'est pas strictement positive
+        """
+
+    @abstractmethod
+    def add_pays(self, pays_id: str, nom: str) -> None:
+        """Ajoute un nouveau pays."""
+
+    @abstractmethod
+    def remove_pays(self, pays_id: str) -> bool:
+        """Supprime un pays et ses villes/stations associées."""
+
+    @abstractmethod
+    def add_ville(self, ville_id: str, nom: str, pays_id: str) -> None:
+        """
+        Ajoute une nouvelle ville.
+
+        Raises:
+            ValueError: Si le stockage vérifie les clés étrangères et que le
+                pays n'existe pas
+        """
+
+    @abstractmethod
+    def remove_ville(self, ville_id: str) -> bool:
+        """Supprime une ville et ses stations associées."""
+
+    @abstractmethod
+    def add_station(self, station_id: str, nom: str, ville_id: str, api_url: str) -> None:
+        """
+        Ajoute une nouvelle station météo.
+
+        Raises:
+            ValueError: Si le stockage vérifie les clés étrangères et que la
+                ville n'existe pas
+        """
+
+    @abstractmethod
+    def update_station_url(self, station_id: str, new_url: str) -> bool:
+        """Met à jour l'URL API d'une station."""
+
+    @abstractmethod
+    def remove_station(self, station_id: str) -> bool:
+        """Supprime une station météo."""
+
+    @abstractmethod
+    def batch(self) -> ContextManager['ConfigBackend']:
+        """
+        Regroupe les modifications du bloc en une seule écriture, faite à la
+        sortie du bloc le plus externe (y compris en cas d'exception : les
+        modifications déjà faites sont conservées). Les blocs peuvent
+        s'imbriquer.
+
+        Returns:
+            Un gestionnaire de contexte qui fournit le stockage
+        """
+
+    def flush(self) -> None:
+        """Écrit immédiatement les modifications en attente, s'il y en a."""
+
+    def set_save_delay(self, seconds: float) -> None:
+        """
+        Définit le délai pendant lequel les modifications sont regroupées
+        avant d'être écrites (0 : écriture immédiate). Sans effet pour un
+        stockage dont chaque écriture ne touche que l'entrée modifiée.
+
+        Args:
+            seconds: Le délai en secondes
+
+        Raises:
+            ValueError: Si le délai est négatif
+        """
+        if seconds < 0:
+            raise ValueError("Le délai d'écriture ne peut pas être négatif")
+
+    def close(self) -> None:
+        """Écrit les modifications en attente et libère les ressources."""
+        self.flush()
+
+    def get_all_stations_list(self) -> List[tuple]:
+        """Retourne la liste de toutes les stations (id, nom, url)."""
+        return [(s_id, s["nom"], s["api_url"]) for s_id, s in self.get_stations().items()]
+
+    def get_max_measurements(self, station_id: Optional[str] = None) -> Optional[int]:
+        """
+        Retourne le nombre maximal de mesures conservées par station.
+
+        La valeur propre à la station est prioritaire sur la valeur globale
+        (section "settings").
+
+        Args:
+            station_id: La station concernée (optionnel)
+
+        Returns:
+            Le nombre maximal de mesures, ou None si illimité
+        """
+        station = self.get_station_by_id(station_id) if station_id else None
+        if station and station.get("max_measurements") is not None:
+            return station["max_measurements"]
+        return self.get_setting("max_measurements")
+
+    def get_poll_interval(self, station_id: Optional[str] = None) -> int:
+        """
+        Retourne l'intervalle entre deux interrogations d'une station en
+        mode démon, en secondes.
+
+        La valeur propre à la station est prioritaire sur la valeur globale
+        (section "settings"), elle-même prioritaire sur DEFAULT_POLL_INTERVAL.
+
+        Args:
+            station_id: La station concernée (optionnel)
+
+        Returns:
+            L'intervalle en secondes
+        """
+        station = self.get_station_by_id(station_id) if station_id else None
+        if station and station.get("poll_interval") is not None:
+            return station["poll_interval"]
+        return self.get_setting("poll_interval", DEFAULT_POLL_INTERVAL)
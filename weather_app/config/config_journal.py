@@ -0,0 +1,214 @@
+"""
+Persistance de la configuration : instantané JSON et journal des modifications.
+
+L'instantané (config.json) est toujours réécrit via un fichier temporaire
+synchronisé sur disque puis renommé atomiquement : une interruption laisse
+l'ancien ou le nouveau fichier, jamais un fichier tronqué.
+
+Entre deux instantanés, les modifications sont ajoutées au journal
+(config.journal), une ligne JSON par écriture : la liste des entrées
+modifiées avec leur nouvelle valeur (`set`) ou leur suppression (`del`).
+Une ligne incomplète en fin de journal (écriture interrompue) est ignorée
+et tronquée au chargement : chaque écriture est appliquée entièrement ou
+pas du tout. Quand le journal devient aussi long que la configuration, il
+est compacté dans un nouvel instantané.
+"""
+import json
+import os
+import stat
+import tempfile
+from typing import Dict, List, Optional
+
+# Nombre minimal de modifications journalisées avant un compactage
+COMPACT_THRESHOLD = 1000
+
+
+class ConfigJournal:
+    """
+    Instantané atomique et journal en ajout seul d'un fichier de configuration.
+    """
+
+    def __init__(self, snapshot_path: str, compact_threshold: int = COMPACT_THRESHOLD):
+        """
+        Args:
+            snapshot_path: Chemin de l'instantané (config.json) ; le journal
+                est écrit à côté, avec l'extension .journal
+            compact_threshold: Nombre minimal de modifications journalisées
+                avant un compactage
+
+        Raises:
+            ValueError: Si le seuil de compactage n'est pas strictement positif
+        """
+        if compact_threshold < 1:
+            raise ValueError("Le seuil de compactage doit être positif")
+        self.snapshot_path = snapshot_path
+        self.journal_path = os.path.splitext(snapshot_path)[0] + '.journal'
+        self._compact_threshold = compact_threshold
+        self.records = 0
+
+    def load_snapshot(self) -> Optional[Dict]:
+        """
+        Returns:
+            Le contenu de l'instantané, ou None s'il n'existe pas
+
+        Raises:
+            ValueError: Si l'instantané n'est pas un JSON valide
+            OSError: Si l'instantané ne peut pas être lu
+        """
+        if not os.path.exists(self.snapshot_path):
+            return None
+        with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def quarantine(self) -> str:
+        """
+        Met de côté un instantané illisible, pour qu'il ne soit pas écrasé
+        par le prochain instantané.
+
+        Returns:
+            Le nouveau chemin du fichier
+        """
+        path = self.snapshot_path + '.corrupt'
+        os.replace(self.snapshot_path, path)
+        return path
+
+    def replay(self, config: Dict, repair: bool = True) -> int:
+        """
+        Applique à la configuration les modifications du journal.
+
+        Args:
+            config: La configuration chargée depuis l'instantané (modifiée en place)
+            repair: Tronquer la ligne incomplète en fin de journal ; False
+                pour une simple lecture, qui laisse le fichier intact
+
+        Returns:
+            Le nombre de modifications appliquées
+
+        Raises:
+            KeyError, TypeError: Si une ligne complète n'a pas le format
+                d'une écriture (voir apply_changes)
+        """
+        self.records = 0
+        if not os.path.exists(self.journal_path):
+            return 0
+        valid_size = 0
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError("ligne incomplète")
+                    changes = json.loads(line)
+                except ValueError:
+                    break
+                apply_changes(config, changes)
+                self.records += len(changes)
+                valid_size += len(line)
+        if repair and valid_size < os.path.getsize(self.journal_path):
+            os.truncate(self.journal_path, valid_size)
+        return self.records
+
+    def append(self, changes: List[Dict]) -> None:
+        """
+        Ajoute une écriture au journal et la synchronise sur disque.
+
+        Args:
+            changes: Les modifications (voir apply_changes)
+
+        Raises:
+            OSError: Si le journal ne peut pas être écrit (il est alors
+                ramené à sa taille précédente)
+        """
+        data = memoryview(
+            (json.dumps(changes, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+        )
+        fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            size = os.lseek(fd, 0, os.SEEK_END)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+                os.fsync(fd)
+            except OSError:
+                # Une ligne partielle laissée en place serait collée à la
+                # prochaine écriture, et la relecture s'arrêterait là.
+                os.ftruncate(fd, size)
+                raise
+        finally:
+            os.close(fd)
+        self.records += len(changes)
+
+    def needs_compaction(self, entries: int) -> bool:
+        """
+        Args:
+            entries: Le nombre d'entrées de la configuration
+
+        Returns:
+            True si le journal est assez long pour être compacté : le coût
+            d'un instantané reste ainsi amorti sur autant de modifications
+        """
+        return self.records >= max(self._compact_threshold, entries)
+
+    def write_snapshot(self, config: Dict) -> None:
+        """
+        Écrit atomiquement un instantané complet, puis vide le journal.
+
+        Args:
+            config: La configuration complète
+
+        Raises:
+            OSError: Si l'instantané ne peut pas être écrit
+        """
+        directory = os.path.dirname(self.snapshot_path)
+        try:
+            mode = stat.S_IMODE(os.stat(self.snapshot_path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.config-')
+        try:
+            # mkstemp crée le fichier en 0600, mode que le renommage conserverait
+            os.chmod(tmp_path, mode)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        _fsync_directory(directory)
+        # Un journal rejoué sur le nouvel instantané ne changerait rien :
+        # sa suppression n'a pas besoin d'être atomique avec le renommage.
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+        self.records = 0
+
+
+def apply_changes(config: Dict, changes: List[Dict]) -> None:
+    """
+    Applique des modifications journalisées à une configuration.
+
+    Args:
+        config: La configuration (modifiée en place)
+        changes: Des dictionnaires {"op": "set", "section", "key", "value"}
+            ou {"op": "del", "section", "key"}
+    """
+    for change in changes:
+        entries = config.setdefault(change["section"], {})
+        if change["op"] == "set":
+            entries[change["key"]] = change["value"]
+        else:
+            entries.pop(change["key"], None)
+
+
+def _fsync_directory(directory: str) -> None:
+    """Synchronise un répertoire pour rendre un renommage durable (POSIX)."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,395 @@
+"""
+Stockage de la configuration en mémoire, persisté dans config.json.
+
+Les modifications sont ajoutées au journal de la configuration
+(config.journal), compacté périodiquement dans config.json ; voir
+ConfigJournal. Pour regrouper plusieurs modifications en une écriture :
+- `with config.batch():` regroupe les modifications du bloc en une seule
+  écriture, à la sortie du bloc (les blocs peuvent s'imbriquer) ;
+- `config.set_save_delay(secondes)` diffère les écritures : les
+  modifications faites pendant ce délai sont écrites ensemble par un thread
+  minuteur (`flush()` force l'écriture, faite aussi à la sortie du processus).
+"""
+import atexit
+import json
+import os
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from weather_app.config.backend import ConfigBackend
+from weather_app.config.config_journal import ConfigJournal
+
+
+def _synchronized(method: Callable) -> Callable:
+    """Exécute une méthode de modification sous le verrou de la configuration."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:  # pylint: disable=protected-access
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class JsonConfigBackend(ConfigBackend):
+    """
+    Configuration en mémoire (dictionnaires et index secondaires), persistée
+    dans un fichier JSON et son journal.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, config_file: str):
+        """
+        Charge la configuration (fichier et journal), s'ils existent.
+
+        Args:
+            config_file: Chemin du fichier de configuration (config.json)
+        """
+        self._config_file = config_file
+        self._journal = ConfigJournal(config_file)
+        # Entrées (section, identifiant) modifiées depuis la dernière
+        # écriture, regroupées (batch) ou différées (minuteur)
+        self._pending: Dict[Tuple[str, str], None] = {}
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._save_delay = 0.0
+        self._save_timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
+
+        self._initialize_config()
+        self._load_configuration()
+        self._rebuild_indexes()
+
+    def _initialize_config(self) -> None:
+        """Initialise la structure de configuration par défaut."""
+        self._config: Dict = {
+            "settings": {},
+            "pays": {},
+            "villes": {},
+            "stations": {}
+        }
+
+    def _rebuild_indexes(self) -> None:
+        """
+        Reconstruit les index secondaires (pays -> villes, ville -> stations).
+
+        Les index sont des dictionnaires d'identifiants (valeurs None) : ils
+        gardent l'ordre d'insertion de la configuration. Ils sont ensuite
+        tenus à jour par les méthodes add_* et remove_*.
+        """
+        self._villes_by_pays: Dict[str, Dict[str, None]] = {}
+        for ville_id, ville in self._config.get("villes", {}).items():
+            self._villes_by_pays.setdefault(ville.get("pays_id"), {})[ville_id] = None
+        self._stations_by_ville: Dict[str, Dict[str, None]] = {}
+        for station_id, station in self._config.get("stations", {}).items():
+            self._stations_by_ville.setdefault(station.get("ville_id"), {})[station_id] = None
+
+    @staticmethod
+    def _index_remove(index: Dict[str, Dict[str, None]], key: Optional[str], item_id: str) -> None:
+        """Retire un identifiant d'un index secondaire."""
+        items = index.get(key)
+        if items is not None:
+            items.pop(item_id, None)
+            if not items:
+                del index[key]
+
+    def _load_configuration(self) -> None:
+        """
+        Charge la configuration depuis le fichier JSON, puis rejoue les
+        modifications du journal.
+
+        Un fichier illisible est mis de côté (config.json.corrupt) au lieu
+        d'être écrasé par la prochaine sauvegarde.
+        """
+        try:
+            loaded_config = self._journal.load_snapshot()
+            if loaded_config is None:
+                print("📂 Aucun fichier de configuration trouvé. Un nouveau sera créé.")
+            else:
+                # Fusionner avec la structure par défaut pour éviter les KeyError
+                self._config["settings"] = loaded_config.get("settings", {})
+                self._config["pays"] = loaded_config.get("pays", {})
+                self._config["villes"] = loaded_config.get("villes", {})
+                self._config["stations"] = loaded_config.get("stations", {})
+                print("✅ Configuration chargée avec succès")
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Erreur lors du chargement de la configuration: {e}")
+            self._initialize_config()
+            try:
+                print(f"⚠️  Fichier illisible conservé sous {self._journal.quarantine()}")
+            except OSError:
+                pass
+
+        try:
+            replayed = self._journal.replay(self._config)
+        except (OSError, KeyError, TypeError) as e:
+            print(f"Erreur lors de la relecture du journal: {e}")
+        else:
+            if replayed:
+                print(f"📜 {replayed} modification(s) rejouée(s) depuis le journal")
+
+    def _save_configuration(self, section: str, key: str) -> None:
+        """
+        Demande la sauvegarde d'une entrée modifiée : immédiate, sauf dans un
+        bloc batch() ou si un délai d'écriture est défini.
+
+        Args:
+            section: La section de l'entrée ("settings", "pays", "villes" ou "stations")
+            key: L'identifiant de l'entrée dans la section
+        """
+        with self._lock:
+            self._pending[(section, key)] = None
+            if self._batch_depth:
+                return
+            if self._save_delay > 0:
+                if self._save_timer is None:
+                    self._save_timer = threading.Timer(self._save_delay, self._on_save_timer)
+                    self._save_timer.daemon = True
+                    self._save_timer.start()
+                return
+            self._write_configuration()
+
+    def _write_configuration(self) -> None:
+        """
+        Écrit les modifications en attente : une ligne ajoutée au journal, ou
+        un instantané complet si le fichier n'existe pas encore ou si le
+        journal doit être compacté. En cas d'erreur, les modifications restent
+        en attente de la prochaine écriture.
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            try:
+                if os.path.exists(self._config_file):
+                    self._journal.append(self._pending_changes())
+                if (not os.path.exists(self._config_file)
+                        or self._journal.needs_compaction(self._entry_count())):
+                    self._journal.write_snapshot(self._config)
+                self._pending.clear()
+                print(f"💾 Configuration sauvegardée dans {self._config_file}")
+            except IOError as e:
+                print(f"Erreur lors de la sauvegarde: {e}")
+
+    def _pending_changes(self) -> List[Dict]:
+        """Retourne les modifications en attente, au format du journal."""
+        changes = []
+        for section, key in self._pending:
+            entries = self._config.get(section, {})
+            if key in entries:
+                changes.append({"op": "set", "section": section, "key": key,
+                                "value": entries[key]})
+            else:
+                changes.append({"op": "del", "section": section, "key": key})
+        return changes
+
+    def _entry_count(self) -> int:
+        """Retourne le nombre d'entrées de la configuration (taille d'un instantané)."""
+        return sum(len(entries) for entries in self._config.values())
+
+    def _on_save_timer(self) -> None:
+        """Écrit les modifications en attente à l'échéance du délai d'écriture."""
+        with self._lock:
+            self._save_timer = None
+            if self._pending and not self._batch_depth:
+                self._write_configuration()
+
+    @contextmanager
+    def batch(self) -> Iterator['JsonConfigBackend']:
+        """
+        Regroupe les modifications du bloc en une seule écriture, faite à la
+        sortie du bloc le plus externe (y compris en cas d'exception : les
+        modifications déjà faites en mémoire sont conservées).
+
+        Yields:
+            La configuration
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._pending:
+                    self._write_configuration()
+
+    def set_save_delay(self, seconds: float) -> None:
+        """
+        Définit le délai pendant lequel les modifications sont regroupées
+        avant d'être écrites (0 : écriture immédiate).
+
+        Args:
+            seconds: Le délai en secondes
+
+        Raises:
+            ValueError: Si le délai est négatif
+        """
+        super().set_save_delay(seconds)
+        with self._lock:
+            self._save_delay = seconds
+        if not seconds:
+            self.flush()
+
+    def flush(self) -> None:
+        """Écrit immédiatement les modifications en attente, s'il y en a."""
+        with self._lock:
+            if self._pending:
+                self._write_configuration()
+
+    @_synchronized
+    def set_max_measurements(self,
+                             max_measurements: Optional[int],
+                             station_id: Optional[str] = None) -> bool:
+        """
+        Définit le nombre maximal de mesures conservées, pour une station ou
+        globalement. None retire la limite.
+
+        Args:
+            max_measurements: Le nombre maximal de mesures, ou None
+            station_id: La station concernée (globalement si absent)
+
+        Returns:
+            False si la station n'existe pas
+
+        Raises:
+            ValueError: Si la limite n'est pas strictement positive
+        """
+        if max_measurements is not None and max_measurements < 1:
+            raise ValueError("Le nombre maximal de mesures doit être positif")
+
+        if station_id is None:
+            target = self._config.setdefault("settings", {})
+            section, key = "settings", "max_measurements"
+        else:
+            section, key = "stations", station_id
+            target = self.get_station_by_id(station_id)
+            if target is None:
+                return False
+
+        if max_measurements is None:
+            target.pop("max_measurements", None)
+        else:
+            target["max_measurements"] = max_measurements
+        self._save_configuration(section, key)
+        return True
+
+    def get_setting(self, key: str, default=None):
+        """Retourne un réglage global (section "settings")."""
+        return self._config.get("settings", {}).get(key, default)
+
+    def get_pays(self) -> Dict:
+        """Retourne tous les pays."""
+        return self._config.get("pays", {})
+
+    def get_villes(self, pays_id: Optional[str] = None) -> Dict:
+        """Retourne toutes les villes ou celles d'un pays spécifique (via l'index)."""
+        villes = self._config.get("villes", {})
+        if pays_id:
+            return {k: villes[k] for k in self._villes_by_pays.get(pays_id, ())}
+        return villes
+
+    def get_stations(self, ville_id: Optional[str] = None) -> Dict:
+        """Retourne toutes les stations ou celles d'une ville spécifique (via l'index)."""
+        stations = self._config.get("stations", {})
+        if ville_id:
+            return {k: stations[k] for k in self._stations_by_ville.get(ville_id, ())}
+        return stations
+
+    @_synchronized
+    def add_pays(self, pays_id: str, nom: str) -> None:
+        """Ajoute un nouveau pays."""
+        if "pays" not in self._config:
+            self._config["pays"] = {}
+        self._config["pays"][pays_id] = {"nom": nom}
+        self._save_configuration("pays", pays_id)
+
+    @_synchronized
+    def remove_pays(self, pays_id: str) -> bool:
+        """Supprime un pays et ses villes/stations associées."""
+        if pays_id in self._config.get("pays", {}):
+            with self.batch():
+                # Supprimer les villes et stations liées
+                villes_to_remove = list(self._villes_by_pays.get(pays_id, ()))
+                for v_id in villes_to_remove:
+                    self.remove_ville(v_id)
+
+                del self._config["pays"][pays_id]
+                self._save_configuration("pays", pays_id)
+            return True
+        return False
+
+    @_synchronized
+    def add_ville(self, ville_id: str, nom: str, pays_id: str) -> None:
+        """Ajoute une nouvelle ville."""
+        if "villes" not in self._config:
+            self._config["villes"] = {}
+        previous = self._config["villes"].get(ville_id)
+        if previous is None or previous.get("pays_id") != pays_id:
+            if previous is not None:
+                self._index_remove(self._villes_by_pays, previous.get("pays_id"), ville_id)
+            self._villes_by_pays.setdefault(pays_id, {})[ville_id] = None
+        self._config["villes"][ville_id] = {
+            "nom": nom,
+            "pays_id": pays_id
+        }
+        self._save_configuration("villes", ville_id)
+
+    @_synchronized
+    def remove_ville(self, ville_id: str) -> bool:
+        """Supprime une ville et ses stations associées."""
+        if ville_id in self._config.get("villes", {}):
+            with self.batch():
+                # Supprimer les stations liées
+                stations_to_remove = list(self._stations_by_ville.get(ville_id, ()))
+                for s_id in stations_to_remove:
+                    self.remove_station(s_id)
+
+                ville = self._config["villes"].pop(ville_id)
+                self._index_remove(self._villes_by_pays, ville.get("pays_id"), ville_id)
+                self._save_configuration("villes", ville_id)
+            return True
+        return False
+
+    @_synchronized
+    def add_station(self, station_id: str, nom: str, ville_id: str, api_url: str) -> None:
+        """Ajoute une nouvelle station météo."""
+        if "stations" not in self._config:
+            self._config["stations"] = {}
+        previous = self._config["stations"].get(station_id)
+        if previous is None or previous.get("ville_id") != ville_id:
+            if previous is not None:
+                self._index_remove(self._stations_by_ville, previous.get("ville_id"), station_id)
+            self._stations_by_ville.setdefault(ville_id, {})[station_id] = None
+        self._config["stations"][station_id] = {
+            "nom": nom,
+            "ville_id": ville_id,
+            "api_url": api_url
+        }
+        self._save_configuration("stations", station_id)
+
+    @_synchronized
+    def update_station_url(self, station_id: str, new_url: str) -> bool:
+        """Met à jour l'URL API d'une station."""
+        if station_id in self._config.get("stations", {}):
+            self._config["stations"][station_id]["api_url"] = new_url
+            self._save_configuration("stations", station_id)
+            return True
+        return False
+
+    @_synchronized
+    def remove_station(self, station_id: str) -> bool:
+        """Supprime une station météo."""
+        if station_id in self._config.get("stations", {}):
+            station = self._config["stations"].pop(station_id)
+            self._index_remove(self._stations_by_ville, station.get("ville_id"), station_id)
+            self._save_configuration("stations", station_id)
+            return True
+        return False
+
+    def get_station_by_id(self, station_id: str) -> Optional[Dict]:
+        """Récupère une station par son ID."""
+        return self._config.get("stations", {}).get(station_id)
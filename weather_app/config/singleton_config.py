@@ -1,9 +1,39 @@
 """
 Pattern Singleton pour la configuration de l'application.
+
+Le stockage est délégué à un ConfigBackend choisi au démarrage :
+- SqliteConfigBackend si le répertoire de données contient config.db
+  (créé par `python -m weather_app migrate-config`) ;
+- JsonConfigBackend sinon (config.json et son journal).
 """
-import json
 import os
-from typing import Dict, List, Optional
+from typing import ContextManager, Dict, List, Optional
+
+from weather_app.config.backend import DEFAULT_POLL_INTERVAL, ConfigBackend
+from weather_app.config.json_backend import JsonConfigBackend
+from weather_app.config.sqlite_backend import SqliteConfigBackend
+
+__all__ = ['CONFIG_DB', 'DEFAULT_POLL_INTERVAL', 'ConfigurationSingleton', 'default_data_dir']
+
+# Nom de la base SQLite de la configuration, dans le répertoire de données
+CONFIG_DB = "config.db"
+
+
+def default_data_dir() -> str:
+    """
+    Détermine le répertoire data (compatible Docker et local).
+
+    Returns:
+        /app/data en Docker, weather_app/data en local
+    """
+    # Essayer d'abord le chemin Docker
+    docker_data_dir = '/app/data'
+
+    if os.path.exists(docker_data_dir):
+        # On est dans Docker
+        return docker_data_dir
+    # On est en local
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
 
 
 class ConfigurationSingleton:
@@ -11,6 +41,7 @@ class ConfigurationSingleton:
     Singleton pour gérer la configuration de l'application.
     Principe SOLID : Single Responsibility - gère uniquement la configuration.
     """
+    # pylint: disable=too-many-public-methods
     _instance: Optional['ConfigurationSingleton'] = None
     _initialized: bool = False
 
@@ -21,162 +52,101 @@ class ConfigurationSingleton:
 
     def __init__(self):
         if not self._initialized:
-            # Déterminer le répertoire data (compatible Docker et local)
-            # En Docker : /app/data
-            # En local : weather_app/../data
-
-            # Essayer d'abord le chemin Docker
-            docker_data_dir = '/app/data'
-
-            if os.path.exists(docker_data_dir):
-                # On est dans Docker
-                self._data_dir = docker_data_dir
-            else:
-                # On est en local
-                self._data_dir = os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    'data'
-                )
+            self._data_dir = default_data_dir()
 
             # Créer le dossier data s'il n'existe pas
             os.makedirs(self._data_dir, exist_ok=True)
 
-            self._config_file = os.path.join(self._data_dir, "config.json")
-            self._initialize_config()
-            self._load_configuration()
+            self._config_file = os.path.join(self._data_dir, CONFIG_DB)
+            if os.path.exists(self._config_file):
+                self._backend: ConfigBackend = SqliteConfigBackend(self._config_file)
+            else:
+                self._config_file = os.path.join(self._data_dir, "config.json")
+                self._backend = JsonConfigBackend(self._config_file)
             ConfigurationSingleton._initialized = True
 
             print(f"📂 Configuration chargée depuis : {self._config_file}")
 
-    def _initialize_config(self) -> None:
-        """Initialise la structure de configuration par défaut."""
-        self._config: Dict = {
-            "pays": {},
-            "villes": {},
-            "stations": {}
-        }
-
-    def _load_configuration(self) -> None:
-        """Charge la configuration depuis le fichier JSON."""
-        if os.path.exists(self._config_file):
-            try:
-                with open(self._config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    # Fusionner avec la structure par défaut pour éviter les KeyError
-                    self._config["pays"] = loaded_config.get("pays", {})
-                    self._config["villes"] = loaded_config.get("villes", {})
-                    self._config["stations"] = loaded_config.get("stations", {})
-                print("✅ Configuration chargée avec succès")
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Erreur lors du chargement de la configuration: {e}")
-                self._initialize_config()
-        else:
-            print("📂 Aucun fichier de configuration trouvé. Un nouveau sera créé.")
-
-    def _save_configuration(self) -> None:
-        """Sauvegarde la configuration dans le fichier JSON."""
-        try:
-            with open(self._config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
-            print(f"💾 Configuration sauvegardée dans {self._config_file}")
-        except IOError as e:
-            print(f"Erreur lors de la sauvegarde: {e}")
+    @property
+    def data_dir(self) -> str:
+        """Retourne le répertoire des données persistantes."""
+        return self._data_dir
+
+    @property
+    def backend(self) -> ConfigBackend:
+        """Retourne le stockage de la configuration."""
+        return self._backend
+
+    def batch(self) -> ContextManager[ConfigBackend]:
+        """Regroupe les modifications du bloc en une seule écriture (voir ConfigBackend.batch)."""
+        return self._backend.batch()
+
+    def set_save_delay(self, seconds: float) -> None:
+        """Définit le délai de regroupement des écritures (voir ConfigBackend.set_save_delay)."""
+        self._backend.set_save_delay(seconds)
+
+    def flush(self) -> None:
+        """Écrit immédiatement les modifications en attente, s'il y en a."""
+        self._backend.flush()
+
+    def get_max_measurements(self, station_id: Optional[str] = None) -> Optional[int]:
+        """Retourne le nombre maximal de mesures conservées par station (None : illimité)."""
+        return self._backend.get_max_measurements(station_id)
+
+    def get_poll_interval(self, station_id: Optional[str] = None) -> int:
+        """Retourne l'intervalle entre deux interrogations d'une station, en secondes."""
+        return self._backend.get_poll_interval(station_id)
+
+    def set_max_measurements(self,
+                             max_measurements: Optional[int],
+                             station_id: Optional[str] = None) -> bool:
+        """Définit le nombre maximal de mesures conservées (voir ConfigBackend)."""
+        return self._backend.set_max_measurements(max_measurements, station_id)
 
     def get_pays(self) -> Dict:
         """Retourne tous les pays."""
-        return self._config.get("pays", {})
+        return self._backend.get_pays()
 
     def get_villes(self, pays_id: Optional[str] = None) -> Dict:
         """Retourne toutes les villes ou celles d'un pays spécifique."""
-        villes = self._config.get("villes", {})
-        if pays_id:
-            return {k: v for k, v in villes.items() if v.get("pays_id") == pays_id}
-        return villes
+        return self._backend.get_villes(pays_id)
 
     def get_stations(self, ville_id: Optional[str] = None) -> Dict:
         """Retourne toutes les stations ou celles d'une ville spécifique."""
-        stations = self._config.get("stations", {})
-        if ville_id:
-            return {k: v for k, v in stations.items() if v.get("ville_id") == ville_id}
-        return stations
+        return self._backend.get_stations(ville_id)
 
     def add_pays(self, pays_id: str, nom: str) -> None:
         """Ajoute un nouveau pays."""
-        if "pays" not in self._config:
-            self._config["pays"] = {}
-        self._config["pays"][pays_id] = {"nom": nom}
-        self._save_configuration()
+        self._backend.add_pays(pays_id, nom)
 
     def remove_pays(self, pays_id: str) -> bool:
         """Supprime un pays et ses villes/stations associées."""
-        if pays_id in self._config.get("pays", {}):
-            # Supprimer les villes et stations liées
-            villes_to_remove = [v_id for v_id, v in self._config.get("villes", {}).items()
-                                if v.get("pays_id") == pays_id]
-            for v_id in villes_to_remove:
-                self.remove_ville(v_id)
-
-            del self._config["pays"][pays_id]
-            self._save_configuration()
-            return True
-        return False
+        return self._backend.remove_pays(pays_id)
 
     def add_ville(self, ville_id: str, nom: str, pays_id: str) -> None:
         """Ajoute une nouvelle ville."""
-        if "villes" not in self._config:
-            self._config["villes"] = {}
-        self._config["villes"][ville_id] = {
-            "nom": nom,
-            "pays_id": pays_id
-        }
-        self._save_configuration()
+        self._backend.add_ville(ville_id, nom, pays_id)
 
     def remove_ville(self, ville_id: str) -> bool:
         """Supprime une ville et ses stations associées."""
-        if ville_id in self._config.get("villes", {}):
-            # Supprimer les stations liées
-            stations_to_remove = [s_id for s_id, s in self._config.get("stations", {}).items()
-                                  if s.get("ville_id") == ville_id]
-            for s_id in stations_to_remove:
-                self.remove_station(s_id)
-
-            del self._config["villes"][ville_id]
-            self._save_configuration()
-            return True
-        return False
+        return self._backend.remove_ville(ville_id)
 
     def add_station(self, station_id: str, nom: str, ville_id: str, api_url: str) -> None:
         """Ajoute une nouvelle station météo."""
-        if "stations" not in self._config:
-            self._config["stations"] = {}
-        self._config["stations"][station_id] = {
-            "nom": nom,
-            "ville_id": ville_id,
-            "api_url": api_url
-        }
-        self._save_configuration()
+        self._backend.add_station(station_id, nom, ville_id, api_url)
 
     def update_station_url(self, station_id: str, new_url: str) -> bool:
         """Met à jour l'URL API d'une station."""
-        if station_id in self._config.get("stations", {}):
-            self._config["stations"][station_id]["api_url"] = new_url
-            self._save_configuration()
-            return True
-        return False
+        return self._backend.update_station_url(station_id, new_url)
 
     def remove_station(self, station_id: str) -> bool:
         """Supprime une station météo."""
-        if station_id in self._config.get("stations", {}):
-            del self._config["stations"][station_id]
-            self._save_configuration()
-            return True
-        return False
+        return self._backend.remove_station(station_id)
 
     def get_station_by_id(self, station_id: str) -> Optional[Dict]:
         """Récupère une station par son ID."""
-        return self._config.get("stations", {}).get(station_id)
+        return self._backend.get_station_by_id(station_id)
 
     def get_all_stations_list(self) -> List[tuple]:
         """Retourne la liste de toutes les stations (id, nom, url)."""
-        return [(s_id, s["nom"], s["api_url"])
-                for s_id, s in self._config.get("stations", {}).items()]
+        return self._backend.get_all_stations_list()
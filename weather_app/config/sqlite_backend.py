@@ -0,0 +1,332 @@
+"""
+Stockage de la configuration dans une base SQLite (config.db).
+
+Pour les grands inventaires de stations : une modification n'écrit que la
+ligne concernée et le démarrage ne relit pas toute la configuration. Les
+clés étrangères (ville -> pays, station -> ville) sont déclarées avec
+ON DELETE CASCADE : la suppression d'un pays ou d'une ville retire ses villes
+et stations dans la même instruction. Les villes d'un pays et les stations
+d'une ville sont lues par index.
+
+migrate_json_config() crée la base à partir d'un config.json existant.
+"""
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from weather_app.config.backend import ConfigBackend
+from weather_app.config.config_journal import ConfigJournal
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pays (
+    id  TEXT PRIMARY KEY,
+    nom TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS villes (
+    id      TEXT PRIMARY KEY,
+    nom     TEXT NOT NULL,
+    pays_id TEXT NOT NULL REFERENCES pays (id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS villes_pays_id ON villes (pays_id);
+CREATE TABLE IF NOT EXISTS stations (
+    id               TEXT PRIMARY KEY,
+    nom              TEXT NOT NULL,
+    ville_id         TEXT NOT NULL REFERENCES villes (id) ON DELETE CASCADE,
+    api_url          TEXT NOT NULL,
+    max_measurements INTEGER,
+    poll_interval    INTEGER
+);
+CREATE INDEX IF NOT EXISTS stations_ville_id ON stations (ville_id);
+"""
+
+_STATION_COLUMNS = "id, nom, ville_id, api_url, max_measurements, poll_interval"
+
+# Une ville ou une station ré-ajoutée garde sa place (rowid) et ses enfants :
+# INSERT OR REPLACE supprimerait la ligne, et donc ses enfants en cascade.
+_UPSERT_STATION = (
+    f"INSERT INTO stations ({_STATION_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET nom = excluded.nom, ville_id = excluded.ville_id, "
+    "api_url = excluded.api_url, max_measurements = excluded.max_measurements, "
+    "poll_interval = excluded.poll_interval"
+)
+
+
+class SqliteConfigBackend(ConfigBackend):
+    """
+    Configuration stockée dans SQLite.
+
+    Contrairement au stockage JSON, une ville doit appartenir à un pays
+    existant et une station à une ville existante (ValueError sinon).
+    Une seule connexion est partagée entre threads, protégée par un verrou ;
+    un bloc batch() est une transaction, qui garde le verrou jusqu'à sa fin.
+    """
+
+    def __init__(self, path: str):
+        """
+        Ouvre (ou crée) la base.
+
+        Args:
+            path: Chemin du fichier SQLite (ex. data/config.db),
+                ou ':memory:' pour une base temporaire
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        # Mode autocommit : chaque instruction hors batch() est une transaction
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute("PRAGMA foreign_keys=ON")
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        """Exécute une modification et retourne le nombre de lignes touchées."""
+        with self._lock:
+            return self._connection.execute(sql, params).rowcount
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """Exécute une lecture et retourne toutes les lignes."""
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _station(row: tuple) -> Dict:
+        """Convertit une ligne de la table stations au format de la configuration."""
+        station = {"nom": row[1], "ville_id": row[2], "api_url": row[3]}
+        if row[4] is not None:
+            station["max_measurements"] = row[4]
+        if row[5] is not None:
+            station["poll_interval"] = row[5]
+        return station
+
+    def _upsert_station(self, station_id: str, station: Dict) -> None:
+        """
+        Ajoute ou remplace une station (champs optionnels compris).
+
+        Raises:
+            ValueError: Si la ville de la station n'existe pas
+        """
+        try:
+            self._execute(_UPSERT_STATION, (
+                station_id, station["nom"], station["ville_id"], station["api_url"],
+                station.get("max_measurements"), station.get("poll_interval")
+            ))
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Ville inconnue: {station['ville_id']}") from e
+
+    def _set_setting(self, key: str, value) -> None:
+        """Définit un réglage global (None le supprime)."""
+        if value is None:
+            self._execute("DELETE FROM settings WHERE key = ?", (key,))
+        else:
+            self._execute(
+                "INSERT INTO settings (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, json.dumps(value))
+            )
+
+    @contextmanager
+    def batch(self) -> Iterator['SqliteConfigBackend']:
+        """
+        Exécute les modifications du bloc dans une seule transaction,
+        validée à la sortie du bloc le plus externe (y compris en cas
+        d'exception, comme pour le stockage JSON).
+
+        Yields:
+            La configuration
+        """
+        with self._lock:
+            if not self._batch_depth:
+                self._connection.execute("BEGIN")
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                # SQLite annule lui-même la transaction sur certaines erreurs
+                # (disque plein, E/S) : COMMIT échouerait et masquerait l'exception.
+                if not self._batch_depth and self._connection.in_transaction:
+                    self._connection.execute("COMMIT")
+
+    def close(self) -> None:
+        """Ferme la base."""
+        with self._lock:
+            self._connection.close()
+
+    def get_setting(self, key: str, default=None):
+        """Retourne un réglage global (section "settings")."""
+        rows = self._query("SELECT value FROM settings WHERE key = ?", (key,))
+        return json.loads(rows[0][0]) if rows else default
+
+    def set_max_measurements(self,
+                             max_measurements: Optional[int],
+                             station_id: Optional[str] = None) -> bool:
+        """
+        Définit le nombre maximal de mesures conservées, pour une station ou
+        globalement. None retire la limite.
+
+        Args:
+            max_measurements: Le nombre maximal de mesures, ou None
+            station_id: La station concernée (globalement si absent)
+
+        Returns:
+            False si la station n'existe pas
+
+        Raises:
+            ValueError: Si la limite n'est pas strictement positive
+        """
+        if max_measurements is not None and max_measurements < 1:
+            raise ValueError("Le nombre maximal de mesures doit être positif")
+        if station_id is None:
+            self._set_setting("max_measurements", max_measurements)
+            return True
+        return self._execute("UPDATE stations SET max_measurements = ? WHERE id = ?",
+                             (max_measurements, station_id)) > 0
+
+    def get_pays(self) -> Dict:
+        """Retourne tous les pays."""
+        return {row[0]: {"nom": row[1]}
+                for row in self._query("SELECT id, nom FROM pays ORDER BY rowid")}
+
+    def get_villes(self, pays_id: Optional[str] = None) -> Dict:
+        """Retourne toutes les villes ou celles d'un pays spécifique (via l'index)."""
+        if pays_id:
+            rows = self._query(
+                "SELECT id, nom, pays_id FROM villes WHERE pays_id = ? ORDER BY rowid", (pays_id,)
+            )
+        else:
+            rows = self._query("SELECT id, nom, pays_id FROM villes ORDER BY rowid")
+        return {row[0]: {"nom": row[1], "pays_id": row[2]} for row in rows}
+
+    def get_stations(self, ville_id: Optional[str] = None) -> Dict:
+        """Retourne toutes les stations ou celles d'une ville spécifique (via l'index)."""
+        if ville_id:
+            rows = self._query(
+                f"SELECT {_STATION_COLUMNS} FROM stations WHERE ville_id = ? ORDER BY rowid",
+                (ville_id,)
+            )
+        else:
+            rows = self._query(f"SELECT {_STATION_COLUMNS} FROM stations ORDER BY rowid")
+        return {row[0]: self._station(row) for row in rows}
+
+    def get_station_by_id(self, station_id: str) -> Optional[Dict]:
+        """Récupère une station par son ID."""
+        rows = self._query(f"SELECT {_STATION_COLUMNS} FROM stations WHERE id = ?",
+                           (station_id,))
+        return self._station(rows[0]) if rows else None
+
+    def add_pays(self, pays_id: str, nom: str) -> None:
+        """Ajoute un nouveau pays."""
+        self._execute("INSERT INTO pays (id, nom) VALUES (?, ?) "
+                      "ON CONFLICT (id) DO UPDATE SET nom = excluded.nom", (pays_id, nom))
+
+    def remove_pays(self, pays_id: str) -> bool:
+        """Supprime un pays et ses villes/stations associées (ON DELETE CASCADE)."""
+        return self._execute("DELETE FROM pays WHERE id = ?", (pays_id,)) > 0
+
+    def add_ville(self, ville_id: str, nom: str, pays_id: str) -> None:
+        """
+        Ajoute une nouvelle ville.
+
+        Raises:
+            ValueError: Si le pays n'existe pas
+        """
+        try:
+            self._execute(
+                "INSERT INTO villes (id, nom, pays_id) VALUES (?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET nom = excluded.nom, pays_id = excluded.pays_id",
+                (ville_id, nom, pays_id)
+            )
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Pays inconnu: {pays_id}") from e
+
+    def remove_ville(self, ville_id: str) -> bool:
+        """Supprime une ville et ses stations associées (ON DELETE CASCADE)."""
+        return self._execute("DELETE FROM villes WHERE id = ?", (ville_id,)) > 0
+
+    def add_station(self, station_id: str, nom: str, ville_id: str, api_url: str) -> None:
+        """
+        Ajoute une nouvelle station météo.
+
+        Raises:
+            ValueError: Si la ville n'existe pas
+        """
+        self._upsert_station(station_id, {"nom": nom, "ville_id": ville_id, "api_url": api_url})
+
+    def update_station_url(self, station_id: str, new_url: str) -> bool:
+        """Met à jour l'URL API d'une station."""
+        return self._execute("UPDATE stations SET api_url = ? WHERE id = ?",
+                             (new_url, station_id)) > 0
+
+    def remove_station(self, station_id: str) -> bool:
+        """Supprime une station météo."""
+        return self._execute("DELETE FROM stations WHERE id = ?", (station_id,)) > 0
+
+
+def migrate_json_config(json_path: str, db_path: str) -> Dict[str, int]:
+    """
+    Crée une base SQLite à partir d'un config.json (et de son journal).
+
+    La base est construite dans un fichier temporaire puis renommée : elle
+    n'apparaît qu'une fois complète. Le fichier JSON n'est pas modifié. Les
+    villes dont le pays n'existe pas et les stations dont la ville n'existe
+    pas ne peuvent pas être migrées : elles sont comptées comme ignorées.
+
+    Args:
+        json_path: Chemin du fichier de configuration JSON
+        db_path: Chemin de la base à créer
+
+    Returns:
+        Le nombre d'entrées migrées ("pays", "villes", "stations") et
+        ignorées ("ignorées")
+
+    Raises:
+        FileExistsError: Si la base existe déjà
+        FileNotFoundError: Si le fichier JSON n'existe pas
+        ValueError: Si le fichier JSON est illisible
+        KeyError, TypeError: Si le journal contient une écriture mal formée
+    """
+    if os.path.exists(db_path):
+        raise FileExistsError(db_path)
+    journal = ConfigJournal(json_path)
+    config = journal.load_snapshot()
+    if config is None:
+        raise FileNotFoundError(json_path)
+    journal.replay(config, repair=False)
+
+    tmp_path = db_path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    counts = {"pays": 0, "villes": 0, "stations": 0, "ignorées": 0}
+    # pylint: disable=protected-access
+    backend = SqliteConfigBackend(tmp_path)
+    try:
+        with backend.batch():
+            for key, value in config.get("settings", {}).items():
+                backend._set_setting(key, value)
+            for pays_id, pays in config.get("pays", {}).items():
+                backend.add_pays(pays_id, pays["nom"])
+                counts["pays"] += 1
+            for ville_id, ville in config.get("villes", {}).items():
+                try:
+                    backend.add_ville(ville_id, ville["nom"], ville.get("pays_id"))
+                    counts["villes"] += 1
+                except (KeyError, ValueError):
+                    counts["ignorées"] += 1
+            for station_id, station in config.get("stations", {}).items():
+                try:
+                    backend._upsert_station(station_id, station)
+                    counts["stations"] += 1
+                except (KeyError, ValueError):
+                    counts["ignorées"] += 1
+    finally:
+        backend.close()
+    os.replace(tmp_path, db_path)
+    return counts
@@ -0,0 +1,143 @@
+"""
+Mode démon : interrogation périodique des stations, sans interface.
+
+Chaque station configurée est interrogée à son propre intervalle (voir
+ConfigurationSingleton.get_poll_interval) ; les mesures reçues sont
+enregistrées dans la base historique. SIGTERM et SIGINT arrêtent le démon
+proprement : les interrogations en cours se terminent, puis la base est
+fermée.
+"""
+import os
+import signal
+import threading
+import time
+from typing import Optional
+
+from weather_app.config.singleton_config import ConfigurationSingleton
+from weather_app.models.builders import load_stations
+from weather_app.models.location import Station
+from weather_app.services.api_service import ApiService
+from weather_app.services.scheduler import PollScheduler
+from weather_app.storage.time_series_store import TimeSeriesStore
+
+# Mesures gardées en mémoire par station quand la configuration ne fixe pas
+# de limite : le démon ne les lit pas, elles ne servent qu'aux requêtes
+# incrémentales (dernière mesure reçue).
+DAEMON_MAX_MEASUREMENTS = 1000
+
+
+class PollingDaemon:
+    """Interroge périodiquement les stations configurées et enregistre leurs mesures."""
+
+    def __init__(self,
+                 config: ConfigurationSingleton,
+                 api_service: ApiService,
+                 scheduler: PollScheduler,
+                 *,
+                 store: Optional[TimeSeriesStore] = None):
+        """
+        Args:
+            config: La configuration (stations et intervalles)
+            api_service: Service API, configuré pour enregistrer les mesures
+            scheduler: Ordonnanceur des interrogations
+            store: Base historique dont la dernière mesure de chaque station
+                sert de point de départ aux requêtes incrémentales (optionnel)
+        """
+        self._config = config
+        self._api_service = api_service
+        self._scheduler = scheduler
+        self._store = store
+        self._stop = threading.Event()
+
+    def schedule_stations(self, interval: Optional[float] = None) -> int:
+        """
+        Programme l'interrogation de chaque station configurée.
+
+        Args:
+            interval: Intervalle imposé à toutes les stations, en secondes
+                (celui de la configuration si absent)
+
+        Returns:
+            Le nombre de stations programmées
+        """
+        stations = load_stations(self._config, DAEMON_MAX_MEASUREMENTS)
+        for station in stations:
+            if self._store is not None:
+                station.add_measurements(self._store.latest(station.id))
+            self._scheduler.schedule(
+                station.id,
+                interval or self._config.get_poll_interval(station.id),
+                lambda station=station: self.poll(station)
+            )
+        return len(stations)
+
+    def poll(self, station: Station) -> bool:
+        """
+        Interroge une station et affiche le résultat.
+
+        Args:
+            station: La station à interroger
+
+        Returns:
+            True si les données ont été chargées
+        """
+        result = self._api_service.fetch_station(station)
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        print(f"[{timestamp}] {station.id}: {result.message}", flush=True)
+        return result.success
+
+    def install_signal_handlers(self) -> None:
+        """Arrête le démon proprement à la réception de SIGTERM ou SIGINT."""
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self._handle_signal)
+
+    def stop(self) -> None:
+        """Demande l'arrêt du démon."""
+        self._stop.set()
+
+    def run(self) -> None:
+        """Exécute les interrogations jusqu'à l'arrêt, puis attend celles en cours."""
+        self._scheduler.run(self._stop)
+
+    def _handle_signal(self, signum: int, _frame) -> None:
+        """Demande l'arrêt à la réception d'un signal."""
+        print(f"🛑 Signal {signal.Signals(signum).name} reçu, arrêt en cours...", flush=True)
+        self.stop()
+
+
+def run_daemon(interval: Optional[float] = None,
+               jitter: float = 0.1,
+               max_workers: int = 4) -> int:
+    """
+    Lance le démon jusqu'à la réception de SIGTERM ou SIGINT.
+
+    Args:
+        interval: Intervalle imposé à toutes les stations, en secondes
+            (celui de la configuration si absent)
+        jitter: Décalage aléatoire maximal, en fraction de l'intervalle
+        max_workers: Nombre maximal d'interrogations simultanées
+
+    Returns:
+        Le code de sortie du processus
+    """
+    config = ConfigurationSingleton()
+    store = TimeSeriesStore(os.path.join(config.data_dir, 'measurements.db'))
+    # Les requêtes incrémentales ne demandent que les mesures plus récentes
+    # que la dernière reçue ; la base ignore les doublons.
+    api_service = ApiService(pool_maxsize=max_workers, incremental=True, store=store)
+    scheduler = PollScheduler(max_workers, jitter)
+    try:
+        daemon = PollingDaemon(config, api_service, scheduler, store=store)
+        count = daemon.schedule_stations(interval)
+        if not count:
+            print("⚠️  Aucune station configurée.", flush=True)
+            return 1
+        daemon.install_signal_handlers()
+        print(f"🚀 Démon démarré : {count} station(s) interrogée(s)", flush=True)
+        daemon.run()
+        print("👋 Démon arrêté.", flush=True)
+        return 0
+    finally:
+        scheduler.shutdown()
+        api_service.close()
+        store.close()
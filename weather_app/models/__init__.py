@@ -3,10 +3,11 @@ Module des modèles de données.
 """
 from .location import Location, Pays, Ville, Station
 from .measurement import Measurement
-from .builders import StationBuilder, VilleBuilder
+from .measurement_series import MeasurementSeries
+from .builders import StationBuilder, VilleBuilder, load_stations
 
 __all__ = [
     'Location', 'Pays', 'Ville', 'Station',
-    'Measurement',
-    'StationBuilder', 'VilleBuilder'
+    'Measurement', 'MeasurementSeries',
+    'StationBuilder', 'VilleBuilder', 'load_stations'
 ]
@@ -1,7 +1,7 @@
 """
 Pattern Builder pour la construction des stations météo.
 """
-from typing import Optional
+from typing import List, Optional
 from weather_app.models.location import Station, Ville, Pays
 
 
@@ -16,6 +16,7 @@ class StationBuilder:
         self._nom: Optional[str] = None
         self._ville: Optional[Ville] = None
         self._api_url: Optional[str] = None
+        self._max_measurements: Optional[int] = None
 
     def set_id(self, station_id: str) -> 'StationBuilder':
         """Définit l'ID de la station."""
@@ -37,6 +38,11 @@ class StationBuilder:
         self._api_url = api_url
         return self
 
+    def set_max_measurements(self, max_measurements: Optional[int]) -> 'StationBuilder':
+        """Définit le nombre maximal de mesures conservées (None si illimité)."""
+        self._max_measurements = max_measurements
+        return self
+
     def build(self) -> Station:
         """
         Construit et retourne la station.
@@ -54,7 +60,10 @@ class StationBuilder:
                 missing.append("API URL")
             raise ValueError(f"Informations manquantes pour créer la station: {', '.join(missing)}")
 
-        return Station(self._id, self._nom, self._ville, self._api_url)
+        return Station(
+            self._id, self._nom, self._ville, self._api_url,
+            max_measurements=self._max_measurements
+        )
 
     def reset(self) -> 'StationBuilder':
         """Réinitialise le builder."""
@@ -62,6 +71,7 @@ class StationBuilder:
         self._nom = None
         self._ville = None
         self._api_url = None
+        self._max_measurements = None
         return self
 
 
@@ -101,3 +111,40 @@ class VilleBuilder:
         self._nom = None
         self._pays = None
         return self
+
+
+def load_stations(config, default_max_measurements: Optional[int] = None) -> List[Station]:
+    """
+    Crée les stations décrites par la configuration, avec leur ville et leur pays.
+
+    Args:
+        config: La configuration (ConfigurationSingleton)
+        default_max_measurements: Limite de mesures des stations qui n'en
+            ont pas dans la configuration (optionnel)
+
+    Returns:
+        Les stations dont la ville et le pays existent
+    """
+    pays = {pays_id: Pays(pays_id, data['nom']) for pays_id, data in config.get_pays().items()}
+    villes = {
+        ville_id: Ville(ville_id, data['nom'], pays[data['pays_id']])
+        for ville_id, data in config.get_villes().items() if data['pays_id'] in pays
+    }
+
+    stations = []
+    for station_id, data in config.get_stations().items():
+        ville = villes.get(data['ville_id'])
+        if ville is None:
+            continue
+        max_measurements = config.get_max_measurements(station_id)
+        try:
+            stations.append(StationBuilder()
+                            .set_id(station_id)
+                            .set_nom(data['nom'])
+                            .set_ville(ville)
+                            .set_api_url(data['api_url'])
+                            .set_max_measurements(max_measurements or default_max_measurements)
+                            .build())
+        except ValueError as e:
+            print(f"⚠️  Station {station_id} ignorée: {e}")
+    return stations
@@ -2,9 +2,12 @@
 Modèles pour les localisations avec héritage.
 Principe SOLID: Open/Closed - ouvert à l'extension, fermé à la modification.
 """
-from typing import List
+from typing import Iterable, List, Optional, Sequence
 from abc import ABC, abstractmethod
 
+from weather_app.models.measurement_series import MeasurementSeries
+from weather_app.patterns.observer import Subject
+
 
 class Location(ABC):
     """Classe abstraite de base pour toutes les localisations."""
@@ -100,10 +103,25 @@ class Ville(Location):
         return f"Ville: {self.nom} (Pays: {self._pays.nom}) - {len(self._stations)} station(s)"
 
 
-class Station(Location):
-    """Représente une station météo, hérite de Location."""
-
-    def __init__(self, identifier: str, nom: str, ville: Ville, api_url: str):
+class Station(Location, Subject):
+    """
+    Représente une station météo, hérite de Location.
+
+    La station est observable : après chaque ajout de mesures, les
+    observateurs attachés reçoivent les nouvelles mesures en colonnes
+    (arguments nommés epochs, temperatures, humidites, pressions et
+    utc_offsets), ce qui permet de tenir des agrégats à jour sans relire
+    la série.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self,
+                 identifier: str,
+                 nom: str,
+                 ville: Ville,
+                 api_url: str,
+                 *,
+                 max_measurements: Optional[int] = None):
         """
         Initialise une station météo.
 
@@ -112,11 +130,14 @@ class Station(Location):
             nom: Nom de la station
             ville: Ville où se trouve la station
             api_url: URL de l'API pour récupérer les données
+            max_measurements: Nombre maximal de mesures conservées ; au-delà,
+                les plus anciennes sont évincées (illimité si None)
         """
         super().__init__(identifier, nom)
+        Subject.__init__(self)
         self._ville = ville
         self._api_url = api_url
-        self._measurements: List = []
+        self._measurements = MeasurementSeries(capacity=max_measurements)
         ville.add_station(self)
 
     @property
@@ -134,13 +155,73 @@ class Station(Location):
         """Modifie l'URL de l'API."""
         self._api_url = new_url
 
+    @property
+    def max_measurements(self) -> Optional[int]:
+        """Retourne le nombre maximal de mesures conservées (None si illimité)."""
+        return self._measurements.capacity
+
+    @property
+    def measurements(self) -> MeasurementSeries:
+        """Retourne la série des mesures (accès en colonnes, sans copie)."""
+        return self._measurements
+
     def add_measurement(self, measurement) -> None:
         """Ajoute une mesure météo."""
-        self._measurements.append(measurement)
+        self.add_measurements([measurement])
+
+    def add_measurements(self, measurements: Iterable) -> None:
+        """Ajoute plusieurs mesures météo, dans l'ordre fourni."""
+        if not self._observers:
+            self._measurements.extend(measurements)
+            return
+
+        measurements = list(measurements)
+        self._measurements.extend(measurements)
+        dated = [m for m in measurements if m.epoch is not None]
+        if dated:
+            self.notify(
+                epochs=[m.epoch for m in dated],
+                temperatures=[m.temperature for m in dated],
+                humidites=[m.humidite for m in dated],
+                pressions=[m.pression for m in dated],
+                utc_offsets=[m.utc_offset or 0 for m in dated]
+            )
+
+    # pylint: disable=too-many-arguments
+    def append_columns(self,
+                       epochs: Sequence[int],
+                       temperatures: Sequence[float],
+                       humidites: Sequence[int],
+                       pressions: Sequence[int],
+                       *,
+                       utc_offsets: Sequence[int]) -> None:
+        """
+        Ajoute des mesures en bloc à partir de colonnes déjà converties
+        (voir MeasurementSeries.append_columns).
+
+        Args:
+            epochs: Horodatages en secondes depuis l'epoch Unix
+            temperatures: Températures en °C
+            humidites: Humidités en %
+            pressions: Pressions en Pa
+            utc_offsets: Décalage UTC de chaque mesure, en minutes
+        """
+        self._measurements.append_columns(
+            epochs, temperatures, humidites, pressions, utc_offsets=utc_offsets
+        )
+        if self._observers and len(epochs):
+            self.notify(
+                epochs=epochs, temperatures=temperatures, humidites=humidites,
+                pressions=pressions, utc_offsets=utc_offsets
+            )
 
     def get_measurements(self) -> List:
-        """Retourne la liste des mesures."""
-        return self._measurements.copy()
+        """Retourne une nouvelle liste des mesures."""
+        return self._measurements.to_list()
+
+    def count_measurements(self) -> int:
+        """Retourne le nombre de mesures, sans copier la liste."""
+        return len(self._measurements)
 
     def clear_measurements(self) -> None:
         """Efface toutes les mesures."""
@@ -1,13 +1,27 @@
 """
 Modèle pour les mesures météorologiques.
 """
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def _timezone(offset: int) -> timezone:
+    """Retourne le fuseau (partagé) correspondant à un décalage UTC en minutes."""
+    return timezone(timedelta(minutes=offset))
 
 
 class Measurement:
     """
     Représente une mesure météorologique à un instant donné.
 
+    L'horodatage est interprété une seule fois, à la construction ; les
+    libellés formatés sont calculés au premier affichage puis conservés.
+    Les attributs sont déclarés dans __slots__, et la chaîne `heure` n'est
+    conservée que si elle ne peut pas être reconstruite depuis l'epoch et
+    le décalage UTC, afin de réduire l'empreinte mémoire de chaque mesure.
+
     Attributes:
         heure: Horodatage de la mesure (format ISO 8601)
         temperature: Température en degrés Celsius
@@ -15,6 +29,11 @@ class Measurement:
         pression: Pression atmosphérique en Pascals
     """
 
+    __slots__ = (
+        '_heure', '_temperature', '_humidite', '_pression',
+        '_epoch', '_utc_offset', '_formatted'
+    )
+
     def __init__(self,
                  heure: str,
                  temperature: float,
@@ -29,14 +48,30 @@ class Measurement:
             humidite: Humidité en %
             pression: Pression en Pa
         """
-        self._heure = heure
+        self._heure: Optional[str] = heure
         self._temperature = temperature
         self._humidite = humidite
         self._pression = pression
+        self._formatted: Optional[str] = None
+
+        try:
+            dt = datetime.fromisoformat(heure.replace('Z', '+00:00'))
+        except (ValueError, AttributeError):
+            self._epoch: Optional[int] = None
+            self._utc_offset: Optional[int] = None
+            return
+
+        self._epoch = int(dt.timestamp())
+        offset = dt.utcoffset()
+        self._utc_offset = None if offset is None else int(offset.total_seconds() // 60)
+        if self._utc_offset is not None and dt.microsecond == 0 and dt.isoformat() == heure:
+            self._heure = None
 
     @property
     def heure(self) -> str:
         """Retourne l'horodatage de la mesure."""
+        if self._heure is None:
+            return self._local_datetime().isoformat()
         return self._heure
 
     @property
@@ -54,6 +89,26 @@ class Measurement:
         """Retourne la pression atmosphérique en Pascals."""
         return self._pression
 
+    @property
+    def epoch(self) -> Optional[int]:
+        """
+        Retourne l'horodatage en secondes depuis l'epoch Unix.
+
+        Returns:
+            int: Timestamp de la mesure, ou None si l'heure est invalide
+        """
+        return self._epoch
+
+    @property
+    def utc_offset(self) -> Optional[int]:
+        """
+        Retourne le décalage UTC de l'heure d'origine.
+
+        Returns:
+            int: Décalage en minutes, ou None si l'heure n'a pas de fuseau
+        """
+        return self._utc_offset
+
     def format_heure(self) -> str:
         """
         Formate l'heure de manière lisible.
@@ -61,11 +116,49 @@ class Measurement:
         Returns:
             str: Date et heure formatées (JJ/MM/AAAA HH:MM)
         """
-        try:
-            dt = datetime.fromisoformat(self._heure.replace('Z', '+00:00'))
-            return dt.strftime("%d/%m/%Y %H:%M")
-        except (ValueError, AttributeError):
-            return self._heure
+        if self._epoch is None:
+            return self.heure
+        if self._formatted is None:
+            self._formatted = self._local_datetime().strftime("%d/%m/%Y %H:%M")
+        return self._formatted
+
+    def format_date(self) -> Optional[str]:
+        """
+        Returns:
+            str: Date de la mesure (JJ/MM/AAAA), ou None si l'heure est invalide
+        """
+        if self._epoch is None:
+            return None
+        return self.format_heure().split(' ')[0]
+
+    def format_time(self) -> Optional[str]:
+        """
+        Returns:
+            str: Heure de la mesure (HHhMM), ou None si l'heure est invalide
+        """
+        if self._epoch is None:
+            return None
+        return self.format_heure().split(' ')[1].replace(':', 'h')
+
+    def _local_datetime(self) -> datetime:
+        """Retourne la date de la mesure dans son fuseau d'origine."""
+        if self._utc_offset is None:
+            return datetime.fromtimestamp(self._epoch)
+        return datetime.fromtimestamp(self._epoch, _timezone(self._utc_offset))
+
+    def __eq__(self, other: object) -> bool:
+        """Deux mesures sont égales si toutes leurs valeurs le sont."""
+        if not isinstance(other, Measurement):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        """Hash cohérent avec l'égalité."""
+        return hash(self._key())
+
+    def _key(self) -> tuple:
+        """Retourne les valeurs identifiant la mesure."""
+        return (self.heure, self._temperature, self._humidite, self._pression)
 
     def __str__(self) -> str:
         """Représentation textuelle de la mesure."""
@@ -79,6 +172,6 @@ class Measurement:
     def __repr__(self) -> str:
         """Représentation technique de la mesure."""
         return (
-            f"Measurement({self._heure}, {self._temperature}°C, "
+            f"Measurement({self.heure}, {self._temperature}°C, "
             f"{self._humidite}%, {self._pression}Pa)"
         )
@@ -0,0 +1,329 @@
+"""
+Stockage en colonnes des mesures d'une station.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from weather_app.models.measurement import Measurement
+
+# Epoch enregistré pour une mesure dont l'heure n'est pas interprétable
+NO_EPOCH = -(2 ** 63)
+
+# Manière de reconstruire la chaîne `heure` d'origine
+_FORMAT_OFFSET = 0  # ISO 8601 avec décalage (+HH:MM)
+_FORMAT_UTC_Z = 1   # ISO 8601 avec suffixe Z
+_FORMAT_NAIVE = 2   # ISO 8601 sans fuseau (heure locale)
+_FORMAT_RAW = 3     # chaîne conservée telle quelle
+
+
+class MeasurementSeries:
+    """
+    Série de mesures stockée en colonnes typées (module array).
+
+    Chaque mesure occupe environ 27 octets (epoch, température, humidité,
+    pression, décalage horaire et format de l'heure) au lieu d'un objet
+    Python par mesure. Les objets Measurement sont reconstruits à la demande.
+
+    Avec une capacité, la série devient un tampon circulaire : les colonnes
+    sont allouées une fois, chaque ajout est en O(1) et remplace la mesure
+    la plus ancienne quand la série est pleine. Chaque mesure est écrite à
+    deux emplacements (i et i + capacité), de sorte que les mesures, dans
+    l'ordre d'ajout, sont toujours contiguës en mémoire.
+
+    Les méthodes de colonne (epochs, temperatures, ...) renvoient des vues
+    memoryview sans copie. Sans capacité, la série ne peut pas grandir tant
+    qu'une vue existe (BufferError) : les vues doivent être relâchées
+    (`release()` ou bloc `with`) avant tout ajout. Avec une capacité, les
+    ajouts restent possibles mais modifient le contenu des vues existantes.
+
+    Les recherches par date (index_range) supposent que les mesures sont
+    ajoutées dans l'ordre chronologique, comme le fait Station.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self,
+                 measurements: Optional[Iterable[Measurement]] = None,
+                 capacity: Optional[int] = None):
+        """
+        Initialise une série, éventuellement avec des mesures.
+
+        Args:
+            measurements: Mesures initiales (optionnel)
+            capacity: Nombre maximal de mesures conservées (illimité si None)
+
+        Raises:
+            ValueError: Si la capacité n'est pas strictement positive
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("La capacité doit être supérieure ou égale à 1")
+
+        size = 0 if capacity is None else 2 * capacity
+        self._capacity = capacity
+        self._epochs = array('q', [0]) * size
+        self._temperatures = array('d', [0.0]) * size
+        self._humidites = array('i', [0]) * size
+        self._pressions = array('i', [0]) * size
+        # Décalage UTC en minutes et format de l'heure d'origine
+        self._offsets = array('h', [0]) * size
+        self._formats = array('b', [0]) * size
+        # Position physique de la mesure la plus ancienne, et nombre de mesures
+        self._start = 0
+        self._count = 0
+        # Emplacement -> heure d'origine, pour les heures non reconstructibles
+        self._raw_heures: Dict[int, str] = {}
+
+        if measurements is not None:
+            self.extend(measurements)
+
+    @property
+    def capacity(self) -> Optional[int]:
+        """Retourne la capacité du tampon circulaire (None si illimitée)."""
+        return self._capacity
+
+    def append(self, measurement: Measurement) -> None:
+        """
+        Ajoute une mesure à la fin de la série, en évinçant la plus ancienne
+        si la capacité est atteinte.
+
+        Args:
+            measurement: La mesure à ajouter
+        """
+        epoch, offset, fmt = _encode_heure(measurement)
+        # Humidité et pression sont stockées en entiers : une valeur
+        # décimale (ex. 65.5 %) est arrondie à l'entier le plus proche,
+        # comme à la lecture des réponses de l'API (batch_parser.round_int).
+        values = (epoch, measurement.temperature, int(round(measurement.humidite)),
+                  int(round(measurement.pression)), offset, fmt)
+
+        if self._capacity is None:
+            slot = self._count
+            for column, value in zip(self._columns(), values):
+                column.append(value)
+            self._count += 1
+        else:
+            slot = self._reserve(1)
+            for column, value in zip(self._columns(), values):
+                column[slot] = value
+                column[slot + self._capacity] = value
+
+        if fmt == _FORMAT_RAW:
+            self._raw_heures[slot] = measurement.heure
+
+    def extend(self, measurements: Iterable[Measurement]) -> None:
+        """
+        Ajoute plusieurs mesures à la fin de la série.
+
+        Args:
+            measurements: Les mesures à ajouter
+        """
+        for measurement in measurements:
+            self.append(measurement)
+
+    # pylint: disable=too-many-arguments
+    def append_columns(self,
+                       epochs: Iterable[int],
+                       temperatures: Iterable[float],
+                       humidites: Iterable[int],
+                       pressions: Iterable[int],
+                       *,
+                       utc_offset: int = 0,
+                       utc_offsets: Optional[Iterable[int]] = None) -> None:
+        """
+        Ajoute des mesures en bloc à partir de colonnes déjà converties.
+
+        Aucun objet Measurement n'est créé : les colonnes (listes, arrays
+        ou memoryview) sont copiées directement dans la série.
+
+        Args:
+            epochs: Horodatages en secondes depuis l'epoch Unix
+            temperatures: Températures en °C
+            humidites: Humidités en %
+            pressions: Pressions en Pa
+            utc_offset: Décalage UTC en minutes utilisé pour reconstruire `heure`
+            utc_offsets: Décalage UTC de chaque mesure (remplace utc_offset)
+
+        Raises:
+            ValueError: Si les colonnes n'ont pas la même longueur
+        """
+        columns = [array('q', epochs), array('d', temperatures),
+                   array('i', humidites), array('i', pressions)]
+        count = len(columns[0])
+        columns.append(array('h', [utc_offset]) * count if utc_offsets is None
+                       else array('h', utc_offsets))
+        columns.append(array('b', [_FORMAT_OFFSET]) * count)
+        if any(len(column) != count for column in columns):
+            raise ValueError("Les colonnes doivent avoir la même longueur")
+
+        if self._capacity is None:
+            for column, values in zip(self._columns(), columns):
+                column.extend(values)
+            self._count += count
+            return
+
+        # Seules les `capacité` dernières mesures peuvent être conservées
+        if count > self._capacity:
+            columns = [values[count - self._capacity:] for values in columns]
+            count = self._capacity
+        slot = self._reserve(count)
+        first = min(count, self._capacity - slot)
+        for column, values in zip(self._columns(), columns):
+            for position in (slot, slot + self._capacity):
+                column[position:position + first] = values[:first]
+            for position in (0, self._capacity):
+                column[position:position + count - first] = values[first:]
+
+    def clear(self) -> None:
+        """Efface toutes les mesures (la mémoire d'un tampon circulaire est conservée)."""
+        if self._capacity is None:
+            for column in self._columns():
+                del column[:]
+        self._start = 0
+        self._count = 0
+        self._raw_heures.clear()
+
+    def to_list(self) -> List[Measurement]:
+        """
+        Returns:
+            Nouvelle liste des mesures, de la plus ancienne ajoutée à la plus récente
+        """
+        return [self[index] for index in range(len(self))]
+
+    def epochs(self, start: int = 0, stop: Optional[int] = None) -> memoryview:
+        """Retourne une vue (sans copie) des horodatages."""
+        return self._view(self._epochs, start, stop)
+
+    def temperatures(self, start: int = 0, stop: Optional[int] = None) -> memoryview:
+        """Retourne une vue (sans copie) des températures."""
+        return self._view(self._temperatures, start, stop)
+
+    def humidites(self, start: int = 0, stop: Optional[int] = None) -> memoryview:
+        """Retourne une vue (sans copie) des humidités."""
+        return self._view(self._humidites, start, stop)
+
+    def pressions(self, start: int = 0, stop: Optional[int] = None) -> memoryview:
+        """Retourne une vue (sans copie) des pressions."""
+        return self._view(self._pressions, start, stop)
+
+    def utc_offsets(self, start: int = 0, stop: Optional[int] = None) -> memoryview:
+        """Retourne une vue (sans copie) des décalages UTC, en minutes."""
+        return self._view(self._offsets, start, stop)
+
+    def index_range(self,
+                    start_epoch: Optional[int] = None,
+                    end_epoch: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Recherche par dichotomie les mesures comprises dans un intervalle.
+
+        Args:
+            start_epoch: Borne inférieure incluse (optionnel)
+            end_epoch: Borne supérieure incluse (optionnel)
+
+        Returns:
+            Les index (start, stop) à passer aux méthodes de colonne
+        """
+        low, high = self._start, self._start + self._count
+        start = low if start_epoch is None else bisect_left(self._epochs, start_epoch, low, high)
+        stop = high if end_epoch is None else bisect_right(self._epochs, end_epoch, low, high)
+        return start - low, max(start, stop) - low
+
+    @property
+    def nbytes(self) -> int:
+        """Retourne la taille allouée pour les colonnes, en octets."""
+        return sum(column.itemsize * len(column) for column in self._columns())
+
+    def _columns(self) -> Tuple[array, ...]:
+        """Retourne les colonnes, dans l'ordre des valeurs d'une mesure."""
+        return (self._epochs, self._temperatures, self._humidites,
+                self._pressions, self._offsets, self._formats)
+
+    def _view(self, column: array, start: int, stop: Optional[int]) -> memoryview:
+        """Retourne la vue des mesures [start:stop] d'une colonne."""
+        bounds = range(self._start, self._start + self._count)[start:stop]
+        return memoryview(column)[bounds.start:bounds.stop]
+
+    def _reserve(self, count: int) -> int:
+        """
+        Réserve `count` emplacements (au plus la capacité) dans le tampon
+        circulaire, en évinçant les mesures les plus anciennes.
+
+        Returns:
+            L'emplacement de la première mesure à écrire
+        """
+        capacity = self._capacity
+        slot = (self._start + self._count) % capacity
+        overflow = max(0, self._count + count - capacity)
+        self._start = (self._start + overflow) % capacity
+        self._count = min(capacity, self._count + count)
+        if self._raw_heures:
+            for position in range(slot, slot + count):
+                self._raw_heures.pop(position % capacity, None)
+        return slot
+
+    def __getitem__(self, index: int) -> Measurement:
+        """
+        Reconstruit la mesure à la position `index` (index négatifs acceptés).
+
+        Raises:
+            IndexError: Si l'index est hors limites
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Index de mesure hors limites")
+
+        position = self._start + index
+        if self._formats[position] == _FORMAT_RAW:
+            slot = position if self._capacity is None else position % self._capacity
+            heure = self._raw_heures[slot]
+        else:
+            heure = _decode_heure(
+                self._epochs[position], self._offsets[position], self._formats[position]
+            )
+        return Measurement(
+            heure=heure,
+            temperature=self._temperatures[position],
+            humidite=self._humidites[position],
+            pression=self._pressions[position]
+        )
+
+    def __iter__(self) -> Iterator[Measurement]:
+        """Itère sur les mesures reconstruites, de la plus ancienne à la plus récente."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        """Retourne le nombre de mesures."""
+        return self._count
+
+
+def _encode_heure(measurement: Measurement) -> Tuple[int, int, int]:
+    """
+    Décompose l'heure d'une mesure en (epoch, décalage en minutes, format).
+
+    Le format _FORMAT_RAW est retourné quand la chaîne ne peut pas être
+    reconstruite à l'identique (heure invalide, fractions de seconde...).
+    """
+    epoch = measurement.epoch
+    if epoch is None:
+        return NO_EPOCH, 0, _FORMAT_RAW
+
+    offset = measurement.utc_offset
+    if offset is None:
+        offset, fmt = 0, _FORMAT_NAIVE
+    else:
+        fmt = _FORMAT_UTC_Z if measurement.heure.endswith('Z') else _FORMAT_OFFSET
+
+    if _decode_heure(epoch, offset, fmt) != measurement.heure:
+        fmt = _FORMAT_RAW
+    return epoch, offset, fmt
+
+
+def _decode_heure(epoch: int, offset: int, fmt: int) -> str:
+    """Reconstruit l'heure ISO 8601 d'origine."""
+    if fmt == _FORMAT_NAIVE:
+        return datetime.fromtimestamp(epoch).isoformat()
+    if fmt == _FORMAT_UTC_Z:
+        return datetime.fromtimestamp(epoch, timezone.utc).isoformat().replace('+00:00', 'Z')
+    return datetime.fromtimestamp(epoch, timezone(timedelta(minutes=offset))).isoformat()
@@ -9,8 +9,9 @@ Les warnings pylint R0903, R0913, R0917 sont désactivés pour ce fichier.
 # pylint: disable=too-many-arguments
 # pylint: disable=too-many-positional-arguments
 
+import json
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable, TextIO
 
 
 class Command(ABC):
@@ -57,11 +58,35 @@ class RefreshDataCommand(Command):
     def execute(self) -> Any:
         """Rafraîchit les données de la station."""
         print(f"\n🔄 Rafraîchissement des données pour {self._station.nom}...")
-        self._station.clear_measurements()
-        self._api_service.fetch_data_for_station(self._station)
+        # Les mesures sont remplacées par le service, sauf si le serveur
+        # indique qu'elles n'ont pas changé (304). Le cache est ignoré.
+        self._api_service.fetch_data_for_station(self._station, force_refresh=True)
         return self._station.get_measurements()
 
 
+class RefreshStationsCommand(Command):
+    """Commande pour rafraîchir plusieurs stations en parallèle."""
+
+    def __init__(self, api_service, stations, max_workers: int = 8, force_refresh: bool = False):
+        """
+        Args:
+            api_service: Le service API
+            stations: Les stations à rafraîchir
+            max_workers: Nombre maximal de requêtes simultanées
+            force_refresh: Ignore le cache des réponses
+        """
+        self._api_service = api_service
+        self._stations = stations
+        self._max_workers = max_workers
+        self._force_refresh = force_refresh
+
+    def execute(self) -> Any:
+        """Rafraîchit les stations et retourne les résultats (FetchResult)."""
+        return self._api_service.fetch_all(
+            self._stations, max_workers=self._max_workers, force_refresh=self._force_refresh
+        )
+
+
 class DisplayMeasurementsCommand(Command):
     """Commande pour afficher les mesures d'une station."""
 
@@ -77,6 +102,36 @@ class DisplayMeasurementsCommand(Command):
         return self._station.get_measurements()
 
 
+class ExportMeasurementsCommand(Command):
+    """Commande pour exporter les mesures enregistrées, une ligne JSON par mesure."""
+
+    def __init__(self, store, station_ids: Iterable[str], output: TextIO):
+        """
+        Args:
+            store: La base historique (TimeSeriesStore)
+            station_ids: Les stations à exporter
+            output: Le fichier texte où écrire les lignes
+        """
+        self._store = store
+        self._station_ids = station_ids
+        self._output = output
+
+    def execute(self) -> Any:
+        """Exporte les mesures et retourne le nombre de lignes écrites."""
+        count = 0
+        for station_id in self._station_ids:
+            for measurement in self._store.query(station_id):
+                self._output.write(json.dumps({
+                    'station_id': station_id,
+                    'heure': measurement.heure,
+                    'temperature': measurement.temperature,
+                    'humidite': measurement.humidite,
+                    'pression': measurement.pression,
+                }, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+
 class AddCountryCommand(Command):
     """Commande pour ajouter un pays."""
 
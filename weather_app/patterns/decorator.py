@@ -5,7 +5,6 @@ import shutil
 import time
 from functools import wraps
 from typing import Callable, Any
-from datetime import datetime
 
 
 def display_measurements_decorator(func: Callable) -> Callable:
@@ -52,15 +51,14 @@ def _display_measurements_table(measurements: list) -> None:
 
     # Grouper les mesures par date
     measurements_by_date = {}
+    # (libellés calculés une seule fois par mesure)
     for m in measurements:
-        try:
-            dt = datetime.fromisoformat(m.heure.replace('Z', '+00:00'))
-            date_key = dt.strftime("%d/%m/%Y")
-            if date_key not in measurements_by_date:
-                measurements_by_date[date_key] = []
-            measurements_by_date[date_key].append(m)
-        except (ValueError, AttributeError):
+        date_key = m.format_date()
+        if date_key is None:
             continue
+        if date_key not in measurements_by_date:
+            measurements_by_date[date_key] = []
+        measurements_by_date[date_key].append(m)
 
     # Afficher chaque journée
     for date, day_measurements in sorted(measurements_by_date.items(), reverse=True):
@@ -94,14 +92,13 @@ def _print_measurement_row(measurements: list, col_width: int, terminal_width: i
     press = []
 
     for m in measurements:
-        try:
-            dt = datetime.fromisoformat(m.heure.replace('Z', '+00:00'))
-            heure = dt.strftime("%Hh%M")
+        heure = m.format_time()
+        if heure is not None:
             headers.append(heure)
             temps.append(f"{m.temperature}°C")
             hums.append(f"{m.humidite}%")
             press.append(f"{m.pression} Pa")
-        except (ValueError, AttributeError):
+        else:
             headers.append("--:--")
             temps.append("--°C")
             hums.append("--%")
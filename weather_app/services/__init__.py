@@ -1,6 +1,14 @@
 """
 Module des services.
 """
-from .api_service import ApiService
+from .api_service import ApiService, FetchResult, iter_measurements, parse_measurements
+from .async_api_service import AsyncApiService
+from .disk_cache import DiskResponseCache
+from .response_cache import ResponseCache
+from .scheduler import PollScheduler, ScheduledJob
 
-__all__ = ['ApiService']
+__all__ = [
+    'ApiService', 'AsyncApiService', 'DiskResponseCache', 'FetchResult',
+    'iter_measurements', 'parse_measurements', 'PollScheduler', 'ResponseCache',
+    'ScheduledJob'
+]
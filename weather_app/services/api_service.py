@@ -1,13 +1,211 @@
 """
 Service pour gérer les appels à l'API météo.
 """
-from typing import List, Dict
+import json
+import sqlite3
+import time
+from collections import deque
+from itertools import compress
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from weather_app.data_structures.queue import Queue
 from weather_app.models.measurement import Measurement
 from weather_app.models.location import Station
+from weather_app.models.measurement_series import NO_EPOCH
+from weather_app.services.batch_parser import MeasurementColumns, parse_columns, round_int
+from weather_app.services.disk_cache import DiskResponseCache
+from weather_app.services.json_stream import iter_json_records
+from weather_app.services.response_cache import ResponseCache
+from weather_app.storage.time_series_store import TimeSeriesStore
+
+# Limites de pagination de l'API Opendatasoft (v2.1)
+MAX_PAGE_SIZE = 100
+MAX_OFFSET_WINDOW = 10000
+# Taille des blocs lus lors d'un parsing en flux
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def parse_measurements(data: Dict) -> List[Measurement]:
+    """
+    Convertit les résultats JSON de l'API en mesures.
+
+    Partagé entre les services synchrone et asynchrone.
+
+    Args:
+        data: Les données JSON de l'API
+
+    Returns:
+        Liste d'objets Measurement
+    """
+    return list(iter_measurements(data.get('results', [])))
+
+
+def iter_measurements(records: Iterable[Dict]) -> Iterator[Measurement]:
+    """
+    Convertit des enregistrements de l'API en mesures, un par un.
+
+    Les enregistrements invalides sont signalés puis ignorés.
+
+    Args:
+        records: Les enregistrements JSON (liste ou flux)
+
+    Yields:
+        Les objets Measurement
+    """
+    for result in records:
+        try:
+            yield Measurement(
+                heure=result.get('heure_de_paris', ''),
+                temperature=float(result.get('temperature_en_degre_c', 0)),
+                humidite=round_int(result.get('humidite', 0)),
+                pression=round_int(result.get('pression', 0))
+            )
+        except (ValueError, TypeError, OverflowError) as e:
+            print(f"⚠️  Erreur lors du parsing d'une mesure: {e}")
+            continue
+
+
+def chronological(measurements: Iterable[Measurement]) -> List[Measurement]:
+    """
+    Trie des mesures de la plus ancienne à la plus récente.
+
+    L'API renvoie les mesures de la plus récente à la plus ancienne ; les
+    stations les conservent dans l'ordre chronologique pour que les mesures
+    plus récentes s'ajoutent simplement à la fin. Les mesures sans heure
+    valide sont placées en tête.
+
+    Args:
+        measurements: Les mesures à trier
+
+    Returns:
+        Nouvelle liste triée
+    """
+    return sorted(
+        measurements,
+        key=lambda m: (m.epoch is not None, m.epoch or 0)
+    )
+
+
+def build_incremental_url(url: str, since: str) -> str:
+    """
+    Réécrit l'URL d'une station pour ne demander que les mesures postérieures
+    à `since`, de la plus ancienne à la plus récente.
+
+    Une clause `where` existante est conservée et combinée avec AND.
+
+    Args:
+        url: L'URL Opendatasoft de la station
+        since: Horodatage ISO 8601 de la mesure la plus récente déjà connue
+
+    Returns:
+        L'URL incrémentale
+    """
+    parts = urlsplit(url)
+    params = dict(parse_qsl(parts.query, keep_blank_values=True))
+
+    clause = f"heure_de_paris > date'{since}'"
+    if params.get('where'):
+        clause = f"({params['where']}) AND {clause}"
+    params['where'] = clause
+    # Ordre croissant : sans trou si plus de `limit` mesures sont arrivées
+    params['order_by'] = 'heure_de_paris ASC'
+
+    query = urlencode(params, quote_via=quote, safe='')
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, parts.fragment))
+
+
+def build_page_url(url: str, offset: int, limit: int) -> str:
+    """
+    Réécrit l'URL d'une station pour demander une page de résultats.
+
+    Args:
+        url: L'URL Opendatasoft de la station
+        offset: Index du premier enregistrement
+        limit: Nombre d'enregistrements de la page
+
+    Returns:
+        L'URL de la page
+    """
+    parts = urlsplit(url)
+    params = dict(parse_qsl(parts.query, keep_blank_values=True))
+    params['offset'] = str(offset)
+    params['limit'] = str(limit)
+
+    query = urlencode(params, quote_via=quote, safe='')
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, parts.fragment))
+
+
+def fill_station(station: Station, columns: MeasurementColumns) -> 'FetchResult':
+    """
+    Remplace les mesures d'une station par les lignes valides des colonnes,
+    ajoutées en bloc dans l'ordre chronologique.
+
+    Args:
+        station: La station à remplir
+        columns: Les mesures converties par parse_columns
+
+    Returns:
+        Le résultat de chargement correspondant
+    """
+    ordered = columns.chronological()
+    station.clear_measurements()
+    station.append_columns(
+        ordered.epochs, ordered.temperatures, ordered.humidites, ordered.pressions,
+        utc_offsets=ordered.utc_offsets
+    )
+
+    message = f"✅ {len(ordered)} mesure(s) chargée(s) pour {station.nom}"
+    if columns.bad_rows:
+        message = f"{message} ({columns.bad_rows} mesure(s) invalide(s) ignorée(s))"
+    return FetchResult(station, True, message, len(ordered))
+
+
+def print_fetch_report(results: List['FetchResult'], elapsed: float) -> None:
+    """
+    Affiche les erreurs et le bilan d'un chargement de plusieurs stations.
+
+    Args:
+        results: Les résultats de chargement
+        elapsed: Durée totale en secondes
+    """
+    for result in results:
+        if not result.success:
+            print(result.message)
+    succeeded = sum(1 for result in results if result.success)
+    print(f"✅ {succeeded}/{len(results)} station(s) chargée(s) en {elapsed:.2f}s")
+
+
+class FetchResult:
+    """
+    Résultat du chargement des données d'une station.
+
+    Cette classe est une simple structure de données sans méthodes.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, station: Station, success: bool, message: str, count: int = 0):
+        """
+        Initialise un résultat de chargement.
+
+        Args:
+            station: La station concernée
+            success: True si les données ont été chargées
+            message: Message de statut à afficher
+            count: Nombre de mesures chargées
+        """
+        self.station = station
+        self.success = success
+        self.message = message
+        self.count = count
+        self.not_modified = False
+        self.from_cache = False
+        self.duration = 0.0
 
 
 class ApiService:
@@ -15,45 +213,550 @@ class ApiService:
     Service pour gérer les requêtes API.
     """
 
-    def __init__(self):
-        """Initialise le service API avec une file de requêtes."""
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
+    def __init__(self,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 response_cache: Optional[ResponseCache] = None,
+                 disk_cache: Optional[DiskResponseCache] = None,
+                 *,
+                 incremental: bool = False,
+                 store: Optional[TimeSeriesStore] = None):
+        """
+        Initialise le service API avec une file de requêtes et une session HTTP.
+
+        La session garde les connexions ouvertes (keep-alive) : les requêtes
+        successives vers un même hôte réutilisent la connexion TCP/TLS.
+
+        Args:
+            pool_connections: Nombre d'hôtes dont le pool est conservé
+            pool_maxsize: Nombre maximal de connexions gardées par hôte
+                (à garder >= max_workers de fetch_all)
+            response_cache: Cache mémoire consulté avant le réseau (optionnel)
+            disk_cache: Cache disque consulté après le cache mémoire, et
+                utilisé en dernier recours si le réseau échoue (optionnel)
+            incremental: Ne demande que les mesures plus récentes que celles
+                déjà présentes dans la station, puis les ajoute
+            store: Base où sont enregistrées les mesures reçues de l'API
+                (optionnel, les doublons y sont ignorés)
+        """
         self._request_queue = Queue()
         self._timeout = 10  # Timeout en secondes
+        # Validateurs HTTP (ETag / Last-Modified) par URL
+        self._validators: Dict[str, Dict[str, str]] = {}
+        self._response_cache = response_cache
+        self._disk_cache = disk_cache
+        self._incremental = incremental
+        self._store = store
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize
+        )
+        self._session = requests.Session()
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
 
-    def fetch_data_for_station(self, station: Station) -> bool:
+    def fetch_data_for_station(self, station: Station, force_refresh: bool = False) -> bool:
         """
         Args:
             station: La station pour laquelle récupérer les données
+            force_refresh: Ignore le cache des réponses et interroge l'API
 
         Returns:
             True si les données ont été chargées avec succès, False sinon
         """
+        self._request_queue.enqueue(station.api_url)
+        url = self._request_queue.dequeue()
+
+        result = self._load_station(station, url, force_refresh)
+        print(result.message)
+        return result.success
+
+    def fetch_station(self, station: Station, force_refresh: bool = False) -> FetchResult:
+        """
+        Charge les données d'une station sans rien afficher ; peut être
+        appelée depuis plusieurs threads.
+
+        Args:
+            station: La station pour laquelle récupérer les données
+            force_refresh: Ignore le cache des réponses et interroge l'API
+
+        Returns:
+            Le résultat du chargement
+        """
+        return self._load_station(station, station.api_url, force_refresh)
+
+    def fetch_all(self,
+                  stations: Iterable[Station],
+                  max_workers: int = 8,
+                  force_refresh: bool = False) -> List[FetchResult]:
+        """
+        Charge les données de plusieurs stations en parallèle.
+
+        Les requêtes sont réparties sur un pool de `max_workers` threads au
+        maximum. La file de l'instance n'est pas utilisée : plusieurs
+        rafraîchissements peuvent s'exécuter en même temps.
+
+        Args:
+            stations: Les stations à rafraîchir
+            max_workers: Nombre maximal de requêtes simultanées
+            force_refresh: Ignore le cache des réponses et interroge l'API
+
+        Returns:
+            Liste des résultats, dans l'ordre des stations fournies
+
+        Raises:
+            ValueError: Si max_workers est inférieur à 1
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers doit être supérieur ou égal à 1")
+
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda station: self._load_station(station, station.api_url, force_refresh),
+                stations
+            ))
+        print_fetch_report(results, time.perf_counter() - start_time)
+        return results
+
+    def backfill_station(self,
+                         station: Station,
+                         sink: Callable[[List[Measurement]], None],
+                         *,
+                         page_size: int = MAX_PAGE_SIZE,
+                         max_records: Optional[int] = None,
+                         prefetch: int = 4) -> int:
+        """
+        Parcourt l'historique d'une station page par page (offset/limit).
+
+        Les `prefetch` pages suivantes sont demandées pendant que la page
+        courante est transmise au `sink` : seules ces pages sont en mémoire,
+        jamais l'historique complet. Les mesures ne sont pas ajoutées à la
+        station. L'API limite la pagination aux 10 000 premiers résultats.
+
+        Args:
+            station: La station dont récupérer l'historique
+            sink: Fonction appelée avec chaque page de mesures, dans l'ordre
+            page_size: Nombre de mesures par page (100 au maximum)
+            max_records: Nombre maximal de mesures à récupérer (optionnel)
+            prefetch: Nombre de pages demandées à l'avance
+
+        Returns:
+            Le nombre de mesures transmises au sink
+
+        Raises:
+            ValueError: Si page_size ou prefetch est hors limites
+        """
+        if not 1 <= page_size <= MAX_PAGE_SIZE or prefetch < 1:
+            raise ValueError(
+                f"page_size doit être entre 1 et {MAX_PAGE_SIZE}, prefetch au moins 1"
+            )
+
+        written = 0
         try:
-            self._request_queue.enqueue(station.api_url)
-            url = self._request_queue.dequeue()
+            pages = self._iter_history_pages(station.api_url, page_size, max_records, prefetch)
+            for page in pages:
+                sink(page)
+                written += len(page)
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Historique interrompu pour {station.nom} après "
+                  f"{written} mesure(s): {str(e)}")
+            return written
+        except (KeyError, ValueError) as e:
+            print(f"❌ Erreur lors du parsing de l'historique: {str(e)}")
+            return written
 
-            response = requests.get(url, timeout=self._timeout)
+        print(f"✅ {written} mesure(s) d'historique récupérée(s) pour {station.nom}")
+        return written
+
+    def stream_measurements(self,
+                            url: str,
+                            chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Measurement]:
+        """
+        Télécharge une réponse de l'API et produit ses mesures au fil de la lecture.
+
+        Le corps n'est jamais chargé entièrement : seul le bloc en cours de
+        décodage est en mémoire, et les premières mesures sont disponibles
+        avant la fin du téléchargement. Convient aux réponses `/records`
+        (clé `results`) comme aux exports `/exports/json` (liste à la racine).
+        Les réponses lues en flux ne passent pas par les caches.
+
+        Args:
+            url: L'URL à interroger
+            chunk_size: Taille des blocs lus sur la connexion, en octets
+
+        Yields:
+            Les mesures, dans l'ordre renvoyé par l'API
+
+        Raises:
+            requests.exceptions.RequestException: En cas d'erreur réseau ou HTTP
+            ValueError: Si le corps n'est pas du JSON valide ou est tronqué
+        """
+        with self._session.get(url, stream=True, timeout=self._timeout) as response:
             response.raise_for_status()
+            records = iter_json_records(response.iter_content(chunk_size))
+            yield from iter_measurements(records)
 
-            data = response.json()
-            measurements = self._parse_measurements(data)
+    def _iter_history_pages(self,
+                            url: str,
+                            page_size: int,
+                            max_records: Optional[int],
+                            prefetch: int) -> Iterator[List[Measurement]]:
+        """
+        Génère les pages d'historique en gardant `prefetch` requêtes d'avance.
+
+        Args:
+            url: L'URL de la station
+            page_size: Taille des pages
+            max_records: Nombre maximal de mesures (optionnel)
+            prefetch: Nombre de pages demandées à l'avance
+
+        Yields:
+            Les pages de mesures non vides, tronquées au nombre demandé
+        """
+        total_count, page = self._fetch_page(url, 0, page_size)
+        target = min(total_count, MAX_OFFSET_WINDOW)
+        if max_records is not None:
+            target = min(target, max_records)
+        if total_count > MAX_OFFSET_WINDOW:
+            print(f"⚠️  {total_count} mesure(s) disponibles, "
+                  f"pagination limitée à {MAX_OFFSET_WINDOW} par l'API")
 
-            station.clear_measurements()
-            for measurement in measurements:
-                station.add_measurement(measurement)
+        remaining = target
+        offsets = iter(range(page_size, target, page_size))
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            # La dernière page est raccourcie : offset + limit ne doit pas
+            # dépasser la fenêtre de pagination de l'API.
+            pending = deque(
+                executor.submit(self._fetch_page, url, offset, min(page_size, target - offset))
+                for offset, _ in zip(offsets, range(prefetch))
+            )
+            try:
+                while page and remaining > 0:
+                    page = page[:remaining]
+                    remaining -= len(page)
+                    yield page
+
+                    if not pending:
+                        break
+                    _, page = pending.popleft().result()
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        pending.append(executor.submit(
+                            self._fetch_page, url, next_offset,
+                            min(page_size, target - next_offset)
+                        ))
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _fetch_page(self, url: str, offset: int, limit: int) -> Tuple[int, List[Measurement]]:
+        """
+        Args:
+            url: L'URL de la station
+            offset: Index du premier enregistrement
+            limit: Taille de la page
+
+        Returns:
+            Le nombre total d'enregistrements annoncé par l'API et les mesures de la page
+        """
+        response = self._session.get(
+            build_page_url(url, offset, limit), timeout=self._timeout
+        )
+        response.raise_for_status()
+        data = response.json()
+        return int(data.get('total_count', 0)), self._parse_measurements(data)
 
-            print(f"✅ {len(measurements)} mesure(s) chargée(s) pour {station.nom}")
-            return True
+    def _load_station(self,
+                      station: Station,
+                      url: str,
+                      force_refresh: bool = False) -> FetchResult:
+        """
+        Récupère les données d'une URL et remplit la station.
+
+        Args:
+            station: La station à remplir
+            url: L'URL à interroger
+            force_refresh: Ignore le cache des réponses
+
+        Returns:
+            Le résultat du chargement
+        """
+        start_time = time.perf_counter()
+        try:
+            result = None
+            if not force_refresh:
+                result = self._load_from_cache(station, url)
+            if result is None:
+                result = self._load_from_network(station, url)
 
         except requests.exceptions.Timeout:
-            print(f"❌ Timeout lors de la récupération des données pour {station.nom}")
-            return False
+            result = self._load_stale(station, url) or FetchResult(
+                station, False,
+                f"❌ Timeout lors de la récupération des données pour {station.nom}"
+            )
         except requests.exceptions.RequestException as e:
-            print(f"❌ Erreur réseau: {str(e)}")
-            return False
+            result = self._load_stale(station, url) or FetchResult(
+                station, False, f"❌ Erreur réseau: {str(e)}"
+            )
         except (KeyError, ValueError) as e:
-            print(f"❌ Erreur lors du parsing des données: {str(e)}")
-            return False
+            result = FetchResult(
+                station, False, f"❌ Erreur lors du parsing des données: {str(e)}"
+            )
+
+        result.duration = time.perf_counter() - start_time
+        return result
+
+    def _load_from_cache(self, station: Station, url: str) -> Optional[FetchResult]:
+        """
+        Remplit la station depuis le cache mémoire, puis le cache disque.
+
+        Args:
+            station: La station à remplir
+            url: L'URL de la station
+
+        Returns:
+            Le résultat du chargement, ou None si la réponse n'est pas en cache
+        """
+        body = None
+        if self._response_cache is not None:
+            body = self._response_cache.get(url)
+        if body is None and self._disk_cache is not None:
+            body = self._disk_cache.get(url)
+            if body is not None and self._response_cache is not None:
+                self._response_cache.put(url, body)
+        if body is None:
+            return None
+
+        result = fill_station(station, self._parse_columns(json.loads(body)))
+        result.message = f"{result.message} (cache)"
+        result.from_cache = True
+        return result
+
+    def _load_stale(self, station: Station, url: str) -> Optional[FetchResult]:
+        """
+        Remplit la station avec la dernière réponse connue du cache disque,
+        même expirée. Utilisé quand l'API est injoignable.
+
+        Args:
+            station: La station à remplir
+            url: L'URL de la station
+
+        Returns:
+            Le résultat du chargement, ou None si aucune copie n'est disponible
+        """
+        if self._disk_cache is None:
+            return None
+        body = self._disk_cache.get(url, allow_stale=True)
+        if body is None:
+            return None
+
+        try:
+            result = fill_station(station, self._parse_columns(json.loads(body)))
+        except ValueError:
+            return None
+        result.message = (
+            f"⚠️  API injoignable : {result.count} dernière(s) mesure(s) connue(s) "
+            f"pour {station.nom}"
+        )
+        result.from_cache = True
+        return result
+
+    def _store_response(self, url: str, body: bytes) -> None:
+        """
+        Enregistre un corps de réponse dans les caches configurés.
+
+        Args:
+            url: L'URL interrogée
+            body: Le corps brut de la réponse
+        """
+        if self._response_cache is not None:
+            self._response_cache.put(url, body)
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache.put(url, body)
+            except OSError as e:
+                print(f"⚠️  Impossible d'écrire dans le cache disque: {e}")
+
+    def _load_from_network(self, station: Station, url: str) -> FetchResult:
+        """
+        Interroge l'API, de manière conditionnelle si la station a déjà des mesures.
+
+        Args:
+            station: La station à remplir
+            url: L'URL à interroger
+
+        Returns:
+            Le résultat du chargement
+        """
+        headers = {}
+        if station.count_measurements():
+            if self._incremental:
+                latest = self._latest_measurement(station)
+                if latest is not None:
+                    return self._load_incremental(station, url, latest)
+            headers = self._conditional_headers(url)
+
+        response = self._session.get(url, headers=headers, timeout=self._timeout)
+        if response.status_code == 304:
+            result = FetchResult(
+                station, True,
+                f"✅ Données inchangées pour {station.nom} "
+                f"({station.count_measurements()} mesure(s))",
+                station.count_measurements()
+            )
+            result.not_modified = True
+            return result
+
+        response.raise_for_status()
+
+        columns = self._parse_columns(response.json())
+        result = fill_station(station, columns)
+        self._persist_columns(station, columns)
+        self._store_validators(url, response)
+        self._store_response(url, response.content)
+        return result
+
+    def _load_incremental(self,
+                          station: Station,
+                          url: str,
+                          latest: Measurement) -> FetchResult:
+        """
+        Demande uniquement les mesures postérieures à `latest` et les ajoute
+        à la station, sans effacer les mesures existantes.
+
+        Args:
+            station: La station à compléter
+            url: L'URL de la station
+            latest: La mesure la plus récente déjà présente
+
+        Returns:
+            Le résultat du chargement
+        """
+        # Pas de requête conditionnelle : l'URL change avec chaque nouvelle
+        # mesure, des validateurs enregistrés ne resserviraient jamais.
+        response = self._session.get(
+            build_incremental_url(url, latest.heure), headers={}, timeout=self._timeout
+        )
+
+        new_measurements = []
+        if response.status_code != 304:
+            response.raise_for_status()
+            new_measurements = [
+                m for m in self._parse_measurements(response.json())
+                if m.epoch is not None and m.epoch > latest.epoch
+            ]
+
+        station.add_measurements(chronological(new_measurements))
+        self._persist(station, lambda store: store.add_measurements(
+            station.id, new_measurements
+        ))
+
+        result = FetchResult(
+            station, True,
+            f"✅ {len(new_measurements)} nouvelle(s) mesure(s) pour {station.nom} "
+            f"({station.count_measurements()} au total)",
+            len(new_measurements)
+        )
+        result.not_modified = not new_measurements
+        return result
+
+    @staticmethod
+    def _latest_measurement(station: Station) -> Optional[Measurement]:
+        """
+        Args:
+            station: La station
+
+        Returns:
+            La mesure la plus récente de la station, ou None si aucune n'est datée
+        """
+        # La série est chronologique : la dernière mesure datée est la plus
+        # récente. Seule celle-ci est reconstruite, sans copier la série.
+        series = station.measurements
+        with series.epochs() as epochs:
+            index = next((i for i in range(len(epochs) - 1, -1, -1)
+                          if epochs[i] != NO_EPOCH), None)
+        return None if index is None else series[index]
+
+    def _persist_columns(self, station: Station, columns: MeasurementColumns) -> None:
+        """
+        Enregistre les lignes valides d'une réponse dans la base de mesures.
+
+        Args:
+            station: La station concernée
+            columns: Les mesures converties par parse_columns
+        """
+        self._persist(station, lambda store: store.add_rows(station.id, compress(
+            zip(columns.epochs, columns.utc_offsets, columns.temperatures,
+                columns.humidites, columns.pressions),
+            columns.valid
+        )))
+
+    def _persist(self, station: Station, write: Callable[[TimeSeriesStore], int]) -> None:
+        """
+        Exécute une écriture dans la base de mesures, si elle est configurée.
+
+        Une erreur d'écriture est signalée sans faire échouer le chargement.
+
+        Args:
+            station: La station concernée
+            write: L'écriture à effectuer
+        """
+        if self._store is None:
+            return
+        try:
+            write(self._store)
+        except sqlite3.Error as e:
+            print(f"⚠️  Impossible d'enregistrer les mesures de {station.nom}: {e}")
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Args:
+            url: L'URL à interroger
+
+        Returns:
+            Les en-têtes If-None-Match / If-Modified-Since connus pour l'URL
+        """
+        validators = self._validators.get(url, {})
+        headers = {}
+        if 'etag' in validators:
+            headers['If-None-Match'] = validators['etag']
+        if 'last_modified' in validators:
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def _store_validators(self, url: str, response: requests.Response) -> None:
+        """
+        Mémorise les validateurs renvoyés par le serveur pour une URL.
+
+        Args:
+            url: L'URL interrogée
+            response: La réponse complète (200) du serveur
+        """
+        validators = {}
+        etag = response.headers.get('ETag')
+        if etag:
+            validators['etag'] = etag
+        last_modified = response.headers.get('Last-Modified')
+        if last_modified:
+            validators['last_modified'] = last_modified
+
+        if validators:
+            self._validators[url] = validators
+        else:
+            self._validators.pop(url, None)
+
+    def _parse_columns(self, data: Dict) -> MeasurementColumns:
+        """
+        Args:
+            data: Les données JSON de l'API
+
+        Returns:
+            Les mesures converties en colonnes, avec le masque des lignes invalides
+        """
+        return parse_columns(data.get('results', []))
 
     def _parse_measurements(self, data: Dict) -> List[Measurement]:
         """
@@ -63,23 +766,7 @@ class ApiService:
         Returns:
             Liste d'objets Measurement
         """
-        measurements = []
-
-        results = data.get('results', [])
-        for result in results:
-            try:
-                measurement = Measurement(
-                    heure=result.get('heure_de_paris', ''),
-                    temperature=float(result.get('temperature_en_degre_c', 0)),
-                    humidite=int(result.get('humidite', 0)),
-                    pression=int(result.get('pression', 0))
-                )
-                measurements.append(measurement)
-            except (ValueError, TypeError) as e:
-                print(f"⚠️  Erreur lors du parsing d'une mesure: {e}")
-                continue
-
-        return measurements
+        return parse_measurements(data)
 
     def test_api_url(self, url: str) -> bool:
         """
@@ -90,9 +777,46 @@ class ApiService:
             True si l'URL est valide, False sinon
         """
         try:
-            response = requests.get(url, timeout=self._timeout)
+            response = self._session.get(url, timeout=self._timeout)
             response.raise_for_status()
             data = response.json()
             return 'results' in data
         except (requests.exceptions.RequestException, ValueError, KeyError):
             return False
+
+    def get_connection_stats(self) -> Dict:
+        """
+        Statistiques de réutilisation des connexions HTTP.
+
+        Les compteurs proviennent des pools urllib3 encore actifs : un hôte
+        évincé (au-delà de pool_connections) sort des statistiques.
+
+        Returns:
+            Dictionnaire avec le nombre total de requêtes, de connexions
+            ouvertes, de requêtes ayant réutilisé une connexion, et le
+            détail par hôte
+        """
+        hosts = {}
+        pools = self._session.get_adapter('https://').poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.scheme}://{pool.host}:{pool.port}"
+            hosts[host] = {
+                'requests': pool.num_requests,
+                'connections': pool.num_connections,
+            }
+
+        total_requests = sum(stats['requests'] for stats in hosts.values())
+        total_connections = sum(stats['connections'] for stats in hosts.values())
+        return {
+            'requests': total_requests,
+            'connections': total_connections,
+            'reused': max(0, total_requests - total_connections),
+            'hosts': hosts,
+        }
+
+    def close(self) -> None:
+        """Ferme la session HTTP et les connexions du pool."""
+        self._session.close()
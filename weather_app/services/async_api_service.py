@@ -0,0 +1,132 @@
+"""
+Service asynchrone pour gérer les appels à l'API météo.
+
+Pendant asyncio d'ApiService : un seul thread et une boucle d'événements
+suffisent pour interroger des milliers de stations, le nombre de requêtes
+simultanées étant borné par un sémaphore.
+"""
+import asyncio
+import time
+from typing import Iterable, List, Optional
+
+import aiohttp
+
+from weather_app.models.location import Station
+from weather_app.services.api_service import FetchResult, fill_station, print_fetch_report
+from weather_app.services.batch_parser import parse_columns
+
+
+class AsyncApiService:
+    """
+    Service API asynchrone à concurrence bornée.
+
+    S'utilise de préférence comme gestionnaire de contexte asynchrone
+    (`async with AsyncApiService() as service:`) afin de fermer la session.
+    """
+
+    def __init__(self, max_concurrency: int = 100):
+        """
+        Initialise le service asynchrone.
+
+        Args:
+            max_concurrency: Nombre maximal de requêtes simultanées
+
+        Raises:
+            ValueError: Si max_concurrency est inférieur à 1
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency doit être supérieur ou égal à 1")
+
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._timeout = aiohttp.ClientTimeout(total=10)  # Timeout en secondes
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> 'AsyncApiService':
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns:
+            La session HTTP, créée à la première utilisation
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._max_concurrency)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self._timeout
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Ferme la session HTTP et ses connexions."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def fetch_data_for_station(self, station: Station) -> bool:
+        """
+        Args:
+            station: La station pour laquelle récupérer les données
+
+        Returns:
+            True si les données ont été chargées avec succès, False sinon
+        """
+        result = await self._load_station(station)
+        print(result.message)
+        return result.success
+
+    async def fetch_all(self, stations: Iterable[Station]) -> List[FetchResult]:
+        """
+        Charge les données de plusieurs stations de manière concurrente.
+
+        Args:
+            stations: Les stations à rafraîchir
+
+        Returns:
+            Liste des résultats, dans l'ordre des stations fournies
+        """
+        start_time = time.perf_counter()
+        results = await asyncio.gather(
+            *(self._load_station(station) for station in stations)
+        )
+        print_fetch_report(results, time.perf_counter() - start_time)
+        return list(results)
+
+    async def _load_station(self, station: Station) -> FetchResult:
+        """
+        Récupère les données d'une station et la remplit.
+
+        Args:
+            station: La station à remplir
+
+        Returns:
+            Le résultat du chargement
+        """
+        start_time = time.perf_counter()
+        try:
+            async with self._semaphore:
+                session = self._get_session()
+                async with session.get(station.api_url) as response:
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+
+            result = fill_station(station, parse_columns(data.get('results', [])))
+
+        except asyncio.TimeoutError:
+            result = FetchResult(
+                station, False,
+                f"❌ Timeout lors de la récupération des données pour {station.nom}"
+            )
+        except aiohttp.ClientError as e:
+            result = FetchResult(station, False, f"❌ Erreur réseau: {str(e)}")
+        except (KeyError, ValueError, AttributeError) as e:
+            result = FetchResult(
+                station, False, f"❌ Erreur lors du parsing des données: {str(e)}"
+            )
+
+        result.duration = time.perf_counter() - start_time
+        return result
@@ -0,0 +1,233 @@
+"""
+Conversion en bloc des résultats de l'API en colonnes typées.
+
+Au lieu de créer un objet Measurement par enregistrement, chaque champ est
+extrait puis converti colonne par colonne avec `map` (boucles exécutées en
+C). Une ligne invalide ne fait pas échouer le lot : la colonne concernée est
+reconvertie ligne par ligne et la ligne est marquée dans un masque.
+"""
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+_EPOCH_ORIGIN = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MINUTE = timedelta(minutes=1)
+
+
+class MeasurementColumns:
+    """
+    Mesures d'une réponse de l'API, stockées en colonnes.
+
+    La ligne `i` est valide si `valid[i]` vaut 1 ; les colonnes d'une ligne
+    invalide contiennent des zéros.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self,
+                 epochs: array,
+                 temperatures: array,
+                 humidites: array,
+                 pressions: array,
+                 *,
+                 utc_offsets: array,
+                 valid: bytearray):
+        """
+        Args:
+            epochs: Horodatages en secondes depuis l'epoch Unix ('q')
+            temperatures: Températures en °C ('d')
+            humidites: Humidités en % ('i')
+            pressions: Pressions en Pa ('i')
+            utc_offsets: Décalages UTC d'origine en minutes ('h')
+            valid: Masque des lignes valides
+        """
+        self.epochs = epochs
+        self.temperatures = temperatures
+        self.humidites = humidites
+        self.pressions = pressions
+        self.utc_offsets = utc_offsets
+        self.valid = valid
+
+    @property
+    def bad_rows(self) -> int:
+        """Retourne le nombre de lignes invalides."""
+        return len(self.valid) - sum(self.valid)
+
+    def bad_indices(self) -> List[int]:
+        """Retourne les positions des lignes invalides."""
+        return [index for index, ok in enumerate(self.valid) if not ok]
+
+    def chronological(self) -> 'MeasurementColumns':
+        """
+        Returns:
+            Nouvelles colonnes ne contenant que les lignes valides,
+            de la plus ancienne à la plus récente
+        """
+        if all(self.valid):
+            epochs = self.epochs.tolist()
+            ascending = sorted(epochs)
+            if ascending == epochs:
+                return self._select(None)
+            if ascending[::-1] == epochs:
+                # Cas habituel : l'API renvoie les mesures les plus récentes en premier
+                return self._select(None, reverse=True)
+
+        return self._select([
+            index for index in sorted(range(len(self)), key=self.epochs.__getitem__)
+            if self.valid[index]
+        ])
+
+    def _select(self, order: Optional[List[int]], reverse: bool = False) -> 'MeasurementColumns':
+        """
+        Copie les lignes demandées dans de nouvelles colonnes.
+
+        Args:
+            order: Index des lignes à copier, ou None pour toutes
+            reverse: Inverse l'ordre des lignes copiées
+
+        Returns:
+            Les nouvelles colonnes, toutes valides
+        """
+        def pick(column: array) -> array:
+            if order is None:
+                copy = array(column.typecode, column)
+            else:
+                copy = array(column.typecode, map(column.__getitem__, order))
+            if reverse:
+                copy.reverse()
+            return copy
+
+        epochs = pick(self.epochs)
+        return MeasurementColumns(
+            epochs, pick(self.temperatures), pick(self.humidites), pick(self.pressions),
+            utc_offsets=pick(self.utc_offsets), valid=bytearray(b'\x01') * len(epochs)
+        )
+
+    def __len__(self) -> int:
+        """Retourne le nombre de lignes, valides ou non."""
+        return len(self.valid)
+
+
+def parse_columns(results: Sequence[Dict]) -> MeasurementColumns:
+    """
+    Convertit les enregistrements `results` de l'API en colonnes typées.
+
+    Comme pour parse_measurements, une valeur absente vaut 0 ; une heure
+    absente ou invalide rend en revanche la ligne invalide.
+
+    Args:
+        results: Les enregistrements JSON de l'API
+
+    Returns:
+        Les colonnes et le masque des lignes valides
+    """
+    valid = bytearray(b'\x01') * len(results)
+
+    temperatures = _convert(
+        [r.get('temperature_en_degre_c', 0) for r in results], float, 'd', valid
+    )
+    humidites = _convert([r.get('humidite', 0) for r in results], round_int, 'i', valid)
+    pressions = _convert([r.get('pression', 0) for r in results], round_int, 'i', valid)
+
+    datetimes = _convert_heures([r.get('heure_de_paris') for r in results], valid)
+    epochs = array('q', map(int, map(datetime.timestamp, datetimes)))
+    offsets = list(map(datetime.utcoffset, datetimes))
+    try:
+        # Peu de décalages distincts par réponse : conversion une fois par valeur
+        minutes = {offset: offset // _MINUTE for offset in set(offsets)}
+        utc_offsets = array('h', map(minutes.__getitem__, offsets))
+    except TypeError:
+        # Au moins une heure sans fuseau : décalage de l'heure locale
+        utc_offsets = array('h', map(_offset_minutes, datetimes))
+
+    return MeasurementColumns(
+        epochs, temperatures, humidites, pressions, utc_offsets=utc_offsets, valid=valid
+    )
+
+
+def round_int(value) -> int:
+    """
+    Convertit une humidité ou une pression en entier, comme MeasurementSeries
+    les stocke : une valeur décimale (ex. 65.6 %) est arrondie à l'entier le
+    plus proche au lieu d'être tronquée.
+
+    Args:
+        value: Un nombre ou sa représentation textuelle
+
+    Returns:
+        L'entier le plus proche
+
+    Raises:
+        ValueError: Si la valeur n'est pas un nombre
+        TypeError: Si la valeur n'est ni un nombre ni une chaîne
+        OverflowError: Si la valeur est infinie
+    """
+    if isinstance(value, int):
+        return value
+    return int(round(float(value)))
+
+
+def _convert(values: List, convert: Callable, typecode: str, valid: bytearray) -> array:
+    """
+    Convertit une colonne d'un coup, ou ligne par ligne si une valeur est invalide.
+
+    Args:
+        values: Les valeurs brutes
+        convert: La fonction de conversion (float, round_int)
+        typecode: Le type de l'array produit
+        valid: Masque mis à jour pour les valeurs invalides
+
+    Returns:
+        La colonne convertie (0 pour les valeurs invalides)
+    """
+    try:
+        # Valeurs déjà du bon type (cas habituel) : copie directe
+        return array(typecode, values)
+    except (TypeError, OverflowError):
+        pass
+    try:
+        return array(typecode, map(convert, values))
+    except (ValueError, TypeError, OverflowError):
+        pass
+
+    column = array(typecode)
+    for index, value in enumerate(values):
+        try:
+            column.append(convert(value))
+        except (ValueError, TypeError, OverflowError):
+            column.append(0)
+            valid[index] = 0
+    return column
+
+
+def _convert_heures(heures: List, valid: bytearray) -> List[datetime]:
+    """
+    Interprète une colonne d'heures ISO 8601.
+
+    Args:
+        heures: Les heures brutes
+        valid: Masque mis à jour pour les heures invalides
+
+    Returns:
+        Les dates (l'origine Unix pour les heures invalides)
+    """
+    try:
+        return list(map(datetime.fromisoformat, heures))
+    except (ValueError, TypeError):
+        pass
+
+    datetimes = []
+    for index, heure in enumerate(heures):
+        try:
+            datetimes.append(datetime.fromisoformat(heure))
+        except (ValueError, TypeError):
+            datetimes.append(_EPOCH_ORIGIN)
+            valid[index] = 0
+    return datetimes
+
+
+def _offset_minutes(dt: datetime) -> int:
+    """Retourne le décalage UTC d'une date en minutes (heure locale si sans fuseau)."""
+    offset = dt.utcoffset()
+    if offset is None:
+        offset = dt.astimezone().utcoffset()
+    return offset // _MINUTE
@@ -0,0 +1,239 @@
+"""
+Cache disque des réponses de l'API, sous le répertoire de données.
+
+Organisation du répertoire :
+    objects/<sha256 du corps>   corps de réponse, adressés par leur contenu
+    index/<sha256 de l'URL>.json métadonnées (URL, hash du corps, expiration)
+
+Les corps sont immuables et toutes les écritures passent par un fichier
+temporaire renommé atomiquement : deux processus partageant le même
+volume (docker-compose) ne voient jamais de fichier à moitié écrit. Une
+entrée dont le corps a disparu ou ne correspond plus à son hash est
+simplement traitée comme absente.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class DiskResponseCache:
+    """
+    Cache persistant des corps de réponse indexé par URL.
+
+    Les entrées expirent après `ttl` secondes mais restent lisibles en mode
+    « périmé » (allow_stale) tant qu'elles ne sont pas évincées, afin de
+    servir les dernières mesures connues quand le réseau est indisponible.
+    """
+
+    def __init__(self,
+                 cache_dir: str,
+                 ttl: float = 900,
+                 max_bytes: int = 64 * 1024 * 1024,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialise le cache et crée ses répertoires.
+
+        Args:
+            cache_dir: Répertoire du cache (ex. data/cache)
+            ttl: Durée de fraîcheur d'une entrée en secondes
+            max_bytes: Taille totale maximale des corps stockés en octets
+            clock: Horloge murale (partagée entre processus)
+
+        Raises:
+            ValueError: Si ttl ou max_bytes n'est pas strictement positif
+        """
+        if ttl <= 0 or max_bytes < 1:
+            raise ValueError("ttl et max_bytes doivent être positifs")
+
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._index_dir = os.path.join(cache_dir, 'index')
+        self._objects_dir = os.path.join(cache_dir, 'objects')
+        os.makedirs(self._index_dir, exist_ok=True)
+        os.makedirs(self._objects_dir, exist_ok=True)
+
+    def get(self, url: str, allow_stale: bool = False) -> Optional[bytes]:
+        """
+        Args:
+            url: L'URL recherchée
+            allow_stale: Accepte une entrée expirée
+
+        Returns:
+            Le corps en cache, ou None si absent, expiré ou corrompu
+        """
+        index_path = self._index_path(url)
+        meta = self._read_meta(index_path)
+        if meta is None or meta.get('url') != url:
+            return None
+        if not allow_stale and self._clock() >= meta['expires_at']:
+            return None
+
+        try:
+            with open(self._object_path(meta['sha256']), 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+        if hashlib.sha256(body).hexdigest() != meta['sha256']:
+            return None
+
+        # La date de modification de l'index sert d'horodatage LRU
+        try:
+            os.utime(index_path)
+        except OSError:
+            pass
+        return body
+
+    def put(self, url: str, body: bytes) -> None:
+        """
+        Stocke un corps de réponse puis applique la limite de taille.
+
+        Args:
+            url: L'URL de la réponse
+            body: Le corps brut de la réponse
+        """
+        if len(body) > self._max_bytes:
+            return
+
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            self._atomic_write(object_path, body)
+
+        now = self._clock()
+        meta = {
+            'url': url,
+            'sha256': digest,
+            'size': len(body),
+            'stored_at': now,
+            'expires_at': now + self._ttl,
+        }
+        self._atomic_write(self._index_path(url), json.dumps(meta).encode('utf-8'))
+        self._enforce_size_limit()
+
+    def invalidate(self, url: str) -> None:
+        """
+        Args:
+            url: L'URL à retirer du cache
+        """
+        self._remove_file(self._index_path(url))
+        self._collect_garbage()
+
+    def clear(self) -> None:
+        """Vide entièrement le cache."""
+        for name in os.listdir(self._index_dir):
+            self._remove_file(os.path.join(self._index_dir, name))
+        self._collect_garbage()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Nombre d'entrées indexées, de corps stockés et taille occupée
+        """
+        objects = self._list_objects()
+        return {
+            'entries': len(self._list_index()),
+            'objects': len(objects),
+            'bytes': sum(size for _, size in objects),
+        }
+
+    def _enforce_size_limit(self) -> None:
+        """Évince les entrées les moins récemment utilisées au-delà de max_bytes."""
+        total = sum(size for _, size in self._list_objects())
+        if total <= self._max_bytes:
+            return
+
+        for index_path, _ in sorted(self._list_index(), key=lambda item: item[1]):
+            self._remove_file(index_path)
+            total = self._collect_garbage()
+            if total <= self._max_bytes:
+                break
+
+    def _collect_garbage(self) -> int:
+        """
+        Supprime les corps qui ne sont plus référencés par aucune entrée.
+
+        Returns:
+            La taille totale des corps restants
+        """
+        referenced = set()
+        for index_path, _ in self._list_index():
+            meta = self._read_meta(index_path)
+            if meta is not None:
+                referenced.add(meta['sha256'])
+
+        total = 0
+        for object_path, size in self._list_objects():
+            if os.path.basename(object_path) in referenced:
+                total += size
+            else:
+                self._remove_file(object_path)
+        return total
+
+    def _list_index(self) -> List[Tuple[str, float]]:
+        """Retourne les fichiers d'index avec leur date de dernière utilisation."""
+        entries = []
+        for name in os.listdir(self._index_dir):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self._index_dir, name)
+            try:
+                entries.append((path, os.path.getmtime(path)))
+            except OSError:
+                continue
+        return entries
+
+    def _list_objects(self) -> List[Tuple[str, int]]:
+        """Retourne les fichiers de corps avec leur taille."""
+        objects = []
+        for name in os.listdir(self._objects_dir):
+            if name.startswith('.'):
+                continue
+            path = os.path.join(self._objects_dir, name)
+            try:
+                objects.append((path, os.path.getsize(path)))
+            except OSError:
+                continue
+        return objects
+
+    def _index_path(self, url: str) -> str:
+        """Chemin du fichier d'index d'une URL."""
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self._index_dir, f"{digest}.json")
+
+    def _object_path(self, digest: str) -> str:
+        """Chemin du fichier contenant le corps de hash `digest`."""
+        return os.path.join(self._objects_dir, digest)
+
+    @staticmethod
+    def _read_meta(index_path: str) -> Optional[Dict]:
+        """Lit un fichier d'index, None s'il est absent ou illisible."""
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _atomic_write(path: str, data: bytes) -> None:
+        """Écrit un fichier via un fichier temporaire renommé atomiquement."""
+        directory = os.path.dirname(path)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            DiskResponseCache._remove_file(temp_path)
+            raise
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        """Supprime un fichier, éventuellement déjà supprimé par un autre processus."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
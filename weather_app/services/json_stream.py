@@ -0,0 +1,171 @@
+"""
+Lecture incrémentale de documents JSON volumineux.
+
+Les réponses de l'API contiennent une liste d'enregistrements, soit à la
+racine (export `/exports/json`), soit sous la clé `results` (`/records`).
+Ce module produit ces enregistrements un par un à mesure que les blocs
+d'octets arrivent, sans jamais décoder le document complet : la mémoire
+utilisée reste de l'ordre d'un bloc, quelle que soit la taille de la réponse.
+"""
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator
+
+_WHITESPACE = ' \t\n\r'
+_DECODER = json.JSONDecoder()
+
+
+class _TextBuffer:
+    """
+    Tampon de texte alimenté bloc par bloc.
+
+    Seule la partie non encore consommée (à partir de `pos`) est conservée.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        """
+        Args:
+            chunks: Les blocs d'octets du document (UTF-8)
+        """
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._exhausted = False
+        self.text = ''
+        self.pos = 0
+
+    def fill(self) -> bool:
+        """
+        Ajoute le bloc suivant au tampon.
+
+        Returns:
+            False si le flux est terminé
+        """
+        decoded = ''
+        for chunk in self._chunks:
+            decoded = self._decoder.decode(chunk)
+            if decoded:
+                break
+        else:
+            if self._exhausted:
+                return False
+            self._exhausted = True
+            decoded = self._decoder.decode(b'', final=True)
+            if not decoded:
+                return False
+
+        self.text = self.text[self.pos:] + decoded
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Returns:
+            Le prochain caractère significatif, ou '' en fin de flux
+        """
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        """
+        Consomme le caractère attendu.
+
+        Raises:
+            ValueError: Si un autre caractère est rencontré
+        """
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"JSON invalide : '{char}' attendu, '{found}' trouvé")
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        """
+        Décode la valeur JSON suivante, en lisant des blocs tant qu'elle est incomplète.
+
+        Returns:
+            La valeur décodée
+
+        Raises:
+            ValueError: Si le flux se termine au milieu d'une valeur invalide
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError as e:
+                if not self.fill():
+                    raise ValueError(f"Flux JSON tronqué ou invalide: {e}") from e
+                continue
+            # Un nombre en fin de tampon peut se poursuivre dans le bloc suivant
+            if end == len(self.text) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_records(chunks: Iterable[bytes], key: str = 'results') -> Iterator[Dict]:
+    """
+    Produit les enregistrements d'un document JSON au fil de sa lecture.
+
+    Args:
+        chunks: Les blocs d'octets du document (ex. response.iter_content())
+        key: Clé de la liste d'enregistrements quand la racine est un objet
+
+    Yields:
+        Chaque enregistrement de la liste
+
+    Raises:
+        ValueError: Si le document n'est pas du JSON valide ou est tronqué
+    """
+    buffer = _TextBuffer(chunks)
+    first = buffer.peek()
+
+    if first == '[':
+        yield from _iter_array(buffer)
+        return
+    if first != '{':
+        raise ValueError("JSON invalide : objet ou liste attendu")
+
+    buffer.expect('{')
+    while True:
+        char = buffer.peek()
+        if char == '}':
+            return
+        if char == ',':
+            buffer.pos += 1
+            continue
+
+        name = buffer.decode_value()
+        buffer.expect(':')
+        if name == key and buffer.peek() == '[':
+            yield from _iter_array(buffer)
+            return
+        buffer.decode_value()
+
+
+def _iter_array(buffer: _TextBuffer) -> Iterator[Any]:
+    """
+    Produit les éléments d'une liste JSON, le tampon étant positionné sur '['.
+
+    Args:
+        buffer: Le tampon de lecture
+
+    Yields:
+        Chaque élément de la liste
+    """
+    buffer.expect('[')
+    while True:
+        char = buffer.peek()
+        if char == ']':
+            buffer.pos += 1
+            return
+        if char == ',':
+            buffer.pos += 1
+            continue
+        if char == '':
+            raise ValueError("Flux JSON tronqué : ']' manquant")
+        yield buffer.decode_value()
@@ -0,0 +1,129 @@
+"""
+Cache mémoire des réponses de l'API, avec expiration (TTL) et éviction LRU.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    Cache des corps de réponse indexé par URL.
+
+    Une entrée expire `ttl` secondes après son stockage. Quand le nombre
+    d'entrées ou la taille totale dépasse la limite, les entrées les moins
+    récemment utilisées sont évincées. Le cache est partagé entre threads.
+    """
+
+    def __init__(self,
+                 ttl: float = 300,
+                 max_entries: int = 256,
+                 max_bytes: int = 16 * 1024 * 1024,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialise le cache.
+
+        Args:
+            ttl: Durée de vie d'une entrée en secondes
+            max_entries: Nombre maximal d'entrées
+            max_bytes: Taille totale maximale des corps en octets
+            clock: Horloge utilisée pour l'expiration (injectable pour les tests)
+
+        Raises:
+            ValueError: Si une limite n'est pas strictement positive
+        """
+        if ttl <= 0 or max_entries < 1 or max_bytes < 1:
+            raise ValueError("ttl, max_entries et max_bytes doivent être positifs")
+
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        # url -> (corps, date d'expiration), du moins au plus récemment utilisé
+        self._entries: 'OrderedDict[str, Tuple[bytes, float]]' = OrderedDict()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'bytes': 0}
+
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        Args:
+            url: L'URL recherchée
+
+        Returns:
+            Le corps en cache, ou None si absent ou expiré
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+
+            body, expires_at = entry
+            if self._clock() >= expires_at:
+                self._remove(url)
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(url)
+            self._stats['hits'] += 1
+            return body
+
+    def put(self, url: str, body: bytes) -> None:
+        """
+        Stocke un corps de réponse. Un corps plus gros que max_bytes est ignoré.
+
+        Args:
+            url: L'URL de la réponse
+            body: Le corps brut de la réponse
+        """
+        with self._lock:
+            if url in self._entries:
+                self._remove(url)
+            if len(body) > self._max_bytes:
+                return
+
+            self._entries[url] = (body, self._clock() + self._ttl)
+            self._stats['bytes'] += len(body)
+
+            while (len(self._entries) > self._max_entries
+                   or self._stats['bytes'] > self._max_bytes):
+                oldest_url = next(iter(self._entries))
+                self._remove(oldest_url)
+                self._stats['evictions'] += 1
+
+    def invalidate(self, url: str) -> None:
+        """
+        Args:
+            url: L'URL à retirer du cache
+        """
+        with self._lock:
+            if url in self._entries:
+                self._remove(url)
+
+    def clear(self) -> None:
+        """Vide le cache (les compteurs sont conservés)."""
+        with self._lock:
+            self._entries.clear()
+            self._stats['bytes'] = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Compteurs de hits, misses, évictions et expirations, ainsi que
+            le nombre d'entrées et la taille occupée
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            return stats
+
+    def _remove(self, url: str) -> None:
+        """Retire une entrée (le verrou doit être détenu)."""
+        body, _ = self._entries.pop(url)
+        self._stats['bytes'] -= len(body)
+
+    def __len__(self) -> int:
+        """Retourne le nombre d'entrées."""
+        return len(self._entries)
@@ -0,0 +1,200 @@
+"""
+Ordonnanceur de tâches périodiques (interrogation régulière des stations).
+"""
+import heapq
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledJob:
+    """
+    Tâche périodique de l'ordonnanceur.
+
+    Cette classe est une simple structure de données sans méthodes.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, key: str, interval: float, task: Callable[[], Any]):
+        """
+        Args:
+            key: Identifiant de la tâche (ex. identifiant de station)
+            interval: Intervalle entre deux exécutions, en secondes
+            task: La fonction à exécuter
+        """
+        self.key = key
+        self.interval = interval
+        self.task = task
+        self.runs = 0
+        self.skipped = 0
+        self.failures = 0
+
+
+class PollScheduler:
+    """
+    Exécute des tâches périodiques sur un pool de threads.
+
+    Chaque tâche a son propre intervalle. Un décalage aléatoire (jitter)
+    étale les exécutions pour éviter que toutes les stations interrogent
+    l'API au même instant. Une tâche dont l'exécution précédente n'est pas
+    terminée n'est pas relancée : l'échéance est sautée et reprogrammée.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self,
+                 max_workers: int = 4,
+                 jitter: float = 0.1,
+                 clock: Callable[[], float] = time.monotonic,
+                 rng: Optional[random.Random] = None):
+        """
+        Args:
+            max_workers: Nombre maximal de tâches exécutées simultanément
+            jitter: Décalage aléatoire maximal, en fraction de l'intervalle
+            clock: Horloge monotone, en secondes
+            rng: Générateur aléatoire (optionnel)
+
+        Raises:
+            ValueError: Si max_workers est inférieur à 1 ou si jitter n'est
+                pas entre 0 et 1
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers doit être supérieur ou égal à 1")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter doit être compris entre 0 et 1")
+        self._jitter = jitter
+        self._clock = clock
+        self._random = rng or random.Random()
+        self._jobs: Dict[str, ScheduledJob] = {}
+        # Échéances (instant, numéro d'ordre, identifiant de tâche)
+        self._due: List[Tuple[float, int, str]] = []
+        self._sequence = 0
+        self._running: Set[str] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    @property
+    def jobs(self) -> Dict[str, ScheduledJob]:
+        """Retourne les tâches programmées, par identifiant."""
+        return dict(self._jobs)
+
+    def schedule(self,
+                 key: str,
+                 interval: float,
+                 task: Callable[[], Any],
+                 delay: Optional[float] = None) -> ScheduledJob:
+        """
+        Programme une tâche périodique.
+
+        Args:
+            key: Identifiant unique de la tâche
+            interval: Intervalle entre deux exécutions, en secondes
+            task: La fonction à exécuter
+            delay: Délai avant la première exécution (tiré au hasard dans
+                l'intervalle de jitter si absent)
+
+        Returns:
+            La tâche programmée
+
+        Raises:
+            ValueError: Si l'intervalle n'est pas strictement positif ou si
+                la tâche est déjà programmée
+        """
+        if interval <= 0:
+            raise ValueError("L'intervalle doit être strictement positif")
+        if key in self._jobs:
+            raise ValueError(f"La tâche {key} est déjà programmée")
+        job = self._jobs[key] = ScheduledJob(key, interval, task)
+        if delay is None:
+            delay = self._random.uniform(0, interval * self._jitter)
+        self._push(self._clock() + delay, key)
+        return job
+
+    def next_due(self) -> Optional[float]:
+        """Retourne l'instant de la prochaine échéance, ou None s'il n'y en a pas."""
+        return self._due[0][0] if self._due else None
+
+    def run_pending(self) -> int:
+        """
+        Lance les tâches arrivées à échéance et programme leur exécution suivante.
+
+        Returns:
+            Le nombre de tâches lancées
+        """
+        now = self._clock()
+        started = 0
+        while self._due and self._due[0][0] <= now:
+            due, _, key = heapq.heappop(self._due)
+            job = self._jobs[key]
+            self._push(self._next(due, job.interval, now), key)
+            with self._lock:
+                if key in self._running:
+                    job.skipped += 1
+                    continue
+                self._running.add(key)
+            future = self._executor.submit(job.task)
+            future.add_done_callback(lambda f, job=job: self._finished(job, f))
+            started += 1
+        return started
+
+    def run(self, stop: threading.Event, max_sleep: float = 1.0) -> None:
+        """
+        Exécute les tâches jusqu'à ce que `stop` soit positionné, puis attend
+        la fin des exécutions en cours.
+
+        Args:
+            stop: Événement qui demande l'arrêt
+            max_sleep: Attente maximale entre deux vérifications, en secondes
+        """
+        try:
+            while not stop.is_set():
+                self.run_pending()
+                due = self.next_due()
+                timeout = max_sleep if due is None else due - self._clock()
+                stop.wait(min(max(timeout, 0.0), max_sleep))
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Annule les exécutions encore en file, attend la fin de celles déjà
+        commencées et libère le pool de threads.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _next(self, due: float, interval: float, now: float) -> float:
+        """
+        Calcule l'échéance suivante, décalée au hasard. Les échéances déjà
+        dépassées (retard du processus) sont sautées plutôt que rattrapées.
+        """
+        offset = self._random.uniform(-self._jitter, self._jitter) * interval
+        following = due + interval + offset
+        if following <= now:
+            following = now + interval + offset
+        return following
+
+    def _push(self, due: float, key: str) -> None:
+        """Ajoute une échéance."""
+        self._sequence += 1
+        heapq.heappush(self._due, (due, self._sequence, key))
+
+    def _finished(self, job: ScheduledJob, future: Future) -> None:
+        """Enregistre la fin d'une exécution."""
+        with self._lock:
+            self._running.discard(job.key)
+            if future.cancelled():
+                return
+            job.runs += 1
+            error = future.exception()
+            if error is not None:
+                job.failures += 1
+            failures = job.failures
+        # Sans trace, une tâche qui échoue à chaque échéance passerait inaperçue
+        if error is not None:
+            logger.error("Échec de la tâche %s (%d échec(s))", job.key, failures,
+                         exc_info=error)
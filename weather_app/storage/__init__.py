@@ -0,0 +1,7 @@
+"""
+Module de stockage persistant des mesures.
+"""
+from .segment_log import SegmentLog
+from .time_series_store import TimeSeriesStore
+
+__all__ = ['SegmentLog', 'TimeSeriesStore']
@@ -0,0 +1,546 @@
+"""
+Journal de mesures en segments binaires, lus par projection mémoire (mmap).
+
+Organisation du répertoire :
+    <station>/CURRENT                génération active (ex. gen-000002)
+    <station>/gen-000002/000000.seg  segments de la génération, dans l'ordre
+
+Chaque segment est une suite d'enregistrements de taille fixe (19 octets,
+little-endian) : epoch int64, décalage UTC int16 (minutes), température
+float32, humidité uint8, pression uint32. Les enregistrements d'une station
+sont ajoutés dans l'ordre chronologique, jamais modifiés : une recherche par
+date est une dichotomie directement dans la projection du fichier, et les
+enregistrements d'un intervalle sont exposés sous forme de memoryview sans
+aucune copie ni objet Python par mesure.
+
+Un segment plein est scellé et un nouveau segment est ouvert. Le compactage
+réécrit les segments d'une station dans une nouvelle génération, puis
+bascule CURRENT par un renommage atomique : une interruption ne laisse
+jamais la station dans un état intermédiaire.
+"""
+import os
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from mmap import ACCESS_READ, mmap
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import quote, unquote
+
+from weather_app.models.measurement import Measurement
+from weather_app.models.measurement_series import MeasurementSeries
+from weather_app.storage.time_series_store import Row
+
+# (epoch, décalage UTC en minutes, température, humidité, pression)
+RECORD = struct.Struct('<qhfBI')
+_EPOCH = struct.Struct('<q')
+_CURRENT = 'CURRENT'
+_SEGMENT_SUFFIX = '.seg'
+
+
+class _Segment:
+    """Un fichier segment et sa projection mémoire, ouverte à la demande."""
+
+    def __init__(self, path: str):
+        """
+        Ouvre un segment existant ; un enregistrement incomplet en fin de
+        fichier (écriture interrompue) est tronqué.
+
+        Args:
+            path: Chemin du fichier segment
+        """
+        self.path = path
+        size = os.path.getsize(path)
+        if size % RECORD.size:
+            size -= size % RECORD.size
+            os.truncate(path, size)
+        self.count = size // RECORD.size
+        self._map: Optional[mmap] = None
+        self._mapped = 0
+
+    def view(self) -> memoryview:
+        """
+        Returns:
+            Les enregistrements du segment, projetés en mémoire (sans copie)
+        """
+        if self.count == 0:
+            return memoryview(b'')
+        return memoryview(self._mapping())
+
+    def epoch_at(self, index: int) -> int:
+        """Retourne l'epoch de l'enregistrement `index`."""
+        return _EPOCH.unpack_from(self._mapping(), index * RECORD.size)[0]
+
+    def _mapping(self) -> mmap:
+        """Retourne la projection du segment, refaite si le segment a grandi."""
+        if self._mapped != self.count:
+            self.release()
+            with open(self.path, 'rb') as f:
+                self._map = mmap(f.fileno(), self.count * RECORD.size, access=ACCESS_READ)
+            self._mapped = self.count
+        return self._map
+
+    def release(self) -> None:
+        """
+        Ferme la projection. Si des vues sont encore utilisées, elle sera
+        fermée quand elles seront libérées.
+        """
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass
+        self._map = None
+        self._mapped = 0
+
+
+class SegmentLog:
+    """
+    Historique des mesures de toutes les stations, en segments binaires.
+
+    Offre la même interface d'écriture et de lecture que TimeSeriesStore
+    (add_rows, add_measurements, query, latest_epoch, count...), plus un
+    accès sans copie aux enregistrements (records). Les mesures qui ne sont
+    pas plus récentes que la dernière mesure enregistrée d'une station sont
+    ignorées, ce qui évite les doublons (station, heure).
+
+    La température est stockée en float32 : elle est relue avec 7 chiffres
+    significatifs, largement au-delà de la précision des capteurs.
+    """
+
+    def __init__(self, directory: str, segment_records: int = 128 * 1024):
+        """
+        Ouvre (ou crée) le journal.
+
+        Args:
+            directory: Répertoire du journal (ex. data/segments)
+            segment_records: Nombre d'enregistrements par segment
+
+        Raises:
+            ValueError: Si segment_records n'est pas strictement positif
+        """
+        if segment_records < 1:
+            raise ValueError("segment_records doit être supérieur ou égal à 1")
+
+        self._directory = directory
+        self._segment_records = segment_records
+        self._lock = threading.RLock()
+        # Station -> segments de la génération active, dans l'ordre
+        self._segments: Dict[str, List[_Segment]] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def add_measurements(self, station_id: str, measurements: Iterable[Measurement]) -> int:
+        """
+        Enregistre des mesures ; celles sans heure valide sont ignorées.
+
+        Args:
+            station_id: L'identifiant de la station
+            measurements: Les mesures à enregistrer
+
+        Returns:
+            Le nombre de mesures réellement ajoutées
+        """
+        return self.add_rows(station_id, (
+            (m.epoch, m.utc_offset or 0, m.temperature, m.humidite, m.pression)
+            for m in measurements if m.epoch is not None
+        ))
+
+    def add_rows(self, station_id: str, rows: Iterable[Row]) -> int:
+        """
+        Ajoute des mesures à la fin du journal d'une station.
+
+        Les lignes sont triées par date ; celles qui ne sont pas plus récentes
+        que la dernière mesure enregistrée sont ignorées.
+
+        Args:
+            station_id: L'identifiant de la station
+            rows: Tuples (epoch, décalage UTC en minutes, température, humidité, pression)
+
+        Returns:
+            Le nombre de mesures ajoutées
+
+        Raises:
+            ValueError: Si une valeur ne tient pas dans son champ binaire
+        """
+        with self._lock:
+            segments = self._load(station_id)
+            latest = self._latest(segments)
+
+            packed = []
+            for row in sorted(rows, key=lambda row: row[0]):
+                if latest is not None and row[0] <= latest:
+                    continue
+                try:
+                    packed.append(RECORD.pack(*row))
+                except struct.error as e:
+                    raise ValueError(f"Mesure non enregistrable {row}: {e}") from e
+                latest = row[0]
+
+            written = 0
+            while written < len(packed):
+                segment = segments[-1] if segments else None
+                if segment is None or segment.count >= self._segment_records:
+                    segment = self._new_segment(station_id, len(segments))
+                    segments.append(segment)
+                batch = packed[written:written + self._segment_records - segment.count]
+                with open(segment.path, 'ab') as f:
+                    f.write(b''.join(batch))
+                segment.count += len(batch)
+                written += len(batch)
+            return written
+
+    def records(self,
+                station_id: str,
+                start_epoch: Optional[int] = None,
+                end_epoch: Optional[int] = None) -> List[memoryview]:
+        """
+        Recherche les enregistrements bruts d'un intervalle, sans copie.
+
+        Chaque vue couvre une partie contiguë d'un segment projeté en mémoire
+        et se décode avec RECORD (ex. RECORD.iter_unpack(vue)). Les vues
+        doivent être libérées avant un compactage ou la fermeture du journal
+        pour que les projections puissent être fermées immédiatement.
+
+        Args:
+            station_id: L'identifiant de la station
+            start_epoch: Borne inférieure incluse (optionnel)
+            end_epoch: Borne supérieure incluse (optionnel)
+
+        Returns:
+            Les vues des enregistrements, de la plus ancienne à la plus récente
+        """
+        with self._lock:
+            views = []
+            for segment in self._load(station_id):
+                if segment.count == 0:
+                    continue
+                if end_epoch is not None and segment.epoch_at(0) > end_epoch:
+                    break
+                if start_epoch is not None and segment.epoch_at(segment.count - 1) < start_epoch:
+                    continue
+
+                positions = range(segment.count)
+                low = 0 if start_epoch is None else bisect_left(
+                    positions, start_epoch, key=segment.epoch_at
+                )
+                high = segment.count if end_epoch is None else bisect_right(
+                    positions, end_epoch, key=segment.epoch_at
+                )
+                if low < high:
+                    views.append(segment.view()[low * RECORD.size:high * RECORD.size])
+            return views
+
+    def iter_rows(self,
+                  station_id: str,
+                  start_epoch: Optional[int] = None,
+                  end_epoch: Optional[int] = None) -> Iterator[Row]:
+        """
+        Produit les enregistrements d'un intervalle, décodés un par un.
+
+        Args:
+            station_id: L'identifiant de la station
+            start_epoch: Borne inférieure incluse (optionnel)
+            end_epoch: Borne supérieure incluse (optionnel)
+
+        Yields:
+            Tuples (epoch, décalage UTC en minutes, température, humidité, pression)
+        """
+        for view in self.records(station_id, start_epoch, end_epoch):
+            yield from RECORD.iter_unpack(view)
+
+    def query(self,
+              station_id: str,
+              start_epoch: Optional[int] = None,
+              end_epoch: Optional[int] = None) -> MeasurementSeries:
+        """
+        Lit les mesures d'une station sur un intervalle de temps.
+
+        Args:
+            station_id: L'identifiant de la station
+            start_epoch: Borne inférieure incluse (optionnel)
+            end_epoch: Borne supérieure incluse (optionnel)
+
+        Returns:
+            Les mesures, de la plus ancienne à la plus récente
+        """
+        views = self.records(station_id, start_epoch, end_epoch)
+        temperatures = _column(views, 10, 'f')
+        # Peu de températures distinctes : arrondi une fois par valeur
+        rounded = {value: _from_float32(value) for value in set(temperatures)}
+
+        series = MeasurementSeries()
+        series.append_columns(
+            _column(views, 0, 'q'),
+            map(rounded.__getitem__, temperatures),
+            _column(views, 14, 'B'),
+            _column(views, 15, 'I'),
+            utc_offsets=_column(views, 8, 'h')
+        )
+        for view in views:
+            view.release()
+        return series
+
+    def latest_epoch(self, station_id: str) -> Optional[int]:
+        """
+        Args:
+            station_id: L'identifiant de la station
+
+        Returns:
+            L'horodatage de la mesure la plus récente, ou None si aucune
+        """
+        with self._lock:
+            return self._latest(self._load(station_id))
+
+    def count(self, station_id: Optional[str] = None) -> int:
+        """
+        Args:
+            station_id: L'identifiant de la station (toutes si absent)
+
+        Returns:
+            Le nombre de mesures enregistrées
+        """
+        with self._lock:
+            station_ids = self.station_ids() if station_id is None else [station_id]
+            return sum(
+                segment.count for sid in station_ids for segment in self._load(sid)
+            )
+
+    def station_ids(self) -> List[str]:
+        """
+        Returns:
+            Les identifiants des stations ayant un journal, triés
+        """
+        with self._lock:
+            return sorted(
+                unquote(name) for name in os.listdir(self._directory)
+                if os.path.exists(os.path.join(self._directory, name, _CURRENT))
+            )
+
+    def segment_count(self, station_id: str) -> int:
+        """
+        Args:
+            station_id: L'identifiant de la station
+
+        Returns:
+            Le nombre de segments de la station
+        """
+        with self._lock:
+            return len(self._load(station_id))
+
+    def sink(self, station_id: str) -> Callable[[List[Measurement]], None]:
+        """
+        Args:
+            station_id: L'identifiant de la station
+
+        Returns:
+            Une fonction qui enregistre une page de mesures, utilisable comme
+            sink de ApiService.backfill_station
+        """
+        def write(page: List[Measurement]) -> None:
+            self.add_measurements(station_id, page)
+        return write
+
+    def compact(self, station_id: str, before_epoch: Optional[int] = None) -> int:
+        """
+        Réécrit les segments d'une station en segments pleins, en supprimant
+        éventuellement les mesures trop anciennes.
+
+        Les nouveaux segments sont écrits dans une nouvelle génération, puis
+        CURRENT est remplacé atomiquement et l'ancienne génération supprimée.
+
+        Args:
+            station_id: L'identifiant de la station
+            before_epoch: Supprime les mesures antérieures à cette date (optionnel)
+
+        Returns:
+            Le nombre de mesures supprimées
+        """
+        with self._lock:
+            segments = self._load(station_id)
+            if not segments:
+                return 0
+            station_dir = self._station_dir(station_id)
+            old_generation = os.path.join(station_dir, _current_generation(station_dir))
+            generation = _next_generation(station_dir)
+            os.makedirs(os.path.join(station_dir, generation))
+
+            views = self.records(station_id, start_epoch=before_epoch)
+            kept = self._write_segments(os.path.join(station_dir, generation), views)
+            for view in views:
+                view.release()
+
+            removed = sum(segment.count for segment in segments) - kept
+            _write_current(station_dir, generation)
+            for segment in segments:
+                segment.release()
+                os.remove(segment.path)
+            os.rmdir(old_generation)
+            del self._segments[station_id]
+            return removed
+
+    def close(self) -> None:
+        """Ferme les projections mémoire de tous les segments."""
+        with self._lock:
+            for segments in self._segments.values():
+                for segment in segments:
+                    segment.release()
+            self._segments.clear()
+
+    def __enter__(self) -> 'SegmentLog':
+        """Permet l'utilisation avec `with`."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Ferme le journal en sortie de bloc `with`."""
+        self.close()
+
+    def _write_segments(self, generation_dir: str, views: List[memoryview]) -> int:
+        """
+        Écrit des enregistrements en segments pleins, synchronisés sur disque.
+
+        Args:
+            generation_dir: Répertoire de la nouvelle génération
+            views: Les enregistrements à écrire
+
+        Returns:
+            Le nombre d'enregistrements écrits
+        """
+        buffer = b''.join(views)
+        chunk = self._segment_records * RECORD.size
+        for index, offset in enumerate(range(0, len(buffer), chunk)):
+            with open(os.path.join(generation_dir, _segment_name(index)), 'wb') as f:
+                f.write(buffer[offset:offset + chunk])
+                f.flush()
+                os.fsync(f.fileno())
+        return len(buffer) // RECORD.size
+
+    def _station_dir(self, station_id: str) -> str:
+        """Retourne le répertoire d'une station (identifiant échappé)."""
+        return os.path.join(self._directory, quote(station_id, safe=''))
+
+    def _load(self, station_id: str) -> List[_Segment]:
+        """
+        Retourne les segments d'une station, lus sur disque au premier accès.
+
+        Les générations abandonnées (compactage interrompu) sont supprimées.
+        """
+        segments = self._segments.get(station_id)
+        if segments is not None:
+            return segments
+
+        station_dir = self._station_dir(station_id)
+        generation = _current_generation(station_dir)
+        segments = []
+        if generation is not None:
+            generation_dir = os.path.join(station_dir, generation)
+            os.makedirs(generation_dir, exist_ok=True)
+            segments = [
+                _Segment(os.path.join(generation_dir, name))
+                for name in sorted(os.listdir(generation_dir))
+                if name.endswith(_SEGMENT_SUFFIX)
+            ]
+            for name in os.listdir(station_dir):
+                path = os.path.join(station_dir, name)
+                if name != generation and name.startswith('gen-') and os.path.isdir(path):
+                    for leftover in os.listdir(path):
+                        os.remove(os.path.join(path, leftover))
+                    os.rmdir(path)
+
+        self._segments[station_id] = segments
+        return segments
+
+    def _new_segment(self, station_id: str, index: int) -> _Segment:
+        """Crée le segment `index` de la génération active d'une station."""
+        station_dir = self._station_dir(station_id)
+        generation = _current_generation(station_dir)
+        if generation is None:
+            generation = _next_generation(station_dir)
+            os.makedirs(os.path.join(station_dir, generation))
+            _write_current(station_dir, generation)
+        generation_dir = os.path.join(station_dir, generation)
+
+        path = os.path.join(generation_dir, _segment_name(index))
+        with open(path, 'ab'):
+            pass
+        return _Segment(path)
+
+    @staticmethod
+    def _latest(segments: List[_Segment]) -> Optional[int]:
+        """Retourne l'epoch du dernier enregistrement, ou None si aucun."""
+        for segment in reversed(segments):
+            if segment.count:
+                return segment.epoch_at(segment.count - 1)
+        return None
+
+
+def _segment_name(index: int) -> str:
+    """Retourne le nom du fichier du segment `index`."""
+    return f"{index:06d}{_SEGMENT_SUFFIX}"
+
+
+def _current_generation(station_dir: str) -> Optional[str]:
+    """Retourne la génération active d'une station, ou None si elle n'a pas de journal."""
+    try:
+        with open(os.path.join(station_dir, _CURRENT), encoding='utf-8') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def _next_generation(station_dir: str) -> str:
+    """Retourne le nom de la prochaine génération d'une station."""
+    os.makedirs(station_dir, exist_ok=True)
+    numbers = [
+        int(name[4:]) for name in os.listdir(station_dir)
+        if name.startswith('gen-') and name[4:].isdigit()
+    ]
+    return f"gen-{max(numbers, default=0) + 1:06d}"
+
+
+def _write_current(station_dir: str, generation: str) -> None:
+    """Désigne atomiquement la génération active d'une station."""
+    fd, tmp_path = tempfile.mkstemp(dir=station_dir, prefix='.current-')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(generation)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, os.path.join(station_dir, _CURRENT))
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _column(views: List[memoryview], offset: int, typecode: str) -> array:
+    """
+    Extrait un champ des enregistrements en colonne typée.
+
+    Les octets du champ sont recopiés par tranches à pas fixe (en C), sans
+    décoder les enregistrements un par un.
+
+    Args:
+        views: Les vues d'enregistrements retournées par records
+        offset: Position du champ dans l'enregistrement
+        typecode: Type du champ (module array)
+
+    Returns:
+        La colonne, dans l'ordre des enregistrements
+    """
+    column = array(typecode)
+    size = column.itemsize
+    for view in views:
+        raw = bytearray(len(view) // RECORD.size * size)
+        for byte in range(size):
+            raw[byte::size] = view[offset + byte::RECORD.size]
+        column.frombytes(raw)
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column
+
+
+def _from_float32(value: float) -> float:
+    """Arrondit une valeur relue en float32 à sa précision (7 chiffres significatifs)."""
+    return float(f"{value:.7g}")
@@ -0,0 +1,237 @@
+"""
+Base de séries temporelles des mesures, sous le répertoire de données.
+
+Les mesures sont stockées dans SQLite, dans une table WITHOUT ROWID dont la
+clé primaire (station_id, epoch) sert d'index groupé : les mesures d'une
+station sont rangées physiquement par date, ce qui rend les requêtes par
+intervalle de temps séquentielles. Une mesure déjà connue (même station,
+même instant) est ignorée à l'insertion.
+"""
+import sqlite3
+import threading
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from weather_app.models.measurement import Measurement
+from weather_app.models.measurement_series import MeasurementSeries
+
+# (epoch, décalage UTC en minutes, température, humidité, pression)
+Row = Tuple[int, int, float, int, int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS measurements (
+    station_id  TEXT    NOT NULL,
+    epoch       INTEGER NOT NULL,
+    utc_offset  INTEGER NOT NULL,
+    temperature REAL    NOT NULL,
+    humidite    INTEGER NOT NULL,
+    pression    INTEGER NOT NULL,
+    PRIMARY KEY (station_id, epoch)
+) WITHOUT ROWID
+"""
+
+
+class TimeSeriesStore:
+    """
+    Stockage persistant des mesures de toutes les stations.
+
+    Une seule connexion est partagée entre threads, protégée par un verrou
+    (les écritures SQLite sont de toute façon sérialisées).
+    """
+
+    def __init__(self, path: str):
+        """
+        Ouvre (ou crée) la base.
+
+        Args:
+            path: Chemin du fichier SQLite (ex. data/measurements.db),
+                ou ':memory:' pour une base temporaire
+        """
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(_SCHEMA)
+
+    def add_measurements(self, station_id: str, measurements: Iterable[Measurement]) -> int:
+        """
+        Enregistre des mesures ; celles sans heure valide sont ignorées.
+
+        Args:
+            station_id: L'identifiant de la station
+            measurements: Les mesures à enregistrer
+
+        Returns:
+            Le nombre de mesures réellement ajoutées (hors doublons)
+        """
+        return self.add_rows(station_id, (
+            (m.epoch, m.utc_offset or 0, m.temperature, m.humidite, m.pression)
+            for m in measurements if m.epoch is not None
+        ))
+
+    def add_rows(self, station_id: str, rows: Iterable[Row]) -> int:
+        """
+        Enregistre des mesures déjà converties, en une seule transaction.
+
+        Args:
+            station_id: L'identifiant de la station
+            rows: Tuples (epoch, décalage UTC en minutes, température, humidité, pression)
+
+        Returns:
+            Le nombre de mesures réellement ajoutées (hors doublons)
+        """
+        with self._lock, self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO measurements "
+                "(station_id, epoch, utc_offset, temperature, humidite, pression) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                ((station_id,) + tuple(row) for row in rows)
+            )
+            return self._connection.total_changes - before
+
+    def sink(self, station_id: str) -> Callable[[List[Measurement]], None]:
+        """
+        Args:
+            station_id: L'identifiant de la station
+
+        Returns:
+            Une fonction qui enregistre une page de mesures, utilisable comme
+            sink de ApiService.backfill_station
+        """
+        def write(page: List[Measurement]) -> None:
+            self.add_measurements(station_id, page)
+        return write
+
+    def query(self,
+              station_id: str,
+              start_epoch: Optional[int] = None,
+              end_epoch: Optional[int] = None,
+              limit: Optional[int] = None) -> MeasurementSeries:
+        """
+        Lit les mesures d'une station sur un intervalle de temps.
+
+        Args:
+            station_id: L'identifiant de la station
+            start_epoch: Borne inférieure incluse (optionnel)
+            end_epoch: Borne supérieure incluse (optionnel)
+            limit: Nombre maximal de mesures, les plus anciennes d'abord (optionnel)
+
+        Returns:
+            Les mesures, de la plus ancienne à la plus récente
+        """
+        sql = ("SELECT epoch, temperature, humidite, pression, utc_offset "
+               "FROM measurements WHERE station_id = ? AND epoch BETWEEN ? AND ? "
+               "ORDER BY epoch")
+        params = [
+            station_id,
+            -(2 ** 63) if start_epoch is None else start_epoch,
+            2 ** 63 - 1 if end_epoch is None else end_epoch,
+        ]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+
+        series = MeasurementSeries()
+        if rows:
+            epochs, temperatures, humidites, pressions, offsets = zip(*rows)
+            series.append_columns(epochs, temperatures, humidites, pressions,
+                                  utc_offsets=offsets)
+        return series
+
+    def latest(self, station_id: str, count: int = 1) -> MeasurementSeries:
+        """
+        Lit les mesures les plus récentes d'une station.
+
+        Args:
+            station_id: L'identifiant de la station
+            count: Nombre de mesures à lire
+
+        Returns:
+            Les `count` dernières mesures, de la plus ancienne à la plus récente
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT epoch, temperature, humidite, pression, utc_offset "
+                "FROM measurements WHERE station_id = ? ORDER BY epoch DESC LIMIT ?",
+                (station_id, count)
+            ).fetchall()
+
+        series = MeasurementSeries()
+        if rows:
+            epochs, temperatures, humidites, pressions, offsets = zip(*reversed(rows))
+            series.append_columns(epochs, temperatures, humidites, pressions,
+                                  utc_offsets=offsets)
+        return series
+
+    def latest_epoch(self, station_id: str) -> Optional[int]:
+        """
+        Args:
+            station_id: L'identifiant de la station
+
+        Returns:
+            L'horodatage de la mesure la plus récente, ou None si aucune
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT MAX(epoch) FROM measurements WHERE station_id = ?", (station_id,)
+            ).fetchone()
+        return row[0]
+
+    def station_ids(self) -> List[str]:
+        """
+        Returns:
+            Les identifiants des stations ayant au moins une mesure, triés
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT DISTINCT station_id FROM measurements ORDER BY station_id"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def count(self, station_id: Optional[str] = None) -> int:
+        """
+        Args:
+            station_id: L'identifiant de la station (toutes si absent)
+
+        Returns:
+            Le nombre de mesures enregistrées
+        """
+        with self._lock:
+            if station_id is None:
+                row = self._connection.execute("SELECT COUNT(*) FROM measurements").fetchone()
+            else:
+                row = self._connection.execute(
+                    "SELECT COUNT(*) FROM measurements WHERE station_id = ?", (station_id,)
+                ).fetchone()
+        return row[0]
+
+    def delete_station(self, station_id: str) -> int:
+        """
+        Args:
+            station_id: L'identifiant de la station
+
+        Returns:
+            Le nombre de mesures supprimées
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM measurements WHERE station_id = ?", (station_id,)
+            )
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Ferme la base."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> 'TimeSeriesStore':
+        """Permet l'utilisation avec `with`."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Ferme la base en sortie de bloc `with`."""
+        self.close()
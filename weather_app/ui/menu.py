@@ -9,9 +9,15 @@ des menus complexes avec validation et affichage (disable R0914).
 import os
 import sys
 import uuid
+from datetime import datetime, timedelta, timezone
+
+from weather_app.analytics.service import AnalyticsService
 
 from weather_app.config.singleton_config import ConfigurationSingleton
 from weather_app.services.api_service import ApiService
+from weather_app.services.disk_cache import DiskResponseCache
+from weather_app.services.response_cache import ResponseCache
+from weather_app.storage.time_series_store import TimeSeriesStore
 from weather_app.patterns.observer import StationSelector, DataLoader
 from weather_app.patterns.command import (
     CommandInvoker, SelectStationCommand, RefreshDataCommand,
@@ -55,10 +61,23 @@ class MainMenu:
     Menu principal de l'application.
     """
 
+    # pylint: disable=too-many-instance-attributes
     def __init__(self):
         """Initialise le menu principal avec tous les composants nécessaires."""
         self._config = ConfigurationSingleton()
-        self._api_service = ApiService()
+        # Le cache mémoire rend instantané le retour sur une station déjà
+        # consultée ; le cache disque sert les dernières mesures au redémarrage.
+        # Les rafraîchissements ne demandent que les nouvelles mesures, et
+        # toutes les mesures reçues sont conservées dans la base historique.
+        self._store = TimeSeriesStore(os.path.join(self._config.data_dir, 'measurements.db'))
+        self._api_service = ApiService(
+            response_cache=ResponseCache(ttl=300),
+            disk_cache=DiskResponseCache(os.path.join(self._config.data_dir, 'cache')),
+            incremental=True,
+            store=self._store
+        )
+        # Agrégats (10 min, heure, jour) tenus à jour à chaque chargement
+        self._analytics = AnalyticsService(store=self._store)
         self._station_selector = StationSelector()
         self._data_loader = DataLoader(self._api_service)
         self._station_selector.attach(self._data_loader)
@@ -101,6 +120,8 @@ class MainMenu:
         """Lance l'application."""
         while self._running:
             self._show_main_menu()
+        self._api_service.close()
+        self._store.close()
 
     def _show_main_menu(self) -> None:
         """Affiche le menu principal."""
@@ -138,6 +159,9 @@ class MainMenu:
             self.pause()
             return
 
+        # Les résumés des villes et des pays couvrent toutes les stations
+        self._analytics.track_all(stations_list)
+
         print("0. Revenir au menu principal")
 
         for i, station in enumerate(stations_list, 1):
@@ -168,6 +192,7 @@ class MainMenu:
         Args:
             station: La station à afficher
         """
+        rolling = self._analytics.track(station).rolling
         # Utiliser le pattern Command pour sélectionner la station
         command = SelectStationCommand(self._station_selector, station)
         self._command_invoker.execute_command(command)
@@ -176,10 +201,21 @@ class MainMenu:
             self.display_header(f"STATION: {station.nom}")
             safe_print(f"📍 Ville: {self._get_ville_name(station)}")
             safe_print(f"🌍 Pays: {self._get_pays_name(station)}")
-            safe_print(f"📊 Mesures: {len(station.get_measurements())}\n")
+            safe_print(f"📊 Mesures: {len(station.get_measurements())}")
+            temperature = rolling.stats('temperature', '24h')
+            if temperature.count:
+                trend = ("" if temperature.rate is None
+                         else f", tendance {temperature.rate:+.1f}°C/h")
+                safe_print(
+                    f"🌡️  24h: moy. {temperature.mean:.1f}°C "
+                    f"(min {temperature.minimum}°C / max {temperature.maximum}°C{trend})"
+                )
+            self._display_ville_summary(station)
+            print()
 
             print("1. Afficher les mesures")
             print("2. Rafraîchir les données")
+            print("3. Résumé (min / moyenne / max)")
             print("0. Retour")
 
             choice = self.get_user_choice()
@@ -189,12 +225,31 @@ class MainMenu:
                 self.pause()
             elif choice == "2":
                 self._refresh_station_data(station)
+            elif choice == "3":
+                self._display_station_summary(station)
+                self.pause()
             elif choice == "0":
                 break
             else:
                 safe_print("\n❌ Choix invalide.")
                 self.pause()
 
+    def _display_ville_summary(self, station: Station) -> None:
+        """
+        Affiche le résumé en direct de la ville d'une station.
+
+        Args:
+            station: La station
+        """
+        summary = self._analytics.summary(station.ville) if station.ville else None
+        if summary is None or not summary.station_count:
+            return
+        safe_print(
+            f"🏙️  {self._get_ville_name(station)}: moy. actuelle {summary.current_mean():.1f}°C "
+            f"sur {summary.station_count} station(s) "
+            f"(min {summary.temperature.minimum}°C / max {summary.temperature.maximum}°C)"
+        )
+
     @display_measurements_decorator
     def _display_station_measurements(self, station: Station):
         """
@@ -207,6 +262,49 @@ class MainMenu:
         measurements = self._command_invoker.execute_command(command)
         return measurements
 
+    def _display_station_summary(self, station: Station) -> None:
+        """
+        Affiche les agrégats précalculés de la station, à la résolution la
+        plus large qui découpe encore l'historique en intervalles lisibles.
+
+        Args:
+            station: La station dont afficher le résumé
+        """
+        resolution, buckets = self._analytics.track(station).rollups.query()
+        if not buckets:
+            safe_print("\n⚠️  Aucune mesure disponible.")
+            return
+
+        labels = {600: "10 minutes", 3600: "heure", 86400: "jour"}
+        date_format = "%d/%m/%Y" if resolution >= 86400 else "%d/%m/%Y %H:%M"
+        safe_print(f"\n📊 Résumé par {labels.get(resolution, f'{resolution}s')}\n")
+        for bucket in reversed(buckets):
+            start = datetime.fromtimestamp(
+                bucket.start, timezone(timedelta(minutes=bucket.utc_offset))
+            )
+            temperature, humidite, pression = bucket.temperature, bucket.humidite, bucket.pression
+            safe_print(
+                f"📅 {start.strftime(date_format):<16} "
+                f"🌡️ {temperature.minimum:5.1f} / {temperature.mean:5.1f} / "
+                f"{temperature.maximum:5.1f}°C  "
+                f"💧 {humidite.mean:3.0f}%  "
+                f"🔽 {pression.mean:8.0f} Pa  ({bucket.count} mesure(s))"
+            )
+
+        safe_print("\n📈 Percentiles p50 / p95 / p99 (approchés)")
+        locations = [("Station", station)]
+        if station.ville:
+            locations.append((f"Ville ({self._get_ville_name(station)})", station.ville))
+        for label, location in locations:
+            temperatures = self._analytics.quantiles(location, 'temperature')
+            humidites = self._analytics.quantiles(location, 'humidite')
+            if None in temperatures:
+                continue
+            safe_print(
+                f"   {label:<24} 🌡️ {' / '.join(f'{t:.1f}' for t in temperatures)}°C  "
+                f"💧 {' / '.join(f'{h:.0f}' for h in humidites)}%"
+            )
+
     def _refresh_station_data(self, station: Station) -> None:
         """
         Rafraîchit les données d'une station.
@@ -776,6 +874,8 @@ class MainMenu:
                                .set_nom(station_data['nom'])
                                .set_ville(ville)
                                .set_api_url(station_data['api_url'])
+                               .set_max_measurements(
+                                   self._config.get_max_measurements(station_id))
                                .build())
                     stations_list.append(station)
                 except ValueError as e: